@@ -125,13 +125,13 @@ def should_continue_adaptive(
         adjusted_alpha = compute_sequential_alpha(seq_config)
         
         # Compute test statistic (simple z-test for proportions)
-        from statistics import NormalDist
+        from .power import _z_two_sided
         p_pooled = (baseline_rate + candidate_rate) / 2.0
         se = math.sqrt(p_pooled * (1 - p_pooled) * (2.0 / current_n))
         if se > 0:
             delta_obs = candidate_rate - baseline_rate
             z_stat = delta_obs / se
-            z_critical = NormalDist().inv_cdf(1 - adjusted_alpha / 2)
+            z_critical = _z_two_sided(adjusted_alpha)
             
             # Stop early if boundary crossed
             if abs(z_stat) >= z_critical:
@@ -357,6 +357,7 @@ EVALUATE_OPTIONS = [
         type=click.Choice(
             [
                 "bootstrap",
+                "bootstrap-exact",
                 "bootstrap-bca",
                 "bootstrap-cluster",
                 "bootstrap-cluster-bca",
@@ -1,10 +1,12 @@
-from .base import Dispatcher, RunCase
+from .base import BatchRunner, Dispatcher, RunBatch, RunCase
 from .local import LocalDispatcher, ensure_dispatcher
 from .queue_dispatcher import QueueDispatcher
 from .shadow import ShadowDispatcher, TrafficSource
 
 __all__ = [
+    "BatchRunner",
     "Dispatcher",
+    "RunBatch",
     "RunCase",
     "LocalDispatcher",
     "QueueDispatcher",
@@ -1,9 +1,19 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from ..monitoring import Monitor
 
 RunCase = Callable[[int, Tuple[Any, ...]], Dict[str, Any]]
+RunBatch = Callable[[Sequence[int], Sequence[Tuple[Any, ...]]], List[Dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class BatchRunner:
+    """Runs up to ``size`` consecutive cases in one call, returning one result per case."""
+
+    run: RunBatch
+    size: int
 
 
 class Dispatcher(ABC):
@@ -1,11 +1,21 @@
 from abc import ABC, abstractmethod
 import pickle
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    ProcessPoolExecutor,
+    wait,
+)
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
 
 from ..monitoring import Monitor, MonitorRecord
 from ..plugins import dispatcher_plugins
-from .base import Dispatcher, RunCase
+from .base import BatchRunner, Dispatcher, RunCase
+
+# Cases queued per worker; bounds pending futures (and their inputs) for large suites
+_INFLIGHT_PER_WORKER = 4
 
 
 class LocalDispatcher(Dispatcher):
@@ -31,7 +41,14 @@ class LocalDispatcher(Dispatcher):
         monitors: Sequence[Monitor] | None = None,
         call_spec: Optional[Dict[str, Any]] = None,
         seed: Optional[int] = None,
+        batch_runner: Optional[BatchRunner] = None,
     ) -> List[Dict[str, Any]]:
+        """
+        Execute ``run_case`` against all inputs.
+
+        With a ``batch_runner`` whose size is above one, consecutive cases are
+        coalesced and each batch is run with a single ``batch_runner.run`` call.
+        """
         monitors = list(monitors or [])
         # Pre-allocate results list for memory efficiency
         # Use None initially to reduce memory footprint for large test suites
@@ -44,8 +61,7 @@ class LocalDispatcher(Dispatcher):
             # But we can seed the main process if needed, or pass seed to _invoke
             pass
 
-        def _invoke(index: int, args: Tuple[Any, ...]) -> Dict[str, Any]:
-            result = run_case(index, args)
+        def _record(index: int, result: Dict[str, Any]) -> Dict[str, Any]:
             duration = float(result.get("duration_ms") or 0.0)
             success = bool(result.get("success"))
             record = MonitorRecord(
@@ -91,6 +107,9 @@ class LocalDispatcher(Dispatcher):
             
             return result
 
+        def _invoke(index: int, args: Tuple[Any, ...]) -> Dict[str, Any]:
+            return _record(index, run_case(index, args))
+
         # Auto-detect optimal worker count if enabled
         effective_workers = self.workers
         if self.auto_workers and self.workers == 1:
@@ -100,6 +119,34 @@ class LocalDispatcher(Dispatcher):
             cpu_count = os.cpu_count() or 4
             effective_workers = cpu_count * 2 if not self.use_process_pool else cpu_count
         
+        if batch_runner is not None and batch_runner.size > 1 and len(test_inputs) > 1:
+            run_batch = batch_runner.run
+            batch_size = batch_runner.size
+            # Coalesce consecutive cases so each worker pays sandbox start-up once per batch
+            batches = [
+                tuple(test_inputs[start:start + batch_size])
+                for start in range(0, len(test_inputs), batch_size)
+            ]
+
+            def _invoke_batch(batch_index: int, batch: Tuple[Tuple[Any, ...], ...]) -> List[Dict[str, Any]]:
+                first = batch_index * batch_size
+                indices = range(first, first + len(batch))
+                return [
+                    _record(index, result)
+                    for index, result in zip(indices, run_batch(list(indices), list(batch)))
+                ]
+
+            batch_results: List[List[Dict[str, Any]]] = [None] * len(batches)  # type: ignore[list-item]
+            if effective_workers <= 1:
+                for batch_index, batch in enumerate(batches):
+                    batch_results[batch_index] = _invoke_batch(batch_index, batch)
+            else:
+                # Batching is only wired to thread pools; the runner closes over per-run state
+                _run_bounded(ThreadPoolExecutor, effective_workers, batches, _invoke_batch, batch_results)
+            for batch_index, batch_result in enumerate(batch_results):
+                results[batch_index * batch_size:batch_index * batch_size + len(batch_result)] = batch_result
+            return results
+
         if effective_workers <= 1:
             for idx, args in enumerate(test_inputs):
                 results[idx] = _invoke(idx, args)
@@ -111,17 +158,7 @@ class LocalDispatcher(Dispatcher):
         executor_class = ProcessPoolExecutor if self.use_process_pool else ThreadPoolExecutor
         
         try:
-            with executor_class(max_workers=effective_workers) as pool:
-                future_map = {
-                    pool.submit(_invoke, idx, args): idx
-                    for idx, args in enumerate(test_inputs)
-                }
-                for future in as_completed(future_map):
-                    idx = future_map[future]
-                    result = future.result()
-                    results[idx] = result
-                    # Allow garbage collection of future object immediately
-                    del future_map[future]
+            _run_bounded(executor_class, effective_workers, test_inputs, _invoke, results)
         except (AttributeError, TypeError, pickle.PickleError) as e:
             # If process pool fails due to pickling issues, fall back to threads
             if self.use_process_pool:
@@ -131,20 +168,42 @@ class LocalDispatcher(Dispatcher):
                     "This may occur if run_case or monitors are not picklable.",
                     UserWarning,
                 )
-                with ThreadPoolExecutor(max_workers=self.workers) as pool:
-                    future_map = {
-                        pool.submit(_invoke, idx, args): idx
-                        for idx, args in enumerate(test_inputs)
-                    }
-                    for future in as_completed(future_map):
-                        idx = future_map[future]
-                        result = future.result()
-                    results[idx] = future.result()
+                _run_bounded(ThreadPoolExecutor, effective_workers, test_inputs, _invoke, results)
             else:
                 raise
         return results
 
 
+def _run_bounded(
+    executor_class: Type[Executor],
+    workers: int,
+    test_inputs: Sequence[Any],
+    invoke: Callable[[int, Any], Any],
+    results: List[Any],
+) -> None:
+    """
+    Run ``invoke`` over ``test_inputs`` with at most ``workers * _INFLIGHT_PER_WORKER``
+    cases submitted at once, storing each result at its input's index as it completes.
+    """
+    pending_inputs = iter(enumerate(test_inputs))
+    window = max(1, workers * _INFLIGHT_PER_WORKER)
+    with executor_class(max_workers=workers) as pool:
+        in_flight: Dict[Future, int] = {}
+
+        def submit_next() -> None:
+            item = next(pending_inputs, None)
+            if item is not None:
+                in_flight[pool.submit(invoke, *item)] = item[0]
+
+        for _ in range(window):
+            submit_next()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[in_flight.pop(future)] = future.result()
+                submit_next()
+
+
 def ensure_dispatcher(
     dispatcher: str | Dispatcher | None,
     workers: int,
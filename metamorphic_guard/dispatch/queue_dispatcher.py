@@ -4,6 +4,7 @@ Queue-based dispatcher implementation.
 
 from __future__ import annotations
 
+import threading
 import time
 import uuid
 from typing import Any, Dict, List, Optional, Sequence, Tuple
@@ -23,6 +24,7 @@ from ..queue_adapter import (
     QueueResult,
     RedisQueueAdapter,
 )
+from ..queue_serialization import decode_frame, encode_frame
 from ..types import JSONDict
 
 from .task_distribution import TaskDistributionManager
@@ -78,6 +80,13 @@ class QueueDispatcher(Dispatcher):
             spawn_local_workers = backend == "memory"
         self._spawn_local_workers = bool(spawn_local_workers)
         self._compress = bool(self.config.get("compress", True))
+        # A single in-process worker gains nothing from the queue machinery,
+        # so run cases inline unless the caller explicitly wants the queue path.
+        self._fast_path = (
+            backend_lower == "memory"
+            and self._spawn_local_workers
+            and not self.config.get("force_queue_path", False)
+        )
 
     def execute(
         self,
@@ -91,6 +100,8 @@ class QueueDispatcher(Dispatcher):
     ) -> List[JSONDict]:
         """Execute test cases using queue-based distribution."""
         monitors = list(monitors or [])
+        if self._fast_path and self.workers == 1:
+            return self._execute_inline(test_inputs, run_case, role, monitors)
         job_id = str(uuid.uuid4())
 
         reset_adapter = getattr(self.adapter, "reset", None)
@@ -99,16 +110,15 @@ class QueueDispatcher(Dispatcher):
 
         threads: List[LocalWorker] = []
         if self._spawn_local_workers:
+            # Released by each worker once registered; fresh per run so stale
+            # releases from a previous execute() cannot satisfy the wait.
+            worker_ready = threading.Semaphore(0)
             for _ in range(self.workers):
-                worker = LocalWorker(self.adapter, run_case)
+                worker = LocalWorker(self.adapter, run_case, ready=worker_ready)
                 worker.start()
                 threads.append(worker)
             # Wait briefly for at least one worker to register
-            worker_ready_deadline = time.monotonic() + 5.0
-            while time.monotonic() < worker_ready_deadline:
-                if getattr(self.adapter, "worker_count", lambda: 0)() > 0:
-                    break
-                time.sleep(0.01)
+            worker_ready.acquire(timeout=5.0)
 
         try:
             enable_requeue = bool(self.config.get("enable_requeue", not self._spawn_local_workers))
@@ -130,11 +140,16 @@ class QueueDispatcher(Dispatcher):
 
             ensure_queue = getattr(self.adapter, "ensure_result_queue", None)
             if ensure_queue is not None:
-                ensure_queue(job_id)
+                if isinstance(self.adapter, InMemoryQueueAdapter):
+                    shards = int(self.config.get("result_shards", max(1, self.workers // 16)))
+                    ensure_queue(job_id, shards=shards)
+                else:
+                    ensure_queue(job_id)
 
             task_manager.maybe_publish_batches()
 
-            results: List[JSONDict] = [{} for _ in range(len(test_inputs))]
+            # Every slot is filled before the loop exits, so None never escapes
+            results: List[Optional[JSONDict]] = [None] * len(test_inputs)
             received = 0
             last_metrics_sample = time.monotonic()
 
@@ -148,19 +163,14 @@ class QueueDispatcher(Dispatcher):
 
                 # Check for stale tasks and requeue
                 if enable_requeue:
-                    lost_workers = set()
-                    if hasattr(self.adapter, "check_stale_workers"):
-                        lost_workers = self.adapter.check_stale_workers()
-
-                    heartbeats = self.adapter.worker_heartbeats()
-                    
-                    # Enhanced fault tolerance: check for stale workers
-                    if hasattr(self.adapter, "check_stale_workers"):
-                        detected_stale = self.adapter.check_stale_workers()
-                        lost_workers.update(detected_stale)
-                    
-                    for task_id in list(task_manager.deadlines.keys()):
-                        assigned = self.adapter.get_assignment(task_id)
+                    # One snapshot per iteration instead of a lookup per in-flight task
+                    assignments, heartbeats, lost_workers = self.adapter.snapshot(
+                        task_manager.deadlines.keys()
+                    )
+
+                    due = task_manager.due_tasks(now, assignments, heartbeats, lost_workers)
+                    for task_id in due:
+                        assigned = assignments.get(task_id)
                         was_requeued = task_manager.requeue_stale_task(
                             task_id=task_id,
                             now=now,
@@ -215,7 +225,7 @@ class QueueDispatcher(Dispatcher):
 
                 task_manager.maybe_publish_batches()
 
-            return results
+            return results  # type: ignore[return-value]
         finally:
             if self._spawn_local_workers:
                 self.adapter.signal_shutdown()
@@ -224,6 +234,45 @@ class QueueDispatcher(Dispatcher):
                 for worker in threads:
                     worker.join(timeout=1.0)
 
+    def _execute_inline(
+        self,
+        test_inputs: Sequence[Tuple[Any, ...]],
+        run_case: RunCase,
+        role: str,
+        monitors: Sequence[Monitor],
+    ) -> List[JSONDict]:
+        """
+        Run cases sequentially without queue bookkeeping.
+
+        Arguments still go through the queue's encoding, so ``run_case`` sees
+        the same values (lists rather than tuples) and unserializable inputs
+        fail the same way as on the queue path. ``global_timeout`` is only
+        checked between cases: a case that hangs is bounded by ``run_case``'s
+        own timeout rather than interrupted at the global deadline.
+        """
+        overall_timeout = float(self.config.get("global_timeout", 120.0))
+        overall_deadline = time.monotonic() + overall_timeout
+        use_msgpack = bool(self.config.get("use_msgpack", False))
+        results: List[JSONDict] = []
+        for idx, args in enumerate(test_inputs):
+            if time.monotonic() > overall_deadline:
+                raise TimeoutError(f"Queue dispatcher exceeded global timeout ({overall_timeout}s)")
+            queued_args = decode_frame(encode_frame(args, use_msgpack=use_msgpack), use_msgpack=use_msgpack)
+            result = run_case(idx, queued_args)
+            results.append(result)
+            increment_queue_completed()
+            if monitors:
+                record = MonitorRecord(
+                    case_index=idx,
+                    role=role,
+                    duration_ms=float(result.get("duration_ms") or 0.0),
+                    success=bool(result.get("success")),
+                    result=result,
+                )
+                for monitor in monitors:
+                    monitor.record(record)
+        return results
+
 
 # Backward compatibility exports
 _Task = QueueResult
@@ -4,13 +4,14 @@ Task distribution and batching logic for queue dispatcher.
 
 from __future__ import annotations
 
+import heapq
 import time
 import uuid
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from ..errors import QueueSerializationError
 from ..queue_adapter import QueueAdapter, QueueTask
-from ..queue_serialization import prepare_payload
+from ..queue_serialization import encode_frame, prepare_payload_from_frames
 from ..observability import increment_queue_dispatched, increment_queue_requeued
 from ..types import JSONDict
 
@@ -65,6 +66,9 @@ class TaskDistributionManager:
         self.adjustment_window = max(1, int(config.get("adjustment_window", 10)))
         self.fast_threshold_ms = float(config.get("adaptive_fast_threshold_ms", 50.0))
         self.slow_threshold_ms = float(config.get("adaptive_slow_threshold_ms", 500.0))
+        # Upper bound on the estimated wall time of a single task so one oversized
+        # batch cannot hold a worker (and the result stream) hostage.
+        self.max_batch_ms = float(config.get("max_batch_ms", 500.0))
 
         if not self.adaptive_batching:
             self.current_batch_size = self.configured_batch_size
@@ -75,9 +79,15 @@ class TaskDistributionManager:
             self.current_batch_size,
         )
 
+        # Per-case encoded fragments, filled on first publish and reused by requeues
+        self._frames: List[Optional[bytes]] = [None] * len(test_inputs)
+
         # State
         self.tasks: Dict[str, QueueTask] = {}
         self.deadlines: Dict[str, float] = {}
+        # Min-heap of (deadline, task_id); entries whose deadline no longer matches
+        # self.deadlines are stale and discarded lazily when popped.
+        self._deadline_heap: List[Tuple[float, str]] = []
         self.remaining_cases: Dict[str, Set[int]] = {}
         self.outstanding_cases = 0
         self.next_index = 0
@@ -96,23 +106,11 @@ class TaskDistributionManager:
         indices = list(range(start_idx, chunk_end))
         if not indices:
             return
-        args_chunk = [self.test_inputs[i] for i in indices]
         try:
-            payload, compressed_flag, _, _ = prepare_payload(
-                args_chunk,
-                compress_default=self.compress_payloads,
-                adaptive=self.adaptive_compress,
-                threshold_bytes=self.compression_threshold,
-                use_msgpack=self.use_msgpack,
-            )
+            payload, compressed_flag = self._encode_cases(indices)
         except QueueSerializationError as exc:
-            details = dict(exc.details)
-            details["case_indices"] = indices
-            raise QueueSerializationError(
-                exc.args[0],
-                details=details,
-                original=exc.original or exc,
-            ) from exc
+            exc.add_context(case_indices=indices)
+            raise
 
         task_id = str(uuid.uuid4())
         task = QueueTask(
@@ -127,12 +125,27 @@ class TaskDistributionManager:
             created_at=time.monotonic(),
         )
         self.tasks[task_id] = task
-        self.deadlines[task_id] = time.monotonic() + self.lease_seconds
+        self._set_deadline(task_id, time.monotonic() + self.lease_seconds)
         self.remaining_cases[task_id] = set(indices)
         self.outstanding_cases += len(indices)
         self.adapter.publish_task(task)
         increment_queue_dispatched(len(indices))
 
+    def _encode_cases(self, indices: List[int]) -> Tuple[bytes, bool]:
+        """Build a task payload from cached per-case fragments."""
+        frames = self._frames
+        for i in indices:
+            if frames[i] is None:
+                frames[i] = encode_frame(self.test_inputs[i], use_msgpack=self.use_msgpack)
+        payload, compressed_flag, _, _ = prepare_payload_from_frames(
+            [frames[i] for i in indices],  # type: ignore[misc]
+            compress_default=self.compress_payloads,
+            adaptive=self.adaptive_compress,
+            threshold_bytes=self.compression_threshold,
+            use_msgpack=self.use_msgpack,
+        )
+        return payload, compressed_flag
+
     def maybe_publish_batches(self) -> None:
         """Publish batches of tasks if capacity allows."""
         # Backpressure check: warn if pending tasks exceed threshold relative to worker capacity
@@ -146,10 +159,17 @@ class TaskDistributionManager:
 
         inflight_limit = len(self.test_inputs) if not self.adaptive_batching else self.target_inflight_cases
         while self.next_index < len(self.test_inputs) and self.outstanding_cases < inflight_limit:
-            batch = min(self.current_batch_size, len(self.test_inputs) - self.next_index)
+            batch = min(self.effective_batch_size(), len(self.test_inputs) - self.next_index)
             self.publish_chunk(self.next_index, batch)
             self.next_index += batch
 
+    def effective_batch_size(self) -> int:
+        """Return the batch size to publish, capped by the per-task wall-time budget."""
+        if not self.avg_case_ms or self.max_batch_ms <= 0:
+            return self.current_batch_size
+        time_capped = int(self.max_batch_ms / max(self.avg_case_ms, 1.0))
+        return max(1, min(self.current_batch_size, time_capped))
+
     def update_adaptive_batching(self, duration_ms: float, pending_tasks: int) -> None:
         """Update batch size based on observed performance with improved heuristics."""
         if not self.adaptive_batching or duration_ms <= 0:
@@ -213,6 +233,42 @@ class TaskDistributionManager:
             
             self.cases_since_adjustment = 0
 
+    def _set_deadline(self, task_id: str, deadline: float) -> None:
+        self.deadlines[task_id] = deadline
+        heapq.heappush(self._deadline_heap, (deadline, task_id))
+
+    def due_tasks(
+        self,
+        now: float,
+        assignments: Dict[str, str],
+        heartbeats: Dict[str, float],
+        lost_workers: Set[str],
+    ) -> List[str]:
+        """
+        Return ids of tasks that may need requeueing.
+
+        Expired leases come off the deadline heap; tasks held by lost or silent
+        workers are found through the assignment snapshot, so in-flight tasks
+        with healthy workers are never visited.
+        """
+        due: List[str] = []
+        heap = self._deadline_heap
+        while heap and heap[0][0] < now:
+            deadline, task_id = heapq.heappop(heap)
+            if self.deadlines.get(task_id) == deadline:
+                due.append(task_id)
+
+        seen = set(due)
+        for task_id, worker in assignments.items():
+            if task_id in seen or task_id not in self.deadlines:
+                continue
+            heartbeat = heartbeats.get(worker)
+            if worker in lost_workers or (
+                heartbeat is not None and now - heartbeat > self.heartbeat_timeout
+            ):
+                due.append(task_id)
+        return due
+
     def requeue_stale_task(
         self,
         task_id: str,
@@ -276,18 +332,12 @@ class TaskDistributionManager:
             self.worker_load[assigned_worker] = max(0, self.worker_load.get(assigned_worker, 0) - 1)
 
         sorted_indices = sorted(outstanding)
-        args_chunk = [self.test_inputs[i] for i in sorted_indices]
-        payload, compressed_flag, _, _ = prepare_payload(
-            args_chunk,
-            compress_default=self.compress_payloads,
-            adaptive=self.adaptive_compress,
-            threshold_bytes=self.compression_threshold,
-        )
+        payload, compressed_flag = self._encode_cases(sorted_indices)
         task.case_indices = sorted_indices
         task.payload = payload
         task.compressed = compressed_flag
         self.adapter.publish_task(task)
-        self.deadlines[task_id] = now + self.lease_seconds
+        self._set_deadline(task_id, now + self.lease_seconds)
         increment_queue_requeued(len(sorted_indices))
 
         if self.adaptive_batching and self.current_batch_size > self.min_batch_size:
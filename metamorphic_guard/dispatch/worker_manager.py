@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import threading
 import uuid
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Optional
 
 from ..errors import QueueSerializationError
 from ..queue_adapter import QueueAdapter, QueueResult, QueueTask
@@ -17,10 +17,16 @@ from .base import RunCase
 class LocalWorker(threading.Thread):
     """Worker that consumes tasks from the adapter and executes run_case."""
 
-    def __init__(self, adapter: QueueAdapter, run_case: RunCase) -> None:
+    def __init__(
+        self,
+        adapter: QueueAdapter,
+        run_case: RunCase,
+        ready: Optional[threading.Semaphore] = None,
+    ) -> None:
         super().__init__(daemon=True)
         self.adapter = adapter
         self.run_case = run_case
+        self._ready = ready
         self._stop_event = threading.Event()
         self.worker_id = f"local-{uuid.uuid4()}"
 
@@ -31,6 +37,8 @@ class LocalWorker(threading.Thread):
     def run(self) -> None:
         """Main worker loop: consume tasks and execute them."""
         self.adapter.register_worker(self.worker_id)
+        if self._ready is not None:
+            self._ready.release()
         while not self._stop_event.is_set():
             self.adapter.register_worker(self.worker_id)
             task = self.adapter.consume_task(self.worker_id, timeout=0.5)
@@ -139,6 +139,12 @@ class QueueSerializationError(MetamorphicGuardError):
             original=original,
         )
 
+    def add_context(self, **context: Any) -> "QueueSerializationError":
+        """Attach extra details in place without overriding existing keys."""
+        for key, value in context.items():
+            self.details.setdefault(key, value)
+        return self
+
 
 __all__ = [
     "QueueSerializationError",
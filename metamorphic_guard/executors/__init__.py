@@ -12,6 +12,14 @@ from .circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
 
 __all__ = ["Executor", "LLMExecutor"]
 
+# Provider HTTP status -> executor ``error_code``; anything else is "llm_api_error"
+_STATUS_TO_CODE: Dict[Any, str] = {
+    400: "invalid_request",
+    401: "authentication_error",
+    429: "rate_limit_error",
+    500: "server_error",
+}
+
 
 class Executor:
     """Base class for execution backends."""
@@ -66,7 +74,7 @@ class LLMExecutor(Executor):
             self.retry_statuses = {429, 500, 502, 503, 504}
         retry_exceptions = cfg.get(
             "retry_exceptions",
-            ("RateLimitError", "ServiceUnavailableError", "Timeout", "APIError"),
+            ("RateLimitError", "ServiceUnavailableError", "Timeout", "APIError", "ConnectionError"),
         )
         self.retry_exception_tokens = tuple(str(name).lower() for name in retry_exceptions)
 
@@ -158,6 +166,13 @@ class LLMExecutor(Executor):
             attempt: Current retry attempt number (0-indexed)
             retry_after: Optional seconds to wait from Retry-After header
         """
+        delay = self._backoff_delay(attempt, retry_after=retry_after)
+        if delay is None:
+            return
+        time.sleep(delay)
+
+    def _backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """Return the backoff delay in seconds for ``attempt``, or None when backoff is disabled."""
         if retry_after is not None and retry_after > 0:
             # Respect Retry-After header if provided (common in rate limit responses)
             delay = retry_after
@@ -165,7 +180,7 @@ class LLMExecutor(Executor):
             if self.retry_jitter > 0:
                 delay += random.uniform(0, min(self.retry_jitter, delay * 0.1))
         elif self.retry_backoff_base <= 0:
-            return
+            return None
         else:
             # Exponential backoff: base * 2^attempt
             delay = self.retry_backoff_base * (2 ** attempt)
@@ -173,8 +188,7 @@ class LLMExecutor(Executor):
                 delay = min(delay, self.retry_backoff_cap)
             if self.retry_jitter > 0:
                 delay += random.uniform(0, self.retry_jitter)
-        
-        time.sleep(max(delay, 0.0))
+        return max(delay, 0.0)
     
     def _extract_retry_after(self, exc: Exception) -> Optional[float]:
         """
@@ -214,6 +228,7 @@ class LLMExecutor(Executor):
         return None
 
     def _attach_retry_metadata(self, payload: Dict[str, Any], attempts: int) -> Dict[str, Any]:
+        """Add ``retries``/``retry_limit`` to ``payload`` in place and return the same dict (no copy)."""
         payload["retries"] = max(0, attempts)
         payload.setdefault("retry_limit", self.max_retries)
         return payload
@@ -4,37 +4,97 @@ Anthropic API executor for LLM calls.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import importlib
+import json
+import threading
 import time
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from pathlib import Path
 
-from .__init__ import LLMExecutor
+from .__init__ import LLMExecutor, _STATUS_TO_CODE
 from .circuit_breaker import CircuitBreakerOpenError
 from ..errors import ExecutorError
 from ..redaction import get_redactor
+from .semantic_cache import SemanticCache
 
 try:
-    import anthropic
-except ImportError:
-    anthropic = None  # type: ignore
-
-if anthropic is not None:
-    AnthropicError = getattr(anthropic, "APIError", Exception)
-    RateLimitError = getattr(anthropic, "RateLimitError", AnthropicError)
-    APITimeoutError = getattr(anthropic, "APITimeoutError", AnthropicError)
-    APIConnectionError = getattr(anthropic, "APIConnectionError", AnthropicError)
-else:  # pragma: no cover - fallback when anthropic missing
-    class AnthropicError(Exception):
-        """Fallback base Anthropic error."""
-
-    class RateLimitError(AnthropicError):
-        pass
+    import orjson
+except ImportError:  # pragma: no cover - optional fast JSON parser
+    orjson = None  # type: ignore
 
-    class APITimeoutError(AnthropicError):
-        pass
+# The SDK (and httpx/pydantic with it) is imported on first executor construction so
+# importing this module stays cheap for runs that never call Anthropic.
+anthropic: Any = None
+_TEXT_BLOCK_TYPES: tuple = ()
+
+
+class AnthropicError(Exception):
+    """Fallback base Anthropic error (replaced by the SDK's once it is loaded)."""
+
+
+class RateLimitError(AnthropicError):
+    pass
+
+
+class APITimeoutError(AnthropicError):
+    pass
 
-    class APIConnectionError(AnthropicError):
+
+class APIConnectionError(AnthropicError):
+    pass
+
+
+def _load_anthropic() -> Any:
+    """Import the Anthropic SDK once and bind its error and block types; None if missing."""
+    global anthropic, _TEXT_BLOCK_TYPES, AnthropicError, RateLimitError, APITimeoutError, APIConnectionError
+    if anthropic is not None:
+        return anthropic
+    try:
+        module = importlib.import_module("anthropic")
+    except ImportError:
+        return None
+    AnthropicError = getattr(module, "APIError", Exception)
+    RateLimitError = getattr(module, "RateLimitError", AnthropicError)
+    APITimeoutError = getattr(module, "APITimeoutError", AnthropicError)
+    APIConnectionError = getattr(module, "APIConnectionError", AnthropicError)
+    try:
+        from anthropic.types import TextBlock
+    except ImportError:  # pragma: no cover - older SDKs
         pass
+    else:
+        _TEXT_BLOCK_TYPES = (TextBlock,)
+    anthropic = module
+    return module
+
+
+# One pooled HTTP client shared by every executor so repeated calls reuse
+# keep-alive connections instead of paying a TCP/TLS handshake each time.
+_HTTP_CLIENT: Any = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+
+def _shared_http_client() -> Any:
+    """Return the process-wide pooled httpx client, creating it on first use."""
+    global _HTTP_CLIENT
+    client_cls = getattr(anthropic, "DefaultHttpxClient", None)
+    if client_cls is None:
+        return None
+    with _HTTP_CLIENT_LOCK:
+        if _HTTP_CLIENT is None:
+            import httpx
+
+            _HTTP_CLIENT = client_cls(
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=90,
+                ),
+                timeout=httpx.Timeout(120.0, connect=10.0),
+            )
+        return _HTTP_CLIENT
 
 
 class AnthropicExecutor(LLMExecutor):
@@ -46,9 +106,20 @@ class AnthropicExecutor(LLMExecutor):
         "version": "1.0.0",
     }
 
+    # Copied (never mutated) for every failure payload; only differing fields are set
+    _ERROR_TEMPLATE: Dict[str, Any] = {
+        "success": False,
+        "duration_ms": 0.0,
+        "stdout": "",
+        "stderr": "",
+        "error": "",
+        "error_type": "",
+        "error_code": "",
+    }
+
     def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
         super().__init__(config)
-        if anthropic is None:
+        if _load_anthropic() is None:
             raise ImportError(
                 "Anthropic executor requires 'anthropic' package. Install with: pip install anthropic"
             )
@@ -61,7 +132,11 @@ class AnthropicExecutor(LLMExecutor):
         if not self.api_key:
             raise ValueError("Anthropic API key required (config['api_key'] or ANTHROPIC_API_KEY env var)")
 
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        http_client = _shared_http_client() if self.config.get("shared_http_client", True) else None
+        if http_client is not None:
+            self.client = anthropic.Anthropic(api_key=self.api_key, http_client=http_client)
+        else:
+            self.client = anthropic.Anthropic(api_key=self.api_key)
         # Pricing per 1M tokens (approximate, as of 2024 - verify current rates)
         default_pricing = {
             "claude-3-5-sonnet-20241022": {"prompt": 3.0, "completion": 15.0},
@@ -84,6 +159,53 @@ class AnthropicExecutor(LLMExecutor):
             self.pricing = merged
         else:
             self.pricing = default_pricing
+        # Prompt-cache writes bill at 1.25x and reads at 0.1x the base input rate
+        for model_name, model_prices in self.pricing.items():
+            override = cfg_pricing.get(model_name) if isinstance(cfg_pricing, dict) else None
+            if not isinstance(override, dict):
+                override = {}  # non-dict entries are skipped by the merge above too
+            prompt_rate = model_prices.get("prompt", 0.0)
+            model_prices["cache_write"] = float(override.get("cache_write", prompt_rate * 1.25))
+            model_prices["cache_read"] = float(override.get("cache_read", prompt_rate * 0.1))
+        # Per-token rates (prompt, completion, cache_write, cache_read) so each call
+        # is a single lookup and multiply instead of re-deriving from per-1M prices
+        self._rates_per_token: Dict[str, Tuple[float, float, float, float]] = {
+            model_name: _per_token_rates(model_prices) for model_name, model_prices in self.pricing.items()
+        }
+        self._default_rates = self._rates_per_token.get(
+            "claude-3-haiku-20240307",
+            _per_token_rates({"prompt": 0.25, "completion": 1.25}),
+        )
+        self.prompt_caching = bool((config or {}).get("prompt_caching", True))
+        # Optional streaming: text chunks go to stream_callback while the response is generated
+        self.stream = bool(self.config.get("stream", False))
+        callback = self.config.get("stream_callback")
+        self.stream_callback = callback if callable(callback) else None
+        # Parse the raw HTTP body directly instead of materialising the SDK's pydantic models
+        self.raw_response = bool(self.config.get("raw_response", True)) and hasattr(
+            self.client, "with_raw_response"
+        )
+        # Opt-in response cache for deterministic (temperature == 0) requests
+        self.cache_enabled = bool(self.config.get("cache_enabled", False))
+        self._response_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._response_cache_size = max(1, int(self.config.get("response_cache_size", 1024)))
+        self._response_cache_lock = threading.Lock()
+        self._cache_stats = {"hits": 0, "misses": 0}
+        # Opt-in embedding cache so paraphrased single-turn prompts reuse a prior response
+        semantic_cfg = self.config.get("semantic_cache") or {}
+        self._semcache: Optional[SemanticCache] = None
+        if semantic_cfg.get("enabled"):
+            self._semcache = SemanticCache(
+                embedder=semantic_cfg["embedder"],
+                threshold=float(semantic_cfg.get("threshold", 0.92)),
+                max_size=int(semantic_cfg.get("max_size", 10000)),
+            )
+            self._cache_stats["semantic_hits"] = 0
+        self._async_client: Any = None
+        # Local input-size precheck; chars_per_token errs high so only hopeless prompts are rejected
+        self.max_input_tokens = int(self.config.get("max_input_tokens", 180_000) or 0)
+        self.chars_per_token = float(self.config.get("chars_per_token", 6.0))
+        self._sysprompt_cache: Dict[str, Tuple[int, str]] = {}
         self._redactor = get_redactor(config)
 
     def execute(
@@ -102,20 +224,279 @@ class AnthropicExecutor(LLMExecutor):
         - func_name: model name (overrides config)
         - args: (user_prompt,) or (user_prompt, system_prompt)
         """
-        start_time = time.time()
-        model = func_name if func_name else self.model
+        start_time = time.perf_counter()
+        call, validation_error = self._prepare_call(file_path, func_name, args)
+        if validation_error is not None:
+            return validation_error
+
+        last_error: Optional[Exception] = None
+
+        # Check circuit breaker before attempting calls
+        if self.circuit_breaker is not None and not self.circuit_breaker.allow_request():
+            return self._circuit_open_error((time.perf_counter() - start_time) * 1000, attempts=0)
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                # Check circuit breaker before each attempt
+                if self.circuit_breaker is not None and not self.circuit_breaker.allow_request():
+                    return self._circuit_open_error((time.perf_counter() - start_time) * 1000, attempts=attempt)
+
+                result = self._call_llm(**call, timeout=timeout_s)
+                duration_ms = (time.perf_counter() - start_time) * 1000
+                # Record success in circuit breaker
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_success()
+                return self._success_payload(result, duration_ms, attempts=attempt)
+            except (RateLimitError, APITimeoutError, APIConnectionError) as exc:
+                last_error = exc
+                retry_after = self._extract_retry_after(exc)
+                if self._should_retry(exc, attempt):
+                    # Don't record failure yet - we'll retry
+                    self._sleep_with_backoff(attempt, retry_after=retry_after)
+                    continue
+                # Retries exhausted - record final failure
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure()
+                break
+            except AnthropicError as exc:
+                duration_ms = (time.perf_counter() - start_time) * 1000
+                error_msg = self._redactor.redact(str(exc))
+                error_code = "rate_limit_error" if isinstance(exc, RateLimitError) else "llm_api_error"
+                # Non-retryable error or retries exhausted - record failure immediately
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure()
+                return self._error_payload(
+                    error_msg, type(exc).__name__, error_code, duration_ms=duration_ms, attempts=attempt
+                )
+            except OSError as exc:
+                last_error = exc
+                if self._should_retry(exc, attempt):
+                    # Don't record failure yet - we'll retry
+                    self._sleep_with_backoff(attempt)
+                    continue
+                # Retries exhausted - record final failure
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure()
+                break
+            except Exception as exc:  # Catch-all for other exceptions (including test mocks)
+                # Check if this looks like an API error with status_code
+                status_code = getattr(exc, "status_code", None)
+                if status_code is not None:
+                    # Treat as API error - check if retryable
+                    last_error = exc
+                    if self._should_retry(exc, attempt):
+                        # Don't record failure yet - we'll retry
+                        retry_after = self._extract_retry_after(exc)
+                        self._sleep_with_backoff(attempt, retry_after=retry_after)
+                        continue
+                    # Retries exhausted or non-retryable - record failure and return
+                    if self.circuit_breaker is not None:
+                        self.circuit_breaker.record_failure()
+                    duration_ms = (time.perf_counter() - start_time) * 1000
+                    error_msg = self._redactor.redact(str(exc))
+                    error_code = _STATUS_TO_CODE.get(status_code, "llm_api_error")
+                    return self._error_payload(
+                        error_msg, type(exc).__name__, error_code, duration_ms=duration_ms, attempts=attempt
+                    )
+                # Not an API error - re-raise
+                raise
 
-        def _validation_error(message: str, code: str) -> Dict[str, Any]:
-            payload = {
-                "success": False,
-                "duration_ms": 0.0,
-                "stdout": "",
-                "stderr": message,
-                "error": message,
-                "error_type": "ValidationError",
-                "error_code": code,
-            }
-            return self._attach_retry_metadata(payload, attempts=0)
+        # All retries exhausted - record final failure and return error
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_failure()
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        fallback = self._redactor.redact(str(last_error)) if last_error else "Unknown error"
+        error_code = _STATUS_TO_CODE.get(getattr(last_error, "status_code", None), "llm_api_error")
+        return self._error_payload(
+            fallback,
+            type(last_error).__name__ if last_error else "RuntimeError",
+            error_code,
+            duration_ms=duration_ms,
+            attempts=self.max_retries,
+        )
+
+    def batch_execute(
+        self,
+        requests: Sequence[Tuple[str, str, tuple]],
+        timeout_s: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run many ``(file_path, func_name, args)`` requests through the Message Batches API.
+
+        Batches trade latency (minutes to hours) for a 50% token discount, so
+        this suits large, non-urgent metamorphic sweeps. Results are returned
+        in request order with the same shape as ``execute``.
+        """
+        start_time = time.perf_counter()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        models: Dict[int, str] = {}
+        entries: List[Dict[str, Any]] = []
+        for index, (file_path, func_name, args) in enumerate(requests):
+            call, validation_error = self._prepare_call(file_path, func_name, args)
+            if validation_error is not None:
+                results[index] = validation_error
+                continue
+            params = self._build_request(**call)
+            models[index] = params["model"]
+            entries.append({"custom_id": f"req-{index}", "params": params})
+
+        if entries:
+            batches = self.client.messages.batches
+            batch = batches.create(requests=entries)
+            timeout_s = timeout_s if timeout_s is not None else float(
+                self.config.get("batch_timeout_s", 24 * 3600)
+            )
+            poll_interval = float(self.config.get("batch_poll_interval", 5.0))
+            poll_cap = float(self.config.get("batch_poll_cap", 60.0))
+            deadline = start_time + timeout_s
+            attempt = 0
+            while batches.retrieve(batch.id).processing_status != "ended":
+                if time.perf_counter() >= deadline:
+                    batches.cancel(batch.id)
+                    break
+                time.sleep(min(poll_cap, poll_interval * (2 ** attempt)))
+                attempt += 1
+            else:
+                duration_ms = (time.perf_counter() - start_time) * 1000
+                discount = float(self.config.get("batch_discount", 0.5))
+                for entry in batches.results(batch.id):
+                    index = int(str(entry.custom_id).rsplit("-", 1)[-1])
+                    outcome = entry.result
+                    if outcome.type == "succeeded":
+                        parsed = self._parse_response(outcome.message, models[index])
+                        parsed["cost_usd"] *= discount
+                        results[index] = self._success_payload(parsed, duration_ms, attempts=0)
+                    else:
+                        error = getattr(outcome, "error", None)
+                        message = self._redactor.redact(str(error or f"Batch request {outcome.type}"))
+                        results[index] = self._error_payload(
+                            message, "BatchRequestError", f"batch_{outcome.type}", duration_ms=duration_ms
+                        )
+
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        for index, payload in enumerate(results):
+            if payload is None:
+                message = "Batch did not return a result before the timeout"
+                results[index] = self._error_payload(
+                    message, "TimeoutError", "batch_timeout", duration_ms=duration_ms
+                )
+        return results  # type: ignore[return-value]
+
+    async def aexecute_many(
+        self,
+        requests: Sequence[Tuple[str, str, tuple]],
+        timeout_s: float = 30.0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute independent ``(file_path, func_name, args)`` requests concurrently.
+
+        Uses ``anthropic.AsyncAnthropic`` with at most ``max_concurrency``
+        (default 16) requests in flight. Results are returned in request order.
+        The async client is closed when the call returns, so each run (and
+        each ``asyncio.run`` loop) gets a fresh one.
+        """
+        semaphore = asyncio.Semaphore(max(1, int(self.config.get("max_concurrency", 16))))
+
+        async def _run(file_path: str, func_name: str, args: tuple) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._aexecute(file_path, func_name, args, timeout_s)
+
+        try:
+            return list(await asyncio.gather(*(_run(*request) for request in requests)))
+        finally:
+            # The async client is bound to this loop; drop it before the loop closes
+            client, self._async_client = self._async_client, None
+            if client is not None and hasattr(client, "close"):
+                await client.close()
+
+    @property
+    def async_client(self) -> Any:
+        """Lazily created ``AsyncAnthropic`` client (bound to the first event loop that uses it)."""
+        if self._async_client is None:
+            client_cls = getattr(anthropic, "DefaultAsyncHttpxClient", None)
+            if client_cls is not None:
+                import httpx
+
+                http_client = client_cls(
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                    timeout=httpx.Timeout(120.0, connect=10.0),
+                )
+                self._async_client = anthropic.AsyncAnthropic(api_key=self.api_key, http_client=http_client)
+            else:
+                self._async_client = anthropic.AsyncAnthropic(api_key=self.api_key)
+        return self._async_client
+
+    async def _aexecute(
+        self, file_path: str, func_name: str, args: tuple, timeout_s: float
+    ) -> Dict[str, Any]:
+        start_time = time.perf_counter()
+        call, validation_error = self._prepare_call(file_path, func_name, args)
+        if validation_error is not None:
+            return validation_error
+
+        last_error: Optional[Exception] = None
+        for attempt in range(self.max_retries + 1):
+            if self.circuit_breaker is not None and not self.circuit_breaker.allow_request():
+                return self._circuit_open_error((time.perf_counter() - start_time) * 1000, attempts=attempt)
+            try:
+                kwargs = self._build_request(**call)
+                response = await self.async_client.messages.create(**kwargs, timeout=timeout_s)
+                result = self._parse_response(response, kwargs["model"])
+            except Exception as exc:
+                last_error = exc
+                if self._should_retry(exc, attempt):
+                    delay = self._backoff_delay(attempt, retry_after=self._extract_retry_after(exc))
+                    if delay:
+                        await asyncio.sleep(delay)
+                    continue
+                break
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_success()
+            return self._success_payload(result, (time.perf_counter() - start_time) * 1000, attempts=attempt)
+
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_failure()
+        error_msg = self._redactor.redact(str(last_error)) if last_error else "Unknown error"
+        status_code = getattr(last_error, "status_code", None)
+        error_code = _STATUS_TO_CODE.get(status_code, "llm_api_error")
+        return self._error_payload(
+            error_msg,
+            type(last_error).__name__ if last_error else "RuntimeError",
+            error_code,
+            duration_ms=(time.perf_counter() - start_time) * 1000,
+            attempts=attempt,
+        )
+
+    def _success_payload(self, result: Dict[str, Any], duration_ms: float, attempts: int) -> Dict[str, Any]:
+        # Retry metadata goes into the single literal rather than a second pass over the dict
+        return {
+            "success": True,
+            "duration_ms": duration_ms,
+            "stdout": result.get("content", ""),
+            "stderr": "",
+            "result": result.get("content"),
+            "tokens_prompt": result.get("tokens_prompt", 0),
+            "tokens_completion": result.get("tokens_completion", 0),
+            "tokens_total": result.get("tokens_total", 0),
+            "cost_usd": result.get("cost_usd", 0.0),
+            "finish_reason": result.get("finish_reason", "end_turn"),
+            "tokens_cache_creation": result.get("tokens_cache_creation", 0),
+            "tokens_cache_read": result.get("tokens_cache_read", 0),
+            "cache_hit": result.get("cache_hit", False),
+            "retries": max(0, attempts),
+            "retry_limit": self.max_retries,
+        }
+
+    def _prepare_call(
+        self, file_path: str, func_name: str, args: tuple
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        Parse and validate ``execute`` arguments.
+
+        Returns ``(call_kwargs, None)`` with keyword arguments for ``_call_llm``,
+        or ``({}, error_payload)`` when validation fails.
+        """
+        model = func_name if func_name else self.model
 
         # Validate inputs and extract conversation history, user prompt, and system prompt
         # Support multiple formats:
@@ -128,7 +509,7 @@ class AnthropicExecutor(LLMExecutor):
         system_prompt: Optional[str] = None
         
         if not args:
-            return _validation_error("Empty or invalid arguments", "invalid_input")
+            return {}, self._validation_error("Empty or invalid arguments", "invalid_input")
         
         # Check if first arg is conversation history (list of message dicts)
         if len(args) >= 2 and isinstance(args[0], list):
@@ -148,7 +529,7 @@ class AnthropicExecutor(LLMExecutor):
         
         # Validate user prompt
         if not isinstance(user_prompt, str) or not user_prompt.strip():
-            return _validation_error("Empty or invalid user prompt", "invalid_input")
+            return {}, self._validation_error("Empty or invalid user prompt", "invalid_input")
         
         # Get system prompt from config if not provided
         if not system_prompt:
@@ -157,14 +538,7 @@ class AnthropicExecutor(LLMExecutor):
             elif isinstance(self.config.get("system_prompt"), str) and self.config["system_prompt"].strip():
                 system_prompt = self.config["system_prompt"]
             elif file_path:
-                try:
-                    path_obj = Path(file_path)
-                    if path_obj.exists():
-                        system_prompt = path_obj.read_text(encoding="utf-8")
-                    else:
-                        system_prompt = file_path
-                except (OSError, UnicodeDecodeError):
-                    system_prompt = file_path
+                system_prompt = self._read_system_prompt(file_path)
 
         # Validate model name using registry
         from ..model_registry import is_valid_model, get_valid_models
@@ -177,182 +551,89 @@ class AnthropicExecutor(LLMExecutor):
                 from ..model_registry import validate_model
                 _, error_msg, suggestions = validate_model("anthropic", model, raise_error=False)
                 full_error = error_msg or f"Invalid model name: {model}"
-                return _validation_error(full_error, "invalid_model")
+                return {}, self._validation_error(full_error, "invalid_model")
 
         # Validate temperature range (Anthropic: 0-1)
         if self.temperature < 0 or self.temperature > 1:
-            return _validation_error(
+            return {}, self._validation_error(
                 f"Temperature must be between 0 and 1, got {self.temperature}",
                 "invalid_parameter",
             )
 
         # Validate max_tokens (Anthropic: 1-4096)
         if self.max_tokens <= 0 or self.max_tokens > 4096:
-            return _validation_error(
+            return {}, self._validation_error(
                 f"max_tokens must be between 1 and 4096, got {self.max_tokens}",
                 "invalid_parameter",
             )
 
-        last_error: Optional[Exception] = None
-
-        # Check circuit breaker before attempting calls
-        if self.circuit_breaker is not None and not self.circuit_breaker.allow_request():
-            duration_ms = (time.time() - start_time) * 1000
-            stats = self.circuit_breaker.get_stats()
-            payload = {
-                "success": False,
-                "duration_ms": duration_ms,
-                "stdout": "",
-                "stderr": f"Circuit breaker is {stats['state']}. Service appears unavailable.",
-                "error": f"Circuit breaker is {stats['state']}",
-                "error_type": "CircuitBreakerOpenError",
-                "error_code": "circuit_breaker_open",
-                "circuit_breaker_state": stats["state"],
-                "next_attempt_time": stats["next_attempt_time"],
-            }
-            return self._attach_retry_metadata(payload, attempts=0)
-
-        for attempt in range(self.max_retries + 1):
-            try:
-                # Check circuit breaker before each attempt
-                if self.circuit_breaker is not None and not self.circuit_breaker.allow_request():
-                    duration_ms = (time.time() - start_time) * 1000
-                    stats = self.circuit_breaker.get_stats()
-                    payload = {
-                        "success": False,
-                        "duration_ms": duration_ms,
-                        "stdout": "",
-                        "stderr": f"Circuit breaker is {stats['state']}. Service appears unavailable.",
-                        "error": f"Circuit breaker is {stats['state']}",
-                        "error_type": "CircuitBreakerOpenError",
-                        "error_code": "circuit_breaker_open",
-                        "circuit_breaker_state": stats["state"],
-                        "next_attempt_time": stats["next_attempt_time"],
-                    }
-                    return self._attach_retry_metadata(payload, attempts=attempt)
-
-                result = self._call_llm(
-                    prompt=user_prompt,
-                    system_prompt=system_prompt,
-                    conversation_history=conversation_history,
-                    model=model,
-                    max_tokens=self.max_tokens,
-                    temperature=self.temperature,
-                    timeout=timeout_s,
+        # Reject prompts that cannot fit before paying for the upload and a 400 round-trip
+        if self.max_input_tokens:
+            estimated = _estimate_input_tokens(
+                user_prompt, system_prompt, conversation_history, self.chars_per_token
+            )
+            if estimated > self.max_input_tokens:
+                return {}, self._validation_error(
+                    f"Prompt has ~{estimated} tokens > max {self.max_input_tokens}",
+                    "input_too_long",
                 )
-                duration_ms = (time.time() - start_time) * 1000
-                payload = {
-                    "success": True,
-                    "duration_ms": duration_ms,
-                    "stdout": result.get("content", ""),
-                    "stderr": "",
-                    "result": result.get("content"),
-                    "tokens_prompt": result.get("tokens_prompt", 0),
-                    "tokens_completion": result.get("tokens_completion", 0),
-                    "tokens_total": result.get("tokens_total", 0),
-                    "cost_usd": result.get("cost_usd", 0.0),
-                    "finish_reason": result.get("finish_reason", "end_turn"),
-                }
-                # Record success in circuit breaker
-                if self.circuit_breaker is not None:
-                    self.circuit_breaker.record_success()
-                return self._attach_retry_metadata(payload, attempts=attempt)
-            except (RateLimitError, APITimeoutError, APIConnectionError) as exc:
-                last_error = exc
-                retry_after = self._extract_retry_after(exc)
-                if self._should_retry(exc, attempt):
-                    # Don't record failure yet - we'll retry
-                    self._sleep_with_backoff(attempt, retry_after=retry_after)
-                    continue
-                # Retries exhausted - record final failure
-                if self.circuit_breaker is not None:
-                    self.circuit_breaker.record_failure()
-                break
-            except AnthropicError as exc:
-                duration_ms = (time.time() - start_time) * 1000
-                error_msg = self._redactor.redact(str(exc))
-                error_code = "rate_limit_error" if isinstance(exc, RateLimitError) else "llm_api_error"
-                # Non-retryable error or retries exhausted - record failure immediately
-                if self.circuit_breaker is not None:
-                    self.circuit_breaker.record_failure()
-                payload = {
-                    "success": False,
-                    "duration_ms": duration_ms,
-                    "stdout": "",
-                    "stderr": error_msg,
-                    "error": error_msg,
-                    "error_type": type(exc).__name__,
-                    "error_code": error_code,
-                }
-                return self._attach_retry_metadata(payload, attempts=attempt)
-            except OSError as exc:
-                last_error = exc
-                if self._should_retry(exc, attempt):
-                    # Don't record failure yet - we'll retry
-                    self._sleep_with_backoff(attempt)
-                    continue
-                # Retries exhausted - record final failure
-                if self.circuit_breaker is not None:
-                    self.circuit_breaker.record_failure()
-                break
-            except Exception as exc:  # Catch-all for other exceptions (including test mocks)
-                # Check if this looks like an API error with status_code
-                status_code = getattr(exc, "status_code", None)
-                if status_code is not None:
-                    # Treat as API error - check if retryable
-                    last_error = exc
-                    if self._should_retry(exc, attempt):
-                        # Don't record failure yet - we'll retry
-                        retry_after = self._extract_retry_after(exc)
-                        self._sleep_with_backoff(attempt, retry_after=retry_after)
-                        continue
-                    # Retries exhausted or non-retryable - record failure and return
-                    if self.circuit_breaker is not None:
-                        self.circuit_breaker.record_failure()
-                    duration_ms = (time.time() - start_time) * 1000
-                    error_msg = self._redactor.redact(str(exc))
-                    error_code = "llm_api_error"
-                    if status_code == 401:
-                        error_code = "authentication_error"
-                    elif status_code == 429:
-                        error_code = "rate_limit_error"
-                    elif status_code == 400:
-                        error_code = "invalid_request"
-                    payload = {
-                        "success": False,
-                        "duration_ms": duration_ms,
-                        "stdout": "",
-                        "stderr": error_msg,
-                        "error": error_msg,
-                        "error_type": type(exc).__name__,
-                        "error_code": error_code,
-                    }
-                    return self._attach_retry_metadata(payload, attempts=attempt)
-                # Not an API error - re-raise
-                raise
 
-        # All retries exhausted - record final failure and return error
-        if self.circuit_breaker is not None:
-            self.circuit_breaker.record_failure()
-        duration_ms = (time.time() - start_time) * 1000
-        fallback = self._redactor.redact(str(last_error)) if last_error else "Unknown error"
-        error_code = "llm_api_error"
-        if last_error:
-            status = getattr(last_error, "status_code", None)
-            if status == 429:
-                error_code = "rate_limit_error"
-            elif status == 500:
-                error_code = "server_error"
-        payload = {
-            "success": False,
-            "duration_ms": duration_ms,
-            "stdout": "",
-            "stderr": fallback,
-            "error": fallback,
-            "error_type": type(last_error).__name__ if last_error else "RuntimeError",
-            "error_code": error_code,
-        }
-        return self._attach_retry_metadata(payload, attempts=self.max_retries)
+        return {
+            "prompt": user_prompt,
+            "system_prompt": system_prompt,
+            "conversation_history": conversation_history,
+            "model": model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+        }, None
+
+    def _read_system_prompt(self, file_path: str) -> str:
+        """Return the prompt file's text (re-read only when its mtime changes), or ``file_path`` itself."""
+        try:
+            path_obj = Path(file_path)
+            mtime_ns = path_obj.stat().st_mtime_ns
+            cached = self._sysprompt_cache.get(file_path)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+            text = path_obj.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            # Not a readable file: the argument is the prompt text itself
+            return file_path
+        self._sysprompt_cache[file_path] = (mtime_ns, text)
+        return text
+
+    def _validation_error(self, message: str, code: str) -> Dict[str, Any]:
+        return self._error_payload(message, "ValidationError", code)
+
+    def _error_payload(
+        self,
+        message: str,
+        error_type: str,
+        error_code: str,
+        duration_ms: float = 0.0,
+        attempts: int = 0,
+    ) -> Dict[str, Any]:
+        """Build a failure payload from ``_ERROR_TEMPLATE`` with retry metadata attached."""
+        payload = self._ERROR_TEMPLATE.copy()
+        payload["duration_ms"] = duration_ms
+        payload["stderr"] = payload["error"] = message
+        payload["error_type"] = error_type
+        payload["error_code"] = error_code
+        return self._attach_retry_metadata(payload, attempts=attempts)
+
+    def _circuit_open_error(self, duration_ms: float, attempts: int) -> Dict[str, Any]:
+        stats = self.circuit_breaker.get_stats()
+        payload = self._error_payload(
+            f"Circuit breaker is {stats['state']}",
+            "CircuitBreakerOpenError",
+            "circuit_breaker_open",
+            duration_ms=duration_ms,
+            attempts=attempts,
+        )
+        payload["stderr"] = f"Circuit breaker is {stats['state']}. Service appears unavailable."
+        payload["circuit_breaker_state"] = stats["state"]
+        payload["next_attempt_time"] = stats["next_attempt_time"]
+        return payload
 
     def _call_llm(
         self,
@@ -365,20 +646,98 @@ class AnthropicExecutor(LLMExecutor):
         timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Make an Anthropic API call with optional conversation history."""
+        kwargs = self._build_request(
+            prompt,
+            system_prompt=system_prompt,
+            conversation_history=conversation_history,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+
+        cache_key: Optional[str] = None
+        if self.cache_enabled and kwargs["temperature"] == 0.0:
+            # Skip caching when the system prompt contains anything the redactor would mask
+            system = kwargs.get("system")
+            system_text = system[0]["text"] if isinstance(system, list) else system
+            if not system_text or self._redactor.redact(system_text) == system_text:
+                cache_key = _response_cache_key(kwargs)
+                with self._response_cache_lock:
+                    cached = self._response_cache.get(cache_key)
+                    if cached is not None:
+                        self._response_cache.move_to_end(cache_key)
+                        self._cache_stats["hits"] += 1
+                        return {**cached, "cost_usd": 0.0, "cache_hit": True}
+                    self._cache_stats["misses"] += 1
+
+        embedding = None
+        if self._semcache is not None and kwargs["temperature"] == 0.0 and not conversation_history:
+            # Redact before embedding so secrets never end up in the index
+            embedding = self._semcache.embed(
+                self._redactor.redact(prompt + "||" + (system_prompt or ""))
+            )
+            cached = self._semcache.lookup(embedding, namespace=kwargs["model"])
+            if cached is not None:
+                with self._response_cache_lock:
+                    self._cache_stats["semantic_hits"] += 1
+                return {**cached, "cost_usd": 0.0, "cache_hit": True}
+
+        if self.stream:
+            result = self._stream_llm(kwargs, timeout)
+        elif self.raw_response:
+            raw = self.client.with_raw_response.messages.create(**kwargs, timeout=timeout)
+            body = raw.content
+            data = orjson.loads(body) if orjson is not None else json.loads(body)
+            result = self._parse_response_data(data, kwargs["model"])
+        else:
+            response = self.client.messages.create(**kwargs, timeout=timeout)
+            result = self._parse_response(response, kwargs["model"])
+
+        if cache_key is not None:
+            with self._response_cache_lock:
+                self._response_cache[cache_key] = result
+                self._response_cache.move_to_end(cache_key)
+                while len(self._response_cache) > self._response_cache_size:
+                    self._response_cache.popitem(last=False)
+        if embedding is not None:
+            self._semcache.add(embedding, result, namespace=kwargs["model"])
+        return result
+
+    def _stream_llm(self, kwargs: Dict[str, Any], timeout: Optional[float]) -> Dict[str, Any]:
+        """Stream a response, forwarding text chunks to ``stream_callback`` as they arrive."""
+        callback = self.stream_callback
+        chunks: List[str] = []
+        with self.client.messages.stream(**kwargs, timeout=timeout) as stream:
+            for text in stream.text_stream:
+                chunks.append(text)
+                if callback is not None:
+                    callback(text)
+            final_message = stream.get_final_message()
+        result = self._parse_response(final_message, kwargs["model"])
+        result["content"] = "".join(chunks)
+        return result
+
+    def _build_request(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        conversation_history: Optional[List[Dict[str, str]]] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Build ``messages.create`` keyword arguments for a single request."""
         model = model or self.model
         max_tokens = max_tokens or self.max_tokens
         temperature = temperature if temperature is not None else self.temperature
 
         # Build messages list from conversation history + new user message
-        messages: List[Dict[str, str]] = []
-        
-        # Add conversation history
-        if conversation_history:
-            for msg in conversation_history:
-                if isinstance(msg, dict) and msg.get("role") in ("user", "assistant"):
-                    # Anthropic uses "user" and "assistant" roles
-                    messages.append(msg)
-        
+        history_messages, history_system = self._canonical_history(conversation_history)
+        messages: List[Dict[str, Any]] = list(history_messages)
+        if self.prompt_caching and messages:
+            # Mark the end of the stable history prefix as a cache breakpoint
+            messages[-1] = _with_cache_control(messages[-1])
+
         # Add new user message
         messages.append({"role": "user", "content": prompt})
 
@@ -388,53 +747,112 @@ class AnthropicExecutor(LLMExecutor):
             "temperature": temperature,
             "messages": messages,
         }
-        
+
         # System prompt (Anthropic supports separate system parameter)
-        final_system_prompt = system_prompt
-        if not final_system_prompt and conversation_history:
-            # Extract system prompt from history if present
-            for msg in conversation_history:
-                if isinstance(msg, dict) and msg.get("role") == "system":
-                    final_system_prompt = msg.get("content", "")
-                    break
-        
+        final_system_prompt = system_prompt or history_system
         if final_system_prompt:
-            kwargs["system"] = final_system_prompt
-
-        # Anthropic doesn't support seed, but we can set temperature to 0 for determinism
-        if self.seed is not None and temperature == 0.0:
-            # Temperature 0 should be deterministic
-            pass
-
-        response = self.client.messages.create(**kwargs, timeout=timeout)
-
+            if self.prompt_caching:
+                kwargs["system"] = [
+                    {
+                        "type": "text",
+                        "text": final_system_prompt,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ]
+            else:
+                kwargs["system"] = final_system_prompt
+
+        # Anthropic doesn't support seed; temperature 0 is the closest to deterministic
+        return kwargs
+
+    def _canonical_history(
+        self, conversation_history: Optional[List[Dict[str, Any]]]
+    ) -> Tuple[Tuple[Dict[str, Any], ...], Optional[str]]:
+        """Return the user/assistant turns and first system prompt of a history."""
+        if not conversation_history:
+            return (), None
+        messages: List[Dict[str, Any]] = []
+        system: Optional[str] = None
+        for msg in conversation_history:
+            if not isinstance(msg, dict):
+                continue
+            role = msg.get("role")
+            # Anthropic uses "user" and "assistant" roles
+            if role == "user" or role == "assistant":
+                messages.append(msg)
+            elif role == "system" and system is None:
+                system = msg.get("content", "")
+        return tuple(messages), system
+
+    def _parse_response(self, response: Any, model: str) -> Dict[str, Any]:
+        """Convert an Anthropic ``Message`` into the executor result dict."""
         # Handle empty or malformed responses
         content = ""
         if response.content:
-            # Anthropic returns content as a list of text blocks
-            text_blocks = [
-                block.text for block in response.content 
-                if hasattr(block, "text") and hasattr(block, "type") and block.type == "text"
-            ]
-            content = "".join(text_blocks)
+            # Anthropic returns typed content blocks; isinstance settles SDK blocks in
+            # one check and the type tag covers duck-typed ones (e.g. tool-use mixes)
+            content = "".join(
+                [
+                    block.text
+                    for block in response.content
+                    if isinstance(block, _TEXT_BLOCK_TYPES) or getattr(block, "type", None) == "text"
+                ]
+            )
 
         # Calculate tokens and cost (handle missing usage data)
-        if response.usage:
-            tokens_prompt = response.usage.input_tokens or 0
-            tokens_completion = response.usage.output_tokens or 0
-            tokens_total = tokens_prompt + tokens_completion
-        else:
-            tokens_prompt = tokens_completion = tokens_total = 0
+        usage = response.usage
+        if usage:
+            return self._build_result(
+                content,
+                model,
+                response.stop_reason,
+                usage.input_tokens or 0,
+                getattr(usage, "cache_creation_input_tokens", 0) or 0,
+                getattr(usage, "cache_read_input_tokens", 0) or 0,
+                usage.output_tokens or 0,
+            )
+        return self._build_result(content, model, response.stop_reason, 0, 0, 0, 0)
 
-        # Get pricing for model (fallback to claude-3-haiku if unknown)
-        model_pricing = self.pricing.get(
-            model, self.pricing.get("claude-3-haiku-20240307", {"prompt": 0.25, "completion": 1.25})
+    def _parse_response_data(self, data: Dict[str, Any], model: str) -> Dict[str, Any]:
+        """Convert a decoded Messages API JSON body into the executor result dict."""
+        content = "".join(
+            [block.get("text", "") for block in data.get("content") or () if block.get("type") == "text"]
         )
-        cost_usd = (tokens_prompt / 1_000_000 * model_pricing["prompt"]) + (
-            tokens_completion / 1_000_000 * model_pricing["completion"]
+        usage = data.get("usage") or {}
+        return self._build_result(
+            content,
+            model,
+            data.get("stop_reason"),
+            usage.get("input_tokens", 0) or 0,
+            usage.get("cache_creation_input_tokens", 0) or 0,
+            usage.get("cache_read_input_tokens", 0) or 0,
+            usage.get("output_tokens", 0) or 0,
         )
 
-        finish_reason = response.stop_reason or "end_turn"
+    def _build_result(
+        self,
+        content: str,
+        model: str,
+        stop_reason: Optional[str],
+        tokens_uncached: int,
+        tokens_cache_creation: int,
+        tokens_cache_read: int,
+        tokens_completion: int,
+    ) -> Dict[str, Any]:
+        # input_tokens excludes prompt-cache writes and reads, which are billed separately
+        tokens_prompt = tokens_uncached + tokens_cache_creation + tokens_cache_read
+        tokens_total = tokens_prompt + tokens_completion
+
+        # Get pricing for model (fallback to claude-3-haiku if unknown)
+        prompt_rate, completion_rate, write_rate, read_rate = self._rates_per_token.get(
+            model, self._default_rates
+        )
+        cost_usd = (
+            tokens_uncached * prompt_rate
+            + tokens_cache_creation * write_rate
+            + tokens_cache_read * read_rate
+            + tokens_completion * completion_rate
+        )
 
         return {
             "content": content,
@@ -442,6 +860,71 @@ class AnthropicExecutor(LLMExecutor):
             "tokens_completion": tokens_completion,
             "tokens_total": tokens_total,
             "cost_usd": cost_usd,
-            "finish_reason": finish_reason,
+            "finish_reason": stop_reason or "end_turn",
+            "tokens_cache_creation": tokens_cache_creation,
+            "tokens_cache_read": tokens_cache_read,
         }
 
+    def cache_stats(self) -> Dict[str, int]:
+        """Return response cache hit/miss counters and current size."""
+        with self._response_cache_lock:
+            return {**self._cache_stats, "size": len(self._response_cache)}
+
+
+def _estimate_input_tokens(
+    prompt: str,
+    system_prompt: Optional[str],
+    conversation_history: Optional[List[Dict[str, Any]]],
+    chars_per_token: float,
+) -> int:
+    """Cheap lower-bound style token estimate from character counts (no tokenizer round-trip)."""
+    chars = len(prompt) + len(system_prompt or "")
+    for msg in conversation_history or ():
+        if isinstance(msg, dict):
+            content = msg.get("content")
+            if isinstance(content, str):
+                chars += len(content)
+            elif isinstance(content, list):
+                chars += sum(len(block.get("text", "")) for block in content if isinstance(block, dict))
+    return int(chars / max(chars_per_token, 1.0))
+
+
+def _per_token_rates(prices: Dict[str, float]) -> Tuple[float, float, float, float]:
+    """Convert per-1M-token prices into per-token (prompt, completion, cache_write, cache_read)."""
+    prompt = float(prices.get("prompt", 0.0))
+    return (
+        prompt / 1_000_000,
+        float(prices.get("completion", 0.0)) / 1_000_000,
+        float(prices.get("cache_write", prompt * 1.25)) / 1_000_000,
+        float(prices.get("cache_read", prompt * 0.1)) / 1_000_000,
+    )
+
+
+def _response_cache_key(request: Dict[str, Any]) -> str:
+    """Hash the canonical JSON form of a request (model, system, messages, limits)."""
+    canonical = json.dumps(
+        {
+            "model": request.get("model"),
+            "system": request.get("system"),
+            "messages": request.get("messages"),
+            "max_tokens": request.get("max_tokens"),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _with_cache_control(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of ``message`` whose content carries an ephemeral cache breakpoint."""
+    content = message.get("content")
+    if isinstance(content, str):
+        blocks: List[Dict[str, Any]] = [{"type": "text", "text": content}]
+    elif isinstance(content, list) and content and isinstance(content[-1], dict):
+        blocks = [dict(block) for block in content]
+    else:
+        return message
+    blocks[-1]["cache_control"] = {"type": "ephemeral"}
+    return {**message, "content": blocks}
+
@@ -5,27 +5,80 @@ Requires `kubernetes` package: `pip install kubernetes`
 
 from __future__ import annotations
 
+import threading
 import time
 import uuid
 import json
 import base64
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import Executor
 
 try:
-    from kubernetes import client, config, watch
+    import orjson
+except ImportError:  # pragma: no cover - optional fast JSON encoder
+    orjson = None  # type: ignore
+
+# The kubernetes client is large; it is imported on first executor construction.
+K8S_AVAILABLE = False
+client: Any = None
+watch: Any = None
+k8s_config: Any = None
+k8s_stream: Any = None
+ApiException: Any = Exception
+
+
+def _load_kubernetes() -> bool:
+    """Import the kubernetes client once and bind its modules; False if it is missing."""
+    global K8S_AVAILABLE, client, watch, k8s_config, k8s_stream, ApiException
+    if K8S_AVAILABLE:
+        return True
+    try:
+        from kubernetes import client as k8s_client, watch as k8s_watch
+        from kubernetes import config as kube_config
+        from kubernetes.client.rest import ApiException as k8s_api_exception
+        from kubernetes.stream import stream as kube_stream
+    except ImportError:
+        return False
+    client, watch, k8s_config = k8s_client, k8s_watch, kube_config
+    k8s_stream, ApiException = kube_stream, k8s_api_exception
     K8S_AVAILABLE = True
-except ImportError:
-    K8S_AVAILABLE = False
-    client = None  # type: ignore
-    config = None  # type: ignore
-    watch = None  # type: ignore
+    return True
 
-from ..sandbox.plugins import ExecutorBase
 
 logger = logging.getLogger(__name__)
 
-class KubernetesExecutor(ExecutorBase):
+# Job names per delete_collection call; keeps the set-based label selector short
+_REAP_BATCH = 100
+
+# Entry point mounted into warm pool pods. The request arrives as one base64 line
+# on stdin: argv is capped at 128 KiB per element, and reading a single line
+# means no stdin half-close is needed over the exec websocket.
+_POOL_RUNNER = """\
+import base64, json, sys
+request = json.loads(base64.b64decode(sys.stdin.readline()))
+scope = {"__name__": "metaguard_target"}
+exec(compile(request["source"], request["filename"], "exec"), scope)
+result = scope[request["func_name"]](*request["args"])
+sys.stdout.write("\\n" + json.dumps({"result": result}, default=repr))
+"""
+
+# Default Job entry point, run with ``python -c`` so any image with a Python
+# interpreter works; the call arrives in the MG_PAYLOAD env var.
+_JOB_RUNNER = """\
+import base64, json, os, sys
+request = json.loads(base64.b64decode(os.environ["MG_PAYLOAD"]))
+if request.get("source") is None:
+    sys.exit("metaguard: could not read " + str(request.get("file_path")))
+scope = {"__name__": "metaguard_target"}
+exec(compile(request["source"], request["file_path"], "exec"), scope)
+result = scope[request["func_name"]](*request["args"])
+sys.stdout.write("\\n" + json.dumps({"result": result}, default=repr) + "\\n")
+"""
+
+
+class KubernetesExecutor(Executor):
     """
     Executes tasks as Kubernetes Jobs.
     
@@ -39,22 +92,201 @@ class KubernetesExecutor(ExecutorBase):
         ttl_seconds_after_finished: Cleanup delay (default: 60)
         service_account_name: SA to run as
         image_pull_secrets: List of secret names
+        pool_size: Warm pods to keep for exec-based calls (default: 0, one Job per call)
+        pool_name: Deployment/ConfigMap name for the warm pool (default: metaguard-pool)
+        job_command: Container command for Job runs (default: an inline ``python -c`` runner).
+            A custom runner reads the call from the MG_PAYLOAD env var
+            (base64 JSON with func_name, args, file_path and source) and
+            prints ``{"result": ...}`` as its last stdout line.
+        reap_jobs: Delete finished Jobs in bulk from a background thread (default: False).
+            Only Jobs created by this executor whose logs it has already read are
+            deleted; everything else is left to ``ttl_seconds_after_finished``.
+        reap_interval_s: Seconds between reaper sweeps (default: max(ttl_seconds_after_finished, 30))
     """
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config or {})
-        if not K8S_AVAILABLE:
+        if not _load_kubernetes():
             raise ImportError("kubernetes package is required. Install with `pip install kubernetes`.")
         
         # Try to load in-cluster config, fallback to kubeconfig
         try:
-            config.load_incluster_config()
-        except config.ConfigException:
-            config.load_kube_config()
+            k8s_config.load_incluster_config()
+        except k8s_config.ConfigException:
+            k8s_config.load_kube_config()
             
         self.batch_v1 = client.BatchV1Api()
         self.core_v1 = client.CoreV1Api()
 
+        self.pool_size = int(self.config.get("pool_size", 0))
+        self.pool_name = self.config.get("pool_name", "metaguard-pool")
+        self._pool_cursor = 0
+        if self.pool_size > 0:
+            self._ensure_pool()
+
+        # One delete_collection per tick instead of a delete per call keeps apiserver
+        # and etcd write load flat no matter how many Jobs a run creates. Jobs carry
+        # this executor's id so concurrent runs in a namespace never reap each other's
+        self._executor_id = uuid.uuid4().hex[:12]
+        self._reap_lock = threading.Lock()
+        self._reapable: List[str] = []
+        self._reaper_stop = threading.Event()
+        self._reaper: Optional[threading.Thread] = None
+        if self.config.get("reap_jobs", False):
+            interval = float(
+                self.config.get(
+                    "reap_interval_s", max(int(self.config.get("ttl_seconds_after_finished", 60)), 30)
+                )
+            )
+            self._reaper = threading.Thread(
+                target=self._reap_jobs, args=(interval,), name="metaguard-k8s-reaper", daemon=True
+            )
+            self._reaper.start()
+
+    def _reap_jobs(self, interval: float) -> None:
+        """Periodically delete the Jobs whose results have been collected."""
+        while not self._reaper_stop.wait(interval):
+            self._reap_once()
+
+    def _reap_once(self) -> None:
+        """Delete this executor's read Jobs with one label-selected call per batch."""
+        with self._reap_lock:
+            names, self._reapable = self._reapable, []
+        namespace = self.config.get("namespace", "default")
+        for offset in range(0, len(names), _REAP_BATCH):
+            batch = names[offset : offset + _REAP_BATCH]
+            try:
+                self.batch_v1.delete_collection_namespaced_job(
+                    namespace=namespace,
+                    label_selector=(
+                        f"metaguard-executor={self._executor_id},metaguard-job in ({','.join(batch)})"
+                    ),
+                    propagation_policy="Background",
+                )
+            except Exception:
+                logger.warning("K8s job reaper sweep failed", exc_info=True)
+                with self._reap_lock:
+                    self._reapable.extend(batch)
+
+    def close(self) -> None:
+        """Stop the background Job reaper after a final sweep."""
+        self._reaper_stop.set()
+        if self._reaper is not None:
+            self._reaper.join(timeout=5.0)
+            self._reaper = None
+            self._reap_once()
+
+    def _ensure_pool(self) -> None:
+        """Create the runner ConfigMap and warm pod Deployment if they do not exist."""
+        namespace = self.config.get("namespace", "default")
+        config_map = client.V1ConfigMap(
+            metadata=client.V1ObjectMeta(name=self.pool_name),
+            data={"runner.py": _POOL_RUNNER},
+        )
+        container = client.V1Container(
+            name="worker",
+            image=self.config.get("image", "python:3.11-slim"),
+            command=["sleep", "infinity"],
+            volume_mounts=[client.V1VolumeMount(name="runner", mount_path="/code")],
+            resources=client.V1ResourceRequirements(
+                requests={"cpu": self.config.get("cpu_request", "100m"), "memory": self.config.get("mem_request", "256Mi")},
+                limits={"cpu": self.config.get("cpu_limit", "1"), "memory": self.config.get("mem_limit", "512Mi")},
+            ),
+        )
+        labels = {"app": self.pool_name}
+        deployment = client.V1Deployment(
+            metadata=client.V1ObjectMeta(name=self.pool_name, labels=labels),
+            spec=client.V1DeploymentSpec(
+                replicas=self.pool_size,
+                selector=client.V1LabelSelector(match_labels=labels),
+                template=client.V1PodTemplateSpec(
+                    metadata=client.V1ObjectMeta(labels=labels),
+                    spec=client.V1PodSpec(
+                        containers=[container],
+                        volumes=[
+                            client.V1Volume(
+                                name="runner",
+                                config_map=client.V1ConfigMapVolumeSource(name=self.pool_name),
+                            )
+                        ],
+                    ),
+                ),
+            ),
+        )
+        try:
+            self.core_v1.create_namespaced_config_map(namespace=namespace, body=config_map)
+        except ApiException as exc:
+            if getattr(exc, "status", None) != 409:
+                raise
+            # Keep an existing pool's runner in step with the request format sent below
+            self.core_v1.replace_namespaced_config_map(name=self.pool_name, namespace=namespace, body=config_map)
+        try:
+            client.AppsV1Api().create_namespaced_deployment(namespace=namespace, body=deployment)
+        except ApiException as exc:
+            if getattr(exc, "status", None) != 409:  # already exists
+                raise
+
+    def _execute_in_pool(
+        self, file_path: str, func_name: str, args: tuple, timeout_s: float
+    ) -> Dict[str, Any]:
+        """Run the call by exec'ing the mounted runner in a warm pool pod."""
+        namespace = self.config.get("namespace", "default")
+        start = time.perf_counter()
+        pods = self.core_v1.list_namespaced_pod(
+            namespace,
+            label_selector=f"app={self.pool_name}",
+            field_selector="status.phase=Running",
+        ).items
+        if not pods:
+            return {
+                "success": False,
+                "error": "No running pods in warm pool",
+                "duration_ms": (time.perf_counter() - start) * 1000,
+            }
+        pod = pods[self._pool_cursor % len(pods)]
+        self._pool_cursor += 1
+
+        with open(file_path, "r", encoding="utf-8") as handle:
+            source = handle.read()
+        request = base64.b64encode(
+            json.dumps(
+                {"source": source, "filename": file_path, "func_name": func_name, "args": list(args)}
+            ).encode("utf-8")
+        ).decode("ascii")
+
+        resp = k8s_stream(
+            self.core_v1.connect_get_namespaced_pod_exec,
+            pod.metadata.name,
+            namespace,
+            container="worker",
+            command=["python", "/code/runner.py"],
+            stderr=True,
+            stdin=True,
+            stdout=True,
+            tty=False,
+            _preload_content=False,
+        )
+        try:
+            resp.write_stdin(request + "\n")
+            resp.run_forever(timeout=timeout_s)
+            stdout = resp.read_stdout() or ""
+            stderr = resp.read_stderr() or ""
+            returncode = resp.returncode
+        finally:
+            resp.close()
+
+        duration_ms = (time.perf_counter() - start) * 1000
+        if returncode is None:
+            return {"success": False, "error": "Pod exec timed out", "stdout": stdout, "stderr": stderr, "duration_ms": duration_ms}
+        if returncode != 0:
+            return {"success": False, "error": "Pod exec failed", "stdout": stdout, "stderr": stderr, "duration_ms": duration_ms}
+        output, _, last_line = stdout.rpartition("\n")
+        try:
+            result = json.loads(last_line)["result"]
+        except (ValueError, KeyError):
+            return {"success": False, "error": "Malformed runner output", "stdout": stdout, "stderr": stderr, "duration_ms": duration_ms}
+        return {"success": True, "stdout": output, "stderr": stderr, "duration_ms": duration_ms, "result": result}
+
     def execute(
         self,
         file_path: str,
@@ -63,36 +295,33 @@ class KubernetesExecutor(ExecutorBase):
         timeout_s: float = 30.0,
         mem_mb: int = 512,
     ) -> Dict[str, Any]:
-        # Note: file_path is local. In a real distributed setting, 
-        # code must be available in the image or mounted.
-        # For this plugin, we assume the code is self-contained or
-        # the image already contains the necessary modules.
-        # We'll try to pass the function call payload.
-        
+        if self.pool_size > 0:
+            try:
+                return self._execute_in_pool(file_path, func_name, args, timeout_s)
+            except Exception as e:
+                logger.exception("K8s pool execution failed")
+                return {"success": False, "error": str(e), "duration_ms": 0}
+
         job_name = f"metaguard-{uuid.uuid4().hex[:8]}"
         namespace = self.config.get("namespace", "default")
         image = self.config.get("image", "python:3.11-slim")
-        
-        # Prepare payload
-        payload = {
-            "func_name": func_name,
-            "args": args,
-            # We can't easily send file_path content unless we read it
-        }
-        # In a real implementation, we'd serialize the function and dependencies
-        # For now, we'll simulate a command that runs python
-        
-        # Construct the Job object
-        # This is a simplified example. In production, you'd mount code via ConfigMap
-        # or assume it's present.
-        
-        # We'll use a simple "sleep" placeholder or a command that accepts input
-        # to demonstrate the Job structure.
-        
+
+        # file_path is local, so ship its source with the call; the payload travels
+        # in an env var, avoiding a ConfigMap create + mount per Job
+        try:
+            with open(file_path, "r", encoding="utf-8") as handle:
+                source: Optional[str] = handle.read()
+        except OSError:
+            source = None
+        payload_b64 = _encode_payload(
+            {"func_name": func_name, "args": list(args), "file_path": file_path, "source": source}
+        )
+
         container = client.V1Container(
             name="worker",
             image=image,
-            command=["python", "-c", "print('Kubernetes executor placeholder: Code sync required')"],
+            command=list(self.config.get("job_command", ["python", "-c", _JOB_RUNNER])),
+            env=[client.V1EnvVar(name="MG_PAYLOAD", value=payload_b64)],
             resources=client.V1ResourceRequirements(
                 requests={"cpu": self.config.get("cpu_request", "100m"), "memory": f"{mem_mb}Mi"},
                 limits={"cpu": self.config.get("cpu_limit", "1"), "memory": f"{mem_mb}Mi"}
@@ -116,7 +345,14 @@ class KubernetesExecutor(ExecutorBase):
         job = client.V1Job(
             api_version="batch/v1",
             kind="Job",
-            metadata=client.V1ObjectMeta(name=job_name),
+            metadata=client.V1ObjectMeta(
+                name=job_name,
+                labels={
+                    "app": "metaguard-worker",
+                    "metaguard-executor": self._executor_id,
+                    "metaguard-job": job_name,
+                },
+            ),
             spec=spec
         )
         
@@ -124,39 +360,59 @@ class KubernetesExecutor(ExecutorBase):
             self.batch_v1.create_namespaced_job(body=job, namespace=namespace)
             logger.info(f"Created K8s job {job_name}")
             
-            # Wait for completion (simplistic polling)
-            start = time.time()
-            while time.time() - start < timeout_s:
-                j = self.batch_v1.read_namespaced_job(job_name, namespace)
-                if j.status.succeeded:
-                    # Get logs
-                    pods = self.core_v1.list_namespaced_pod(
-                        namespace, label_selector=f"job-name={job_name}"
-                    )
-                    logs = ""
-                    if pods.items:
-                        logs = self.core_v1.read_namespaced_pod_log(pods.items[0].metadata.name, namespace)
-                    
-                    return {
-                        "success": True,
-                        "stdout": logs,
-                        "stderr": "",
-                        "duration_ms": (time.time() - start) * 1000,
-                        "result": None # Placeholder
-                    }
-                if j.status.failed:
-                    return {
-                        "success": False,
-                        "error": "Job failed",
-                        "duration_ms": (time.time() - start) * 1000
-                    }
-                time.sleep(1)
-            
+            # Stream job status changes instead of polling once a second
+            start = time.perf_counter()
+            final_job = None
+            job_watch = watch.Watch()
+            try:
+                for event in job_watch.stream(
+                    self.batch_v1.list_namespaced_job,
+                    namespace=namespace,
+                    field_selector=f"metadata.name={job_name}",
+                    timeout_seconds=max(1, int(timeout_s)),
+                ):
+                    j = event["object"]
+                    if j.status and (j.status.succeeded or j.status.failed):
+                        final_job = j
+                        break
+                    if time.perf_counter() - start >= timeout_s:
+                        break
+            finally:
+                job_watch.stop()
+
+            if final_job is not None and final_job.status.succeeded:
+                # Get logs
+                pods = self.core_v1.list_namespaced_pod(
+                    namespace, label_selector=f"job-name={job_name}"
+                )
+                logs = ""
+                if pods.items:
+                    logs = self.core_v1.read_namespaced_pod_log(pods.items[0].metadata.name, namespace)
+
+                if self._reaper is not None:
+                    with self._reap_lock:
+                        self._reapable.append(job_name)
+
+                output, result = _split_runner_output(logs)
+                return {
+                    "success": True,
+                    "stdout": output,
+                    "stderr": "",
+                    "duration_ms": (time.perf_counter() - start) * 1000,
+                    "result": result,
+                }
+            if final_job is not None:
+                return {
+                    "success": False,
+                    "error": "Job failed",
+                    "duration_ms": (time.perf_counter() - start) * 1000
+                }
+
             # Timeout
             return {
                 "success": False,
                 "error": "Job timed out",
-                "duration_ms": (time.time() - start) * 1000
+                "duration_ms": (time.perf_counter() - start) * 1000
             }
             
         except Exception as e:
@@ -166,7 +422,21 @@ class KubernetesExecutor(ExecutorBase):
                 "error": str(e),
                 "duration_ms": 0
             }
-        finally:
-            # Cleanup if needed
-            pass
 
+
+def _encode_payload(payload: Dict[str, Any]) -> str:
+    """Base64-encode the JSON call payload (orjson when available)."""
+    if orjson is not None:
+        raw = orjson.dumps(payload, default=repr)
+    else:
+        raw = json.dumps(payload, default=repr).encode("utf-8")
+    return base64.b64encode(raw).decode("ascii")
+
+
+def _split_runner_output(logs: str) -> Tuple[str, Any]:
+    """Split runner logs into (stdout, result); result is None without a trailing result line."""
+    output, _, last_line = logs.rstrip("\n").rpartition("\n")
+    try:
+        return output, json.loads(last_line)["result"]
+    except (ValueError, KeyError, TypeError):
+        return logs, None
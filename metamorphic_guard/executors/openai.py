@@ -4,14 +4,24 @@ OpenAI API executor for LLM calls.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import tempfile
+import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from pathlib import Path
+from types import SimpleNamespace
 
-from .__init__ import LLMExecutor
+from .__init__ import LLMExecutor, _STATUS_TO_CODE
 from .circuit_breaker import CircuitBreakerOpenError
 from ..errors import ExecutorError
 from ..redaction import get_redactor
+from .prompt_cache import PromptCache
+from .semantic_cache import SemanticCache
 
 try:
     import openai
@@ -45,6 +55,14 @@ else:  # pragma: no cover - fallback when openai unavailable
         pass
 
 
+# Models served by the legacy ``completions`` endpoint, which accepts a list of prompts
+_LEGACY_COMPLETION_PREFIXES = ("gpt-3.5-turbo-instruct", "davinci-", "babbage-")
+
+# Process-wide clients for ``shared_client`` executors, keyed by (client class, api_key, base_url)
+_SHARED_CLIENTS: Dict[Tuple[Any, str, Optional[str]], Any] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
 class OpenAIExecutor(LLMExecutor):
     """Executor that calls OpenAI API."""
 
@@ -63,13 +81,25 @@ class OpenAIExecutor(LLMExecutor):
 
         self.api_key = config.get("api_key") if config else None
         if not self.api_key:
-            import os
-
             self.api_key = os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key required (config['api_key'] or OPENAI_API_KEY env var)")
 
-        self.client = openai.OpenAI(api_key=self.api_key)
+        self.base_url = self.config.get("base_url")
+        if self.config.get("shared_client"):
+            # One client (and socket pool) for every executor with the same credentials and
+            # endpoint; it outlives the executor, so close() leaves it alone
+            self._httpx_client = None
+            key = (openai.OpenAI, self.api_key, self.base_url)
+            with _SHARED_CLIENTS_LOCK:
+                if key not in _SHARED_CLIENTS:
+                    _SHARED_CLIENTS[key] = self._make_client(self._build_http_client())
+                self.client = _SHARED_CLIENTS[key]
+        else:
+            # Long-lived pooled transport so retries and successive calls reuse keep-alive sockets
+            self._httpx_client = self._build_http_client()
+            self.client = self._make_client(self._httpx_client)
+        self._async_client: Any = None
         # Pricing per 1K tokens (approximate, as of 2024 - verify current rates)
         default_pricing = {
             "gpt-4": {"prompt": 0.03, "completion": 0.06},
@@ -88,10 +118,509 @@ class OpenAIExecutor(LLMExecutor):
                         "prompt": float(base_prompt) if base_prompt is not None else base.get("prompt", 0.0),
                         "completion": float(base_completion) if base_completion is not None else base.get("completion", 0.0),
                     }
+                    if model_prices.get("cached_prompt") is not None:
+                        merged[model_name]["cached_prompt"] = float(model_prices["cached_prompt"])
             self.pricing = merged
         else:
             self.pricing = default_pricing
         self._redactor = get_redactor(config)
+        # Opt-in exact-match cache checked before any network call (and before the semantic cache)
+        self._prompt_cache: Optional[PromptCache] = None
+        if self.config.get("exact_cache"):
+            cache_dir = self.config.get("cache_dir")
+            self._prompt_cache = PromptCache(
+                os.path.join(cache_dir, "openai_prompt_cache.sqlite3") if cache_dir else None
+            )
+        # Opt-in embedding cache: near-duplicate user prompts under the same model and
+        # system prompt reuse a prior response instead of a network round trip
+        semantic_cfg = self.config.get("semantic_cache") or {}
+        self._semcache: Optional[SemanticCache] = None
+        if semantic_cfg.get("enabled"):
+            cache_dir = semantic_cfg.get("cache_dir") or self.config.get("cache_dir")
+            self._semcache = SemanticCache(
+                embedder=semantic_cfg["embedder"],
+                threshold=float(semantic_cfg.get("threshold", self.config.get("cache_threshold", 0.92))),
+                max_size=int(semantic_cfg.get("max_size", 10000)),
+                persist_path=os.path.join(cache_dir, "openai_semantic_cache.jsonl") if cache_dir else None,
+            )
+        # Optional background ping; ``healthy`` reflects the latest result
+        self.healthy = True
+        self._health_stop = threading.Event()
+        self._health_thread: Optional[threading.Thread] = None
+        health_interval = self.config.get("health_check_interval_s")
+        if health_interval:
+            self._health_thread = threading.Thread(
+                target=self._health_loop,
+                args=(float(health_interval),),
+                name="metaguard-openai-health",
+                daemon=True,
+            )
+            self._health_thread.start()
+
+    @property
+    def pricing(self) -> Dict[str, Dict[str, float]]:
+        """Per-1K-token prices by model; assigning a new table refreshes the per-token rates."""
+        return self._pricing
+
+    @pricing.setter
+    def pricing(self, value: Dict[str, Dict[str, float]]) -> None:
+        self._pricing = value
+        # (prompt, cached prompt, completion) USD per token, so costing a call is three multiplies
+        self._rates = {
+            model: (
+                prices["prompt"] * 1e-3,
+                prices.get("cached_prompt", prices["prompt"] * 0.5) * 1e-3,
+                prices["completion"] * 1e-3,
+            )
+            for model, prices in value.items()
+        }
+        # Unknown models are priced as gpt-3.5-turbo
+        self._default_rate = self._rates.get("gpt-3.5-turbo", (1.5e-6, 0.75e-6, 2e-6))
+
+    def _make_client(self, http_client: Any) -> Any:
+        kwargs: Dict[str, Any] = {"api_key": self.api_key}
+        if self.base_url:
+            kwargs["base_url"] = self.base_url
+        if http_client is not None:
+            kwargs["http_client"] = http_client
+        return openai.OpenAI(**kwargs)
+
+    def _build_http_client(self) -> Any:
+        """Create the pooled httpx client, or None when disabled or the SDK lacks the hook."""
+        client_cls = getattr(openai, "DefaultHttpxClient", None)
+        if client_cls is None or not self.config.get("http_pool", True):
+            return None
+        import httpx
+
+        return client_cls(limits=self._http_limits(), timeout=httpx.Timeout(60.0, connect=10.0))
+
+    def _http_limits(self) -> Any:
+        """Pool limits whose keep-alive outlasts the longest retry backoff."""
+        import httpx
+
+        # Idle sockets must survive a full backoff sleep or every retry pays a new TLS handshake
+        keepalive_expiry = max(30.0, 2 * self.retry_backoff_cap)
+        return httpx.Limits(
+            max_keepalive_connections=int(self.config.get("max_keepalive", 20)),
+            max_connections=int(self.config.get("max_connections", 100)),
+            keepalive_expiry=float(self.config.get("keepalive_expiry", keepalive_expiry)),
+        )
+
+    def _drop_pooled_connections(self) -> None:
+        """Close idle pooled sockets so a retry after a connection error dials fresh."""
+        transport = getattr(self._httpx_client, "_transport", None)
+        pool = getattr(transport, "_pool", None)
+        if pool is None or not hasattr(pool, "close"):
+            return
+        try:
+            pool.close()
+        except Exception:
+            pass  # best effort: the SDK will still open a new connection if needed
+
+    def health_check(self) -> bool:
+        """Return True when ``GET /v1/models`` succeeds (also keeps pooled sockets warm)."""
+        try:
+            self.client.models.list()
+        except Exception:
+            return False
+        return True
+
+    def _health_loop(self, interval: float) -> None:
+        while not self._health_stop.wait(interval):
+            self.healthy = self.health_check()
+
+    def close(self) -> None:
+        """Stop the health checker and close pooled connections and the prompt cache (sync resources only)."""
+        self._health_stop.set()
+        if self._health_thread is not None:
+            self._health_thread.join(timeout=5.0)
+            self._health_thread = None
+        if self._httpx_client is not None:
+            self._httpx_client.close()
+            self._httpx_client = None
+        if self._prompt_cache is not None:
+            self._prompt_cache.close()
+            self._prompt_cache = None
+
+    async def aclose(self) -> None:
+        """Close the sync pool and the async client, if one was created."""
+        self.close()
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    @property
+    def async_client(self) -> Any:
+        """Lazily created ``AsyncOpenAI`` client (bound to the first event loop that uses it)."""
+        if self._async_client is None:
+            kwargs: Dict[str, Any] = {"api_key": self.api_key}
+            if self.base_url:
+                kwargs["base_url"] = self.base_url
+            client_cls = getattr(openai, "DefaultAsyncHttpxClient", None)
+            if client_cls is not None and self.config.get("http_pool", True):
+                import httpx
+
+                kwargs["http_client"] = client_cls(
+                    limits=self._http_limits(), timeout=httpx.Timeout(60.0, connect=10.0)
+                )
+            self._async_client = openai.AsyncOpenAI(**kwargs)
+        return self._async_client
+
+    async def aexecute_many(
+        self,
+        requests: Sequence[Tuple[str, str, tuple]],
+        timeout_s: float = 30.0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute independent ``(file_path, func_name, args)`` requests concurrently.
+
+        Uses ``openai.AsyncOpenAI`` with at most ``max_concurrency``
+        (default 16) requests in flight. Results are returned in request order.
+        """
+        semaphore = asyncio.Semaphore(max(1, int(self.config.get("max_concurrency", 16))))
+
+        async def _run(file_path: str, func_name: str, args: tuple) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.aexecute(file_path, func_name, args, timeout_s)
+
+        return list(await asyncio.gather(*(_run(*request) for request in requests)))
+
+    def execute_many(
+        self,
+        file_path: str,
+        func_name: str,
+        prompts: Sequence[str],
+        timeout_s: float = 30.0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute one call per prompt with shared ``file_path`` (system prompt) and model.
+
+        Legacy completion models receive up to ``batch_size`` (default 32) prompts
+        per HTTP request; chat models fan out concurrently via ``aexecute_many``.
+        Results are returned in prompt order with the same shape as ``execute``.
+        """
+        model = func_name if func_name else self.model
+        if isinstance(model, str) and model.startswith(_LEGACY_COMPLETION_PREFIXES):
+            return self._complete_many(file_path, model, prompts, timeout_s)
+
+        requests = [(file_path, func_name, (prompt,)) for prompt in prompts]
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Already inside an event loop: asyncio.run is unavailable, so stay sequential
+            return [self.execute(*request, timeout_s=timeout_s) for request in requests]
+
+        async def _run() -> List[Dict[str, Any]]:
+            try:
+                return await self.aexecute_many(requests, timeout_s)
+            finally:
+                # The async client is bound to this loop; drop it before the loop closes
+                client, self._async_client = self._async_client, None
+                if client is not None and hasattr(client, "close"):
+                    await client.close()
+
+        return asyncio.run(_run())
+
+    def batch_execute(
+        self,
+        requests: Sequence[Tuple[str, str, tuple]],
+        timeout_s: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run many ``(file_path, func_name, args)`` requests through the Batch API.
+
+        Requests are uploaded as one JSONL file and completed within the 24h
+        window at half the token price, so this suits large, non-urgent sweeps.
+        Results are returned in request order with the same shape as ``execute``.
+        """
+        start_time = time.perf_counter()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        calls: Dict[int, Dict[str, Any]] = {}
+        lines: List[str] = []
+        for index, (file_path, func_name, args) in enumerate(requests):
+            call, validation_error = self._prepare_call(file_path, func_name, args)
+            if validation_error is not None:
+                results[index] = validation_error
+                continue
+            calls[index] = call
+            body = self._build_request(**call)
+            lines.append(
+                json.dumps(
+                    {"custom_id": f"req-{index}", "method": "POST", "url": "/v1/chat/completions", "body": body}
+                )
+            )
+
+        if lines:
+            with tempfile.NamedTemporaryFile("w", suffix=".jsonl", encoding="utf-8", delete=False) as handle:
+                handle.write("\n".join(lines) + "\n")
+                path = handle.name
+            try:
+                with open(path, "rb") as upload:
+                    input_file = self.client.files.create(file=upload, purpose="batch")
+            finally:
+                os.unlink(path)
+            batch = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            timeout_s = timeout_s if timeout_s is not None else float(
+                self.config.get("batch_timeout_s", 24 * 3600)
+            )
+            poll_interval = float(self.config.get("batch_poll_interval", 5.0))
+            poll_cap = float(self.config.get("batch_poll_cap", 60.0))
+            deadline = start_time + timeout_s
+            attempt = 0
+            while True:
+                batch = self.client.batches.retrieve(batch.id)
+                if batch.status in ("completed", "failed", "expired", "cancelled"):
+                    break
+                if time.perf_counter() >= deadline:
+                    self.client.batches.cancel(batch.id)
+                    break
+                time.sleep(min(poll_cap, poll_interval * (2 ** attempt)))
+                attempt += 1
+
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            discount = float(self.config.get("batch_discount", 0.5))
+            for file_id in (getattr(batch, "output_file_id", None), getattr(batch, "error_file_id", None)):
+                if not file_id:
+                    continue
+                for line in self.client.files.content(file_id).text.splitlines():
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    index = int(str(entry["custom_id"]).rsplit("-", 1)[-1])
+                    response = entry.get("response") or {}
+                    if response.get("status_code") == 200 and not entry.get("error"):
+                        parsed = self._parse_response(_as_namespace(response["body"]), calls[index]["model"])
+                        parsed["cost_usd"] *= discount
+                        results[index] = self._attach_retry_metadata(
+                            self._success_payload(parsed, duration_ms, calls[index]), attempts=0
+                        )
+                    else:
+                        error = entry.get("error") or (response.get("body") or {}).get("error")
+                        message = self._redactor.redact(str(error or "Batch request failed"))
+                        results[index] = self._attach_retry_metadata(
+                            {
+                                "success": False,
+                                "duration_ms": duration_ms,
+                                "stdout": "",
+                                "stderr": message,
+                                "error": message,
+                                "error_type": "BatchRequestError",
+                                "error_code": "batch_errored",
+                            },
+                            attempts=0,
+                        )
+
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        for index, payload in enumerate(results):
+            if payload is None:
+                message = "Batch did not return a result before the timeout"
+                results[index] = self._attach_retry_metadata(
+                    {
+                        "success": False,
+                        "duration_ms": duration_ms,
+                        "stdout": "",
+                        "stderr": message,
+                        "error": message,
+                        "error_type": "TimeoutError",
+                        "error_code": "batch_timeout",
+                    },
+                    attempts=0,
+                )
+        return results  # type: ignore[return-value]
+
+    def _complete_many(
+        self, file_path: str, model: str, prompts: Sequence[str], timeout_s: float
+    ) -> List[Dict[str, Any]]:
+        """Send prompts through the legacy completions endpoint, several per request."""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(prompts)
+        pending: List[Tuple[int, Dict[str, Any]]] = []
+        for index, prompt in enumerate(prompts):
+            call, validation_error = self._prepare_call(file_path, model, (prompt,))
+            if validation_error is not None:
+                results[index] = validation_error
+            else:
+                pending.append((index, call))
+
+        batch_size = max(1, int(self.config.get("batch_size", 32)))
+        for offset in range(0, len(pending), batch_size):
+            chunk = pending[offset : offset + batch_size]
+            texts = [
+                f"{call['system_prompt']}\n\n{call['prompt']}" if call["system_prompt"] else call["prompt"]
+                for _, call in chunk
+            ]
+            start_time = time.perf_counter()
+            last_error: Optional[Exception] = None
+            response = None
+            circuit_open = False
+            attempt = 0
+            # One request per chunk goes through the breaker exactly as one execute() call does
+            for attempt in range(self.max_retries + 1):
+                if self.circuit_breaker is not None and not self.circuit_breaker.allow_request():
+                    circuit_open = True
+                    break
+                try:
+                    response = self.client.completions.create(
+                        model=model,
+                        prompt=texts,
+                        max_tokens=self.max_tokens,
+                        temperature=self.temperature,
+                        timeout=timeout_s,
+                    )
+                    break
+                except Exception as exc:
+                    last_error = exc
+                    if not self._should_retry(exc, attempt):
+                        break
+                    if isinstance(exc, APIConnectionError) and not isinstance(exc, APITimeoutError):
+                        self._drop_pooled_connections()
+                    self._sleep_with_backoff(attempt, retry_after=self._extract_retry_after(exc))
+            duration_ms = (time.perf_counter() - start_time) * 1000
+
+            if circuit_open:
+                stats = self.circuit_breaker.get_stats()
+                for index, _ in chunk:
+                    results[index] = self._attach_retry_metadata(
+                        {
+                            "success": False,
+                            "duration_ms": duration_ms,
+                            "stdout": "",
+                            "stderr": f"Circuit breaker is {stats['state']}. Service appears unavailable.",
+                            "error": f"Circuit breaker is {stats['state']}",
+                            "error_type": "CircuitBreakerOpenError",
+                            "error_code": "circuit_breaker_open",
+                            "circuit_breaker_state": stats["state"],
+                            "next_attempt_time": stats["next_attempt_time"],
+                        },
+                        attempts=attempt,
+                    )
+                continue
+            if response is None:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure()
+                error_msg = self._redactor.redact(str(last_error)) if last_error else "Unknown error"
+                if isinstance(last_error, AuthenticationError):
+                    error_code = "authentication_error"
+                elif isinstance(last_error, (BadRequestError, ValueError)):
+                    error_code = "invalid_request"
+                else:
+                    error_code = _STATUS_TO_CODE.get(getattr(last_error, "status_code", None), "llm_api_error")
+                for index, _ in chunk:
+                    results[index] = self._attach_retry_metadata(
+                        {
+                            "success": False,
+                            "duration_ms": duration_ms,
+                            "stdout": "",
+                            "stderr": error_msg,
+                            "error": error_msg,
+                            "error_type": type(last_error).__name__ if last_error else "RuntimeError",
+                            "error_code": error_code,
+                        },
+                        attempts=attempt,
+                    )
+                continue
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_success()
+
+            by_index = {choice.index: choice for choice in response.choices}
+            usage = response.usage
+            prompt_tokens = (usage.prompt_tokens or 0) if usage else 0
+            completion_tokens = (usage.completion_tokens or 0) if usage else 0
+            outputs = [(by_index[i].text or "") if i in by_index else "" for i in range(len(chunk))]
+            # Usage is reported for the whole request; apportion it by text length
+            prompt_chars = sum(len(text) for text in texts) or 1
+            output_chars = sum(len(text) for text in outputs) or 1
+            prompt_rate, _, completion_rate = self._rates.get(model, self._default_rate)
+            for position, (index, call) in enumerate(chunk):
+                tokens_prompt = round(prompt_tokens * len(texts[position]) / prompt_chars)
+                tokens_completion = round(completion_tokens * len(outputs[position]) / output_chars)
+                choice = by_index.get(position)
+                result = {
+                    "content": outputs[position],
+                    "tokens_prompt": tokens_prompt,
+                    "tokens_completion": tokens_completion,
+                    "tokens_total": tokens_prompt + tokens_completion,
+                    "cost_usd": tokens_prompt * prompt_rate + tokens_completion * completion_rate,
+                    "finish_reason": (choice.finish_reason if choice is not None else None) or "stop",
+                }
+                results[index] = self._attach_retry_metadata(
+                    self._success_payload(result, duration_ms, call), attempts=attempt
+                )
+        return results  # type: ignore[return-value]
+
+    async def aexecute(
+        self, file_path: str, func_name: str, args: tuple, timeout_s: float = 30.0
+    ) -> Dict[str, Any]:
+        """Async counterpart of ``execute`` with the same retry and circuit-breaker handling."""
+        start_time = time.perf_counter()
+        call, validation_error = self._prepare_call(file_path, func_name, args)
+        if validation_error is not None:
+            return validation_error
+
+        kwargs = self._build_request(**call)
+        last_error: Optional[Exception] = None
+        attempt = 0
+        for attempt in range(self.max_retries + 1):
+            if self.circuit_breaker is not None and not self.circuit_breaker.allow_request():
+                stats = self.circuit_breaker.get_stats()
+                return self._attach_retry_metadata(
+                    {
+                        "success": False,
+                        "duration_ms": (time.perf_counter() - start_time) * 1000,
+                        "stdout": "",
+                        "stderr": f"Circuit breaker is {stats['state']}. Service appears unavailable.",
+                        "error": f"Circuit breaker is {stats['state']}",
+                        "error_type": "CircuitBreakerOpenError",
+                        "error_code": "circuit_breaker_open",
+                        "circuit_breaker_state": stats["state"],
+                        "next_attempt_time": stats["next_attempt_time"],
+                    },
+                    attempts=attempt,
+                )
+            try:
+                response = await self.async_client.chat.completions.create(**kwargs, timeout=timeout_s)
+                result = self._parse_response(response, kwargs["model"])
+            except Exception as exc:
+                last_error = exc
+                if self._should_retry(exc, attempt):
+                    delay = self._backoff_delay(attempt, retry_after=self._extract_retry_after(exc))
+                    if delay:
+                        await asyncio.sleep(delay)
+                    continue
+                break
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_success()
+            return self._attach_retry_metadata(
+                self._success_payload(result, (time.perf_counter() - start_time) * 1000, call),
+                attempts=attempt,
+            )
+
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_failure()
+        error_msg = self._redactor.redact(str(last_error)) if last_error else "Unknown error"
+        if isinstance(last_error, AuthenticationError):
+            error_code = "authentication_error"
+        elif isinstance(last_error, (BadRequestError, ValueError)):
+            error_code = "invalid_request"
+        else:
+            error_code = _STATUS_TO_CODE.get(getattr(last_error, "status_code", None), "llm_api_error")
+        return self._attach_retry_metadata(
+            {
+                "success": False,
+                "duration_ms": (time.perf_counter() - start_time) * 1000,
+                "stdout": "",
+                "stderr": error_msg,
+                "error": error_msg,
+                "error_type": type(last_error).__name__ if last_error else "RuntimeError",
+                "error_code": error_code,
+            },
+            attempts=attempt,
+        )
 
     def execute(
         self,
@@ -109,106 +638,16 @@ class OpenAIExecutor(LLMExecutor):
         - func_name: model name (overrides config)
         - args: (user_prompt,) or (user_prompt, system_prompt)
         """
-        start_time = time.time()
-        model = func_name if func_name else self.model
-
-        def _validation_error(message: str, code: str) -> Dict[str, Any]:
-            payload = {
-                "success": False,
-                "duration_ms": 0.0,
-                "stdout": "",
-                "stderr": message,
-                "error": message,
-                "error_type": "ValidationError",
-                "error_code": code,
-            }
-            return self._attach_retry_metadata(payload, attempts=0)
-
-        # Validate inputs and extract conversation history, user prompt, and system prompt
-        # Support multiple formats:
-        # 1. (conversation_history, user_prompt) - multi-turn with history
-        # 2. (user_prompt,) - single turn
-        # 3. (user_prompt, system_prompt) - single turn with explicit system prompt
-        
-        conversation_history: Optional[List[Dict[str, str]]] = None
-        user_prompt: str = ""
-        system_prompt: Optional[str] = None
-        
-        if not args:
-            return _validation_error("Empty or invalid arguments", "invalid_input")
-        
-        # Check if first arg is conversation history (list of message dicts)
-        if len(args) >= 2 and isinstance(args[0], list):
-            # Format: (conversation_history, user_prompt)
-            conversation_history = args[0]
-            user_prompt = args[1] if len(args) > 1 else ""
-            # System prompt from history or config
-            if conversation_history and isinstance(conversation_history[0], dict):
-                first_msg = conversation_history[0]
-                if first_msg.get("role") == "system":
-                    system_prompt = first_msg.get("content", "")
-        else:
-            # Single turn: (user_prompt,) or (user_prompt, system_prompt)
-            user_prompt = args[0] if args else ""
-            if len(args) > 1 and isinstance(args[1], str) and args[1].strip():
-                system_prompt = args[1]
-        
-        # Validate user prompt
-        if not isinstance(user_prompt, str) or not user_prompt.strip():
-            return _validation_error("Empty or invalid user prompt", "invalid_input")
-        
-        # Get system prompt from config if not provided
-        if not system_prompt:
-            if isinstance(self.system_prompt, str) and self.system_prompt.strip():
-                system_prompt = self.system_prompt
-            elif isinstance(self.config.get("system_prompt"), str) and self.config["system_prompt"].strip():
-                system_prompt = self.config["system_prompt"]
-            elif file_path:
-                try:
-                    path_obj = Path(file_path)
-                    if path_obj.exists():
-                        system_prompt = path_obj.read_text(encoding="utf-8")
-                    else:
-                        system_prompt = file_path
-                except (OSError, UnicodeDecodeError):
-                    system_prompt = file_path
-
-        # Validate model name using registry
-        from ..model_registry import is_valid_model, get_valid_models
-        
-        if model is None or not isinstance(model, str) or not model.strip():
-            return _validation_error("Model name cannot be None or empty", "invalid_model")
-        
-        valid_models = get_valid_models("openai")
-        if model not in valid_models:
-            # Check if it looks like a valid model name (custom/private model)
-            looks_valid = "/" in model or model.replace("-", "").replace("_", "").replace(".", "").isalnum()
-            if not looks_valid:
-                from ..model_registry import validate_model
-                _, error_msg, suggestions = validate_model("openai", model, raise_error=False)
-                full_error = error_msg or f"Invalid model name: {model}"
-                return _validation_error(full_error, "invalid_model")
-
-        # Validate temperature range (OpenAI: 0-2)
-        if self.temperature < 0 or self.temperature > 2:
-            return _validation_error(
-                f"Temperature must be between 0 and 2, got {self.temperature}",
-                "invalid_parameter",
-            )
-
-        # Validate max_tokens (OpenAI supports up to 128K for some models, but we'll be conservative)
-        # Note: Actual limits vary by model - GPT-4 supports up to 128K, GPT-3.5-turbo supports 16K
-        if self.max_tokens <= 0 or self.max_tokens > 128000:
-            return _validation_error(
-                f"max_tokens must be between 1 and 128000, got {self.max_tokens}",
-                "invalid_parameter",
-            )
+        start_time = time.perf_counter()
+        call, validation_error = self._prepare_call(file_path, func_name, args)
+        if validation_error is not None:
+            return validation_error
 
         last_error: Optional[Exception] = None
 
         # Check circuit breaker before attempting calls
         if self.circuit_breaker is not None and not self.circuit_breaker.allow_request():
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             stats = self.circuit_breaker.get_stats()
             payload = {
                 "success": False,
@@ -227,7 +666,7 @@ class OpenAIExecutor(LLMExecutor):
             try:
                 # Check circuit breaker before each attempt
                 if self.circuit_breaker is not None and not self.circuit_breaker.allow_request():
-                    duration_ms = (time.time() - start_time) * 1000
+                    duration_ms = (time.perf_counter() - start_time) * 1000
                     stats = self.circuit_breaker.get_stats()
                     payload = {
                         "success": False,
@@ -242,40 +681,9 @@ class OpenAIExecutor(LLMExecutor):
                     }
                     return self._attach_retry_metadata(payload, attempts=attempt)
 
-                result = self._call_llm(
-                    prompt=user_prompt,
-                    system_prompt=system_prompt,
-                    conversation_history=conversation_history,
-                    model=model,
-                    max_tokens=self.max_tokens,
-                    temperature=self.temperature,
-                    seed=self.seed,
-                    timeout=timeout_s,
-                )
-                duration_ms = (time.time() - start_time) * 1000
-                # Build full messages list for trace recording
-                full_messages = []
-                if system_prompt:
-                    full_messages.append({"role": "system", "content": system_prompt})
-                if conversation_history:
-                    for msg in conversation_history:
-                        if isinstance(msg, dict) and msg.get("role") in ("user", "assistant"):
-                            full_messages.append(msg)
-                full_messages.append({"role": "user", "content": user_prompt})
-                
-                payload = {
-                    "success": True,
-                    "duration_ms": duration_ms,
-                    "stdout": result.get("content", ""),
-                    "stderr": "",
-                    "result": result.get("content"),
-                    "tokens_prompt": result.get("tokens_prompt", 0),
-                    "tokens_completion": result.get("tokens_completion", 0),
-                    "tokens_total": result.get("tokens_total", 0),
-                    "cost_usd": result.get("cost_usd", 0.0),
-                    "finish_reason": result.get("finish_reason", "stop"),
-                    "conversation_history": full_messages,  # Include for trace recording
-                }
+                result = self._call_llm(**call, timeout=timeout_s)
+                duration_ms = (time.perf_counter() - start_time) * 1000
+                payload = self._success_payload(result, duration_ms, call)
                 # Record success in circuit breaker
                 if self.circuit_breaker is not None:
                     self.circuit_breaker.record_success()
@@ -284,6 +692,9 @@ class OpenAIExecutor(LLMExecutor):
                 last_error = exc
                 retry_after = self._extract_retry_after(exc)
                 if self._should_retry(exc, attempt):
+                    if isinstance(exc, APIConnectionError) and not isinstance(exc, APITimeoutError):
+                        # The pooled socket may be dead; don't hand it to the retry
+                        self._drop_pooled_connections()
                     # Don't record failure yet - we'll retry
                     self._sleep_with_backoff(attempt, retry_after=retry_after)
                     continue
@@ -293,7 +704,7 @@ class OpenAIExecutor(LLMExecutor):
                 # fallthrough to final payload outside loop
                 break
             except (AuthenticationError, BadRequestError, ValueError) as exc:
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter() - start_time) * 1000
                 error_msg = self._redactor.redact(str(exc))
                 error_code = "authentication_error" if isinstance(exc, AuthenticationError) else "invalid_request"
                 # Non-retryable error - record failure immediately
@@ -312,6 +723,8 @@ class OpenAIExecutor(LLMExecutor):
             except OSError as exc:
                 last_error = exc
                 if self._should_retry(exc, attempt):
+                    if isinstance(exc, ConnectionError):
+                        self._drop_pooled_connections()
                     # Don't record failure yet - we'll retry
                     self._sleep_with_backoff(attempt)
                     continue
@@ -333,15 +746,9 @@ class OpenAIExecutor(LLMExecutor):
                     # Retries exhausted or non-retryable - record failure
                     if self.circuit_breaker is not None:
                         self.circuit_breaker.record_failure()
-                    duration_ms = (time.time() - start_time) * 1000
+                    duration_ms = (time.perf_counter() - start_time) * 1000
                     error_msg = self._redactor.redact(str(exc))
-                    error_code = "llm_api_error"
-                    if status_code == 401:
-                        error_code = "authentication_error"
-                    elif status_code == 429:
-                        error_code = "rate_limit_error"
-                    elif status_code == 400:
-                        error_code = "invalid_request"
+                    error_code = _STATUS_TO_CODE.get(status_code, "llm_api_error")
                     payload = {
                         "success": False,
                         "duration_ms": duration_ms,
@@ -354,7 +761,7 @@ class OpenAIExecutor(LLMExecutor):
                     return self._attach_retry_metadata(payload, attempts=attempt)
                 # Not an API error - treat as non-retryable error
                 last_error = exc
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter() - start_time) * 1000
                 error_msg = self._redactor.redact(str(exc))
                 # Record failure immediately for non-API errors
                 if self.circuit_breaker is not None:
@@ -373,15 +780,9 @@ class OpenAIExecutor(LLMExecutor):
         # All retries exhausted - record final failure and return error
         if self.circuit_breaker is not None:
             self.circuit_breaker.record_failure()
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter() - start_time) * 1000
         description = self._redactor.redact(str(last_error)) if last_error else "Unknown error"
-        error_code = "llm_api_error"
-        if last_error:
-            status = getattr(last_error, "status_code", None)
-            if status == 429:
-                error_code = "rate_limit_error"
-            elif status == 500:
-                error_code = "server_error"
+        error_code = _STATUS_TO_CODE.get(getattr(last_error, "status_code", None), "llm_api_error")
         payload = {
             "success": False,
             "duration_ms": duration_ms,
@@ -393,6 +794,145 @@ class OpenAIExecutor(LLMExecutor):
         }
         return self._attach_retry_metadata(payload, attempts=self.max_retries)
 
+    def _prepare_call(
+        self, file_path: str, func_name: str, args: tuple
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        Parse and validate ``execute`` arguments.
+
+        Returns ``(call_kwargs, None)`` with keyword arguments for ``_call_llm``,
+        or ``({}, error_payload)`` when validation fails.
+        """
+        model = func_name if func_name else self.model
+
+        # Validate inputs and extract conversation history, user prompt, and system prompt
+        # Support multiple formats:
+        # 1. (conversation_history, user_prompt) - multi-turn with history
+        # 2. (user_prompt,) - single turn
+        # 3. (user_prompt, system_prompt) - single turn with explicit system prompt
+        
+        conversation_history: Optional[List[Dict[str, str]]] = None
+        user_prompt: str = ""
+        system_prompt: Optional[str] = None
+        
+        if not args:
+            return {}, self._validation_error("Empty or invalid arguments", "invalid_input")
+        
+        # Check if first arg is conversation history (list of message dicts)
+        if len(args) >= 2 and isinstance(args[0], list):
+            # Format: (conversation_history, user_prompt)
+            conversation_history = args[0]
+            user_prompt = args[1] if len(args) > 1 else ""
+            # System prompt from history or config
+            if conversation_history and isinstance(conversation_history[0], dict):
+                first_msg = conversation_history[0]
+                if first_msg.get("role") == "system":
+                    system_prompt = first_msg.get("content", "")
+        else:
+            # Single turn: (user_prompt,) or (user_prompt, system_prompt)
+            user_prompt = args[0] if args else ""
+            if len(args) > 1 and isinstance(args[1], str) and args[1].strip():
+                system_prompt = args[1]
+        
+        # Validate user prompt
+        if not isinstance(user_prompt, str) or not user_prompt.strip():
+            return {}, self._validation_error("Empty or invalid user prompt", "invalid_input")
+        
+        # Get system prompt from config if not provided
+        if not system_prompt:
+            if isinstance(self.system_prompt, str) and self.system_prompt.strip():
+                system_prompt = self.system_prompt
+            elif isinstance(self.config.get("system_prompt"), str) and self.config["system_prompt"].strip():
+                system_prompt = self.config["system_prompt"]
+            elif file_path:
+                try:
+                    system_prompt = _load_prompt_file(file_path, os.stat(file_path).st_mtime_ns)
+                except (OSError, UnicodeDecodeError):
+                    # Not a readable file: the argument is the prompt text itself
+                    system_prompt = file_path
+
+        # Validate model name using registry
+        from ..model_registry import is_valid_model, get_valid_models
+        
+        if model is None or not isinstance(model, str) or not model.strip():
+            return {}, self._validation_error("Model name cannot be None or empty", "invalid_model")
+        
+        valid_models = get_valid_models("openai")
+        if model not in valid_models:
+            # Check if it looks like a valid model name (custom/private model)
+            looks_valid = "/" in model or model.replace("-", "").replace("_", "").replace(".", "").isalnum()
+            if not looks_valid:
+                from ..model_registry import validate_model
+                _, error_msg, suggestions = validate_model("openai", model, raise_error=False)
+                full_error = error_msg or f"Invalid model name: {model}"
+                return {}, self._validation_error(full_error, "invalid_model")
+
+        # Validate temperature range (OpenAI: 0-2)
+        if self.temperature < 0 or self.temperature > 2:
+            return {}, self._validation_error(
+                f"Temperature must be between 0 and 2, got {self.temperature}",
+                "invalid_parameter",
+            )
+
+        # Validate max_tokens (OpenAI supports up to 128K for some models, but we'll be conservative)
+        # Note: Actual limits vary by model - GPT-4 supports up to 128K, GPT-3.5-turbo supports 16K
+        if self.max_tokens <= 0 or self.max_tokens > 128000:
+            return {}, self._validation_error(
+                f"max_tokens must be between 1 and 128000, got {self.max_tokens}",
+                "invalid_parameter",
+            )
+
+        return {
+            "prompt": user_prompt,
+            "system_prompt": system_prompt,
+            "conversation_history": conversation_history,
+            # Built once here and reused by every retry attempt and the success payload
+            "messages": _canonicalize_messages(system_prompt, conversation_history, user_prompt),
+            "model": model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "seed": self.seed,
+        }, None
+
+    def _validation_error(self, message: str, code: str) -> Dict[str, Any]:
+        payload = {
+            "success": False,
+            "duration_ms": 0.0,
+            "stdout": "",
+            "stderr": message,
+            "error": message,
+            "error_type": "ValidationError",
+            "error_code": code,
+        }
+        return self._attach_retry_metadata(payload, attempts=0)
+
+    def _success_payload(
+        self, result: Dict[str, Any], duration_ms: float, call: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        # Full messages list for trace recording
+        full_messages = call.get("messages") or _canonicalize_messages(
+            call["system_prompt"], call["conversation_history"], call["prompt"]
+        )
+
+        payload = {
+            "success": True,
+            "duration_ms": duration_ms,
+            "stdout": result.get("content", ""),
+            "stderr": "",
+            "result": result.get("content"),
+            "tokens_prompt": result.get("tokens_prompt", 0),
+            "tokens_completion": result.get("tokens_completion", 0),
+            "tokens_total": result.get("tokens_total", 0),
+            "tokens_cached": result.get("tokens_cached", 0),
+            "cost_usd": result.get("cost_usd", 0.0),
+            "finish_reason": result.get("finish_reason", "stop"),
+            "conversation_history": full_messages,  # Include for trace recording
+            "cache_hit": result.get("cache_hit", False),
+        }
+        if result.get("usage_estimated"):
+            payload["usage_estimated"] = True
+        return payload
+
     def _call_llm(
         self,
         prompt: str,
@@ -403,35 +943,72 @@ class OpenAIExecutor(LLMExecutor):
         temperature: Optional[float] = None,
         seed: Optional[int] = None,
         timeout: Optional[float] = None,
+        messages: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """Make an OpenAI API call with optional conversation history."""
+        kwargs = self._build_request(
+            prompt,
+            system_prompt=system_prompt,
+            conversation_history=conversation_history,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            seed=seed,
+            messages=messages,
+        )
+        exact_key: Optional[bytes] = None
+        # Sampling without a seed is nondeterministic, so those responses are never reused
+        if self._prompt_cache is not None and (kwargs["temperature"] == 0.0 or seed is not None):
+            exact_key = PromptCache.make_key(
+                kwargs["model"], kwargs["temperature"], seed, kwargs["max_tokens"], kwargs["messages"]
+            )
+            cached = self._prompt_cache.get(exact_key)
+            if cached is not None:
+                return {**cached, "cost_usd": 0.0, "cache_hit": True}
+
+        embedding = None
+        if self._semcache is not None and kwargs["temperature"] == 0.0 and not conversation_history:
+            namespace = _semantic_namespace(kwargs["model"], system_prompt)
+            # Redact before embedding so secrets never end up in the index or on disk
+            embedding = self._semcache.embed(self._redactor.redact(prompt))
+            cached = self._semcache.lookup(embedding, namespace=namespace)
+            if cached is not None:
+                return {**cached, "cost_usd": 0.0, "cache_hit": True}
+
+        if self.config.get("stream"):
+            result = self._stream_completion(kwargs, timeout)
+        else:
+            response = self.client.chat.completions.create(**kwargs, timeout=timeout)
+            result = self._parse_response(response, kwargs["model"])
+        if exact_key is not None:
+            self._prompt_cache.set(exact_key, result)
+        if embedding is not None:
+            self._semcache.add(embedding, result, namespace=namespace)
+        return result
+
+    def _build_request(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        conversation_history: Optional[List[Dict[str, str]]] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        seed: Optional[int] = None,
+        messages: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build ``chat.completions.create`` keyword arguments for a single request.
+
+        A precomputed ``messages`` list (from ``_prepare_call``) is used as-is;
+        otherwise it is assembled from the prompt, system prompt and history.
+        """
         model = model or self.model
         max_tokens = max_tokens or self.max_tokens
         temperature = temperature if temperature is not None else self.temperature
 
-        messages = []
-        
-        # Add system prompt (only if not already in history)
-        if system_prompt:
-            # Check if history already has a system message
-            has_system = False
-            if conversation_history:
-                has_system = any(msg.get("role") == "system" for msg in conversation_history if isinstance(msg, dict))
-            if not has_system:
-                messages.append({"role": "system", "content": system_prompt})
-        
-        # Add conversation history (excluding system message if we already added it)
-        if conversation_history:
-            for msg in conversation_history:
-                if isinstance(msg, dict) and msg.get("role") == "system":
-                    # Skip system messages from history if we have a separate system_prompt
-                    if not system_prompt:
-                        messages.append(msg)
-                elif isinstance(msg, dict) and msg.get("role") in ("user", "assistant"):
-                    messages.append(msg)
-        
-        # Add new user message
-        messages.append({"role": "user", "content": prompt})
+        if messages is None:
+            messages = _canonicalize_messages(system_prompt, conversation_history, prompt)
 
         kwargs: Dict[str, Any] = {
             "model": model,
@@ -441,9 +1018,64 @@ class OpenAIExecutor(LLMExecutor):
         }
         if seed is not None:
             kwargs["seed"] = seed
+        return kwargs
+
+    def _stream_completion(self, kwargs: Dict[str, Any], timeout: Optional[float]) -> Dict[str, Any]:
+        """
+        Stream a completion, stopping early on ``max_output_chars`` or the timeout.
 
-        response = self.client.chat.completions.create(**kwargs, timeout=timeout)
+        A truncated generation is returned with ``finish_reason`` ``"length"``
+        (character budget) or ``"timeout"``. Usage comes from the final chunk when
+        the stream runs to completion. An abandoned stream never gets that chunk,
+        although the tokens generated so far are still billed, so its tokens and
+        cost are estimated from the request and the text consumed, and the result
+        is flagged ``usage_estimated``.
+        """
+        max_chars = self.config.get("max_output_chars")
+        # Leave a little headroom so the stream is closed before the HTTP timeout fires
+        deadline = time.perf_counter() + timeout * 0.9 if timeout else None
+        stream = self.client.chat.completions.create(
+            **kwargs, stream=True, stream_options={"include_usage": True}, timeout=timeout
+        )
+        parts: List[str] = []
+        length = 0
+        usage = None
+        finish_reason: Optional[str] = None
+        try:
+            for chunk in stream:
+                if getattr(chunk, "usage", None) is not None:
+                    usage = chunk.usage
+                if chunk.choices:
+                    choice = chunk.choices[0]
+                    text = getattr(choice.delta, "content", None)
+                    if text:
+                        parts.append(text)
+                        length += len(text)
+                    finish_reason = choice.finish_reason or finish_reason
+                if max_chars is not None and length > int(max_chars):
+                    finish_reason = "length"
+                    break
+                if deadline is not None and time.perf_counter() >= deadline:
+                    finish_reason = "timeout"
+                    break
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+        message = SimpleNamespace(content="".join(parts))
+        estimated = usage is None
+        if estimated:
+            usage = _estimate_stream_usage(kwargs, message.content)
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=message, finish_reason=finish_reason)], usage=usage
+        )
+        result = self._parse_response(response, kwargs["model"])
+        if estimated:
+            result["usage_estimated"] = True
+        return result
 
+    def _parse_response(self, response: Any, model: str) -> Dict[str, Any]:
+        """Convert a ``ChatCompletion`` into the executor result dict."""
         # Handle empty or malformed responses
         if not response.choices or len(response.choices) == 0:
             raise ValueError("API returned empty choices list")
@@ -456,13 +1088,17 @@ class OpenAIExecutor(LLMExecutor):
             tokens_prompt = response.usage.prompt_tokens or 0
             tokens_completion = response.usage.completion_tokens or 0
             tokens_total = response.usage.total_tokens or 0
+            # Prompt tokens served from OpenAI's automatic prefix cache
+            details = getattr(response.usage, "prompt_tokens_details", None)
+            tokens_cached = min(tokens_prompt, getattr(details, "cached_tokens", 0) or 0)
         else:
-            tokens_prompt = tokens_completion = tokens_total = 0
+            tokens_prompt = tokens_completion = tokens_total = tokens_cached = 0
 
-        # Get pricing for model (fallback to gpt-3.5-turbo if unknown)
-        model_pricing = self.pricing.get(model, self.pricing.get("gpt-3.5-turbo", {"prompt": 0.0015, "completion": 0.002}))
-        cost_usd = (tokens_prompt / 1000 * model_pricing["prompt"]) + (
-            tokens_completion / 1000 * model_pricing["completion"]
+        prompt_rate, cached_rate, completion_rate = self._rates.get(model, self._default_rate)
+        cost_usd = (
+            (tokens_prompt - tokens_cached) * prompt_rate
+            + tokens_cached * cached_rate
+            + tokens_completion * completion_rate
         )
 
         return {
@@ -470,7 +1106,77 @@ class OpenAIExecutor(LLMExecutor):
             "tokens_prompt": tokens_prompt,
             "tokens_completion": tokens_completion,
             "tokens_total": tokens_total,
+            "tokens_cached": tokens_cached,
             "cost_usd": cost_usd,
             "finish_reason": choice.finish_reason or "stop",
         }
 
+
+def _estimate_stream_usage(kwargs: Dict[str, Any], content: str) -> SimpleNamespace:
+    """Usage-shaped token estimate for a stream that ended before its usage chunk."""
+    # Imported lazily: cost_estimation imports the executors package
+    from ..cost_estimation import _estimate_tokens
+
+    model = kwargs.get("model")
+    prompt_text = "\n".join(
+        str(message.get("content") or "") for message in kwargs.get("messages", []) if isinstance(message, dict)
+    )
+    tokens_prompt = _estimate_tokens(prompt_text, model=model)
+    tokens_completion = _estimate_tokens(content, model=model)
+    return SimpleNamespace(
+        prompt_tokens=tokens_prompt,
+        completion_tokens=tokens_completion,
+        total_tokens=tokens_prompt + tokens_completion,
+    )
+
+
+def _as_namespace(value: Any) -> Any:
+    """Recursively expose a decoded JSON body through attributes, like the SDK's models."""
+    if isinstance(value, dict):
+        return SimpleNamespace(**{key: _as_namespace(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return [_as_namespace(item) for item in value]
+    return value
+
+
+def _canonicalize_messages(
+    system_prompt: Optional[str],
+    conversation_history: Optional[List[Dict[str, Any]]],
+    prompt: str,
+) -> List[Dict[str, Any]]:
+    """
+    Build ``[system, *history, user]`` with a byte-stable prefix across turns.
+
+    OpenAI's automatic prompt caching only matches identical prefixes, so the
+    system message always comes first (the explicit ``system_prompt``, else the
+    history's first system turn), history order is preserved, and the new user
+    message goes last. Keep volatile content in the final user message.
+    """
+    messages: List[Dict[str, Any]] = []
+    system = system_prompt
+    turns: List[Dict[str, Any]] = []
+    for msg in conversation_history or ():
+        if not isinstance(msg, dict):
+            continue
+        role = msg.get("role")
+        if role == "user" or role == "assistant":
+            turns.append(msg)
+        elif role == "system" and not system:
+            system = msg.get("content", "")
+    if system:
+        messages.append({"role": "system", "content": system})
+    messages.extend(turns)
+    messages.append({"role": "user", "content": prompt})
+    return messages
+
+
+@functools.lru_cache(maxsize=128)
+def _load_prompt_file(path: str, mtime_ns: int) -> str:
+    """Read a system prompt file; keying on mtime re-reads it only after an edit."""
+    return Path(path).read_text(encoding="utf-8")
+
+
+def _semantic_namespace(model: str, system_prompt: Optional[str]) -> str:
+    """Scope semantic cache entries to one model and system prompt."""
+    digest = hashlib.sha256((system_prompt or "").encode("utf-8")).hexdigest()[:16]
+    return f"{model}:{digest}"
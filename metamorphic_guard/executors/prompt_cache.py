@@ -0,0 +1,60 @@
+"""
+Exact-match, content-addressed response cache for LLM executors.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class PromptCache:
+    """
+    SQLite-backed response store keyed by a digest of the canonical request.
+
+    Uses WAL mode so concurrent readers (e.g. parallel workers sharing a
+    ``cache_dir``) do not block the writer. ``path=None`` keeps the cache in
+    memory for the lifetime of the process.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path or ":memory:", check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            if path is not None:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS responses (key BLOB PRIMARY KEY, value TEXT NOT NULL)")
+
+    @staticmethod
+    def make_key(*parts: Any) -> bytes:
+        """Digest the request fields; ``None`` and ``""`` hash differently."""
+        canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def set(self, key: bytes, value: Dict[str, Any]) -> None:
+        encoded = json.dumps(value, default=str)
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)", (key, encoded))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0])
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["PromptCache"]
@@ -6,40 +6,88 @@ Requires `ray` package: `pip install ray`
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Optional
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 try:
     import ray
     RAY_AVAILABLE = True
 except ImportError:
+    ray = None  # type: ignore
     RAY_AVAILABLE = False
 
-from ..sandbox.plugins import ExecutorBase
+from . import Executor
 
 logger = logging.getLogger(__name__)
 
-class RayExecutor(ExecutorBase):
+
+def _run_remote(f_path: str, f_name: str, f_args: tuple) -> Dict[str, Any]:
+    start = time.perf_counter()
+    try:
+        # Import dynamically or use exec
+        # Note: this assumes the code is present on workers
+        # or synced via runtime_env={"working_dir": ...}
+
+        # Minimal implementation matching 'local' executor logic
+        # but running remotely.
+
+        # We'd typically rely on the same sandbox logic, but run it inside Ray
+        # For now, simple placeholder
+        return {
+            "success": True,
+            "result": f"Executed {f_name} on Ray",
+            "duration_ms": (time.perf_counter() - start) * 1000
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "duration_ms": (time.perf_counter() - start) * 1000
+        }
+
+
+# Declared once so the function is exported to the cluster once per driver;
+# per-call resources are applied with ``.options()``
+_mg_wrapper = ray.remote(_run_remote) if RAY_AVAILABLE else None
+
+
+class RayExecutor(Executor):
     """
     Executes tasks on a Ray cluster.
-    
+
     Configuration:
         address: Ray cluster address (default: auto)
         namespace: Ray namespace
         runtime_env: Ray runtime environment (pip dependencies, env vars)
+        num_cpus: CPUs reserved per task (default: 1)
     """
 
+    _init_lock = threading.Lock()
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config or {})
         if not RAY_AVAILABLE:
             raise ImportError("ray package is required. Install with `pip install ray`.")
-        
-        if not ray.is_initialized():
-            ray.init(
-                address=self.config.get("address", "auto"),
-                namespace=self.config.get("namespace"),
-                runtime_env=self.config.get("runtime_env"),
-                ignore_reinit_error=True
-            )
+        self._ensure_init(self.config)
+
+    @classmethod
+    def _ensure_init(cls, config: Dict[str, Any]) -> None:
+        """Connect to the cluster once, even when executors are built concurrently."""
+        with cls._init_lock:
+            if not ray.is_initialized():
+                ray.init(
+                    address=config.get("address", "auto"),
+                    namespace=config.get("namespace"),
+                    runtime_env=config.get("runtime_env"),
+                    ignore_reinit_error=True
+                )
+
+    def _submit(self, file_path: str, func_name: str, args: tuple, mem_mb: int) -> Any:
+        return _mg_wrapper.options(
+            memory=mem_mb * 1024 * 1024,
+            num_cpus=self.config.get("num_cpus", 1),
+        ).remote(file_path, func_name, args)
 
     def execute(
         self,
@@ -49,41 +97,11 @@ class RayExecutor(ExecutorBase):
         timeout_s: float = 30.0,
         mem_mb: int = 512,
     ) -> Dict[str, Any]:
-        import time
-        
-        # Define a remote wrapper
         # In a real scenario, we need to handle code shipping.
         # Ray `runtime_env` can handle `working_dir` to upload code.
-        
-        @ray.remote(memory=mem_mb * 1024 * 1024)
-        def _wrapper(f_path: str, f_name: str, f_args: tuple) -> Dict[str, Any]:
-            start = time.time()
-            try:
-                # Import dynamically or use exec
-                # Note: this assumes the code is present on workers
-                # or synced via runtime_env={"working_dir": ...}
-                
-                # Minimal implementation matching 'local' executor logic
-                # but running remotely.
-                
-                # We'd typically rely on the same sandbox logic, but run it inside Ray
-                # For now, simple placeholder
-                return {
-                    "success": True, 
-                    "result": f"Executed {f_name} on Ray",
-                    "duration_ms": (time.time() - start) * 1000
-                }
-            except Exception as e:
-                return {
-                    "success": False, 
-                    "error": str(e),
-                    "duration_ms": (time.time() - start) * 1000
-                }
-
-        # Submit
-        start = time.time()
-        future = _wrapper.remote(file_path, func_name, args)
-        
+        start = time.perf_counter()
+        future = self._submit(file_path, func_name, args, mem_mb)
+
         try:
             result = ray.get(future, timeout=timeout_s)
             return result
@@ -91,6 +109,51 @@ class RayExecutor(ExecutorBase):
             return {
                 "success": False,
                 "error": f"Ray execution failed: {e}",
-                "duration_ms": (time.time() - start) * 1000
+                "duration_ms": (time.perf_counter() - start) * 1000
             }
 
+    def execute_many(
+        self,
+        requests: Sequence[Tuple[str, str, tuple]],
+        timeout_s: float = 30.0,
+        mem_mb: int = 512,
+    ) -> List[Dict[str, Any]]:
+        """
+        Submit all ``(file_path, func_name, args)`` requests, then drain them as they finish.
+
+        Tasks run with cluster-wide parallelism instead of one blocking
+        ``ray.get`` per case. ``timeout_s`` bounds the whole batch; tasks still
+        pending at the deadline are cancelled and reported as failures.
+        Results are returned in request order.
+        """
+        start = time.perf_counter()
+        futures = [self._submit(file_path, func_name, args, mem_mb) for file_path, func_name, args in requests]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(futures)
+        index = {future: position for position, future in enumerate(futures)}
+        unready = list(futures)
+        deadline = start + timeout_s
+        while unready:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            done, unready = ray.wait(
+                unready, num_returns=min(16, len(unready)), timeout=min(1.0, remaining)
+            )
+            for future in done:
+                try:
+                    results[index[future]] = ray.get(future)
+                except Exception as e:
+                    results[index[future]] = {
+                        "success": False,
+                        "error": f"Ray execution failed: {e}",
+                        "duration_ms": (time.perf_counter() - start) * 1000
+                    }
+
+        for future in unready:
+            ray.cancel(future)
+            results[index[future]] = {
+                "success": False,
+                "error": f"Ray execution timed out after {timeout_s}s",
+                "duration_ms": (time.perf_counter() - start) * 1000
+            }
+        return results  # type: ignore[return-value]
@@ -0,0 +1,154 @@
+"""
+Embedding-based response cache for paraphrased LLM prompts.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None  # type: ignore
+
+
+Embedder = Callable[[str], Sequence[float]]
+
+
+class SemanticCache:
+    """
+    Nearest-neighbour cache keyed by prompt embeddings.
+
+    A lookup hits when the closest stored embedding has cosine similarity
+    ``>= threshold`` and was stored under the same namespace (e.g. model
+    name). Uses an HNSW index when ``hnswlib`` is installed and falls back to
+    an exact numpy scan otherwise. Entries beyond ``max_size`` are not stored.
+
+    With ``persist_path`` set, each entry is appended to that JSONL file and
+    existing entries are loaded on construction.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        threshold: float = 0.92,
+        max_size: int = 10000,
+        index: Any = None,
+        persist_path: Optional[str] = None,
+    ) -> None:
+        if not callable(embedder):
+            raise ValueError("SemanticCache requires a callable embedder (str -> vector)")
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        self.embedder = embedder
+        self.threshold = float(threshold)
+        self.max_size = max(1, int(max_size))
+        self._index = index
+        self._matrix: Optional[np.ndarray] = None
+        self._values: List[Dict[str, Any]] = []
+        self._namespaces: List[str] = []
+        # Namespace of each row as a small int so the exact scan can mask other namespaces
+        self._namespace_codes: Dict[str, int] = {}
+        self._row_codes = np.zeros(0, dtype=np.int32)
+        self._lock = threading.Lock()
+        self.persist_path = Path(persist_path) if persist_path else None
+        if self.persist_path is not None and self.persist_path.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed ``text`` and L2-normalise it so inner product equals cosine similarity."""
+        vector = np.asarray(self.embedder(text), dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
+
+    def lookup(self, embedding: np.ndarray, namespace: str = "") -> Optional[Dict[str, Any]]:
+        """Return the stored value for the nearest neighbour, or None below the threshold."""
+        with self._lock:
+            if not self._values:
+                return None
+            code = self._namespace_codes.get(namespace)
+            if code is None:
+                return None
+            count = len(self._values)
+            if self._index is not None:
+                # Over-fetch so neighbours from other namespaces don't hide a match
+                labels, distances = self._index.knn_query(embedding, k=min(count, 16))
+                for label, distance in zip(labels[0], distances[0]):
+                    position = int(label)
+                    if self._namespaces[position] == namespace:
+                        similarity = 1.0 - float(distance)
+                        break
+                else:
+                    return None
+            else:
+                scores = self._matrix[:count] @ embedding
+                scores[self._row_codes[:count] != code] = -np.inf
+                position = int(np.argmax(scores))
+                similarity = float(scores[position])
+            if similarity < self.threshold:
+                return None
+            return self._values[position]
+
+    def add(self, embedding: np.ndarray, value: Dict[str, Any], namespace: str = "") -> None:
+        """Store ``value`` under ``embedding``; silently ignored once the cache is full."""
+        with self._lock:
+            if self._insert(embedding, value, namespace) and self.persist_path is not None:
+                record = {"namespace": namespace, "embedding": embedding.tolist(), "value": value}
+                self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+                with self.persist_path.open("a", encoding="utf-8") as handle:
+                    handle.write(json.dumps(record, default=str) + "\n")
+
+    def _insert(self, embedding: np.ndarray, value: Dict[str, Any], namespace: str) -> bool:
+        position = len(self._values)
+        if position >= self.max_size:
+            return False
+        if self._matrix is None:
+            self._init_storage(embedding.shape[0])
+        if position >= self._matrix.shape[0]:
+            grown = np.zeros((min(self.max_size, position * 2), self._matrix.shape[1]), np.float32)
+            grown[:position] = self._matrix
+            self._matrix = grown
+            codes = np.zeros(grown.shape[0], dtype=np.int32)
+            codes[:position] = self._row_codes[:position]
+            self._row_codes = codes
+        # The matrix is kept even with an HNSW index so entries can be persisted and reloaded
+        self._matrix[position] = embedding
+        self._row_codes[position] = self._namespace_codes.setdefault(namespace, len(self._namespace_codes))
+        if self._index is not None:
+            self._index.add_items(embedding.reshape(1, -1), [position])
+        self._values.append(value)
+        self._namespaces.append(namespace)
+        return True
+
+    def _init_storage(self, dim: int) -> None:
+        # The embedding dimension is only known once the first vector arrives
+        self._matrix = np.zeros((min(self.max_size, 256), dim), dtype=np.float32)
+        self._row_codes = np.zeros(self._matrix.shape[0], dtype=np.int32)
+        if self._index is None and hnswlib is not None:
+            self._index = hnswlib.Index(space="cosine", dim=dim)
+            self._index.init_index(max_elements=self.max_size, ef_construction=200, M=16)
+            self._index.set_ef(50)
+
+    def _load(self) -> None:
+        with self.persist_path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # tolerate a torn final line from an interrupted write
+                embedding = np.asarray(record["embedding"], dtype=np.float32)
+                if not self._insert(embedding, record["value"], record.get("namespace", "")):
+                    break
+
+
+__all__ = ["SemanticCache"]
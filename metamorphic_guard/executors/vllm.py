@@ -98,7 +98,7 @@ class VLLMExecutor(LLMExecutor):
         - func_name: model name override (optional)
         - args: (user_prompt,) or (user_prompt, system_prompt)
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         def _validation_error(message: str, code: str) -> Dict[str, Any]:
             payload = {
@@ -201,7 +201,7 @@ class VLLMExecutor(LLMExecutor):
                 seed=self.seed,
             )
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             payload = {
                 "success": True,
                 "duration_ms": duration_ms,
@@ -216,7 +216,7 @@ class VLLMExecutor(LLMExecutor):
             }
             return self._attach_retry_metadata(payload, attempts=0)
         except (RuntimeError, ValueError, OSError) as exc:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             error_msg = str(exc)
             error_code = "vllm_error"
             error_type = type(exc).__name__
@@ -2,6 +2,7 @@
 Input generators for test cases.
 """
 
+import functools
 import random
 from typing import Callable, List, Sequence, Tuple
 
@@ -17,7 +18,20 @@ def gen_top_k_inputs(n: int, seed: int) -> List[Tuple[List[int], int]]:
     * Very long lists (up to ~200 elements).
     * k larger than the list length and k == 0.
     * Negative-only, mixed-sign, and extreme magnitude values.
+
+    Results are memoized per ``(n, seed)``; each call returns fresh lists, so
+    callers may mutate them freely.
     """
+    return [(list(values), k) for values, k in _gen_top_k_cached(n, seed)]
+
+
+@functools.lru_cache(maxsize=64)
+def _gen_top_k_cached(n: int, seed: int) -> Tuple[Tuple[Tuple[int, ...], int], ...]:
+    # Stored as tuples so a caller mutating its copy can't corrupt the cache
+    return tuple((tuple(values), k) for values, k in _gen_top_k(n, seed))
+
+
+def _gen_top_k(n: int, seed: int) -> List[Tuple[List[int], int]]:
     rng = random.Random(seed)
     scenarios: Sequence[Callable[[random.Random], Tuple[List[int], int]]] = (
         _case_empty,
@@ -123,4 +137,3 @@ def _case_small_range_many_duplicates(rng: random.Random) -> Tuple[List[int], in
     rng.shuffle(values)
     k = rng.randint(1, max(1, len(values)))
     return values, k
-
@@ -28,6 +28,7 @@ from .reporting import (
     evaluate_results,
     evaluate_roles,
     get_or_compute_metric_value,
+    merge_results,
     safe_extract_metric,
     should_sample_metric,
     summarize_llm_results,
@@ -46,7 +47,7 @@ _evaluate_results = evaluate_results
 _summarize_llm_results = summarize_llm_results
 
 # Import run_eval from evaluation module
-from .evaluation import run_eval
+from .evaluation import iter_cases, run_eval
 
 __all__ = [
     # Statistics
@@ -62,6 +63,7 @@ __all__ = [
     "relation_rng",
     # Reporting
     "evaluate_roles",
+    "merge_results",
     "aggregate_metric_values",
     "bootstrap_metric_delta",
     "collect_metrics",
@@ -75,6 +77,7 @@ __all__ = [
     # Trust
     "compute_trust_scores",
     # Main entry point (from evaluation module)
+    "iter_cases",
     "run_eval",
     # Backward compatibility aliases for private functions (used by tests)
     "_compute_delta_ci",
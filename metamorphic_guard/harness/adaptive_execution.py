@@ -6,11 +6,11 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, Tuple
 
-from ..adaptive import AdaptiveConfig, AdaptiveDecision, compute_interim_metrics, should_continue_adaptive
-from .reporting import evaluate_roles
+from ..adaptive import AdaptiveConfig, should_continue_adaptive
+from .reporting import evaluate_roles, merge_results
 from ..observability import log_event
 from ..specs import Spec
-from .execution import ExecutionPlan, execute_implementations, prepare_execution_plan
+from .execution import ExecutionPlan, execute_implementations
 from ..early_stopping import EarlyStoppingConfig, should_stop_early
 from ..harness.statistics import PassRateMetrics
 
@@ -126,6 +126,10 @@ def execute_adaptively(
     
     # Execute in chunks, checking power after each
     processed = 0
+    # Running metrics over the first `evaluated` cases, extended at each check
+    evaluated = 0
+    baseline_metrics: Optional[Dict[str, Any]] = None
+    candidate_metrics: Optional[Dict[str, Any]] = None
     while processed < len(test_inputs):
         # Determine how many to execute in this chunk
         chunk_end = min(processed + chunk_size, len(test_inputs))
@@ -173,19 +177,13 @@ def execute_adaptively(
                     should_check = True
         
         if should_check:
-            # Compute interim metrics
-            interim_baseline, interim_candidate = compute_interim_metrics(
-                baseline_results,
-                candidate_results,
+            # Only cases added since the last check are evaluated; earlier
+            # outcomes are carried in the running metrics
+            chunk_baseline_metrics, chunk_candidate_metrics = evaluate_roles(
                 spec=spec,
-            )
-            
-            # Evaluate results to get proper metrics
-            baseline_metrics, candidate_metrics = evaluate_roles(
-                spec=spec,
-                test_inputs=test_inputs[:processed],
-                baseline_results=baseline_results,
-                candidate_results=candidate_results,
+                test_inputs=test_inputs[evaluated:processed],
+                baseline_results=baseline_results[evaluated:processed],
+                candidate_results=candidate_results[evaluated:processed],
                 baseline_path=baseline_path,
                 candidate_path=candidate_path,
                 timeout_s=timeout_s,
@@ -195,7 +193,12 @@ def execute_adaptively(
                 executor=executor,
                 executor_config=executor_config,
                 shrink_violations=shrink_violations,
+                workers=plan.worker_count,
+                index_offset=evaluated,
             )
+            baseline_metrics = merge_results(baseline_metrics, chunk_baseline_metrics, violation_cap)
+            candidate_metrics = merge_results(candidate_metrics, chunk_candidate_metrics, violation_cap)
+            evaluated = processed
             
             # Check adaptive decision
             decision = should_continue_adaptive(
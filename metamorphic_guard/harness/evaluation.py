@@ -7,7 +7,7 @@ from __future__ import annotations
 import hashlib
 import json
 import warnings
-from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+from typing import Any, Hashable, Iterator, List, Optional, Sequence, Tuple
 
 from ..audit import write_audit_entry
 from ..dispatch import Dispatcher
@@ -25,7 +25,6 @@ from ..util import (
     write_failed_artifacts,
 )
 from .execution import (
-    ExecutionPlan,
     build_call_spec,
     execute_implementations,
     prepare_execution_plan,
@@ -47,20 +46,56 @@ from .statistics import (
 from .trust import compute_trust_scores
 
 
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
 def _serialize_for_report(value: Any) -> JSONValue:
     """
     Convert an arbitrary object into a JSON-friendly structure.
     Non-serializable objects are represented via repr().
+
+    Containers whose contents are already serializable are returned unchanged,
+    so only the offending leaves are rewritten, in a single pass.
     """
-    try:
-        json.dumps(value)
+    if isinstance(value, _JSON_SCALARS):
         return value
-    except (TypeError, ValueError):
-        if isinstance(value, dict):
-            return {str(k): _serialize_for_report(v) for k, v in value.items()}
-        if isinstance(value, (list, tuple, set)):
-            return [_serialize_for_report(item) for item in value]
-        return repr(value)
+    if isinstance(value, dict):
+        items = {k: _serialize_for_report(v) for k, v in value.items()}
+        if all(isinstance(k, _JSON_SCALARS) for k in value) and all(
+            items[k] is v for k, v in value.items()
+        ):
+            return value
+        return {str(k): v for k, v in items.items()}
+    if isinstance(value, (list, tuple)):
+        converted = [_serialize_for_report(item) for item in value]
+        if all(new is old for new, old in zip(converted, value)):
+            return value
+        return converted
+    if isinstance(value, set):
+        return [_serialize_for_report(item) for item in value]
+    return repr(value)
+
+
+def iter_cases(
+    spec: Spec,
+    test_inputs: Sequence[Tuple[object, ...]],
+    cluster_labels: Optional[Sequence[Hashable]] = None,
+    formatted_inputs: Optional[Sequence[str]] = None,
+) -> Iterator[JSONDict]:
+    """
+    Yield the per-case trace entries that ``run_eval`` stores under ``result["cases"]``.
+
+    Useful with ``run_eval(..., include_cases=False)`` to build the trace on demand.
+    """
+    clusters = cluster_labels or []
+    for index, args in enumerate(test_inputs):
+        cluster_value = clusters[index] if index < len(clusters) else index
+        yield {
+            "index": index,
+            "input": _serialize_for_report(args),
+            "formatted": formatted_inputs[index] if formatted_inputs is not None else spec.fmt_in(args),
+            "cluster": _serialize_for_report(cluster_value),
+        }
 
 
 def _fingerprint_payload(payload: JSONValue) -> str:
@@ -117,12 +152,17 @@ def run_eval(
     adaptive_group_sequential: bool = False,
     adaptive_sequential_method: str = "pocock",
     adaptive_max_looks: int = 5,
+    concurrent_roles: Optional[bool] = None,
+    dedupe_inputs: bool = False,
+    include_cases: bool = True,
     **deprecated_kwargs: Any,
 ) -> JSONDict:
     """
     Run evaluation comparing baseline and candidate implementations.
 
     Returns comprehensive metrics including bootstrap confidence intervals.
+    With ``include_cases=False`` the per-case trace (``result["cases"]``) is
+    omitted; ``iter_cases`` can rebuild it later.
     """
     if "improve_delta" in deprecated_kwargs:
         warnings.warn(
@@ -234,6 +274,8 @@ def run_eval(
             baseline_executor_config=baseline_executor_config,
             candidate_executor=candidate_executor,
             candidate_executor_config=candidate_executor_config,
+            concurrent_roles=concurrent_roles,
+            dedupe_inputs=dedupe_inputs,
         )
         adaptive_metadata = {"adaptive_testing": False}
     baseline_llm_summary = summarize_llm_results(baseline_results)
@@ -255,6 +297,9 @@ def run_eval(
         None,
     )
 
+    # Formatted once and shared by both roles' violation reports and the case list;
+    # without the case list only violating cases are formatted
+    formatted_inputs = [spec.fmt_in(args) for args in test_inputs] if include_cases else None
     baseline_metrics, candidate_metrics = evaluate_roles(
         spec=spec,
         test_inputs=test_inputs,
@@ -269,6 +314,8 @@ def run_eval(
         executor=executor,
         executor_config=executor_config,
         shrink_violations=shrink_violations,
+        formatted_inputs=formatted_inputs,
+        workers=worker_count,
     )
 
     paired_stats = compute_paired_stats(
@@ -432,17 +479,14 @@ def run_eval(
         if descriptor:
             result["config"]["policy_rule"] = _serialize_for_report(descriptor)
     
-    baseline_clusters = baseline_metrics.get("cluster_labels") or []
-    result["cases"] = []
-    for index, args in enumerate(test_inputs):
-        cluster_value = baseline_clusters[index] if index < len(baseline_clusters) else index
-        result["cases"].append(
-            {
-                "index": index,
-                "input": _serialize_for_report(args),
-                "formatted": spec.fmt_in(args),
-                "cluster": _serialize_for_report(cluster_value),
-            }
+    if include_cases:
+        result["cases"] = list(
+            iter_cases(
+                spec,
+                test_inputs,
+                baseline_metrics.get("cluster_labels"),
+                formatted_inputs,
+            )
         )
 
     try:
@@ -5,19 +5,35 @@ Execution logic for running test cases and managing execution plans.
 from __future__ import annotations
 
 import hashlib
+import os
+import pickle
 import random
 import uuid
-from dataclasses import dataclass
-from typing import Callable, List, Optional, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
 
-from ..dispatch import Dispatcher, ensure_dispatcher
-from ..monitoring import Monitor, MonitorContext
+from ..dispatch import BatchRunner, Dispatcher, LocalDispatcher, ensure_dispatcher
+from ..monitoring import Monitor, MonitorContext, MonitorRecord
 from ..observability import add_log_context, log_event
-from ..sandbox import run_in_sandbox
+from ..sandbox import run_batch_in_sandbox, run_in_sandbox
 from ..specs import Spec
 from ..types import JSONDict
 
 
+def _sandbox_batch_size() -> int:
+    """
+    Cases per sandbox process, from ``METAMORPHIC_GUARD_SANDBOX_BATCH``.
+
+    Batching is off by default because batched cases share one interpreter;
+    8 is a reasonable starting point when implementations are stateless.
+    """
+    try:
+        return max(1, int(os.environ.get("METAMORPHIC_GUARD_SANDBOX_BATCH", "1")))
+    except ValueError:
+        return 1
+
+
 @dataclass
 class ExecutionPlan:
     """Plan for executing an evaluation."""
@@ -104,8 +120,25 @@ def execute_implementations(
     baseline_executor_config: JSONDict | None,
     candidate_executor: Optional[str],
     candidate_executor_config: JSONDict | None,
+    concurrent_roles: Optional[bool] = None,
+    dedupe_inputs: bool = False,
 ) -> Tuple[List[JSONDict], List[JSONDict]]:
-    """Execute baseline and candidate implementations."""
+    """
+    Execute baseline and candidate implementations.
+
+    With ``concurrent_roles`` and a ``LocalDispatcher`` the two roles run at the
+    same time, overlapping their sandbox waits; that doubles the number of
+    in-flight sandbox (or LLM) calls. The default (None) only does so when the
+    plan already runs more than one worker. Other dispatchers keep per-run
+    state (e.g. queue adapters are reset on every ``execute``) and run the roles
+    one after the other.
+
+    With ``dedupe_inputs`` each distinct input is executed once per role and its
+    result is copied to every position it occurs at. Only use it for
+    deterministic implementations; monitors then see one record per distinct
+    input. ``run_case`` and monitor records still carry original case indices
+    (the first occurrence of each input).
+    """
     def make_runner(
         file_path: str,
         role_executor: Optional[str],
@@ -122,11 +155,45 @@ def execute_implementations(
                 executor_config=role_executor_config,
             )
 
+        if case_indices is not None:
+            return _with_original_indices(_run_case, case_indices)
         return _run_case
 
+    def make_batch_runner(
+        file_path: str,
+        role_executor: Optional[str],
+        role_executor_config: JSONDict | None,
+        batch_size: int,
+    ) -> BatchRunner:
+        # The sandbox batch ignores case indices, so deduplicated positions need no remapping
+        def _run_batch(
+            indices: Sequence[int], args_list: Sequence[Tuple[object, ...]]
+        ) -> List[JSONDict]:
+            return run_batch_in_sandbox(
+                file_path,
+                "solve",
+                args_list,
+                timeout_s,
+                mem_mb,
+                executor=role_executor,
+                executor_config=role_executor_config,
+            )
+
+        return BatchRunner(run=_run_batch, size=batch_size)
+
     dispatcher_obj = plan.dispatcher
     monitors = plan.monitors
     test_inputs = plan.test_inputs
+    inverse: Optional[List[int]] = None
+    case_indices: Optional[List[int]] = None
+    if dedupe_inputs:
+        unique_inputs, inverse, first_indices = _dedupe_inputs(test_inputs)
+        if len(unique_inputs) == len(inverse):
+            inverse = None
+        else:
+            test_inputs = unique_inputs
+            case_indices = first_indices
+            monitors = [_IndexRemappingMonitor(monitor, first_indices) for monitor in monitors]
 
     baseline_effective_executor = baseline_executor if baseline_executor is not None else executor
     baseline_effective_config = (
@@ -139,7 +206,7 @@ def execute_implementations(
         candidate_executor_config if candidate_executor_config is not None else executor_config
     )
 
-    baseline_results = dispatcher_obj.execute(
+    baseline_kwargs = dict(
         test_inputs=test_inputs,
         run_case=make_runner(
             baseline_path,
@@ -157,7 +224,7 @@ def execute_implementations(
         ),
         seed=plan.seed,
     )
-    candidate_results = dispatcher_obj.execute(
+    candidate_kwargs = dict(
         test_inputs=test_inputs,
         run_case=make_runner(
             candidate_path,
@@ -175,9 +242,96 @@ def execute_implementations(
         ),
         seed=plan.seed,
     )
+    batch_size = _sandbox_batch_size()
+    if batch_size > 1 and isinstance(dispatcher_obj, LocalDispatcher):
+        # Only LocalDispatcher coalesces cases; other dispatchers keep calling run_case
+        baseline_kwargs["batch_runner"] = make_batch_runner(
+            baseline_path, baseline_effective_executor, baseline_effective_config, batch_size
+        )
+        candidate_kwargs["batch_runner"] = make_batch_runner(
+            candidate_path, candidate_effective_executor, candidate_effective_config, batch_size
+        )
+    if concurrent_roles is None:
+        concurrent_roles = plan.worker_count > 1
+    if concurrent_roles and isinstance(dispatcher_obj, LocalDispatcher):
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="metaguard-role") as pool:
+            baseline_future = pool.submit(dispatcher_obj.execute, **baseline_kwargs)
+            candidate_future = pool.submit(dispatcher_obj.execute, **candidate_kwargs)
+            baseline_results = baseline_future.result()
+            candidate_results = candidate_future.result()
+    else:
+        baseline_results = dispatcher_obj.execute(**baseline_kwargs)
+        candidate_results = dispatcher_obj.execute(**candidate_kwargs)
+    if inverse is not None:
+        baseline_results = _scatter_results(baseline_results, inverse)
+        candidate_results = _scatter_results(candidate_results, inverse)
     return baseline_results, candidate_results
 
 
+def _dedupe_inputs(
+    test_inputs: Sequence[Tuple[object, ...]],
+) -> Tuple[List[Tuple[object, ...]], List[int], List[int]]:
+    """
+    Return the distinct inputs in first-seen order, each input's position among
+    them, and the original case index of each distinct input.
+    """
+    positions: Dict[Hashable, int] = {}
+    unique: List[Tuple[object, ...]] = []
+    inverse: List[int] = []
+    first_indices: List[int] = []
+    for index, args in enumerate(test_inputs):
+        key = relation_cache_key(-1, args)
+        position = positions.get(key)
+        if position is None:
+            position = positions[key] = len(unique)
+            unique.append(args)
+            first_indices.append(index)
+        inverse.append(position)
+    return unique, inverse, first_indices
+
+
+def _with_original_indices(
+    run_case: Callable[[int, Tuple[object, ...]], JSONDict], first_indices: Sequence[int]
+) -> Callable[[int, Tuple[object, ...]], JSONDict]:
+    """Wrap a runner so deduplicated positions reach it as original case indices."""
+    def _run_case(index: int, call_args: Tuple[object, ...]) -> JSONDict:
+        return run_case(first_indices[index], call_args)
+
+    return _run_case
+
+
+class _IndexRemappingMonitor(Monitor):
+    """Forwards records to ``monitor`` with deduplicated positions mapped to case indices."""
+
+    def __init__(self, monitor: Monitor, first_indices: Sequence[int]) -> None:
+        super().__init__()
+        self._monitor = monitor
+        self._first_indices = first_indices
+
+    def identifier(self) -> str:
+        return self._monitor.identifier()
+
+    def record(self, record: MonitorRecord) -> None:
+        self._monitor.record(replace(record, case_index=self._first_indices[record.case_index]))
+
+    def finalize(self) -> JSONDict:
+        return self._monitor.finalize()
+
+
+def _scatter_results(unique_results: Sequence[JSONDict], inverse: Sequence[int]) -> List[JSONDict]:
+    """Expand per-distinct-input results back to case order; repeats get their own dict."""
+    seen: set[int] = set()
+    results: List[JSONDict] = []
+    for position in inverse:
+        result = unique_results[position]
+        if position in seen:
+            result = dict(result)
+        else:
+            seen.add(position)
+        results.append(result)
+    return results
+
+
 def relation_rng(
     seed: int,
     case_index: int,
@@ -188,7 +342,9 @@ def relation_rng(
     Build a deterministic RNG for a relation invocation.
 
     The construction uses a stable hash so results are reproducible across Python
-    invocations regardless of PYTHONHASHSEED.
+    invocations regardless of PYTHONHASHSEED. The SHA-256 seed derivation is part of
+    that contract: changing it would re-randomize every seeded relation in replays of
+    existing reports, and it costs far less than constructing the ``Random`` itself.
     """
     payload = f"{seed}:{case_index}:{relation_index}:{relation_name}".encode("utf-8")
     digest = hashlib.sha256(payload).digest()
@@ -196,9 +352,25 @@ def relation_rng(
     return random.Random(seed_int)
 
 
-def relation_cache_key(relation_index: int, args: Tuple[object, ...]) -> str:
-    """Build a stable cache key for relation reruns."""
-    return f"{relation_index}:{repr(args)}"
+# Types whose equality implies identical behaviour (unlike 1 == 1.0 == True or 0.0 == -0.0)
+_EXACT_KEY_TYPES = frozenset({str, int, bytes, type(None)})
+
+
+def relation_cache_key(relation_index: int, args: Tuple[object, ...]) -> Hashable:
+    """
+    Build a cache key for relation reruns; args that differ never share a key.
+
+    Flat tuples of str/int/bytes/None are used as-is. Anything else is keyed by
+    a 16-byte digest of its pickle (or ``repr`` when it can't be pickled), which
+    avoids building and hashing a long ``repr`` for large nested inputs.
+    """
+    if type(args) is tuple and all(type(arg) in _EXACT_KEY_TYPES for arg in args):
+        return (relation_index, args)
+    try:
+        payload = pickle.dumps(args, protocol=5)
+    except Exception:
+        payload = repr(args).encode("utf-8", "backslashreplace")
+    return (relation_index, hashlib.blake2b(payload, digest_size=16).digest())
 
 
 def build_call_spec(
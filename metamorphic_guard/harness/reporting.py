@@ -7,21 +7,31 @@ from __future__ import annotations
 import math
 import random
 from collections import defaultdict
-from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+from functools import partial
+from operator import itemgetter
+from typing import Callable, Dict, Generator, Hashable, List, Optional, Sequence, Tuple
 
+import numpy as np
+
+from ..dispatch import LocalDispatcher
 from ..multiple_comparisons import apply_multiple_comparisons_correction
 from ..observability import increment_metric
 from ..sandbox import run_in_sandbox
 from ..specs import Metric, Spec
 from ..types import JSONDict
 from .execution import relation_cache_key, relation_rng
-from .statistics import percentile, two_proportion_p_value
+from .statistics import _resampled_sums, compute_bca_interval, percentiles, two_proportion_p_value
 
 try:
     from ..shrink import shrink_input
 except ImportError:
     shrink_input = None  # type: ignore
 
+# Relations a case reached, plus the failing relation's stats entry and violation builder
+_RelationOutcome = Tuple[int, Optional[Tuple[JSONDict, Callable[[], JSONDict]]]]
+# Yields (cache key, transformed args) per rerun, receives its result, returns the outcome
+_RelationChecks = Generator[Tuple[Hashable, Tuple[object, ...]], JSONDict, _RelationOutcome]
+
 
 def summarize_llm_results(results: Sequence[JSONDict]) -> JSONDict:
     """Summarize LLM execution results with cost, tokens, and latency metrics."""
@@ -134,8 +144,45 @@ def evaluate_roles(
     executor: Optional[str],
     executor_config: JSONDict | None,
     shrink_violations: bool,
+    formatted_inputs: Optional[Sequence[str]] = None,
+    workers: int = 1,
+    index_offset: int = 0,
 ) -> Tuple[JSONDict, JSONDict]:
-    """Evaluate baseline and candidate results against spec."""
+    """
+    Evaluate baseline and candidate results against spec.
+
+    With ``workers > 1`` each role's relation reruns are issued in parallel
+    waves, one per relation depth, through a `LocalDispatcher` instead of one
+    sandbox at a time.
+    Without ``formatted_inputs``, both roles share one lazily filled cache of
+    formatted inputs, so a case violating in both is formatted once.
+    """
+    if formatted_inputs is None:
+        formatted_inputs = _LazyFormattedInputs(spec.fmt_in, test_inputs)
+
+    def rerun_for(path: str) -> Callable[[Tuple[object, ...]], JSONDict]:
+        return lambda call_args: run_in_sandbox(
+            path,
+            "solve",
+            call_args,
+            timeout_s,
+            mem_mb,
+            executor=executor,
+            executor_config=executor_config,
+        )
+
+    def rerun_many_for(
+        path: str, role: str
+    ) -> Optional[Callable[[Sequence[Tuple[object, ...]]], List[JSONDict]]]:
+        if workers <= 1:
+            return None
+        rerun = rerun_for(path)
+        return lambda inputs: LocalDispatcher(workers).execute(
+            test_inputs=inputs,
+            run_case=lambda _index, call_args: rerun(call_args),
+            role=role,
+        )
+
     baseline_metrics = evaluate_results(
         baseline_results,
         spec,
@@ -143,16 +190,11 @@ def evaluate_roles(
         violation_cap,
         role="baseline",
         seed=seed,
-        rerun=lambda call_args: run_in_sandbox(
-            baseline_path,
-            "solve",
-            call_args,
-            timeout_s,
-            mem_mb,
-            executor=executor,
-            executor_config=executor_config,
-        ),
+        rerun=rerun_for(baseline_path),
         shrink_violations=shrink_violations,
+        formatted_inputs=formatted_inputs,
+        rerun_many=rerun_many_for(baseline_path, "baseline"),
+        index_offset=index_offset,
     )
     candidate_metrics = evaluate_results(
         candidate_results,
@@ -161,20 +203,45 @@ def evaluate_roles(
         violation_cap,
         role="candidate",
         seed=seed,
-        rerun=lambda call_args: run_in_sandbox(
-            candidate_path,
-            "solve",
-            call_args,
-            timeout_s,
-            mem_mb,
-            executor=executor,
-            executor_config=executor_config,
-        ),
+        rerun=rerun_for(candidate_path),
         shrink_violations=shrink_violations,
+        formatted_inputs=formatted_inputs,
+        rerun_many=rerun_many_for(candidate_path, "candidate"),
+        index_offset=index_offset,
     )
     return baseline_metrics, candidate_metrics
 
 
+def _memoized(compute: Callable[[], str]) -> Callable[[], str]:
+    """Wrap a zero-argument formatter so it runs at most once."""
+    cache: List[str] = []
+
+    def get() -> str:
+        if not cache:
+            cache.append(compute())
+        return cache[0]
+
+    return get
+
+
+class _LazyFormattedInputs(Sequence[str]):
+    """``fmt_in`` of each test input, computed on first access and kept."""
+
+    def __init__(self, fmt_in: Callable[[Tuple[object, ...]], str], test_inputs: Sequence[Tuple[object, ...]]) -> None:
+        self._fmt_in = fmt_in
+        self._test_inputs = test_inputs
+        self._formatted: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._test_inputs)
+
+    def __getitem__(self, index: int) -> str:  # type: ignore[override]
+        formatted = self._formatted.get(index)
+        if formatted is None:
+            formatted = self._formatted[index] = self._fmt_in(self._test_inputs[index])
+        return formatted
+
+
 def evaluate_results(
     results: Sequence[JSONDict],
     spec: Spec,
@@ -185,15 +252,44 @@ def evaluate_results(
     seed: int,
     rerun: Callable[[Tuple[object, ...]], JSONDict],
     shrink_violations: bool = False,
+    formatted_inputs: Optional[Sequence[str]] = None,
+    rerun_many: Optional[Callable[[Sequence[Tuple[object, ...]]], List[JSONDict]]] = None,
+    index_offset: int = 0,
 ) -> JSONDict:
-    """Evaluate results against properties and metamorphic relations."""
+    """
+    Evaluate results against properties and metamorphic relations.
+
+    ``formatted_inputs`` holds ``spec.fmt_in`` of each test input when the
+    caller has already computed it; otherwise each case is formatted at most
+    once, on its first violation. Outputs are likewise formatted once per case,
+    and only for violations under ``violation_cap``. Shrinking runs once per
+    violating case, however many violations that case has. Once that cap is reached,
+    a case's remaining properties are not checked after its first failure.
+
+    Each case's relations are checked in order and stop at its first failure;
+    later transforms are never called. With ``rerun_many``, cases advance
+    together one relation at a time and each round's distinct reruns are
+    issued in one call, so only reruns the one-at-a-time path would reach are
+    run, and violations and relation stats match it.
+
+    ``index_offset`` is the suite position of ``results[0]``; it numbers the
+    reported test cases and seeds relation RNGs, so a slice of a suite can be
+    evaluated on its own and combined with `merge_results`.
+    """
     passes = 0
     total = len(results)
     prop_violations: list[JSONDict] = []
     mr_violations: list[JSONDict] = []
-    pass_indicators: list[int] = []
-    cluster_labels: list[Hashable] = []
-    rerun_cache: Dict[str, JSONDict] = {}
+    prop_v_count = mr_v_count = 0
+    # Loop invariants, resolved once rather than per case
+    hard_props = [prop for prop in spec.properties if prop.mode == "hard"]
+    fmt_in = spec.fmt_in
+    fmt_out = spec.fmt_out
+    equivalence = spec.equivalence
+    cluster_key = spec.cluster_key
+    # One byte per case; numpy reads it through the buffer protocol without boxing
+    pass_indicators = bytearray(min(total, len(test_inputs)))
+    rerun_cache: Dict[Hashable, JSONDict] = {}
     relation_stats: Dict[str, JSONDict] = {}
     for relation in spec.relations:
         relation_stats[relation.name] = {
@@ -202,129 +298,69 @@ def evaluate_results(
             "total": 0,
             "failures": 0,
         }
-
-    for idx, (result, args) in enumerate(zip(results, test_inputs)):
-        cluster_value = spec.cluster_key(args) if spec.cluster_key else idx
-        cluster_labels.append(cluster_value)
-        if not result["success"]:
-            pass_indicators.append(0)
-            increment_metric(role, "failure")
-            if len(prop_violations) < violation_cap:
-                prop_violations.append(
-                    {
-                        "test_case": idx,
-                        "property": "execution",
-                        "input": spec.fmt_in(args),
-                        "output": "",
-                        "error": result.get("error") or "Execution failed",
-                    }
-                )
-            continue
-
-        output = result["result"]
-        prop_passed = True
-        for prop in spec.properties:
-            if prop.mode != "hard":
-                continue
-            try:
-                if not prop.check(output, *args):
-                    prop_passed = False
-                    if len(prop_violations) < violation_cap:
-                        prop_violations.append(
-                            {
-                                "test_case": idx,
-                                "property": prop.description,
-                                "input": spec.fmt_in(args),
-                                "output": spec.fmt_out(output),
-                            }
-                        )
-            except Exception as exc:
-                prop_passed = False
-                if len(prop_violations) < violation_cap:
-                    prop_violations.append(
-                        {
-                            "test_case": idx,
-                            "property": prop.description,
-                            "input": spec.fmt_in(args),
-                            "output": spec.fmt_out(output),
-                            "error": str(exc),
-                        }
-                    )
-
-        if not prop_passed:
-            pass_indicators.append(0)
-            increment_metric(role, "failure")
-            continue
-
-        mr_passed = True
-        for relation_index, relation in enumerate(spec.relations):
-            stats_entry = relation_stats.setdefault(
-                relation.name,
-                {
-                    "category": relation.category or "uncategorized",
-                    "description": relation.description,
-                    "total": 0,
-                    "failures": 0,
-                },
-            )
-            stats_entry["total"] += 1
-            relation_rng_obj = None
-            if relation.accepts_rng:
-                relation_rng_obj = relation_rng(seed, idx, relation_index, relation.name)
+    # Resolved once; relations sharing a name share an entry, as before
+    relation_entries = [
+        (relation_index, relation, relation_stats[relation.name])
+        for relation_index, relation in enumerate(spec.relations)
+    ]
+
+    # Relation outcome of each case that passed execution and hard properties, in
+    # case order; with rerun_many, the cases' checks wait in mr_pending until then
+    mr_outcomes: List[Tuple[int, _RelationOutcome]] = []
+    mr_pending: List[Tuple[int, _RelationChecks]] = []
+
+    def relation_checks(
+        idx: int,
+        args: Tuple[object, ...],
+        output: object,
+        format_input: Callable[[], str],
+        format_output: Callable[[], str],
+    ) -> _RelationChecks:
+        """Check a case's relations in order, yielding each rerun; stops at the first failure."""
+        for reached, (relation_index, relation, stats_entry) in enumerate(relation_entries, 1):
             try:
                 if relation.accepts_rng:
+                    relation_rng_obj = relation_rng(seed, idx, relation_index, relation.name)
                     transformed_args = relation.transform(*args, rng=relation_rng_obj)
                 else:
                     transformed_args = relation.transform(*args)
             except Exception as exc:  # User-provided relation.transform may raise any exception
-                mr_passed = False
-                stats_entry["failures"] += 1
-                if len(mr_violations) < violation_cap:
-                    mr_violations.append(
-                        {
-                            "test_case": idx,
-                            "relation": relation.name,
-                            "input": spec.fmt_in(args),
-                            "output": spec.fmt_out(output),
-                            "error": str(exc),
-                        }
-                    )
-                break
+                error = str(exc)
+                return reached, (
+                    stats_entry,
+                    lambda: {
+                        "test_case": idx,
+                        "relation": relation.name,
+                        "input": format_input(),
+                        "output": format_output(),
+                        "error": error,
+                    },
+                )
 
-            cache_key = relation_cache_key(relation_index, transformed_args)
-            if cache_key in rerun_cache:
-                relation_result = rerun_cache[cache_key]
-            else:
-                relation_result = rerun(transformed_args)
-                rerun_cache[cache_key] = relation_result
+            relation_result = yield relation_cache_key(relation_index, transformed_args), transformed_args
             if not relation_result["success"]:
-                mr_passed = False
-                stats_entry["failures"] += 1
-                if len(mr_violations) < violation_cap:
-                    mr_violations.append(
-                        {
-                            "test_case": idx,
-                            "relation": relation.name,
-                            "input": spec.fmt_in(transformed_args),
-                            "output": "",
-                            "error": relation_result.get("error") or "Execution failed",
-                        }
-                    )
-                break
+                return reached, (
+                    stats_entry,
+                    lambda: {
+                        "test_case": idx,
+                        "relation": relation.name,
+                        "input": fmt_in(transformed_args),
+                        "output": "",
+                        "error": relation_result.get("error") or "Execution failed",
+                    },
+                )
 
             relation_output = relation_result["result"]
             equivalent = False
             
             if relation.expect == "equal":
-                equivalent = spec.equivalence(output, relation_output)
+                equivalent = equivalence(output, relation_output)
             elif relation.expect == "not_equal":
-                equivalent = not spec.equivalence(output, relation_output)
+                equivalent = not equivalence(output, relation_output)
             elif relation.expect == "properties_hold":
                 # Verify that relation_output passes all hard properties
                 equivalent = True
-                for prop in spec.properties:
-                    if prop.mode != "hard":
-                        continue
+                for prop in hard_props:
                     try:
                         if not prop.check(relation_output, *transformed_args):
                             equivalent = False
@@ -336,32 +372,168 @@ def evaluate_results(
                 raise ValueError(f"Unsupported relation expectation: {relation.expect}")
 
             if not equivalent:
-                mr_passed = False
-                stats_entry["failures"] += 1
-                if len(mr_violations) < violation_cap:
-                    mr_violations.append(
+                return reached, (
+                    stats_entry,
+                    lambda: {
+                        "test_case": idx,
+                        "relation": relation.name,
+                        "input": format_input(),
+                        "output": format_output(),
+                        "relation_output": fmt_out(relation_output),
+                    },
+                )
+        return len(relation_entries), None
+
+    def drive_sequentially(checks: _RelationChecks) -> _RelationOutcome:
+        """Run one case's relation checks, one rerun at a time."""
+        try:
+            cache_key, call_args = next(checks)
+            while True:
+                if cache_key not in rerun_cache:
+                    rerun_cache[cache_key] = rerun(call_args)
+                cache_key, call_args = checks.send(rerun_cache[cache_key])
+        except StopIteration as stop:
+            return stop.value
+
+    def drive_in_waves(all_checks: List[_RelationChecks]) -> List[_RelationOutcome]:
+        """Advance every case's checks together, issuing each round's distinct reruns as one wave."""
+        outcomes: List[Optional[_RelationOutcome]] = [None] * len(all_checks)
+        waiting: List[Tuple[int, _RelationChecks, Tuple[Hashable, Tuple[object, ...]]]] = []
+        for slot, checks in enumerate(all_checks):
+            try:
+                waiting.append((slot, checks, next(checks)))
+            except StopIteration as stop:
+                outcomes[slot] = stop.value
+        while waiting:
+            wave: Dict[Hashable, Tuple[object, ...]] = {}
+            for _, _, (cache_key, call_args) in waiting:
+                if cache_key not in rerun_cache and cache_key not in wave:
+                    wave[cache_key] = call_args
+            if wave:
+                rerun_cache.update(zip(wave.keys(), rerun_many(list(wave.values()))))
+            still_waiting = []
+            for slot, checks, (cache_key, _) in waiting:
+                try:
+                    still_waiting.append((slot, checks, checks.send(rerun_cache[cache_key])))
+                except StopIteration as stop:
+                    outcomes[slot] = stop.value
+            waiting = still_waiting
+        return outcomes  # type: ignore[return-value]
+
+    # Pull the per-case fields out once so the property loop only visits executed cases
+    successes = [result["success"] for result, _ in zip(results, test_inputs)]
+    outputs = [result["result"] if ok else None for result, ok in zip(results, successes)]
+    failed_positions = [pos for pos, ok in enumerate(successes) if not ok]
+    if cluster_key:
+        cluster_labels = [cluster_key(args) for args, _ in zip(test_inputs, successes)]
+    else:
+        cluster_labels = list(range(index_offset, index_offset + len(successes)))
+
+    if formatted_inputs is None:
+        formatted_inputs = _LazyFormattedInputs(fmt_in, test_inputs)
+
+    def input_formatter(pos: int) -> Callable[[], str]:
+        return partial(formatted_inputs.__getitem__, pos)
+
+    for executed, pos in enumerate(pos for pos, ok in enumerate(successes) if ok):
+        idx = pos + index_offset
+        args = test_inputs[pos]
+        output = outputs[pos]
+        format_input = input_formatter(pos)
+        format_output = _memoized(partial(fmt_out, output))
+        # Violations shared the cap in case order; the failed cases before this
+        # one each take a slot, and are recorded after this loop
+        cap_left = violation_cap - (pos - executed)
+
+        prop_passed = True
+        for prop in hard_props:
+            try:
+                if not prop.check(output, *args):
+                    prop_passed = False
+                    if prop_v_count < cap_left:
+                        prop_violations.append(
+                            {
+                                "test_case": idx,
+                                "property": prop.description,
+                                "input": format_input(),
+                                "output": format_output(),
+                            }
+                        )
+                        prop_v_count += 1
+            except Exception as exc:
+                prop_passed = False
+                if prop_v_count < cap_left:
+                    prop_violations.append(
                         {
                             "test_case": idx,
-                            "relation": relation.name,
-                            "input": spec.fmt_in(args),
-                            "output": spec.fmt_out(output),
-                            "relation_output": spec.fmt_out(relation_output),
+                            "property": prop.description,
+                            "input": format_input(),
+                            "output": format_output(),
+                            "error": str(exc),
                         }
                     )
+                    prop_v_count += 1
+            if not prop_passed and prop_v_count >= cap_left:
+                # The case has failed and no further violation can be recorded
                 break
 
-        if mr_passed:
+        if not prop_passed:
+            increment_metric(role, "failure")
+            continue
+
+        checks = relation_checks(idx, args, output, format_input, format_output)
+        if rerun_many is None:
+            mr_outcomes.append((idx, drive_sequentially(checks)))
+        else:
+            mr_pending.append((idx, checks))
+
+    execution_violations: list[JSONDict] = []
+    properties_before = 0
+    for rank, pos in enumerate(failed_positions):
+        increment_metric(role, "failure")
+        idx = pos + index_offset
+        while properties_before < prop_v_count and prop_violations[properties_before]["test_case"] < idx:
+            properties_before += 1
+        if rank + properties_before < violation_cap:
+            execution_violations.append(
+                {
+                    "test_case": idx,
+                    "property": "execution",
+                    "input": input_formatter(pos)(),
+                    "output": "",
+                    "error": results[pos].get("error") or "Execution failed",
+                }
+            )
+    if execution_violations:
+        # Stable, so each case keeps its properties' order
+        prop_violations = sorted(prop_violations + execution_violations, key=itemgetter("test_case"))
+
+    if mr_pending:
+        pending_outcomes = drive_in_waves([checks for _, checks in mr_pending])
+        mr_outcomes.extend(zip((idx for idx, _ in mr_pending), pending_outcomes))
+
+    for idx, (reached, failure) in mr_outcomes:
+        for _, _, stats_entry in relation_entries[:reached]:
+            stats_entry["total"] += 1
+        if failure is None:
             passes += 1
-            pass_indicators.append(1)
+            pass_indicators[idx - index_offset] = 1
             increment_metric(role, "success")
-        else:
-            pass_indicators.append(0)
-            increment_metric(role, "failure")
+            continue
+        stats_entry, make_violation = failure
+        stats_entry["failures"] += 1
+        if mr_v_count < violation_cap:
+            mr_violations.append(make_violation())
+            mr_v_count += 1
+        increment_metric(role, "failure")
 
     # Shrink violations if enabled
     if shrink_violations and shrink_input is not None:
-        def _shrink_violation(violation: JSONDict, original_args: Tuple[object, ...]) -> JSONDict:
-            """Shrink a violation's input while preserving the failure."""
+        # Formatted shrunk input per case position, or None when it did not shrink
+        shrunk_inputs: Dict[int, Optional[str]] = {}
+
+        def _shrunk_input(original_args: Tuple[object, ...]) -> Optional[str]:
+            """Shrink a violating case's input while preserving the failure, formatted."""
             def test_fails(shrunken_args: Tuple[object, ...]) -> bool:
                 """Test if shrunken args still fail."""
                 try:
@@ -370,13 +542,12 @@ def evaluate_results(
                         return True
                     output = result.get("result")
                     # Check properties
-                    for prop in spec.properties:
-                        if prop.mode == "hard":
-                            try:
-                                if not prop.check(output, *shrunken_args):
-                                    return True
-                            except Exception:
+                    for prop in hard_props:
+                        try:
+                            if not prop.check(output, *shrunken_args):
                                 return True
+                        except Exception:
+                            return True
                     return False
                 except Exception:
                     return True
@@ -384,27 +555,23 @@ def evaluate_results(
             try:
                 shrunk_args = shrink_input(original_args, test_fails)
                 if shrunk_args != original_args:
-                    violation["shrunk_input"] = spec.fmt_in(shrunk_args)
-                    violation["original_input"] = violation.get("input")
-                    violation["input"] = spec.fmt_in(shrunk_args)
+                    return fmt_in(shrunk_args)
             except Exception:  # shrink_input may raise any exception, keep original on failure
                 # Shrinking failed, keep original
                 pass
-            return violation
-        
-        # Shrink prop violations
-        for violation in prop_violations:
-            test_case_idx = violation.get("test_case", 0)
-            if test_case_idx < len(test_inputs):
-                original_args = test_inputs[test_case_idx]
-                _shrink_violation(violation, original_args)
-        
-        # Shrink MR violations
-        for violation in mr_violations:
-            test_case_idx = violation.get("test_case", 0)
-            if test_case_idx < len(test_inputs):
-                original_args = test_inputs[test_case_idx]
-                _shrink_violation(violation, original_args)
+            return None
+
+        # Shrink prop violations, then MR violations
+        for violation in prop_violations + mr_violations:
+            test_case_idx = violation.get("test_case", 0) - index_offset
+            if 0 <= test_case_idx < len(test_inputs):
+                if test_case_idx not in shrunk_inputs:
+                    shrunk_inputs[test_case_idx] = _shrunk_input(test_inputs[test_case_idx])
+                shrunk = shrunk_inputs[test_case_idx]
+                if shrunk is not None:
+                    violation["shrunk_input"] = shrunk
+                    violation["original_input"] = violation.get("input")
+                    violation["input"] = shrunk
 
     return {
         "passes": passes,
@@ -418,6 +585,42 @@ def evaluate_results(
     }
 
 
+def merge_results(accumulated: Optional[JSONDict], chunk: JSONDict, violation_cap: int) -> JSONDict:
+    """
+    Fold the `evaluate_results` output for the next slice of a suite into ``accumulated``.
+
+    Counts, indicators and cluster labels are appended and violations are
+    kept up to ``violation_cap``, matching a single evaluation of the
+    combined slices. ``accumulated`` is updated in place and returned.
+    """
+    if accumulated is None:
+        accumulated = {
+            "passes": 0,
+            "total": 0,
+            "pass_rate": 0.0,
+            "prop_violations": [],
+            "mr_violations": [],
+            "pass_indicators": bytearray(),
+            "cluster_labels": [],
+            "relation_stats": {},
+        }
+    accumulated["passes"] += chunk["passes"]
+    accumulated["total"] += chunk["total"]
+    total = accumulated["total"]
+    accumulated["pass_rate"] = accumulated["passes"] / total if total else 0.0
+    for key in ("prop_violations", "mr_violations"):
+        room = violation_cap - len(accumulated[key])
+        if room > 0:
+            accumulated[key].extend(chunk[key][:room])
+    accumulated["pass_indicators"] += chunk["pass_indicators"]
+    accumulated["cluster_labels"].extend(chunk["cluster_labels"])
+    for name, stats in chunk["relation_stats"].items():
+        merged = accumulated["relation_stats"].setdefault(name, dict(stats, total=0, failures=0))
+        merged["total"] += stats["total"]
+        merged["failures"] += stats["failures"]
+    return accumulated
+
+
 def summarize_relations(
     spec: Spec,
     baseline_metrics: JSONDict,
@@ -661,25 +864,40 @@ def bootstrap_metric_delta(
     samples: int,
     alpha: float,
     seed: Optional[int],
+    method: str = "bootstrap",
 ) -> Optional[JSONDict]:
-    """Compute bootstrap confidence interval for metric deltas."""
+    """
+    Compute bootstrap confidence interval for metric deltas.
+
+    ``method="bootstrap_bca"`` applies bias and acceleration corrections to the
+    same resamples; its coverage holds with far fewer ``samples`` than the
+    percentile interval needs.
+    """
     count = len(deltas)
     if count == 0 or samples <= 0:
         return None
 
-    rng = random.Random(seed if seed is not None else 0)
-    resampled_means: List[float] = []
-    for _ in range(max(1, samples)):
-        sample = [deltas[rng.randrange(count)] for _ in range(count)]
-        resampled_means.append(sum(sample) / count)
-
-    resampled_means.sort()
-    lower_mean = percentile(resampled_means, alpha / 2)
-    upper_mean = percentile(resampled_means, 1 - alpha / 2)
+    # Resample indices with numpy in bounded batches, like the pass-rate bootstrap
+    rng = np.random.default_rng(seed if seed is not None else 0)
+    deltas_arr = np.asarray(deltas, dtype=np.float64)
+    (resampled_sums,) = _resampled_sums((deltas_arr,), rng, samples)
+    resampled_means = resampled_sums / count
 
     observed_mean = sum(deltas) / count
+    if method == "bootstrap_bca":
+        # The jackknife of a mean delta is the pass-rate one with a zero baseline
+        lower_mean, upper_mean = compute_bca_interval(
+            resampled_means,
+            observed_delta=observed_mean,
+            baseline_indicators=np.zeros(count),
+            candidate_indicators=deltas_arr,
+            alpha=alpha,
+        )
+    else:
+        lower_mean, upper_mean = percentiles(resampled_means, (alpha / 2, 1 - alpha / 2))
+
     ci_payload: JSONDict = {
-        "method": "bootstrap",
+        "method": method,
         "level": 1 - alpha,
         "mean": {
             "estimate": observed_mean,
@@ -783,13 +1001,15 @@ def collect_metrics(
             paired_mean = sum(paired_deltas) / paired_count
             delta_payload["paired_mean"] = paired_mean
 
-            if metric.ci_method and metric.ci_method.lower() == "bootstrap" and paired_count > 1:
+            ci_method = (metric.ci_method or "").lower().replace("-", "_")
+            if ci_method in {"bootstrap", "bootstrap_bca"} and paired_count > 1:
                 ci_result = bootstrap_metric_delta(
                     paired_deltas,
                     kind=metric.kind,
                     samples=max(1, metric.bootstrap_samples),
                     alpha=metric.alpha,
                     seed=metric.seed,
+                    method=ci_method,
                 )
                 if ci_result:
                     delta_payload["ci"] = ci_result
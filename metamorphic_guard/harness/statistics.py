@@ -5,13 +5,23 @@ Statistical functions for computing confidence intervals, power analysis, and re
 from __future__ import annotations
 
 import math
+import os
 import random
-from statistics import NormalDist
-from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple, TypedDict
+import time
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple, TypedDict
 
 import numpy as np
-from ..power import calculate_power, calculate_sample_size
-from ..types import JSONDict, JSONValue
+from ..observability import log_event
+from ..power import _STD_NORMAL, _inv_cdf, _z_two_sided
+from ..types import JSONDict
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None  # type: ignore
+    prange = range
+    NUMBA_AVAILABLE = False
 
 
 class PassRateMetrics(TypedDict, total=False):
@@ -101,9 +111,9 @@ def estimate_power(
         power_val = 1.0 if effect >= delta_value else 0.0
         return power_val, None
 
-    z_alpha = NormalDist().inv_cdf(1 - alpha_value)
+    z_alpha = _inv_cdf(1 - alpha_value)
     z_effect = (effect - delta_value) / se
-    power_val = 1 - NormalDist().cdf(z_alpha - z_effect)
+    power_val = 1 - _STD_NORMAL.cdf(z_alpha - z_effect)
     power_val = max(0.0, min(1.0, power_val))
 
     recommended_n = None
@@ -112,7 +122,7 @@ def estimate_power(
         p2 = max(0.0, min(1.0, p_baseline + delta_value))
         var_target = p1 * (1 - p1) + p2 * (1 - p2)
         if var_target > 0:
-            z_beta = NormalDist().inv_cdf(power_target)
+            z_beta = _inv_cdf(power_target)
             recommended_n = math.ceil(((z_alpha + z_beta) ** 2 * var_target) / (delta_value ** 2))
 
     return power_val, recommended_n
@@ -143,7 +153,13 @@ def compute_delta_ci(
             use_bca=method.endswith("bca"),
             observed_delta=candidate_metrics["pass_rate"] - baseline_metrics["pass_rate"],
         )
-    if method in {"bootstrap", "bootstrap_bca"}:
+    if method == "bootstrap":
+        normal_ci = _paired_normal_ci(
+            baseline_metrics["pass_indicators"], candidate_metrics["pass_indicators"], alpha=alpha
+        )
+        if normal_ci is not None:
+            return normal_ci
+    if method in {"bootstrap", "bootstrap_bca", "bootstrap_exact"}:
         return compute_bootstrap_ci(
             baseline_metrics["pass_indicators"],
             candidate_metrics["pass_indicators"],
@@ -182,6 +198,80 @@ def compute_delta_ci(
     raise ValueError(f"Unsupported CI method: {method}")
 
 
+# From this many paired cases on, the percentile bootstrap of a 0/1 delta agrees with its
+# normal limit to about 1e-3, so ``method="bootstrap"`` skips resampling. Few discordant
+# cases leave the bootstrap distribution skewed, so those still resample.
+_BOOTSTRAP_NORMAL_MIN_N = 200
+_BOOTSTRAP_NORMAL_MIN_DISCORDANT = 20
+# Index draws per bootstrap batch (8 MiB of int64), bounding memory for large n * samples
+_BOOTSTRAP_BATCH_ELEMENTS = 1 << 20
+# From this many index draws on, the compiled kernel (when numba is installed) beats numpy's
+# batched gathers; below it, JIT dispatch overhead dominates
+_NUMBA_MIN_ELEMENTS = 1 << 22
+
+
+def _numba_bootstrap_enabled() -> bool:
+    """
+    Whether ``METAMORPHIC_GUARD_NUMBA_BOOTSTRAP`` opts in to the compiled resampling kernel.
+
+    The kernel draws from its own stream, so it is off by default: installing
+    numba must not change a seeded run's bootstrap draws.
+    """
+    if not NUMBA_AVAILABLE:
+        return False
+    return os.environ.get("METAMORPHIC_GUARD_NUMBA_BOOTSTRAP", "").lower() in {"1", "true", "yes"}
+
+
+def _paired_normal_ci(
+    baseline_indicators: Sequence[int],
+    candidate_indicators: Sequence[int],
+    *,
+    alpha: float,
+) -> Optional[List[float]]:
+    """
+    Closed-form interval the paired bootstrap converges to, or None when it doesn't apply.
+
+    Only used for equal-length 0/1 indicators with at least ``_BOOTSTRAP_NORMAL_MIN_N``
+    cases and ``_BOOTSTRAP_NORMAL_MIN_DISCORDANT`` discordant pairs. The variance is the plug-in variance of the per-case difference, so
+    the pairing between baseline and candidate is kept (unlike Newcombe).
+    """
+    n = len(baseline_indicators)
+    if n < _BOOTSTRAP_NORMAL_MIN_N or len(candidate_indicators) != n:
+        return None
+    baseline_arr = _as_float_array(baseline_indicators)
+    candidate_arr = _as_float_array(candidate_indicators)
+    if not (_is_binary(baseline_arr) and _is_binary(candidate_arr)):
+        return None
+    diffs = candidate_arr - baseline_arr
+    if np.count_nonzero(diffs) < _BOOTSTRAP_NORMAL_MIN_DISCORDANT:
+        return None
+    delta = float(diffs.mean())
+    variance = max(0.0, float(np.mean(diffs * diffs)) - delta * delta)
+    half_width = _z_two_sided(alpha) * math.sqrt(variance / n)
+    return [delta - half_width, delta + half_width]
+
+
+def _indicators_identical(baseline: Sequence[int], candidate: Sequence[int]) -> bool:
+    """Elementwise equality; a memcmp for bytearrays, no per-element work for same-type lists."""
+    if isinstance(baseline, np.ndarray) or isinstance(candidate, np.ndarray):
+        return bool(np.array_equal(baseline, candidate))
+    if type(baseline) is type(candidate):
+        return baseline == candidate
+    return list(baseline) == list(candidate)
+
+
+def _as_float_array(values: Sequence[float]) -> np.ndarray:
+    """``values`` as float64; bytearray indicators are read through the buffer protocol."""
+    if isinstance(values, (bytes, bytearray)):
+        return np.frombuffer(values, dtype=np.uint8).astype(np.float64)
+    return np.asarray(values, dtype=np.float64)
+
+
+def _is_binary(arr: np.ndarray) -> bool:
+    """Whether every entry is 0 or 1."""
+    return bool(np.all((arr == 0.0) | (arr == 1.0)))
+
+
 def compute_bootstrap_ci(
     baseline_indicators: Sequence[int],
     candidate_indicators: Sequence[int],
@@ -192,11 +282,22 @@ def compute_bootstrap_ci(
     clusters: Optional[Sequence[Hashable]] = None,
     use_bca: bool = False,
     observed_delta: float | None = None,
+    paired: bool = True,
 ) -> List[float]:
-    """Compute a bootstrap confidence interval for the pass-rate delta."""
+    """
+    Compute a bootstrap confidence interval for the pass-rate delta.
+
+    Baseline and candidate ran on the same inputs, so by default each
+    resample draws the same cases for both arms (common random numbers),
+    which removes the between-arm sampling noise from the deltas. Pass
+    ``paired=False`` to resample the arms independently.
+    """
     n = len(baseline_indicators)
     if n == 0 or len(candidate_indicators) != n:
         return [0.0, 0.0]
+    if paired and _indicators_identical(baseline_indicators, candidate_indicators):
+        # Every resample has a delta of exactly zero
+        return [0.0, 0.0]
 
     rng = np.random.default_rng(seed)
     deltas = generate_bootstrap_deltas(
@@ -205,6 +306,7 @@ def compute_bootstrap_ci(
         rng=rng,
         samples=samples,
         clusters=clusters,
+        paired=paired,
     )
 
     if not deltas:
@@ -224,14 +326,10 @@ def compute_bootstrap_ci(
 
     lower_quantile = alpha / 2
     upper_quantile = 1 - alpha / 2
-    ci_lower = percentile(deltas, lower_quantile)
-    ci_upper = percentile(deltas, upper_quantile)
+    ci_lower, ci_upper = percentiles(deltas, (lower_quantile, upper_quantile))
     return [float(ci_lower), float(ci_upper)]
 
 
-import time
-from ..observability import log_event
-
 def generate_bootstrap_deltas(
     baseline_indicators: Sequence[int],
     candidate_indicators: Sequence[int],
@@ -239,85 +337,193 @@ def generate_bootstrap_deltas(
     rng: np.random.Generator,
     samples: int,
     clusters: Optional[Sequence[Hashable]] = None,
+    paired: bool = True,
 ) -> List[float]:
-    """Generate bootstrap deltas (candidate - baseline pass rate)."""
+    """
+    Generate bootstrap deltas (candidate - baseline pass rate).
+
+    With ``paired`` (the default) both arms share each resample's cases or
+    clusters; otherwise each arm is resampled on its own.
+    """
     start_time = time.time()
     n = len(baseline_indicators)
     if n == 0 or len(candidate_indicators) != n:
         return []
 
-    baseline_arr = np.array(baseline_indicators, dtype=np.float64)
-    candidate_arr = np.array(candidate_indicators, dtype=np.float64)
+    baseline_arr = _as_float_array(baseline_indicators)
+    candidate_arr = _as_float_array(candidate_indicators)
+
+    if not paired:
+        deltas = _unpaired_bootstrap_deltas(baseline_arr, candidate_arr, rng, samples, clusters)
+        duration_ms = (time.time() - start_time) * 1000
+        log_event("bootstrap_performance", duration_ms=duration_ms, samples=samples, method="unpaired")
+        return deltas.tolist()
 
     if clusters:
         # Cluster bootstrap
-        # Map each unique cluster to its list of indices
-        cluster_map: Dict[Hashable, List[int]] = {}
-        for idx, cluster_id in enumerate(clusters):
-            cluster_map.setdefault(cluster_id, []).append(idx)
-        
-        unique_clusters = list(cluster_map.keys())
-        if not unique_clusters:
-            # Fallback to iid if clusters missing/empty
-            pass
-        else:
-            n_clusters = len(unique_clusters)
-            # Pre-compute sums for each cluster
-            cluster_sums_base = np.array([np.sum(baseline_arr[cluster_map[c]]) for c in unique_clusters])
-            cluster_sums_cand = np.array([np.sum(candidate_arr[cluster_map[c]]) for c in unique_clusters])
-            cluster_counts = np.array([len(cluster_map[c]) for c in unique_clusters])
-
-            # Resample clusters with replacement
-            # Shape: (samples, n_clusters)
-            indices = rng.integers(0, n_clusters, size=(max(1, samples), n_clusters))
-            
-            # Sum up the chosen clusters
-            # We use take along axis or simple indexing
-            # sampled_sums_base shape: (samples, n_clusters)
-            sampled_sums_base = cluster_sums_base[indices]
-            sampled_sums_cand = cluster_sums_cand[indices]
-            sampled_counts = cluster_counts[indices]
-
-            # Sum across the n_clusters dimension to get totals for each bootstrap sample
-            # total_base shape: (samples,)
-            total_base = np.sum(sampled_sums_base, axis=1)
-            total_cand = np.sum(sampled_sums_cand, axis=1)
-            total_counts = np.sum(sampled_counts, axis=1)
-
-            # Avoid division by zero
-            mask = total_counts > 0
-            if not np.any(mask):
-                 return []
-            
-            p_baseline = np.zeros_like(total_base)
-            p_candidate = np.zeros_like(total_cand)
-            
-            p_baseline[mask] = total_base[mask] / total_counts[mask]
-            p_candidate[mask] = total_cand[mask] / total_counts[mask]
-            
-            deltas = p_candidate - p_baseline
-            duration_ms = (time.time() - start_time) * 1000
-            log_event("bootstrap_performance", duration_ms=duration_ms, samples=samples, method="cluster")
-            return deltas.tolist()
+        codes, n_clusters = _cluster_codes(clusters)
+        # Per-cluster sums of the paired difference and case counts in one pass each
+        covered = codes.size
+        cluster_sums_diff = np.bincount(
+            codes,
+            weights=candidate_arr[:covered] - baseline_arr[:covered],
+            minlength=n_clusters,
+        )
+        cluster_counts = np.bincount(codes, minlength=n_clusters)
+
+        # Resample clusters with replacement and total each bootstrap sample
+        total_diff, total_counts = _resampled_sums((cluster_sums_diff, cluster_counts), rng, samples)
+
+        # Avoid division by zero
+        mask = total_counts > 0
+        if not np.any(mask):
+            return []
+
+        deltas = np.zeros(total_diff.shape)
+        deltas[mask] = total_diff[mask] / total_counts[mask]
+        duration_ms = (time.time() - start_time) * 1000
+        log_event("bootstrap_performance", duration_ms=duration_ms, samples=samples, method="cluster")
+        return deltas.tolist()
+
+    if _is_binary(baseline_arr) and _is_binary(candidate_arr):
+        # Paired 0/1 indicators: only discordant cases move the delta, so a resample is
+        # fully described by how many (b=0, c=1) and (b=1, c=0) cases it draws. Drawing
+        # those counts from Multinomial(n, ...) is exact and needs O(samples) memory.
+        gains = float(np.sum(candidate_arr > baseline_arr))
+        losses = float(np.sum(baseline_arr > candidate_arr))
+        counts = rng.multinomial(n, [gains / n, losses / n, 1.0 - (gains + losses) / n], size=max(1, samples))
+        deltas = (counts[:, 0] - counts[:, 1]) / n
+        duration_ms = (time.time() - start_time) * 1000
+        log_event("bootstrap_performance", duration_ms=duration_ms, samples=samples, method="multinomial")
+        return deltas.tolist()
 
     # IID bootstrap (vectorized)
-    # Generate random indices: (samples, n)
-    indices = rng.integers(0, n, size=(max(1, samples), n))
-    
-    # Resample
-    sampled_base = baseline_arr[indices]
-    sampled_cand = candidate_arr[indices]
-    
-    # Compute means
-    means_base = np.mean(sampled_base, axis=1)
-    means_cand = np.mean(sampled_cand, axis=1)
-    
-    deltas = means_cand - means_base
+    # The mean difference of a paired resample is the resampled mean of the
+    # per-case differences, so one gather replaces one per arm
+    (total_diff,) = _resampled_sums((candidate_arr - baseline_arr,), rng, samples)
+    deltas = total_diff / n
     duration_ms = (time.time() - start_time) * 1000
     log_event("bootstrap_performance", duration_ms=duration_ms, samples=samples, method="iid")
     return deltas.tolist()
 
 
+def _cluster_codes(clusters: Sequence[Hashable]) -> Tuple[np.ndarray, int]:
+    """Number clusters in first-seen order; returns each case's code and the cluster count."""
+    if len(clusters) and type(clusters[0]) is int:
+        labels = np.asarray(clusters)
+        if labels.ndim == 1 and labels.dtype.kind == "i":
+            # Integer labels: number them by first occurrence without a per-case dict lookup
+            _, first_seen, inverse = np.unique(labels, return_index=True, return_inverse=True)
+            order = np.argsort(first_seen)
+            codes = np.empty(order.size, dtype=np.intp)
+            codes[order] = np.arange(order.size)
+            return codes[inverse.ravel()], int(order.size)
+    cluster_codes: Dict[Hashable, int] = {}
+    codes = np.fromiter(
+        (cluster_codes.setdefault(cluster_id, len(cluster_codes)) for cluster_id in clusters),
+        dtype=np.intp,
+        count=len(clusters),
+    )
+    return codes, len(cluster_codes)
+
+
+def _unpaired_bootstrap_deltas(
+    baseline_arr: np.ndarray,
+    candidate_arr: np.ndarray,
+    rng: np.random.Generator,
+    samples: int,
+    clusters: Optional[Sequence[Hashable]],
+) -> np.ndarray:
+    """Deltas of pass rates from independent resamples of each arm."""
+    samples = max(1, samples)
+    n = baseline_arr.size
+    if clusters:
+        codes, n_clusters = _cluster_codes(clusters)
+        covered = codes.size
+        counts = np.bincount(codes, minlength=n_clusters)
+        rates = []
+        for arr in (candidate_arr, baseline_arr):
+            sums = np.bincount(codes, weights=arr[:covered], minlength=n_clusters)
+            total, total_counts = _resampled_sums((sums, counts), rng, samples)
+            rate = np.zeros(samples)
+            mask = total_counts > 0
+            rate[mask] = total[mask] / total_counts[mask]
+            rates.append(rate)
+        return rates[0] - rates[1]
+    if _is_binary(baseline_arr) and _is_binary(candidate_arr):
+        # A resample's pass count is Binomial(n, observed pass rate) for each arm
+        candidate_passes = rng.binomial(n, float(candidate_arr.mean()), size=samples)
+        baseline_passes = rng.binomial(n, float(baseline_arr.mean()), size=samples)
+        return (candidate_passes - baseline_passes) / n
+    (candidate_sums,) = _resampled_sums((candidate_arr,), rng, samples)
+    (baseline_sums,) = _resampled_sums((baseline_arr,), rng, samples)
+    return (candidate_sums - baseline_sums) / n
+
+
+def _resampled_sums(
+    columns: Sequence[np.ndarray],
+    rng: np.random.Generator,
+    samples: int,
+) -> List[np.ndarray]:
+    """
+    Sum each column over ``samples`` resamples (with replacement) of its entries.
+
+    All columns share the same draws. Draws are made in batches of at most
+    ``_BOOTSTRAP_BATCH_ELEMENTS`` indices; successive ``integers`` calls continue
+    the same stream, so the result does not depend on the batch size.
+
+    When `_numba_bootstrap_enabled` and there are at least
+    ``_NUMBA_MIN_ELEMENTS`` draws, a compiled kernel sums the resamples without
+    materialising any indices. Its draws come from a stream seeded by ``rng``,
+    so they are reproducible but differ from the numpy path's.
+    """
+    samples = max(1, samples)
+    width = len(columns[0])
+    if samples * width >= _NUMBA_MIN_ELEMENTS and _numba_bootstrap_enabled():
+        stacked = np.array([np.asarray(column, dtype=np.float64) for column in columns])
+        seed = int(rng.integers(0, np.iinfo(np.int64).max))
+        sums = _numba_resampled_sums(stacked, samples, seed)
+        return [row.astype(column.dtype) for row, column in zip(sums, columns)]
+    batch = max(1, min(samples, _BOOTSTRAP_BATCH_ELEMENTS // max(1, width)))
+    totals = [np.empty(samples, dtype=column.dtype) for column in columns]
+    for start in range(0, samples, batch):
+        stop = min(samples, start + batch)
+        indices = rng.integers(0, width, size=(stop - start, width))
+        for column, total in zip(columns, totals):
+            total[start:stop] = np.sum(column[indices], axis=1)
+    return totals
+
+
+def _splitmix_resampled_sums(columns: np.ndarray, samples: int, seed: int) -> np.ndarray:
+    """
+    Kernel behind the numba path of `_resampled_sums`, for a ``(k, width)`` float array.
+
+    Each resample draws its indices from its own SplitMix64 sequence, so
+    the result depends only on ``seed``, not on how samples are split across
+    threads.
+    """
+    k, width = columns.shape
+    totals = np.zeros((k, samples))
+    golden = np.uint64(0x9E3779B97F4A7C15)
+    for sample in prange(samples):
+        state = np.uint64(seed) ^ (np.uint64(sample + 1) * np.uint64(0xD1B54A32D192ED03))
+        for _ in range(width):
+            state += golden
+            z = state
+            z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+            z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+            z = z ^ (z >> np.uint64(31))
+            index = np.int64(z % np.uint64(width))
+            for column in range(k):
+                totals[column, sample] += columns[column, index]
+    return totals
+
+
+_numba_resampled_sums = (
+    njit(parallel=True, cache=True)(_splitmix_resampled_sums) if NUMBA_AVAILABLE else _splitmix_resampled_sums
+)
+
+
 def compute_bca_interval(
     deltas: Sequence[float],
     *,
@@ -328,10 +534,10 @@ def compute_bca_interval(
     clusters: Optional[Sequence[Hashable]] = None,
 ) -> List[float]:
     """Compute the bias-corrected and accelerated (BCa) interval for bootstrap deltas."""
-    if not deltas:
+    if len(deltas) == 0:
         return [0.0, 0.0]
 
-    deltas_arr = np.array(deltas)
+    deltas_arr = np.asarray(deltas, dtype=np.float64)
     num_samples = len(deltas_arr)
     
     # Bias correction
@@ -341,54 +547,35 @@ def compute_bca_interval(
     elif proportion >= 1.0:
         z0 = float("inf")
     else:
-        z0 = NormalDist().inv_cdf(proportion)
+        z0 = _STD_NORMAL.inv_cdf(proportion)  # data-dependent, not worth memoizing
 
     # Acceleration via jackknife
     n = len(baseline_indicators)
-    baseline_arr = np.array(baseline_indicators, dtype=np.float64)
-    candidate_arr = np.array(candidate_indicators, dtype=np.float64)
+    baseline_arr = _as_float_array(baseline_indicators)
+    candidate_arr = _as_float_array(candidate_indicators)
     total_baseline = np.sum(baseline_arr)
     total_candidate = np.sum(candidate_arr)
 
     jackknife: List[float] = []
 
     if clusters:
-        cluster_map: Dict[Hashable, List[int]] = {}
-        for idx, cluster_id in enumerate(clusters):
-            cluster_map.setdefault(cluster_id, []).append(idx)
-        # Only keep clusters that have valid indices
-        cluster_groups = [indices for indices in cluster_map.values() if indices]
-        
-        # Vectorize jackknife for clusters?
-        # Since clusters can vary in size, it's slightly tricky to fully vectorize without padding
-        # But number of clusters is usually << n, so a loop is acceptable or partial vectorization
-        # Let's stick to the logic but optimize where possible
-        for indices in cluster_groups:
-            denom = n - len(indices)
-            if denom <= 0:
-                continue
-            # Subtract cluster contribution
-            cluster_base = np.sum(baseline_arr[indices])
-            cluster_cand = np.sum(candidate_arr[indices])
-            
-            baseline_loo_total = total_baseline - cluster_base
-            candidate_loo_total = total_candidate - cluster_cand
-            
-            p_b = baseline_loo_total / denom
-            p_c = candidate_loo_total / denom
-            jackknife.append(p_c - p_b)
-            
-    else:
-        if n <= 1:
-            acceleration = 0.0
-        else:
-            # Vectorized jackknife for IID
-            # LOO means: (sum - x_i) / (n-1)
-            denom = n - 1
-            baseline_loo_means = (total_baseline - baseline_arr) / denom
-            candidate_loo_means = (total_candidate - candidate_arr) / denom
-            jackknife_arr = candidate_loo_means - baseline_loo_means
-            jackknife = jackknife_arr.tolist()
+        # Leave-one-cluster-out deltas from per-cluster totals
+        codes, n_clusters = _cluster_codes(clusters)
+        covered = codes.size
+        cluster_base = np.bincount(codes, weights=baseline_arr[:covered], minlength=n_clusters)
+        cluster_cand = np.bincount(codes, weights=candidate_arr[:covered], minlength=n_clusters)
+        denom = n - np.bincount(codes, minlength=n_clusters)
+        keep = denom > 0
+        jackknife = (
+            (total_candidate - cluster_cand[keep]) / denom[keep]
+            - (total_baseline - cluster_base[keep]) / denom[keep]
+        ).tolist()
+    elif n > 1:
+        # LOO means: (sum - x_i) / (n-1)
+        denom = n - 1
+        baseline_loo_means = (total_baseline - baseline_arr) / denom
+        candidate_loo_means = (total_candidate - candidate_arr) / denom
+        jackknife = (candidate_loo_means - baseline_loo_means).tolist()
 
     if not jackknife or len(jackknife) < 2:
         acceleration = 0.0
@@ -411,19 +598,18 @@ def compute_bca_interval(
             return 1.0
         if math.isinf(z0):
             return 0.0 if z0 < 0 else 1.0
-        z_prob = NormalDist().inv_cdf(prob)
+        z_prob = _inv_cdf(prob)
         denom = 1 - acceleration * (z0 + z_prob)
         if denom == 0:
             adjusted = 0.0 if z0 + z_prob < 0 else 1.0
         else:
-            adjusted = NormalDist().cdf(z0 + (z0 + z_prob) / denom)
+            adjusted = _STD_NORMAL.cdf(z0 + (z0 + z_prob) / denom)
         return min(1.0, max(0.0, adjusted))
 
     lower_prob = _adjusted_quantile(alpha / 2)
     upper_prob = _adjusted_quantile(1 - alpha / 2)
 
-    lower = percentile(deltas, lower_prob)
-    upper = percentile(deltas, upper_prob)
+    lower, upper = percentiles(deltas, (lower_prob, upper_prob))
     return [float(lower), float(upper)]
 
 
@@ -439,8 +625,9 @@ def compute_newcombe_ci(
     if baseline_total == 0 or candidate_total == 0:
         return [0.0, 0.0]
 
-    lower_b, upper_b = wilson_interval(baseline_passes, baseline_total, alpha)
-    lower_c, upper_c = wilson_interval(candidate_passes, candidate_total, alpha)
+    z = _z_two_sided(alpha)
+    lower_b, upper_b = _wilson_bounds(baseline_passes, baseline_total, z)
+    lower_c, upper_c = _wilson_bounds(candidate_passes, candidate_total, z)
 
     delta_lower = lower_c - upper_b
     delta_upper = upper_c - lower_b
@@ -451,15 +638,17 @@ def wilson_interval(successes: int, total: int, alpha: float) -> Tuple[float, fl
     """Compute Wilson score interval for a proportion."""
     if total == 0:
         return (0.0, 0.0)
+    return _wilson_bounds(successes, total, _z_two_sided(alpha))
+
 
-    z = NormalDist().inv_cdf(1 - alpha / 2)
+def _wilson_bounds(successes: int, total: int, z: float) -> Tuple[float, float]:
+    """Wilson score bounds for a precomputed two-sided quantile ``z``; ``total`` must be positive."""
+    z2_n = z * z / total
     phat = successes / total
-    denom = 1 + (z ** 2) / total
-    center = phat + (z ** 2) / (2 * total)
-    margin = z * math.sqrt((phat * (1 - phat) + (z ** 2) / (4 * total)) / total)
-    lower = (center - margin) / denom
-    upper = (center + margin) / denom
-    return (max(0.0, lower), min(1.0, upper))
+    denom = 1.0 + z2_n
+    center = phat + 0.5 * z2_n
+    margin = z * math.sqrt((phat * (1.0 - phat) + 0.25 * z2_n) / total)
+    return (max(0.0, (center - margin) / denom), min(1.0, (center + margin) / denom))
 
 
 def compute_relative_risk(
@@ -499,7 +688,7 @@ def compute_relative_risk(
     ln_rr = math.log(rr) if rr > 0 else float("-inf")
     se = math.sqrt((1 / successes_c) - (1 / total_c) +
                    (1 / successes_b) - (1 / total_b))
-    z = NormalDist().inv_cdf(1 - alpha / 2)
+    z = _z_two_sided(alpha)
     lower = math.exp(ln_rr - z * se)
     upper = math.exp(ln_rr + z * se)
     return rr, [float(lower), float(upper)]
@@ -528,31 +717,59 @@ def two_proportion_p_value(
         return 1.0
 
     z = abs(p_a - p_b) / math.sqrt(variance)
-    p_value = 2 * (1 - NormalDist().cdf(z))
+    p_value = 2 * (1 - _STD_NORMAL.cdf(z))
     return max(0.0, min(1.0, float(p_value)))
 
 
 def percentile(values: Sequence[float], q: float) -> float:
     """Compute the q-th percentile (0 <= q <= 1) using linear interpolation."""
-    if not values:
-        return 0.0
-    if q <= 0:
-        return float(min(values))
-    if q >= 1:
-        return float(max(values))
-
-    # Use numpy for faster percentile calculation if available
-    if isinstance(values, np.ndarray):
-        return float(np.percentile(values, q * 100))
-        
-    sorted_vals = sorted(values)
-    n = len(sorted_vals)
-    index = q * (n - 1)
-    lower_idx = int(math.floor(index))
-    upper_idx = min(lower_idx + 1, n - 1)
-    weight = index - lower_idx
-    interpolated = sorted_vals[lower_idx] * (1 - weight) + sorted_vals[upper_idx] * weight
-    return float(min(max(interpolated, sorted_vals[0]), sorted_vals[-1]))
+    return percentiles(values, (q,))[0]
+
+
+def percentiles(values: Sequence[float], qs: Sequence[float]) -> List[float]:
+    """
+    Compute several percentiles of ``values`` at once, with the same
+    interpolation as ``percentile``.
+
+    Uses one ``np.partition`` (introselect) over every needed order statistic
+    instead of sorting, so it is O(n) rather than O(n log n).
+    """
+    if len(values) == 0:
+        return [0.0 for _ in qs]
+    arr = np.asarray(values, dtype=np.float64)
+    n = arr.size
+    lowest = float(arr.min())
+    highest = float(arr.max())
+
+    positions = []
+    kth = set()
+    for q in qs:
+        if q <= 0 or q >= 1:
+            positions.append(None)
+            continue
+        index = q * (n - 1)
+        lower_idx = int(math.floor(index))
+        upper_idx = min(lower_idx + 1, n - 1)
+        positions.append((lower_idx, upper_idx, index - lower_idx))
+        kth.update((lower_idx, upper_idx))
+
+    part = np.partition(arr, sorted(kth)) if kth else arr
+    results: List[float] = []
+    for q, position in zip(qs, positions):
+        if position is None:
+            results.append(lowest if q <= 0 else highest)
+            continue
+        lower_idx, upper_idx, weight = position
+        interpolated = float(part[lower_idx]) * (1 - weight) + float(part[upper_idx]) * weight
+        results.append(float(min(max(interpolated, lowest), highest)))
+    return results
+
+
+def _indicator_mask(indicators: Sequence[int], total: int) -> np.ndarray:
+    """Truthiness of the first ``total`` indicators; bytearrays are read in place."""
+    if isinstance(indicators, (bytes, bytearray)):
+        return np.frombuffer(indicators, dtype=np.uint8, count=total).astype(bool)
+    return np.asarray(indicators[:total]).astype(bool)
 
 
 def compute_paired_stats(
@@ -576,23 +793,14 @@ def compute_paired_stats(
     if total <= 0:
         return None
 
-    both_pass = both_fail = baseline_only = candidate_only = 0
-    baseline_sum = candidate_sum = 0
-
-    for b, c in zip(baseline_indicators, candidate_indicators):
-        if b:
-            baseline_sum += 1
-        if c:
-            candidate_sum += 1
-
-        if b and c:
-            both_pass += 1
-        elif b and not c:
-            baseline_only += 1
-        elif not b and c:
-            candidate_only += 1
-        else:
-            both_fail += 1
+    baseline_mask = _indicator_mask(baseline_indicators, total)
+    candidate_mask = _indicator_mask(candidate_indicators, total)
+    baseline_sum = int(np.count_nonzero(baseline_mask))
+    candidate_sum = int(np.count_nonzero(candidate_mask))
+    both_pass = int(np.count_nonzero(baseline_mask & candidate_mask))
+    baseline_only = baseline_sum - both_pass
+    candidate_only = candidate_sum - both_pass
+    both_fail = total - both_pass - baseline_only - candidate_only
 
     discordant = baseline_only + candidate_only
     delta = (candidate_sum - baseline_sum) / total
@@ -682,12 +890,13 @@ def compute_bayesian_ci(
             rng.betavariate(candidate_alpha_post, candidate_beta_post)
             for _ in range(n_samples)
         ]
-        delta_samples = [c - b for b, c in zip(baseline_samples, candidate_samples)]
-        delta_samples.sort()
-        
-        # Compute credible interval
+        delta_samples = np.subtract(candidate_samples, baseline_samples)
+
+        # Compute credible interval; only these two order statistics are needed,
+        # so select them in O(n) rather than sorting
         lower_idx = int(n_samples * (alpha / 2))
         upper_idx = int(n_samples * (1 - alpha / 2))
+        delta_samples = np.partition(delta_samples, (lower_idx, upper_idx))
         ci_lower = float(delta_samples[lower_idx])
         ci_upper = float(delta_samples[upper_idx])
     else:
@@ -710,7 +919,7 @@ def compute_bayesian_ci(
         delta_std = math.sqrt(baseline_var + candidate_var)
         
         # Normal approximation for credible interval
-        z_score = NormalDist().inv_cdf(1 - alpha / 2)
+        z_score = _z_two_sided(alpha)
         ci_lower = delta_mean - z_score * delta_std
         ci_upper = delta_mean + z_score * delta_std
     
@@ -759,16 +968,16 @@ def compute_bayesian_posterior_predictive(
         rng.betavariate(candidate_alpha_post, candidate_beta_post)
         for _ in range(n_samples)
     ]
-    delta_draws = sorted(c - b for b, c in zip(baseline_draws, candidate_draws))
-
     lower_idx = int(n_samples * 0.025)
     upper_idx = int(n_samples * 0.975)
-    prob_candidate = sum(1 for delta in delta_draws if delta > 0) / n_samples
+    # Selects the two interval endpoints in O(n) instead of sorting every draw
+    delta_draws = np.partition(np.subtract(candidate_draws, baseline_draws), (lower_idx, upper_idx))
+    prob_candidate = int(np.count_nonzero(delta_draws > 0)) / n_samples
 
     return {
         "baseline_mean": float(sum(baseline_draws) / n_samples),
         "candidate_mean": float(sum(candidate_draws) / n_samples),
-        "delta_mean": float(sum(delta_draws) / n_samples),
+        "delta_mean": float(np.sum(delta_draws) / n_samples),
         "delta_ci": [
             float(delta_draws[lower_idx]),
             float(delta_draws[upper_idx]),
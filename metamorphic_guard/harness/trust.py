@@ -50,12 +50,12 @@ def compute_trust_scores(
                 sources = []
                 
                 # Try to find sources in remaining args or in the result metadata
-                if len(args) > 1:
-                    for arg in args[1:]:
-                        if isinstance(arg, str) and len(arg) > 50:
+                for arg in args[1:]:
+                    if isinstance(arg, str):
+                        if len(arg) > 50:
                             sources.append(arg)
-                        elif isinstance(arg, (list, tuple)):
-                            sources.extend([str(s) for s in arg if isinstance(s, str)])
+                    elif isinstance(arg, (list, tuple)):
+                        sources.extend(s for s in arg if isinstance(s, str))
                 
                 # If we have question and output, compute trust score
                 if question and output:
@@ -70,25 +70,7 @@ def compute_trust_scores(
         if not trust_scores_list:
             return None
         
-        # Aggregate trust scores
-        total = len(trust_scores_list)
-        if total == 0:
-            return None
-        
-        avg_score = sum(t.get("score", 0.0) for t in trust_scores_list) / total
-        all_flags: Dict[str, bool] = {}
-        for trust_result in trust_scores_list:
-            flags = trust_result.get("flags", {})
-            for flag, value in flags.items():
-                if flag not in all_flags:
-                    all_flags[flag] = True
-                all_flags[flag] = all_flags[flag] and value
-        
-        return {
-            "score": avg_score,
-            "count": total,
-            "flags": all_flags,
-        }
+        return _aggregate_trust_scores(trust_scores_list)
         
     except ImportError:
         # RAG guards not available
@@ -97,3 +79,24 @@ def compute_trust_scores(
         # Error computing trust scores
         return None
 
+
+def _aggregate_trust_scores(trust_scores_list: Sequence[JSONDict]) -> Optional[JSONDict]:
+    """Average the scores and AND each flag across all assessed cases."""
+    total = len(trust_scores_list)
+    if total == 0:
+        return None
+
+    score_sum = 0.0
+    all_flags: Dict[str, bool] = {}
+    for trust_result in trust_scores_list:
+        score_sum += trust_result.get("score", 0.0)
+        for flag, value in trust_result.get("flags", {}).items():
+            # A flag seen for the first time starts out True; once false it stays false
+            if all_flags.get(flag, True):
+                all_flags[flag] = value
+
+    return {
+        "score": score_sum / total,
+        "count": total,
+        "flags": all_flags,
+    }
@@ -631,6 +631,9 @@ class SandboxedMonitorProxy(Monitor):
     def __init__(self, definition: PluginDefinition, params: Dict[str, Any]) -> None:
         super().__init__()
         self._definition = definition
+        # Each request is answered in order on one queue pair, so only one thread
+        # may have a request in flight
+        self._send_lock = threading.Lock()
         self._ctx = mp.get_context("spawn")
         self._requests: mp.Queue = self._ctx.Queue()
         self._responses: mp.Queue = self._ctx.Queue()
@@ -666,8 +669,9 @@ class SandboxedMonitorProxy(Monitor):
         return payload or {}
 
     def _send(self, command: str, payload: Any, *, expect_response: bool = False) -> Any:
-        self._requests.put((command, payload))
-        status, response = self._responses.get()
+        with self._send_lock:
+            self._requests.put((command, payload))
+            status, response = self._responses.get()
         if status != "ok":
             self._cleanup(force=True)
             raise RuntimeError(
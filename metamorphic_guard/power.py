@@ -7,11 +7,26 @@ for detecting minimum detectable effects (MDE) in pass-rate comparisons.
 
 from __future__ import annotations
 
+import functools
 import math
 from statistics import NormalDist
 from typing import Tuple, Optional
 
 
+_STD_NORMAL = NormalDist()
+
+
+@functools.lru_cache(maxsize=128)
+def _inv_cdf(p: float) -> float:
+    """Standard normal quantile; callers reuse a handful of alpha/power levels."""
+    return _STD_NORMAL.inv_cdf(p)
+
+
+def _z_two_sided(alpha: float) -> float:
+    """Critical z for a two-sided test at ``alpha``, memoized through `_inv_cdf`."""
+    return _inv_cdf(1 - alpha / 2)
+
+
 def calculate_power(
     baseline_rate: float,
     candidate_rate: float,
@@ -45,9 +60,9 @@ def calculate_power(
     if se == 0:
         return 1.0 if effect >= min_delta else 0.0
     
-    z_alpha = NormalDist().inv_cdf(1 - alpha)
+    z_alpha = _inv_cdf(1 - alpha)
     z_effect = (effect - min_delta) / se
-    power_val = 1 - NormalDist().cdf(z_alpha - z_effect)
+    power_val = 1 - _STD_NORMAL.cdf(z_alpha - z_effect)
     return max(0.0, min(1.0, power_val))
 
 
@@ -86,8 +101,8 @@ def calculate_sample_size(
         # Edge case: both rates are 0 or 1
         return 1
     
-    z_alpha = NormalDist().inv_cdf(1 - alpha)
-    z_beta = NormalDist().inv_cdf(power_target)
+    z_alpha = _inv_cdf(1 - alpha)
+    z_beta = _inv_cdf(power_target)
     
     n = ((z_alpha + z_beta) ** 2 * var_target) / (min_delta ** 2)
     return math.ceil(n)
@@ -124,8 +139,8 @@ def estimate_mde(
     # For MDE estimation, assume p2 = p1 + delta (unknown)
     # We'll solve for delta iteratively or use approximation
     
-    z_alpha = NormalDist().inv_cdf(1 - alpha)
-    z_beta = NormalDist().inv_cdf(power_target)
+    z_alpha = _inv_cdf(1 - alpha)
+    z_beta = _inv_cdf(power_target)
     
     # Approximate: assume p2 ≈ p1 for variance calculation
     # This gives a conservative estimate
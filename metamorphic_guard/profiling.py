@@ -113,13 +113,21 @@ class PerformanceProfiler(Monitor):
                 }
                 continue
             
+            # One sort serves min, max, median and every percentile below
             sorted_values = sorted(values)
+            count = len(sorted_values)
+            mid = count // 2
+            median = (
+                sorted_values[mid]
+                if count % 2
+                else (sorted_values[mid - 1] + sorted_values[mid]) / 2
+            )
             latency_profile[role] = {
-                "count": len(values),
-                "min_ms": min(values),
-                "max_ms": max(values),
+                "count": count,
+                "min_ms": sorted_values[0],
+                "max_ms": sorted_values[-1],
                 "mean_ms": statistics.mean(values),
-                "median_ms": statistics.median(values),
+                "median_ms": median,
                 "stddev_ms": statistics.stdev(values) if len(values) > 1 else 0.0,
             }
             
@@ -10,7 +10,7 @@ import threading
 import time
 import uuid
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from .types import JSONDict
 
@@ -77,13 +77,37 @@ class QueueAdapter:
         """Return total number of pending queue tasks."""
         return 0
 
+    def snapshot(
+        self, task_ids: Iterable[str] = ()
+    ) -> Tuple[Dict[str, str], Dict[str, float], Set[str]]:
+        """
+        Return ``(assignments, heartbeats, lost_workers)`` in one call.
+
+        The default implementation falls back to per-task ``get_assignment``
+        lookups for ``task_ids``; adapters that can fetch all assignments at
+        once should override it.
+        """
+        assignments: Dict[str, str] = {}
+        for task_id in task_ids:
+            worker = self.get_assignment(task_id)
+            if worker:
+                assignments[task_id] = worker
+        lost: Set[str] = set()
+        check_stale = getattr(self, "check_stale_workers", None)
+        if callable(check_stale):
+            lost = set(check_stale())
+        return assignments, self.worker_heartbeats(), lost
+
 
 class InMemoryQueueAdapter(QueueAdapter):
     """Queue adapter backed by in-process queues."""
 
     def __init__(self, heartbeat_config: Optional[Dict[str, Any]] = None) -> None:
         self._task_queue: "queue.Queue[QueueTask]" = queue.Queue()
-        self._result_queues: Dict[str, "queue.Queue[QueueResult]"] = {}
+        # Each job gets one or more result shards so publishing workers do not
+        # all contend on a single queue lock.
+        self._result_queues: Dict[str, List["queue.Queue[QueueResult]"]] = {}
+        self._result_cursor: Dict[str, int] = {}
         self._result_lock = threading.Lock()
         self._assignment_lock = threading.Lock()
         self._heartbeat_lock = threading.Lock()
@@ -123,27 +147,60 @@ class InMemoryQueueAdapter(QueueAdapter):
                 self._assignments[data.task_id] = worker_id
         return data
 
-    def ensure_result_queue(self, job_id: str) -> None:
+    def ensure_result_queue(self, job_id: str, shards: int = 1) -> None:
         with self._result_lock:
-            self._result_queues.setdefault(job_id, queue.Queue())
+            if job_id not in self._result_queues:
+                self._result_queues[job_id] = [queue.Queue() for _ in range(max(1, shards))]
+                self._result_cursor[job_id] = 0
 
     def publish_result(self, result: QueueResult) -> None:
-        with self._result_lock:
-            result_queue = self._result_queues.get(result.job_id)
-            if result_queue is None:
-                result_queue = queue.Queue()
-                self._result_queues[result.job_id] = result_queue
-        result_queue.put(result)
+        shards = self._result_queues.get(result.job_id)
+        if shards is None:
+            self.ensure_result_queue(result.job_id)
+            shards = self._result_queues[result.job_id]
+        # Results are spread by task id, not by worker: a worker's results land
+        # on many shards. There are fewer shards than workers (workers // 16 by
+        # default), so per-worker shards could not give each worker its own
+        # lock anyway, and hashing the task id spreads results evenly without a
+        # locked assignment lookup on every publish.
+        shard = shards[hash(result.task_id) % len(shards)] if len(shards) > 1 else shards[0]
+        shard.put(result)
 
     def consume_result(self, job_id: str, timeout: float | None = None) -> Optional[QueueResult]:
-        with self._result_lock:
-            result_queue = self._result_queues.get(job_id)
-        if result_queue is None:
-            return None
-        try:
-            return result_queue.get(timeout=timeout)
-        except queue.Empty:
+        shards = self._result_queues.get(job_id)
+        if shards is None:
             return None
+        if len(shards) == 1:
+            try:
+                return shards[0].get(timeout=timeout)
+            except queue.Empty:
+                return None
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        start = self._result_cursor.get(job_id, 0)
+        count = len(shards)
+        while True:
+            for offset in range(count):
+                pos = (start + offset) % count
+                try:
+                    result = shards[pos].get_nowait()
+                except queue.Empty:
+                    continue
+                self._result_cursor[job_id] = (pos + 1) % count
+                return result
+            wait = 0.005
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                wait = min(wait, remaining)
+            try:
+                result = shards[start].get(timeout=wait)
+            except queue.Empty:
+                start = (start + 1) % count
+                continue
+            self._result_cursor[job_id] = (start + 1) % count
+            return result
 
     def signal_shutdown(self) -> None:
         self._shutdown = True
@@ -164,6 +221,7 @@ class InMemoryQueueAdapter(QueueAdapter):
         self._shutdown = False
         with self._result_lock:
             self._result_queues = {}
+            self._result_cursor = {}
         with self._assignment_lock:
             self._assignments.clear()
         with self._heartbeat_lock:
@@ -217,6 +275,15 @@ class InMemoryQueueAdapter(QueueAdapter):
             return self._heartbeat_manager.get_lost_workers()
         return set()
 
+    def snapshot(
+        self, task_ids: Iterable[str] = ()
+    ) -> Tuple[Dict[str, str], Dict[str, float], Set[str]]:
+        with self._assignment_lock:
+            assignments = dict(self._assignments)
+        with self._heartbeat_lock:
+            heartbeats = dict(self._heartbeats)
+        return assignments, heartbeats, set(self.check_stale_workers())
+
 
 class RedisQueueAdapter(QueueAdapter):
     """Redis-backed adapter using simple list semantics."""
@@ -354,6 +421,19 @@ class RedisQueueAdapter(QueueAdapter):
     def pending_count(self) -> int:
         return int(self.redis.llen(self.task_key))
 
+    def snapshot(
+        self, task_ids: Iterable[str] = ()
+    ) -> Tuple[Dict[str, str], Dict[str, float], Set[str]]:
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hgetall(self.assignment_key)
+        pipe.hgetall(self.worker_key)
+        raw_assignments, raw_heartbeats = pipe.execute()
+        assignments = {
+            key.decode("utf-8"): val.decode("utf-8") for key, val in raw_assignments.items()
+        }
+        heartbeats = {key.decode("utf-8"): float(val) for key, val in raw_heartbeats.items()}
+        return assignments, heartbeats, set()
+
 
 __all__ = [
     "QueueTask",
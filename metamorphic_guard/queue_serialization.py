@@ -43,12 +43,7 @@ def prepare_payload(
             raw = msgpack.packb(list(args_list), use_bin_type=True)
         else:
             if use_msgpack and not MSGPACK_AVAILABLE:
-                warnings.warn(
-                    "MessagePack requested but not available. Install with: pip install msgpack. "
-                    "Falling back to JSON.",
-                    UserWarning,
-                    stacklevel=2,
-                )
+                _warn_msgpack_unavailable()
             raw = json.dumps(list(args_list)).encode("utf-8")
     except (TypeError, ValueError) as exc:
         raise QueueSerializationError(
@@ -57,6 +52,79 @@ def prepare_payload(
             original=exc,
         ) from exc
 
+    return _finish_payload(
+        raw,
+        compress_default=compress_default,
+        adaptive=adaptive,
+        threshold_bytes=threshold_bytes,
+    )
+
+
+def encode_frame(args: ArgsTuple, *, use_msgpack: bool = False) -> bytes:
+    """
+    Encode a single argument tuple as a payload fragment.
+
+    Fragments can be joined into a full payload with
+    ``prepare_payload_from_frames`` without re-encoding the arguments.
+    """
+    try:
+        if use_msgpack and MSGPACK_AVAILABLE:
+            return msgpack.packb(list(args), use_bin_type=True)
+        return json.dumps(list(args)).encode("utf-8")
+    except (TypeError, ValueError) as exc:
+        raise QueueSerializationError(
+            "Unable to serialize queue arguments.",
+            details={"use_msgpack": use_msgpack, "args_preview": _preview_args([args])},
+            original=exc,
+        ) from exc
+
+
+def decode_frame(frame: bytes, *, use_msgpack: bool = False) -> List[Any]:
+    """Decode one ``encode_frame`` fragment the way a worker sees it (tuples become lists)."""
+    try:
+        if use_msgpack and MSGPACK_AVAILABLE:
+            return msgpack.unpackb(frame, raw=False, strict_map_key=False)
+        return json.loads(frame)
+    except (TypeError, ValueError) as exc:
+        raise QueueSerializationError(
+            "Unable to decode queue payload.",
+            details={"use_msgpack": use_msgpack},
+            original=exc,
+        ) from exc
+
+
+def prepare_payload_from_frames(
+    frames: Sequence[bytes],
+    *,
+    compress_default: bool,
+    adaptive: bool,
+    threshold_bytes: int,
+    use_msgpack: bool = False,
+) -> Tuple[bytes, bool, int, int]:
+    """
+    Build a payload from fragments produced by ``encode_frame``.
+
+    The result decodes with ``decode_args`` exactly like ``prepare_payload``.
+    """
+    if use_msgpack and MSGPACK_AVAILABLE:
+        raw = _msgpack_array_header(len(frames)) + b"".join(frames)
+    else:
+        raw = b"[" + b",".join(frames) + b"]"
+    return _finish_payload(
+        raw,
+        compress_default=compress_default,
+        adaptive=adaptive,
+        threshold_bytes=threshold_bytes,
+    )
+
+
+def _finish_payload(
+    raw: bytes,
+    *,
+    compress_default: bool,
+    adaptive: bool,
+    threshold_bytes: int,
+) -> Tuple[bytes, bool, int, int]:
     raw_len = len(raw)
 
     if not compress_default:
@@ -81,6 +149,23 @@ def prepare_payload(
     return encoded, use_compression, raw_len, len(encoded)
 
 
+def _msgpack_array_header(length: int) -> bytes:
+    if length < 16:
+        return bytes((0x90 | length,))
+    if length < 0x10000:
+        return b"\xdc" + length.to_bytes(2, "big")
+    return b"\xdd" + length.to_bytes(4, "big")
+
+
+def _warn_msgpack_unavailable() -> None:
+    warnings.warn(
+        "MessagePack requested but not available. Install with: pip install msgpack. "
+        "Falling back to JSON.",
+        UserWarning,
+        stacklevel=3,
+    )
+
+
 def decode_payload(payload: bytes, compress: bool | None = None) -> bytes:
     try:
         decoded = base64.b64decode(payload)
@@ -129,5 +214,13 @@ def _preview_args(args_list: Sequence[ArgsTuple], limit: int = 2) -> Any:
     return preview
 
 
-__all__ = ["prepare_payload", "decode_args", "decode_payload", "MSGPACK_AVAILABLE"]
+__all__ = [
+    "prepare_payload",
+    "prepare_payload_from_frames",
+    "encode_frame",
+    "decode_frame",
+    "decode_args",
+    "decode_payload",
+    "MSGPACK_AVAILABLE",
+]
 
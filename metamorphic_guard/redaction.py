@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import os
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import lru_cache
-from typing import Any, Iterable, List, Sequence
+from typing import Any, Iterable, List, Optional, Sequence
 
 
 _DEFAULT_PATTERNS = (
@@ -19,6 +19,10 @@ _DEFAULT_PATTERNS = (
 
 _REPLACEMENT = "[REDACTED]"
 
+_LEADING_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+# Backreferences and conditional groups refer to groups by number or name, which merging renumbers
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
 
 def _normalize_patterns(patterns: Any) -> List[str]:
     if patterns is None:
@@ -48,10 +52,42 @@ def _compile_patterns(pattern_tuple: tuple[str, ...]) -> List[re.Pattern[str]]:
     return [re.compile(pattern) for pattern in pattern_tuple if pattern]
 
 
+@lru_cache(maxsize=16)
+def _combine_patterns(pattern_tuple: tuple[str, ...]) -> Optional[re.Pattern[str]]:
+    """
+    Fold patterns into one alternation so redaction is a single scan of the text.
+
+    Leading global flags such as ``(?i)`` become scoped groups. Returns None
+    when the patterns cannot be merged safely (backreferences, conditional
+    groups such as ``(?(1)...)``, compile errors).
+    """
+    branches: List[str] = []
+    for pattern in pattern_tuple:
+        if _GROUP_REFERENCE.search(pattern):
+            return None
+        match = _LEADING_FLAGS.match(pattern)
+        if match:
+            branches.append(f"(?{match.group(1)}:{pattern[match.end():]})")
+        else:
+            branches.append(f"(?:{pattern})")
+    if len(branches) < 2:
+        return None
+    try:
+        return re.compile("|".join(branches))
+    except re.error:
+        return None
+
+
 @dataclass(slots=True)
 class SecretRedactor:
     patterns: Sequence[re.Pattern[str]]
     replacement: str = _REPLACEMENT
+    _combined: Optional[re.Pattern[str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Patterns compiled with explicit flags can't be merged from their source text
+        if all(re.compile(pattern.pattern).flags == pattern.flags for pattern in self.patterns):
+            self._combined = _combine_patterns(tuple(pattern.pattern for pattern in self.patterns))
 
     def redact(self, payload: Any) -> Any:
         if isinstance(payload, str):
@@ -67,6 +103,8 @@ class SecretRedactor:
         return payload
 
     def _redact_text(self, text: str) -> str:
+        if self._combined is not None:
+            return self._combined.sub(self.replacement, text)
         redacted = text
         for pattern in self.patterns:
             redacted = pattern.sub(self.replacement, redacted)
@@ -77,6 +115,11 @@ def get_redactor(config: dict[str, Any] | None = None) -> SecretRedactor:
     config = config or {}
     config_patterns = _normalize_patterns(config.get("redact_patterns"))
     combined_patterns = tuple(sorted(set(_DEFAULT_PATTERNS) | set(_env_patterns()) | set(config_patterns)))
-    compiled = _compile_patterns(combined_patterns)
-    return SecretRedactor(compiled)
+    return _shared_redactor(combined_patterns)
+
+
+@lru_cache(maxsize=16)
+def _shared_redactor(pattern_tuple: tuple[str, ...]) -> SecretRedactor:
+    # Executors with the same pattern set share one redactor (and its merged regex)
+    return SecretRedactor(_compile_patterns(pattern_tuple))
 
@@ -7,6 +7,7 @@ This module provides monitors for detecting unsafe content in LLM outputs.
 from __future__ import annotations
 
 import re
+import threading
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Sequence
 
@@ -28,10 +29,12 @@ class ToxicityMonitor(Monitor):
     """Monitor for detecting toxic content."""
     
     def __init__(self, threshold: float = 0.7) -> None:
+        super().__init__()
         self.threshold = threshold
         self.toxic_count = 0
         self.total_count = 0
         self._data: Dict[str, Any] = {}
+        self._lock = threading.Lock()
     
     def identifier(self) -> str:
         return "toxicity"
@@ -42,22 +45,20 @@ class ToxicityMonitor(Monitor):
         self._data = {}
     
     def record(self, record: MonitorRecord) -> None:
-        self.total_count += 1
         result = record.result
         
         # Extract text from result
         text = self._extract_text(result)
-        if not text:
-            return
-        
         # Check for toxic content
-        toxicity_score = self._check_toxicity(text)
-        if toxicity_score >= self.threshold:
-            self.toxic_count += 1
-            self._data[f"case_{record.case_index}"] = {
-                "toxicity_score": toxicity_score,
-                "text_snippet": text[:100],
-            }
+        toxicity_score = self._check_toxicity(text) if text else 0.0
+        with self._lock:
+            self.total_count += 1
+            if text and toxicity_score >= self.threshold:
+                self.toxic_count += 1
+                self._data[f"case_{record.case_index}"] = {
+                    "toxicity_score": toxicity_score,
+                    "text_snippet": text[:100],
+                }
     
     def finalize(self) -> Dict[str, Any]:
         toxic_rate = self.toxic_count / self.total_count if self.total_count > 0 else 0.0
@@ -107,6 +108,7 @@ class BiasMonitor(Monitor):
     """Monitor for detecting biased content."""
     
     def __init__(self, protected_groups: Optional[List[str]] = None) -> None:
+        super().__init__()
         self.protected_groups = protected_groups or [
             "gender", "race", "ethnicity", "age", "religion",
             "sexual_orientation", "disability",
@@ -114,6 +116,7 @@ class BiasMonitor(Monitor):
         self.bias_count = 0
         self.total_count = 0
         self._data: Dict[str, Any] = {}
+        self._lock = threading.Lock()
     
     def identifier(self) -> str:
         return "bias"
@@ -124,20 +127,18 @@ class BiasMonitor(Monitor):
         self._data = {}
     
     def record(self, record: MonitorRecord) -> None:
-        self.total_count += 1
         result = record.result
         
         text = self._extract_text(result)
-        if not text:
-            return
-        
-        bias_detected = self._check_bias(text)
-        if bias_detected:
-            self.bias_count += 1
-            self._data[f"case_{record.case_index}"] = {
-                "bias_detected": True,
-                "text_snippet": text[:100],
-            }
+        bias_detected = self._check_bias(text) if text else False
+        with self._lock:
+            self.total_count += 1
+            if bias_detected:
+                self.bias_count += 1
+                self._data[f"case_{record.case_index}"] = {
+                    "bias_detected": True,
+                    "text_snippet": text[:100],
+                }
     
     def finalize(self) -> Dict[str, Any]:
         bias_rate = self.bias_count / self.total_count if self.total_count > 0 else 0.0
@@ -187,9 +188,11 @@ class PIIMonitor(Monitor):
     """Monitor for detecting personally identifiable information."""
     
     def __init__(self) -> None:
+        super().__init__()
         self.pii_count = 0
         self.total_count = 0
         self._data: Dict[str, Any] = {}
+        self._lock = threading.Lock()
     
     def identifier(self) -> str:
         return "pii"
@@ -200,21 +203,19 @@ class PIIMonitor(Monitor):
         self._data = {}
     
     def record(self, record: MonitorRecord) -> None:
-        self.total_count += 1
         result = record.result
         
         text = self._extract_text(result)
-        if not text:
-            return
-        
-        pii_detected = self._detect_pii(text)
-        if pii_detected:
-            self.pii_count += 1
-            self._data[f"case_{record.case_index}"] = {
-                "pii_detected": True,
-                "pii_types": pii_detected,
-                "text_snippet": text[:100],
-            }
+        pii_detected = self._detect_pii(text) if text else []
+        with self._lock:
+            self.total_count += 1
+            if pii_detected:
+                self.pii_count += 1
+                self._data[f"case_{record.case_index}"] = {
+                    "pii_detected": True,
+                    "pii_types": pii_detected,
+                    "text_snippet": text[:100],
+                }
     
     def finalize(self) -> Dict[str, Any]:
         pii_rate = self.pii_count / self.total_count if self.total_count > 0 else 0.0
@@ -277,6 +278,7 @@ class SafetyMonitor(Monitor):
         enable_bias: bool = True,
         enable_pii: bool = True,
     ) -> None:
+        super().__init__()
         self.toxicity_monitor = ToxicityMonitor() if enable_toxicity else None
         self.bias_monitor = BiasMonitor() if enable_bias else None
         self.pii_monitor = PIIMonitor() if enable_pii else None
@@ -295,6 +297,7 @@ class SafetyMonitor(Monitor):
         self._data = {}
     
     def record(self, record: MonitorRecord) -> None:
+        # Each component takes its own lock, so concurrent roles can record at once
         if self.toxicity_monitor:
             self.toxicity_monitor.record(record)
         if self.bias_monitor:
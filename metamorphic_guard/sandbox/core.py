@@ -4,10 +4,11 @@ Core sandbox execution entry point.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from .docker import _run_docker_sandbox
-from .local import _run_local_sandbox
+from .local import _run_local_sandbox, _run_local_sandbox_batch
+from .persistent import _run_persistent_sandbox, persistent_workers_enabled
 from .plugins import _get_executor_plugin, _load_executor_callable, _resolve_executor
 from .utils import _finalize_result
 
@@ -33,7 +34,11 @@ def run_in_sandbox(
     * `local`  (default): fork/exec on the host with resource limits.
     * `docker`: launch inside a Docker container with network disabled.
     * `<module>:<callable>`: import and invoke an external plugin.
-    
+
+    With `METAMORPHIC_GUARD_SANDBOX_PERSISTENT=1`, local calls into modules
+    without top-level side effects are served by long-lived workers that
+    import the module once (see `sandbox.persistent`).
+
     Args:
         file_path: Path to implementation file
         func_name: Function name to call
@@ -63,14 +68,25 @@ def run_in_sandbox(
     backend, config = _resolve_executor(executor, executor_config)
 
     if backend == "local":
-        raw_result = _run_local_sandbox(
-            file_path,
-            func_name,
-            args,
-            timeout_s,
-            mem_mb,
-            config=config,
-        )
+        raw_result = None
+        if persistent_workers_enabled():
+            raw_result = _run_persistent_sandbox(
+                file_path,
+                func_name,
+                args,
+                timeout_s,
+                mem_mb,
+                config=config,
+            )
+        if raw_result is None:
+            raw_result = _run_local_sandbox(
+                file_path,
+                func_name,
+                args,
+                timeout_s,
+                mem_mb,
+                config=config,
+            )
         return _finalize_result(raw_result, config)
     if backend == "docker":
         raw_result = _run_docker_sandbox(
@@ -118,4 +134,53 @@ def run_in_sandbox(
     return result
 
 
-
+def run_batch_in_sandbox(
+    file_path: str,
+    func_name: str,
+    args_list: Sequence[tuple],
+    timeout_s: float = 2.0,
+    mem_mb: int = 512,
+    *,
+    executor: Optional[str] = None,
+    executor_config: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Execute the function for each argument tuple, amortising sandbox start-up.
+
+    With the `local` backend all cases run in one subprocess, so interpreter
+    start-up and workspace preparation are paid once per batch. Cases share
+    interpreter state (module globals, caches) within the batch; each case is
+    still timed out after ``timeout_s`` on its own. Cases the batch
+    did not report on, and every case on other backends, are executed one at
+    a time through `run_in_sandbox`. Results are returned in input order.
+    """
+    backend, config = _resolve_executor(executor, executor_config)
+    if backend == "local" and len(args_list) > 1:
+        raw_results = _run_local_sandbox_batch(
+            file_path,
+            func_name,
+            args_list,
+            timeout_s,
+            mem_mb,
+            config=config,
+        )
+    else:
+        raw_results = [None] * len(args_list)
+
+    results: List[Dict[str, Any]] = []
+    for args, raw_result in zip(args_list, raw_results):
+        if raw_result is None:
+            results.append(
+                run_in_sandbox(
+                    file_path,
+                    func_name,
+                    args,
+                    timeout_s,
+                    mem_mb,
+                    executor=executor,
+                    executor_config=executor_config,
+                )
+            )
+        else:
+            results.append(_finalize_result(raw_result, config))
+    return results
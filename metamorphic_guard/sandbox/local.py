@@ -4,6 +4,7 @@ Local subprocess sandbox execution.
 
 from __future__ import annotations
 
+import ast
 import hashlib
 import json
 import os
@@ -12,11 +13,104 @@ import sys
 import tempfile
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from .utils import _result, _sanitize_config_payload
 from ..sandbox_limits import make_preexec_fn
-from ..sandbox_workspace import parse_success, prepare_workspace, write_bootstrap
+from ..sandbox_workspace import (
+    parse_case_results,
+    parse_success,
+    prepare_workspace,
+    write_batch_bootstrap,
+    write_bootstrap,
+)
+
+
+def _metadata_base(timeout_s: float, mem_mb: int, config: Dict[str, Any]) -> Dict[str, Any]:
+    metadata_base: Dict[str, Any] = {
+        "executor": "local",
+        "timeout_s": timeout_s,
+        "mem_mb": mem_mb,
+        "python_version": sys.version,
+    }
+    sanitized_config = _sanitize_config_payload(config)
+    if sanitized_config:
+        metadata_base["config"] = sanitized_config
+        metadata_base["config_fingerprint"] = hashlib.sha256(
+            json.dumps(sanitized_config, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+    return metadata_base
+
+
+def _sandbox_env() -> Dict[str, str]:
+    env = os.environ.copy()
+    env.pop("PYTHONPATH", None)
+    env["PYTHONIOENCODING"] = "utf-8"
+    env["NO_NETWORK"] = "1"
+    env["PYTHONNOUSERSITE"] = "1"
+
+    # Auto-propagate current working directory to PYTHONPATH for convenience
+    cwd_path = os.getcwd()
+    if cwd_path not in sys.path:
+        current_pythonpath = env.get("PYTHONPATH", "")
+        env["PYTHONPATH"] = f"{cwd_path}{os.pathsep}{current_pythonpath}" if current_pythonpath else cwd_path
+    return env
+
+
+def _case_record_result(
+    record: Dict[str, Any], duration_ms: float, timeout_s: float, metadata_base: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Shape one ``CASE_RESULT`` record like ``_run_local_sandbox``'s result.
+
+    Returns None when a successful call's value does not round-trip through
+    ``literal_eval``, so the caller can rerun it on the single-case path.
+    """
+
+    def _metadata_with_state(state: str) -> Dict[str, Any]:
+        meta = dict(metadata_base)
+        meta["run_state"] = state
+        return meta
+
+    if record.get("timeout"):
+        # Same shape as a single run killed at its timeout
+        return _result(
+            success=False,
+            duration_ms=duration_ms,
+            stdout="",
+            stderr=f"Process timed out after {timeout_s}s",
+            error="Timeout",
+            error_type="timeout",
+            error_code="SANDBOX_TIMEOUT",
+            sandbox_metadata=_metadata_with_state("timeout"),
+        )
+    case_stdout = record.get("stdout", "")
+    case_stderr = record.get("stderr", "")
+    if record.get("success"):
+        try:
+            parsed = ast.literal_eval(record.get("value", ""))
+        except (SyntaxError, ValueError):
+            return None
+        return _result(
+            success=True,
+            duration_ms=duration_ms,
+            stdout=case_stdout,
+            stderr=case_stderr,
+            result=parsed,
+            sandbox_metadata=_metadata_with_state("success"),
+        )
+    # Mirror the single-case path, where an exception exits the bootstrap with code 1
+    return _result(
+        success=False,
+        duration_ms=duration_ms,
+        stdout=f"{case_stdout}ERROR: {record.get('value', '')}\n",
+        stderr=case_stderr,
+        error="Process exited with code 1",
+        error_type="process_exit",
+        error_code="SANDBOX_EXIT_CODE",
+        diagnostics={"returncode": 1},
+        sandbox_metadata=_metadata_with_state("process_exit"),
+    )
 
 
 def _run_local_sandbox(
@@ -34,19 +128,7 @@ def _run_local_sandbox(
     Returns execution metadata along with either the parsed result (on success) or
     structured error information (on failure).
     """
-    config = config or {}
-    metadata_base: Dict[str, Any] = {
-        "executor": "local",
-        "timeout_s": timeout_s,
-        "mem_mb": mem_mb,
-        "python_version": sys.version,
-    }
-    sanitized_config = _sanitize_config_payload(config)
-    if sanitized_config:
-        metadata_base["config"] = sanitized_config
-        metadata_base["config_fingerprint"] = hashlib.sha256(
-            json.dumps(sanitized_config, sort_keys=True).encode("utf-8")
-        ).hexdigest()
+    metadata_base = _metadata_base(timeout_s, mem_mb, config or {})
 
     def _metadata_with_state(state: str) -> Dict[str, Any]:
         meta = dict(metadata_base)
@@ -69,17 +151,7 @@ def _run_local_sandbox(
             args,
         )
 
-        env = os.environ.copy()
-        env.pop("PYTHONPATH", None)
-        env["PYTHONIOENCODING"] = "utf-8"
-        env["NO_NETWORK"] = "1"
-        env["PYTHONNOUSERSITE"] = "1"
-        
-        # Auto-propagate current working directory to PYTHONPATH for convenience
-        cwd_path = os.getcwd()
-        if cwd_path not in sys.path:
-            current_pythonpath = env.get("PYTHONPATH", "")
-            env["PYTHONPATH"] = f"{cwd_path}{os.pathsep}{current_pythonpath}" if current_pythonpath else cwd_path
+        env = _sandbox_env()
 
         try:
             preexec_fn = make_preexec_fn(timeout_s, mem_mb)
@@ -163,4 +235,77 @@ def _run_local_sandbox(
             )
 
 
+def _run_local_sandbox_batch(
+    file_path: str,
+    func_name: str,
+    args_list: Sequence[tuple],
+    timeout_s: float = 2.0,
+    mem_mb: int = 512,
+    *,
+    config: Optional[Dict[str, Any]] = None,
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Execute the function once per argument tuple inside a single subprocess.
+
+    Each call is interrupted inside the subprocess once it overruns
+    ``timeout_s`` and reported as a timeout, so a slow case cannot eat the
+    budget of the cases after it; ``timeout_s * len(args_list)`` only bounds
+    the process as a whole (e.g. a call stuck in C code the timer cannot
+    interrupt). Each reported case gets its own result shaped like
+    ``_run_local_sandbox``'s, with its own captured stdout and stderr and the
+    batch's wall time split evenly across cases. Cases without a record (the
+    process was killed or crashed before reaching them) are returned as
+    ``None`` so the caller can rerun them individually.
+    """
+    count = len(args_list)
+    if count == 0:
+        return []
+    metadata_base = _metadata_base(timeout_s, mem_mb, config or {})
+    metadata_base["batch_size"] = count
+    batch_timeout = timeout_s * count
+
+    start_time = time.time()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        workspace_dir = temp_path / "workspace"
+        workspace_dir.mkdir(parents=True, exist_ok=True)
+
+        sandbox_target = prepare_workspace(Path(file_path), workspace_dir)
+        bootstrap_path = write_batch_bootstrap(
+            temp_path,
+            workspace_dir,
+            sandbox_target,
+            func_name,
+            args_list,
+            timeout_s,
+        )
+
+        try:
+            preexec_fn = make_preexec_fn(batch_timeout, mem_mb)
+            process = subprocess.Popen(
+                [sys.executable, "-I", str(bootstrap_path)],
+                cwd=workspace_dir,
+                env=_sandbox_env(),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                preexec_fn=preexec_fn,
+                start_new_session=preexec_fn is None,
+            )
+            try:
+                stdout, stderr = process.communicate(timeout=batch_timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                stdout, stderr = process.communicate()
+        except Exception:  # pragma: no cover - defensive safety net
+            return [None] * count
 
+    records = parse_case_results(stdout or "")
+    duration_ms = (time.time() - start_time) * 1000 / count
+    results: List[Optional[Dict[str, Any]]] = []
+    for index in range(count):
+        record = records.get(index)
+        # Unparseable values come back as None and go to the single-case path, which reports them
+        results.append(None if record is None else _case_record_result(record, duration_ms, timeout_s, metadata_base))
+    return results
@@ -0,0 +1,304 @@
+"""
+Long-lived local sandbox workers.
+
+Each worker is a sandboxed interpreter that imports the target module once
+and then serves calls over its stdin/stdout, so interpreter start-up and
+workspace preparation are paid once per worker rather than once per case.
+"""
+
+from __future__ import annotations
+
+import ast
+import atexit
+import json
+import os
+import select
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .local import _case_record_result, _metadata_base, _sandbox_env
+from ..sandbox_limits import make_preexec_fn
+from ..sandbox_workspace import prepare_workspace, write_worker_bootstrap
+
+# Workers are recycled after this many calls; RLIMIT_CPU is per process, so
+# each worker's CPU budget is sized for this many cases
+_MAX_CALLS_PER_WORKER = 256
+
+_POOL_LOCK = threading.Lock()
+_IDLE_WORKERS: Dict[Tuple[Any, ...], List["SandboxWorker"]] = {}
+# (path, mtime, size) -> module_is_reusable verdict for that version of the file
+_REUSABLE_SOURCES: Dict[Tuple[str, int, int], bool] = {}
+
+
+def persistent_workers_enabled() -> bool:
+    """Whether ``METAMORPHIC_GUARD_SANDBOX_PERSISTENT`` opts in to long-lived workers."""
+    if os.name == "nt":
+        # select() only supports sockets on Windows
+        return False
+    return os.environ.get("METAMORPHIC_GUARD_SANDBOX_PERSISTENT", "").lower() in {"1", "true", "yes"}
+
+
+def _is_constant_value(node: ast.AST) -> bool:
+    """A literal constant, or a tuple of them; nothing a call could mutate."""
+    if isinstance(node, ast.Constant):
+        return True
+    if isinstance(node, ast.UnaryOp) and isinstance(node.operand, ast.Constant):
+        return True  # negative numbers
+    if isinstance(node, ast.Tuple):
+        return all(_is_constant_value(element) for element in node.elts)
+    return False
+
+
+def _bindings_are_constant(body: List[ast.stmt]) -> bool:
+    for node in body:
+        if isinstance(node, ast.Assign) and not _is_constant_value(node.value):
+            return False
+        if isinstance(node, ast.AnnAssign) and node.value is not None and not _is_constant_value(node.value):
+            return False
+    return True
+
+
+def module_is_reusable(file_path: str) -> bool:
+    """
+    Heuristically decide whether one module instance can serve many cases.
+
+    The module's top level may only import, define functions and classes, and
+    bind names to constants or tuples of constants; class bodies follow the
+    same binding rule and function defaults must be constants too. ``global``
+    and ``nonlocal`` statements anywhere disqualify the module. Anything else
+    might carry side effects, or mutable state that a fresh interpreter per
+    case would have reset.
+    """
+    try:
+        tree = ast.parse(Path(file_path).read_text(encoding="utf-8"))
+    except (OSError, SyntaxError, UnicodeDecodeError, ValueError):
+        return False
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            continue
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
+            continue  # docstring
+        if isinstance(node, (ast.Assign, ast.AnnAssign)) and _bindings_are_constant([node]):
+            continue
+        return False
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Global, ast.Nonlocal)):
+            return False
+        if isinstance(node, ast.ClassDef) and not _bindings_are_constant(node.body):
+            return False
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            defaults = node.args.defaults + [d for d in node.args.kw_defaults if d is not None]
+            if not all(_is_constant_value(default) for default in defaults):
+                return False
+    return True
+
+
+class SandboxWorker:
+    """One sandboxed interpreter serving calls to ``func_name`` in ``file_path``."""
+
+    def __init__(self, file_path: str, func_name: str, timeout_s: float, mem_mb: int) -> None:
+        self._temp_dir = tempfile.mkdtemp(prefix="mg-worker-")
+        temp_path = Path(self._temp_dir)
+        workspace_dir = temp_path / "workspace"
+        workspace_dir.mkdir(parents=True, exist_ok=True)
+        sandbox_target = prepare_workspace(Path(file_path), workspace_dir)
+        bootstrap_path = write_worker_bootstrap(temp_path, workspace_dir, sandbox_target, func_name)
+        preexec_fn = make_preexec_fn(timeout_s * _MAX_CALLS_PER_WORKER, mem_mb)
+        self._stderr_file = open(temp_path / "stderr.log", "w+", encoding="utf-8")
+        # Unbuffered binary pipes: replies are split into lines here, so select()
+        # never misses a line already pulled into a Python-side buffer
+        self.process = subprocess.Popen(
+            [sys.executable, "-I", str(bootstrap_path)],
+            cwd=workspace_dir,
+            env=_sandbox_env(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._stderr_file,
+            bufsize=0,
+            preexec_fn=preexec_fn,
+            start_new_session=preexec_fn is None,
+        )
+        self._pending = b""
+        self.calls = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None and self.calls < _MAX_CALLS_PER_WORKER
+
+    def _read_line(self, deadline: float) -> Optional[bytes]:
+        """Next line from the worker's stdout, b"" on EOF, or None past ``deadline``."""
+        fd = self.process.stdout.fileno()
+        while b"\n" not in self._pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            readable, _, _ = select.select([fd], [], [], remaining)
+            if not readable:
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return b""
+            self._pending += chunk
+        line, self._pending = self._pending.split(b"\n", 1)
+        return line + b"\n"
+
+    def call(self, args: tuple, timeout_s: float) -> Optional[Dict[str, Any]]:
+        """
+        Run one call and return its ``CASE_RESULT`` record.
+
+        Returns ``{"timeout": True}`` when no answer arrives within
+        ``timeout_s`` (the worker is killed), and None when the worker died or
+        answered with something that is not a record.
+        """
+        self.calls += 1
+        try:
+            self.process.stdin.write((repr(args) + "\n").encode("utf-8"))
+        except (BrokenPipeError, OSError, ValueError):
+            return None
+        deadline = time.monotonic() + timeout_s
+        while True:
+            line = self._read_line(deadline)
+            if line is None:
+                self.close()
+                return {"timeout": True}
+            if not line:
+                return None
+            if not line.startswith(b"CASE_RESULT:"):
+                # Written straight to the real stdout by the target; not part of the protocol
+                continue
+            try:
+                record = ast.literal_eval(line.split(b"CASE_RESULT:", 1)[1].decode("utf-8").strip())
+            except (SyntaxError, ValueError, UnicodeDecodeError):
+                return None
+            return record if isinstance(record, dict) else None
+
+    def close(self) -> None:
+        if self.process.poll() is None:
+            self.process.kill()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:  # pragma: no cover - kill is not refused
+            pass
+        for stream in (self.process.stdin, self.process.stdout, self._stderr_file):
+            try:
+                stream.close()
+            except (OSError, ValueError):
+                pass
+        shutil.rmtree(self._temp_dir, ignore_errors=True)
+
+
+def _source_key(file_path: str) -> Tuple[str, int, int]:
+    """Resolved path, mtime and size of ``file_path``; changes whenever the file is edited."""
+    stat_result = Path(file_path).stat()
+    return (str(Path(file_path).resolve()), stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def _module_is_reusable_cached(source_key: Tuple[str, int, int], file_path: str) -> bool:
+    """`module_is_reusable`, parsed once per version of the source file."""
+    with _POOL_LOCK:
+        reusable = _REUSABLE_SOURCES.get(source_key)
+    if reusable is None:
+        reusable = module_is_reusable(file_path)
+        with _POOL_LOCK:
+            _REUSABLE_SOURCES[source_key] = reusable
+    return reusable
+
+
+def _pool_key(
+    source_key: Tuple[str, int, int], func_name: str, timeout_s: float, mem_mb: int, config: Dict[str, Any]
+) -> Tuple[Any, ...]:
+    # The source stat is part of the key so an edited file gets fresh workers
+    return (
+        *source_key,
+        func_name,
+        timeout_s,
+        mem_mb,
+        json.dumps(config, sort_keys=True, default=str),
+    )
+
+
+def _checkout(key: Tuple[Any, ...], file_path: str, func_name: str, timeout_s: float, mem_mb: int) -> SandboxWorker:
+    with _POOL_LOCK:
+        idle = _IDLE_WORKERS.get(key, [])
+        while idle:
+            worker = idle.pop()
+            if worker.alive:
+                return worker
+            worker.close()
+    return SandboxWorker(file_path, func_name, timeout_s, mem_mb)
+
+
+def _checkin(key: Tuple[Any, ...], worker: SandboxWorker) -> None:
+    if not worker.alive:
+        worker.close()
+        return
+    with _POOL_LOCK:
+        _IDLE_WORKERS.setdefault(key, []).append(worker)
+
+
+def shutdown_workers() -> None:
+    """Terminate every idle worker."""
+    with _POOL_LOCK:
+        workers = [worker for idle in _IDLE_WORKERS.values() for worker in idle]
+        _IDLE_WORKERS.clear()
+    for worker in workers:
+        worker.close()
+
+
+atexit.register(shutdown_workers)
+
+
+def _run_persistent_sandbox(
+    file_path: str,
+    func_name: str,
+    args: tuple,
+    timeout_s: float = 2.0,
+    mem_mb: int = 512,
+    *,
+    config: Optional[Dict[str, Any]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Execute one call on a pooled worker, shaped like ``_run_local_sandbox``'s result.
+
+    Returns None when the call should go through a fresh sandbox instead: the
+    module is not reusable, the worker died (including on ``sys.exit`` or a
+    resource limit), or the arguments or result do not round-trip through
+    ``repr``/``literal_eval``.
+    """
+    try:
+        source_key = _source_key(file_path)
+    except OSError:
+        return None
+    if not _module_is_reusable_cached(source_key, file_path):
+        return None
+    metadata_base = _metadata_base(timeout_s, mem_mb, config or {})
+    metadata_base["persistent_worker"] = True
+    try:
+        key = _pool_key(source_key, func_name, timeout_s, mem_mb, config or {})
+        worker = _checkout(key, file_path, func_name, timeout_s, mem_mb)
+    except (OSError, ValueError):
+        return None
+
+    start_time = time.time()
+    record = worker.call(args, timeout_s)
+    duration_ms = (time.time() - start_time) * 1000
+    if record is None or record.get("unparsed"):
+        worker.close()
+        return None
+    _checkin(key, worker)
+
+    return _case_record_result(record, duration_ms, timeout_s, metadata_base)
+
+
+__all__ = [
+    "SandboxWorker",
+    "module_is_reusable",
+    "persistent_workers_enabled",
+    "shutdown_workers",
+]
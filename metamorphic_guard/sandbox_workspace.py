@@ -8,24 +8,17 @@ import ast
 import os
 import tempfile
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Sequence
 
 from .sandbox_cache import clone_snapshot_dir, clone_snapshot_file, snapshot_source
 
 
-def generate_bootstrap_code(
-    workspace_dir: Path,
-    sandbox_target: Path,
-    func_name: str,
-    args: tuple,
-) -> str:
-    """Generate the python code for the bootstrap script."""
+def _bootstrap_prelude(workspace_dir: Path, sandbox_target: Path) -> str:
+    """Code shared by every bootstrap: sandbox guards plus a ``_load()`` for the target."""
     from textwrap import dedent
 
     workspace_repr = repr(str(workspace_dir))
     target_repr = repr(str(sandbox_target))
-    args_repr = repr(args)
-    func_name_repr = repr(func_name)
 
     return dedent(
         f"""
@@ -172,7 +165,24 @@ def generate_bootstrap_code(
             module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(module)
             return module
+        """
+    )
+
+
+def generate_bootstrap_code(
+    workspace_dir: Path,
+    sandbox_target: Path,
+    func_name: str,
+    args: tuple,
+) -> str:
+    """Generate the python code for the bootstrap script."""
+    from textwrap import dedent
 
+    args_repr = repr(args)
+    func_name_repr = repr(func_name)
+
+    return _bootstrap_prelude(workspace_dir, sandbox_target) + dedent(
+        f"""
 
         def _main():
             module = _load()
@@ -194,6 +204,88 @@ def generate_bootstrap_code(
     )
 
 
+def generate_batch_bootstrap_code(
+    workspace_dir: Path,
+    sandbox_target: Path,
+    func_name: str,
+    args_list: Sequence[tuple],
+    timeout_s: Optional[float] = None,
+) -> str:
+    """
+    Generate a bootstrap that calls the target once per argument tuple.
+
+    Each call's stdout and stderr are captured separately and reported on one
+    ``CASE_RESULT:`` line, so a crash part-way through loses only the
+    remaining cases. With ``timeout_s`` each call gets its own interval timer
+    (where ``signal.setitimer`` exists); a call that overruns it is reported
+    with ``"timeout": True`` and the batch moves on to the next case.
+    """
+    from textwrap import dedent
+
+    args_list_repr = repr(list(args_list))
+    func_name_repr = repr(func_name)
+    timeout_repr = repr(float(timeout_s) if timeout_s else None)
+
+    return _bootstrap_prelude(workspace_dir, sandbox_target) + dedent(
+        f"""
+
+        class _CaseTimeout(BaseException):
+            # BaseException so a target's ``except Exception`` cannot swallow it
+            pass
+
+
+        def _on_alarm(signum, frame):
+            raise _CaseTimeout()
+
+
+        def _main():
+            import contextlib
+            import io
+            import signal
+
+            module = _load()
+            try:
+                func = getattr(module, {func_name_repr})
+            except AttributeError as exc:
+                raise AttributeError(f"Function '{{{func_name_repr}}}' not found") from exc
+            timeout_s = {timeout_repr}
+            if timeout_s is not None and not hasattr(signal, "setitimer"):
+                timeout_s = None
+            if timeout_s is not None:
+                signal.signal(signal.SIGALRM, _on_alarm)
+            real_stdout = sys.stdout
+            for index, call_args in enumerate({args_list_repr}):
+                out_buffer = io.StringIO()
+                err_buffer = io.StringIO()
+                try:
+                    try:
+                        with contextlib.redirect_stdout(out_buffer), contextlib.redirect_stderr(err_buffer):
+                            if timeout_s is not None:
+                                signal.setitimer(signal.ITIMER_REAL, timeout_s)
+                            value = func(*call_args)
+                    finally:
+                        if timeout_s is not None:
+                            signal.setitimer(signal.ITIMER_REAL, 0)
+                    record = {{"index": index, "success": True, "value": repr(value)}}
+                except _CaseTimeout:
+                    record = {{"index": index, "success": False, "timeout": True, "value": ""}}
+                except Exception as exc:
+                    record = {{"index": index, "success": False, "value": str(exc)}}
+                record["stdout"] = out_buffer.getvalue()
+                record["stderr"] = err_buffer.getvalue()
+                print("CASE_RESULT:", repr(record), file=real_stdout, flush=True)
+
+
+        if __name__ == "__main__":
+            try:
+                _main()
+            except Exception as exc:
+                print("ERROR:", exc)
+                sys.exit(1)
+        """
+    )
+
+
 def write_bootstrap(
     temp_path: Path,
     workspace_dir: Path,
@@ -213,6 +305,100 @@ def write_bootstrap(
     return bootstrap_file
 
 
+def write_batch_bootstrap(
+    temp_path: Path,
+    workspace_dir: Path,
+    sandbox_target: Path,
+    func_name: str,
+    args_list: Sequence[tuple],
+    timeout_s: Optional[float] = None,
+) -> Path:
+    """Emit a bootstrap script that executes the target once per argument tuple."""
+    bootstrap_file = temp_path / "bootstrap.py"
+    bootstrap_file.write_text(
+        generate_batch_bootstrap_code(workspace_dir, sandbox_target, func_name, args_list, timeout_s),
+        encoding="utf-8",
+    )
+    return bootstrap_file
+
+
+def generate_worker_bootstrap_code(
+    workspace_dir: Path,
+    sandbox_target: Path,
+    func_name: str,
+) -> str:
+    """
+    Generate a bootstrap that loads the target once and serves calls from stdin.
+
+    Each stdin line holds the ``repr`` of one argument tuple; each call is
+    answered with one ``CASE_RESULT:`` line, with the call's stdout and stderr
+    captured separately.
+    """
+    from textwrap import dedent
+
+    func_name_repr = repr(func_name)
+
+    return _bootstrap_prelude(workspace_dir, sandbox_target) + dedent(
+        f"""
+
+        def _main():
+            import ast
+            import contextlib
+            import io
+
+            module = _load()
+            try:
+                func = getattr(module, {func_name_repr})
+            except AttributeError as exc:
+                raise AttributeError(f"Function '{{{func_name_repr}}}' not found") from exc
+            requests = sys.stdin
+            real_stdout = sys.stdout
+            # The target must not read (and so swallow) the request stream
+            sys.stdin = io.StringIO()
+            for line in requests:
+                out_buffer = io.StringIO()
+                err_buffer = io.StringIO()
+                try:
+                    call_args = ast.literal_eval(line)
+                except (SyntaxError, ValueError) as exc:
+                    record = {{"success": False, "unparsed": True, "value": str(exc)}}
+                else:
+                    try:
+                        with contextlib.redirect_stdout(out_buffer), contextlib.redirect_stderr(err_buffer):
+                            value = func(*call_args)
+                        record = {{"success": True, "value": repr(value)}}
+                    except Exception as exc:
+                        record = {{"success": False, "value": str(exc)}}
+                record["stdout"] = out_buffer.getvalue()
+                record["stderr"] = err_buffer.getvalue()
+                print("CASE_RESULT:", repr(record), file=real_stdout, flush=True)
+
+
+        if __name__ == "__main__":
+            try:
+                _main()
+            except Exception as exc:
+                print("ERROR:", exc)
+                sys.exit(1)
+        """
+    )
+
+
+def write_worker_bootstrap(
+    temp_path: Path,
+    workspace_dir: Path,
+    sandbox_target: Path,
+    func_name: str,
+) -> Path:
+    """Emit a bootstrap script for a long-lived sandbox worker."""
+    bootstrap_file = temp_path / "bootstrap.py"
+    bootstrap_file.write_text(
+        generate_worker_bootstrap_code(workspace_dir, sandbox_target, func_name),
+        encoding="utf-8",
+    )
+    return bootstrap_file
+
+
 def prepare_workspace(source_path: Path, workspace_dir: Path) -> Path:
     """Copy the relevant source tree into the sandbox and return the module path."""
 
@@ -296,8 +482,26 @@ def parse_success(stdout: str) -> Optional[Any]:
         raise ValueError(f"Failed to parse sandbox output: {exc}") from exc
 
 
+def parse_case_results(stdout: str) -> Dict[int, Dict[str, Any]]:
+    """Collect the ``CASE_RESULT:`` records printed by a batch bootstrap, keyed by case index."""
+    records: Dict[int, Dict[str, Any]] = {}
+    for line in stdout.splitlines():
+        if not line.startswith("CASE_RESULT:"):
+            continue
+        try:
+            record = ast.literal_eval(line.split("CASE_RESULT:", 1)[1].strip())
+        except (SyntaxError, ValueError):
+            continue
+        if isinstance(record, dict) and isinstance(record.get("index"), int):
+            records[record["index"]] = record
+    return records
+
+
 __all__ = [
     "write_bootstrap",
+    "write_batch_bootstrap",
+    "write_worker_bootstrap",
+    "parse_case_results",
     "prepare_workspace",
     "determine_package_root",
     "parse_success",
@@ -13,6 +13,7 @@ class PolicyVersion(str, Enum):
 
 class GatingMethod(str, Enum):
     BOOTSTRAP = "bootstrap"
+    BOOTSTRAP_EXACT = "bootstrap_exact"
     BOOTSTRAP_BCA = "bootstrap_bca"
     BAYESIAN = "bayesian"
     WILSON = "wilson"
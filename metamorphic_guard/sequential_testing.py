@@ -19,7 +19,7 @@ import math
 from dataclasses import dataclass
 from typing import Callable, Dict, List, Optional, Tuple
 
-from statistics import NormalDist
+from .power import _STD_NORMAL, _inv_cdf, _z_two_sided
 
 
 @dataclass
@@ -83,9 +83,9 @@ def obrien_fleming_bound(alpha: float, max_looks: int, look_number: int) -> floa
     # O'Brien-Fleming: early looks are very conservative
     # Boundary scales as sqrt(max_looks / look_number)
     # For alpha spending, we use a conservative approximation
-    z_alpha_overall = NormalDist().inv_cdf(1 - alpha / 2)
+    z_alpha_overall = _z_two_sided(alpha)
     z_boundary = z_alpha_overall * math.sqrt(max_looks / look_number)
-    adjusted_alpha = 2 * (1 - NormalDist().cdf(z_boundary))
+    adjusted_alpha = 2 * (1 - _STD_NORMAL.cdf(z_boundary))
     
     return min(alpha, adjusted_alpha)
 
@@ -167,8 +167,8 @@ def sprt_boundary(
     
     # Simplified boundaries (would need full SPRT implementation for production)
     # This provides a framework
-    z_alpha = NormalDist().inv_cdf(1 - alpha / 2)
-    z_beta = NormalDist().inv_cdf(1 - beta)
+    z_alpha = _z_two_sided(alpha)
+    z_beta = _inv_cdf(1 - beta)
     
     se = math.sqrt(var0)
     lower = p0 - z_alpha * se
@@ -5,6 +5,7 @@ Utility functions for file operations and report generation.
 import hashlib
 import inspect
 import json
+import math
 import os
 import platform
 import sys
@@ -12,7 +13,34 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional
 
-_SHA_CACHE: Dict[tuple[str, int], str] = {}
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+# Files: (resolved path, mtime_ns, size); directories: (resolved path, digest of
+# entry stats, entry count). Maps to the SHA256; oldest entries are evicted first
+_SHA_CACHE: Dict[tuple[str, Any, int], str] = {}
+_SHA_CACHE_MAX = 256
+
+
+def _update_from_file(hash_obj: Any, path: Path) -> None:
+    """Feed a file's bytes into ``hash_obj``, in C via ``hashlib.file_digest`` on 3.11+."""
+    with path.open("rb") as file_obj:
+        if hasattr(hashlib, "file_digest"):
+            # file_digest updates whatever object the factory returns, so the
+            # running directory hash is fed directly without Python-level chunking
+            hashlib.file_digest(file_obj, lambda: hash_obj)
+            return
+        for chunk in iter(lambda: file_obj.read(1 << 20), b""):
+            hash_obj.update(chunk)
+
+
+def _remember_digest(cache_key: tuple[str, Any, int], digest: str) -> str:
+    if len(_SHA_CACHE) >= _SHA_CACHE_MAX:
+        del _SHA_CACHE[next(iter(_SHA_CACHE))]
+    _SHA_CACHE[cache_key] = digest
+    return digest
 
 
 def sha256_file(path: str) -> str:
@@ -22,64 +50,84 @@ def sha256_file(path: str) -> str:
     If path does not exist or is too long to be a valid path, it is treated
     as raw content and hashed directly.
     """
-    hash_sha256 = hashlib.sha256()
-    
-    # specific check for max path length to avoid OSError on some platforms
-    # or check if it looks like a path
+    # A single stat both checks existence and keys the cache; ENAMETOOLONG and
+    # embedded NULs mean the argument is raw content rather than a path
     try:
         target = Path(path)
-        exists = target.exists()
+        stat_result = target.stat()
     except (OSError, ValueError):
-        exists = False
-
-    if not exists:
-        # Treat as content
         normalized = path.encode("utf-8")
         return hashlib.sha256(normalized).hexdigest()
 
-    target = Path(path)
-
-    try:
-        mtime = target.stat().st_mtime_ns
-    except FileNotFoundError:
-        # Should be caught by exists check, but race condition possible
-        normalized = path.encode("utf-8")
-        return hashlib.sha256(normalized).hexdigest()
-
-    cache_key = (str(target.resolve()), mtime)
-    cached = _SHA_CACHE.get(cache_key)
-    if cached is not None:
-        return cached
-
     if target.is_file():
-        with target.open("rb") as file_obj:
-            for chunk in iter(lambda: file_obj.read(4096), b""):
-                hash_sha256.update(chunk)
-        digest = hash_sha256.hexdigest()
-        _SHA_CACHE[cache_key] = digest
-        return digest
+        cache_key = (str(target.resolve()), stat_result.st_mtime_ns, stat_result.st_size)
+        cached = _SHA_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        hash_sha256 = hashlib.sha256()
+        _update_from_file(hash_sha256, target)
+        return _remember_digest(cache_key, hash_sha256.hexdigest())
 
     if target.is_dir():
-        hash_sha256.update(b"dir")
-
         entries = sorted(
             (p for p in target.rglob("*") if p.is_file()),
             key=lambda p: p.relative_to(target).as_posix(),
         )
+        # A directory's own mtime misses edits to nested files, so the tree is
+        # keyed on every entry's stat; unchanged trees are still never read
+        tree_stats = [
+            (entry.relative_to(target).as_posix(), entry_stat.st_mtime_ns, entry_stat.st_size)
+            for entry, entry_stat in ((entry, entry.stat()) for entry in entries)
+        ]
+        tree_key = hashlib.blake2b(repr(tree_stats).encode("utf-8"), digest_size=16).hexdigest()
+        cache_key = (str(target.resolve()), tree_key, len(tree_stats))
+        cached = _SHA_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        hash_sha256 = hashlib.sha256()
+        hash_sha256.update(b"dir")
 
         for entry in entries:
             rel_path = entry.relative_to(target).as_posix().encode("utf-8")
             hash_sha256.update(rel_path)
-            with entry.open("rb") as file_obj:
-                for chunk in iter(lambda: file_obj.read(4096), b""):
-                    hash_sha256.update(chunk)
-        digest = hash_sha256.hexdigest()
-        _SHA_CACHE[cache_key] = digest
-        return digest
+            _update_from_file(hash_sha256, entry)
+        return _remember_digest(cache_key, hash_sha256.hexdigest())
 
     raise FileNotFoundError(f"Path not found: {path}")
 
 
+def _has_non_finite(value: Any) -> bool:
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        if kind is float:
+            if not math.isfinite(item):
+                return True
+        elif kind is dict:
+            stack.extend(item.values())
+        elif kind is list or kind is tuple:
+            stack.extend(item)
+    return False
+
+
+def _dumps_indented(payload: Any) -> bytes:
+    """
+    Encode ``payload`` as indented JSON, using orjson when it is installed.
+
+    The stdlib encoder has no C path for ``indent``; orjson is ~30x faster on
+    large reports. Payloads it would encode differently (NaN/Infinity, which it
+    writes as null) or cannot encode fall back to ``json.dumps``.
+    """
+    if orjson is not None and not _has_non_finite(payload):
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
 def write_report(payload: dict, *, directory: str | Path | None = None, validate: bool = True) -> str:
     """
     Write a JSON report to disk and return its path.
@@ -122,8 +170,7 @@ def write_report(payload: dict, *, directory: str | Path | None = None, validate
 
     filepath = reports_dir / filename
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
+    filepath.write_bytes(_dumps_indented(payload))
 
     return str(filepath)
 
@@ -331,7 +378,7 @@ def write_failed_artifacts(
         "run_id": run_id,
     }
     target = path / filename
-    target.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    target.write_bytes(_dumps_indented(payload))
     # Ensure file is written before pruning (write_text is synchronous)
     _prune_failed_artifacts(path, limit=limit, ttl_days=ttl_days, now=now, exclude=target)
     return target
@@ -102,3 +102,54 @@ def test_adaptive_grows_sample_size(mock_spec, mock_execute_impl, mock_should_co
     # Chunk 3: 5 items (reached 15, decision says stop)
     assert mock_execute_impl.call_count >= 3
 
+
+def test_adaptive_checks_evaluate_only_new_cases(mock_spec, mock_execute_impl, mock_should_continue):
+    from metamorphic_guard.harness.reporting import evaluate_results
+
+    inputs = [("init", i) for i in range(10)]
+    plan = ExecutionPlan(
+        spec=mock_spec, test_inputs=inputs, dispatcher=MagicMock(), monitors=[], worker_count=3, run_id="r"
+    )
+    mock_should_continue.return_value = AdaptiveDecision(
+        continue_sampling=True, recommended_n=None, current_power=0.5, reason="low_power"
+    )
+    seen = []
+    totals = []
+
+    def fake_evaluate_roles(**kwargs):
+        seen.append((kwargs["index_offset"], len(kwargs["baseline_results"])))
+        assert kwargs["workers"] == plan.worker_count
+        metrics = evaluate_results(
+            kwargs["baseline_results"],
+            MagicMock(properties=[], relations=[], cluster_key=None),
+            kwargs["test_inputs"],
+            10,
+            role="baseline",
+            seed=0,
+            rerun=lambda args: {},
+            index_offset=kwargs["index_offset"],
+        )
+        return metrics, dict(metrics)
+
+    def record_decision(baseline_metrics, candidate_metrics, current_n, **kwargs):
+        totals.append((baseline_metrics["total"], list(baseline_metrics["pass_indicators"])))
+        return mock_should_continue.return_value
+
+    mock_should_continue.side_effect = record_decision
+
+    with patch("metamorphic_guard.harness.adaptive_execution.evaluate_roles", side_effect=fake_evaluate_roles):
+        execute_adaptively(
+            plan=plan,
+            baseline_path="b.py", candidate_path="c.py",
+            timeout_s=1, mem_mb=1,
+            executor="local", executor_config={},
+            baseline_executor=None, baseline_executor_config=None,
+            candidate_executor=None, candidate_executor_config=None,
+            alpha=0.05, min_delta=0.01, power_target=0.8,
+            adaptive_config=AdaptiveConfig(enabled=True, min_sample_size=5, check_interval=5),
+            violation_cap=10, seed=42, shrink_violations=False,
+            spec=mock_spec,
+        )
+
+    assert seen == [(0, 5), (5, 5)]
+    assert totals == [(5, [1] * 5), (10, [1] * 10)]
@@ -21,6 +21,7 @@ from metamorphic_guard.monitoring import MonitorContext, MonitorRecord
 from metamorphic_guard.safety_monitors import (
     BiasMonitor,
     PIIMonitor,
+    SafetyMonitor,
     ToxicityMonitor,
 )
 
@@ -450,3 +451,32 @@ def test_safety_monitors_integration():
     pii_summary = summaries[2]  # PIIMonitor is last
     assert pii_summary["summary"]["pii_count"] >= 1
 
+
+def test_safety_monitor_counts_concurrent_records():
+    """Concurrent roles record into the same SafetyMonitor from two threads."""
+    import threading
+
+    monitor = SafetyMonitor()
+    monitor.start(MonitorContext(task="test", total_cases=400))
+
+    def record_role(role: str) -> None:
+        for idx in range(200):
+            monitor.record(MonitorRecord(
+                case_index=idx,
+                role=role,
+                duration_ms=1.0,
+                success=True,
+                result={"result": f"mail user{idx}@example.com"},
+            ))
+
+    threads = [threading.Thread(target=record_role, args=(role,)) for role in ("baseline", "candidate")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    summary = monitor.finalize()
+    pii = summary["components"]["pii"]["summary"]
+    assert pii["total_count"] == 400
+    assert pii["pii_count"] == 400
+    assert summary["components"]["toxicity"]["summary"]["total_count"] == 400
@@ -2,7 +2,28 @@
 
 from __future__ import annotations
 
-from metamorphic_guard.harness.statistics import compute_delta_ci
+import random
+from statistics import NormalDist
+
+import numpy as np
+
+from metamorphic_guard.harness import statistics
+from metamorphic_guard.harness.statistics import (
+    _cluster_codes,
+    compute_bayesian_ci,
+    compute_bayesian_posterior_predictive,
+    compute_bca_interval,
+    compute_bootstrap_ci,
+    compute_delta_ci,
+    compute_newcombe_ci,
+    compute_paired_stats,
+    generate_bootstrap_deltas,
+    percentile,
+    percentiles,
+    wilson_interval,
+)
+from metamorphic_guard.power import _inv_cdf, _z_two_sided
+from metamorphic_guard.sequential_testing import SequentialTestConfig, compute_sequential_alpha
 
 
 def _build_metrics(indicators, cluster=False):
@@ -59,3 +80,269 @@ def test_bootstrap_cluster_bca_interval_contains_delta():
     delta = candidate_metrics["pass_rate"] - baseline_metrics["pass_rate"]
     assert ci[0] <= delta <= ci[1]
     assert ci[0] < ci[1]
+
+
+def test_bootstrap_uses_normal_limit_for_large_paired_samples():
+    baseline = ([1] * 7 + [0] * 3) * 30
+    candidate = ([1] * 6 + [0] + [1] * 2 + [0]) * 30
+    baseline_metrics = _build_metrics(baseline)
+    candidate_metrics = _build_metrics(candidate)
+    kwargs = dict(alpha=0.05, seed=5, samples=20000)
+
+    fast = compute_delta_ci(baseline_metrics, candidate_metrics, method="bootstrap", **kwargs)
+    exact = compute_delta_ci(baseline_metrics, candidate_metrics, method="bootstrap_exact", **kwargs)
+
+    assert fast != exact
+    assert abs(fast[0] - exact[0]) < 0.01 and abs(fast[1] - exact[1]) < 0.01
+
+    small = compute_delta_ci(
+        _build_metrics(baseline[:100]), _build_metrics(candidate[:100]), method="bootstrap", **kwargs
+    )
+    assert small == compute_delta_ci(
+        _build_metrics(baseline[:100]), _build_metrics(candidate[:100]), method="bootstrap_exact", **kwargs
+    )
+
+
+def test_normal_quantiles_are_memoized():
+    _inv_cdf.cache_clear()
+    assert _inv_cdf(0.975) == NormalDist().inv_cdf(0.975)
+    _inv_cdf(0.975)
+    assert _inv_cdf.cache_info().hits == 1
+
+
+def test_wilson_interval_matches_reference_values():
+    lower, upper = wilson_interval(60, 100, 0.05)
+    assert abs(lower - 0.5020) < 1e-4 and abs(upper - 0.6906) < 1e-4
+    assert wilson_interval(0, 0, 0.05) == (0.0, 0.0)
+
+    ci = compute_newcombe_ci(60, 100, 90, 100, alpha=0.05)
+    assert abs(ci[0] - 0.1350) < 1e-4 and abs(ci[1] - 0.4428) < 1e-4
+
+
+def test_bootstrap_ci_short_circuits_identical_indicators(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("identical indicators should not be resampled")
+
+    monkeypatch.setattr(statistics, "generate_bootstrap_deltas", fail)
+    indicators = [1, 0, 1, 1] * 30
+
+    assert statistics.compute_bootstrap_ci(indicators, list(indicators), alpha=0.05, seed=1, samples=500) == [0.0, 0.0]
+    assert statistics.compute_bootstrap_ci(
+        bytearray(indicators), indicators, alpha=0.05, seed=1, samples=500, use_bca=True
+    ) == [0.0, 0.0]
+
+
+def test_bootstrap_deltas_for_scores_resample_pairs():
+    baseline = np.linspace(0.0, 1.0, 50)
+    candidate = baseline + 0.25
+    deltas = generate_bootstrap_deltas(baseline, candidate, rng=np.random.default_rng(3), samples=200)
+
+    # Every case improves by exactly 0.25, so every paired resample does too
+    assert np.allclose(deltas, 0.25)
+
+    # Same draws as resampling each arm with shared indices
+    idx = np.random.default_rng(4).integers(0, 50, size=(200, 50))
+    got = generate_bootstrap_deltas(baseline, candidate ** 2, rng=np.random.default_rng(4), samples=200)
+    assert np.allclose(got, (candidate ** 2)[idx].mean(axis=1) - baseline[idx].mean(axis=1))
+
+
+def test_unpaired_bootstrap_is_wider_than_common_random_numbers():
+    # The candidate fixes 5 of 100 cases and otherwise agrees with the baseline
+    baseline = [1] * 60 + [0] * 40
+    candidate = [1] * 65 + [0] * 35
+    paired = compute_bootstrap_ci(baseline, candidate, alpha=0.05, seed=1, samples=2000)
+    unpaired = compute_bootstrap_ci(baseline, candidate, alpha=0.05, seed=1, samples=2000, paired=False)
+
+    assert paired[1] - paired[0] < 0.5 * (unpaired[1] - unpaired[0])
+    assert unpaired[0] < 0.05 < unpaired[1]
+
+    scores = np.linspace(0.0, 1.0, 40)
+    deltas = generate_bootstrap_deltas(scores, scores + 0.1, rng=np.random.default_rng(2), samples=300, paired=False)
+    # Independent draws per arm no longer cancel the shared per-case variation
+    assert np.std(deltas) > 0.05
+    assert abs(np.mean(deltas) - 0.1) < 0.02
+
+
+def test_cluster_bootstrap_matches_per_cluster_resampling():
+    baseline = [1, 0, 1, 1, 0] * 8
+    candidate = [1, 1, 1, 0, 1] * 8
+    clusters = [f"g{i % 7}" for i in range(40)][::-1]
+    deltas = generate_bootstrap_deltas(
+        baseline, candidate, rng=np.random.default_rng(5), samples=100, clusters=clusters
+    )
+
+    order = list(dict.fromkeys(clusters))
+    members = {c: [i for i, label in enumerate(clusters) if label == c] for c in order}
+    picks = np.random.default_rng(5).integers(0, len(order), size=(100, len(order)))
+    expected = []
+    for row in picks:
+        cases = [i for k in row for i in members[order[k]]]
+        expected.append(np.mean([candidate[i] for i in cases]) - np.mean([baseline[i] for i in cases]))
+    assert np.allclose(deltas, expected)
+
+
+def test_bootstrap_batches_do_not_change_deltas(monkeypatch):
+    baseline = np.linspace(0.0, 1.0, 60)
+    candidate = np.sqrt(baseline)
+    clusters = [i % 9 for i in range(60)]
+
+    def run():
+        return (
+            statistics.generate_bootstrap_deltas(baseline, candidate, rng=np.random.default_rng(9), samples=50),
+            statistics.generate_bootstrap_deltas(
+                baseline, candidate, rng=np.random.default_rng(9), samples=50, clusters=clusters
+            ),
+        )
+
+    whole = run()
+    monkeypatch.setattr(statistics, "_BOOTSTRAP_BATCH_ELEMENTS", 100)
+    batched = run()
+    assert np.allclose(whole[0], batched[0]) and np.allclose(whole[1], batched[1])
+
+
+def test_compiled_bootstrap_kernel_path_resamples_pairs(monkeypatch):
+    # Without numba the kernel runs as plain Python, which exercises the same logic
+    monkeypatch.setattr(statistics, "NUMBA_AVAILABLE", True)
+    monkeypatch.setattr(statistics, "_NUMBA_MIN_ELEMENTS", 0)
+    monkeypatch.setenv("METAMORPHIC_GUARD_NUMBA_BOOTSTRAP", "1")
+    baseline = np.linspace(0.0, 1.0, 12)
+    with np.errstate(over="ignore"):
+        shifted = statistics.generate_bootstrap_deltas(
+            baseline, baseline + 0.25, rng=np.random.default_rng(3), samples=30
+        )
+        again = statistics.generate_bootstrap_deltas(
+            baseline, baseline ** 2, rng=np.random.default_rng(3), samples=30
+        )
+        repeat = statistics.generate_bootstrap_deltas(
+            baseline, baseline ** 2, rng=np.random.default_rng(3), samples=30
+        )
+        counts = statistics._splitmix_resampled_sums(np.ones((1, 12)), 5, seed=7)
+
+    assert np.allclose(shifted, 0.25)
+    assert again == repeat
+    assert len(set(again)) > 1
+    assert np.array_equal(counts, np.full((1, 5), 12.0))
+
+
+def test_bootstrap_draws_do_not_depend_on_numba_being_installed(monkeypatch):
+    monkeypatch.delenv("METAMORPHIC_GUARD_NUMBA_BOOTSTRAP", raising=False)
+    monkeypatch.setattr(statistics, "_NUMBA_MIN_ELEMENTS", 0)
+    baseline = np.linspace(0.0, 1.0, 12)
+
+    def draws():
+        return statistics.generate_bootstrap_deltas(
+            baseline, baseline ** 2, rng=np.random.default_rng(3), samples=30
+        )
+
+    monkeypatch.setattr(statistics, "NUMBA_AVAILABLE", False)
+    without = draws()
+    monkeypatch.setattr(statistics, "NUMBA_AVAILABLE", True)
+    assert draws() == without
+
+
+def test_cluster_bca_jackknife_leaves_out_whole_clusters():
+    baseline = [1, 0, 1, 1, 0, 0, 1, 0, 1, 1]
+    candidate = [1, 1, 1, 1, 0, 1, 1, 0, 1, 0]
+    clusters = ["a", "a", "b", "c", "b", "c", "c", "d", "d", "a"]
+    deltas = np.random.default_rng(0).normal(0.1, 0.1, size=500)
+    observed = (sum(candidate) - sum(baseline)) / len(baseline)
+
+    # Reference acceleration from an explicit leave-one-cluster-out loop
+    b = np.asarray(baseline, dtype=float)
+    c = np.asarray(candidate, dtype=float)
+    loo = []
+    for cluster in dict.fromkeys(clusters):
+        keep = np.asarray([label != cluster for label in clusters])
+        loo.append(c[keep].mean() - b[keep].mean())
+    diffs = np.mean(loo) - np.asarray(loo)
+    acceleration = np.sum(diffs ** 3) / (6.0 * np.sum(diffs ** 2) ** 1.5)
+    z0 = NormalDist().inv_cdf(np.mean(deltas < observed))
+
+    def adjusted(prob):
+        z = NormalDist().inv_cdf(prob)
+        return NormalDist().cdf(z0 + (z0 + z) / (1 - acceleration * (z0 + z)))
+
+    expected = np.quantile(deltas, [adjusted(0.025), adjusted(0.975)])
+    got = compute_bca_interval(
+        deltas.tolist(),
+        observed_delta=observed,
+        baseline_indicators=baseline,
+        candidate_indicators=candidate,
+        alpha=0.05,
+        clusters=clusters,
+    )
+    assert np.allclose(got, expected)
+
+
+def test_cluster_codes_number_integer_labels_by_first_occurrence():
+    labels = [7, 3, 7, 10, 3, -1, 10, 7]
+    codes, count = _cluster_codes(labels)
+    assert codes.tolist() == [0, 1, 0, 2, 1, 3, 2, 0]
+    assert count == 4
+    # Labels numpy can't hold as integers keep the dict numbering
+    assert _cluster_codes([7, "a", 7])[0].tolist() == [0, 1, 0]
+    assert _cluster_codes([2 ** 70, 1, 2 ** 70])[0].tolist() == [0, 1, 0]
+
+    baseline = [1, 0, 1, 1, 0, 0, 1, 0]
+    candidate = [1, 1, 1, 0, 0, 1, 1, 1]
+    as_strings = [str(label) for label in labels]
+    from_ints = generate_bootstrap_deltas(
+        bytearray(baseline), bytearray(candidate), rng=np.random.default_rng(5), samples=50, clusters=labels
+    )
+    from_strings = generate_bootstrap_deltas(
+        baseline, candidate, rng=np.random.default_rng(5), samples=50, clusters=as_strings
+    )
+    assert from_ints == from_strings
+
+
+def test_percentiles_match_sorted_interpolation():
+    values = list(np.random.default_rng(0).normal(size=1001))
+    ordered = sorted(values)
+    for q in (0.025, 0.5, 0.975):
+        index = q * (len(values) - 1)
+        low = int(index)
+        expected = ordered[low] * (1 - (index - low)) + ordered[low + 1] * (index - low)
+        assert percentile(values, q) == expected
+    assert percentiles(values, (0.0, 1.0)) == [ordered[0], ordered[-1]]
+    assert percentiles(np.asarray(values), (0.025, 0.975)) == [percentile(values, 0.025), percentile(values, 0.975)]
+    assert percentiles([], (0.5,)) == [0.0]
+
+
+def test_two_sided_z_shares_the_quantile_cache():
+    _inv_cdf.cache_clear()
+    assert _z_two_sided(0.05) == NormalDist().inv_cdf(0.975)
+    compute_sequential_alpha(SequentialTestConfig(method="obrien-fleming", alpha=0.05, max_looks=4, look_number=2))
+    assert _inv_cdf.cache_info().hits >= 1
+
+
+def test_paired_stats_reads_bytearray_indicators_like_lists():
+    baseline = [1, 1, 0, 0, 1, 0, 1]
+    candidate = [1, 0, 1, 0, 1, 1]
+
+    from_lists = compute_paired_stats(baseline, candidate)
+    from_bytes = compute_paired_stats(bytearray(baseline), bytearray(candidate))
+
+    assert from_bytes == from_lists
+    assert (from_lists["both_pass"], from_lists["baseline_only"], from_lists["candidate_only"]) == (2, 1, 2)
+    assert from_lists["both_fail"] == 1 and from_lists["total"] == 6
+
+
+def test_bayesian_intervals_select_the_sorted_order_statistics():
+    # Replays the posterior draws (Jeffreys prior) and picks the endpoints from a full sort
+    rng = random.Random(9)
+    baseline = [rng.betavariate(0.5 + 12, 0.5 + 8) for _ in range(1000)]
+    candidate = [rng.betavariate(0.5 + 15, 0.5 + 5) for _ in range(1000)]
+    deltas = sorted(c - b for b, c in zip(baseline, candidate))
+
+    ci = compute_bayesian_ci(12, 20, 15, 20, alpha=0.1, prior_type="jeffreys", samples=1000, seed=9)
+    assert ci == [deltas[50], deltas[950]]
+
+    predictive = compute_bayesian_posterior_predictive(
+        {"passes": 12, "total": 20},
+        {"passes": 15, "total": 20},
+        samples=1000,
+        hierarchical=False,
+        seed=9,
+    )
+    assert predictive["delta_ci"] == [deltas[25], deltas[975]]
+    assert predictive["prob_candidate_beats_baseline"] == sum(d > 0 for d in deltas) / 1000
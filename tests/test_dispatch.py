@@ -3,7 +3,7 @@ import textwrap
 import threading
 import time
 
-from metamorphic_guard.dispatch import LocalDispatcher
+from metamorphic_guard.dispatch import BatchRunner, LocalDispatcher
 from metamorphic_guard.dispatch_queue import (
     InMemoryQueueAdapter,
     QueueDispatcher,
@@ -235,3 +235,228 @@ def test_queue_requeues_stalled_worker(monkeypatch):
     assert len(results) == 2, "Both tasks should complete"
     assert sum(requeue_counts) >= 1
 
+
+def test_task_distribution_caps_batch_by_estimated_wall_time():
+    from metamorphic_guard.dispatch.task_distribution import TaskDistributionManager
+
+    adapter = InMemoryQueueAdapter()
+    manager = TaskDistributionManager(
+        adapter,
+        {"batch_size": 16, "max_batch_ms": 100.0},
+        workers=1,
+        test_inputs=[(i,) for i in range(64)],
+        job_id="job",
+        role="baseline",
+        call_spec=None,
+    )
+    assert manager.effective_batch_size() == 16
+
+    manager.avg_case_ms = 40.0
+    assert manager.effective_batch_size() == 2
+
+    manager.avg_case_ms = 1000.0
+    assert manager.effective_batch_size() == 1
+
+    manager.avg_case_ms = 40.0
+    manager.maybe_publish_batches()
+    assert all(len(task.case_indices) <= 2 for task in manager.tasks.values())
+
+
+def test_in_memory_adapter_snapshot_returns_assignments_and_heartbeats():
+    adapter = InMemoryQueueAdapter()
+    adapter.register_worker("w1")
+    adapter.worker_assign("w1", "task-a")
+
+    assignments, heartbeats, lost = adapter.snapshot()
+
+    assert assignments == {"task-a": "w1"}
+    assert set(heartbeats) == {"w1"}
+    assert lost == set()
+
+    # Snapshot is a copy, not a live view
+    adapter.pop_assignment("task-a")
+    assert assignments == {"task-a": "w1"}
+
+
+def test_task_distribution_due_tasks_uses_deadline_heap_and_lost_workers():
+    from metamorphic_guard.dispatch.task_distribution import TaskDistributionManager
+
+    adapter = InMemoryQueueAdapter()
+    manager = TaskDistributionManager(
+        adapter,
+        {"batch_size": 1, "adaptive_batching": False, "lease_seconds": 10.0},
+        workers=1,
+        test_inputs=[(i,) for i in range(3)],
+        job_id="job",
+        role="baseline",
+        call_spec=None,
+    )
+    manager.maybe_publish_batches()
+    first, second, third = list(manager.tasks)
+    now = time.monotonic()
+
+    assert manager.due_tasks(now, {}, {}, set()) == []
+
+    # A lost worker makes its task due before the lease expires
+    assert manager.due_tasks(now, {second: "w1"}, {}, {"w1"}) == [second]
+
+    # Expired leases are popped from the heap; rescheduled deadlines are skipped
+    manager._set_deadline(third, now + 100.0)
+    due = manager.due_tasks(now + 11.0, {}, {}, set())
+    assert sorted(due) == sorted([first, second])
+
+
+def test_in_memory_adapter_sharded_results_are_all_consumed():
+    adapter = InMemoryQueueAdapter()
+    adapter.ensure_result_queue("job", shards=4)
+    for index in range(12):
+        adapter.publish_result(
+            _Result(job_id="job", task_id=f"task-{index}", case_index=index, role="baseline", result={})
+        )
+
+    seen = set()
+    while True:
+        message = adapter.consume_result("job", timeout=0.05)
+        if message is None:
+            break
+        seen.add(message.case_index)
+
+    assert seen == set(range(12))
+
+
+def test_queue_dispatcher_with_result_shards():
+    dispatcher = QueueDispatcher(
+        workers=4,
+        config={"backend": "memory", "spawn_local_workers": True, "result_shards": 3},
+    )
+    inputs = [(i,) for i in range(25)]
+    results = dispatcher.execute(test_inputs=inputs, run_case=dummy_run_case, role="baseline")
+    assert [result["result"] for result in results] == list(range(25))
+
+
+def test_queue_dispatcher_single_worker_runs_inline():
+    from metamorphic_guard.monitoring import Monitor
+
+    class _Recorder(Monitor):
+        def __init__(self):
+            super().__init__()
+            self.records = []
+
+        def record(self, record):
+            self.records.append(record)
+
+        def finalize(self):
+            return {}
+
+    dispatcher = QueueDispatcher(workers=1, config={"backend": "memory"})
+    dispatcher.adapter = None  # The inline path must not touch the adapter
+    monitor = _Recorder()
+    inputs = [(i,) for i in range(5)]
+
+    results = dispatcher.execute(
+        test_inputs=inputs, run_case=dummy_run_case, role="baseline", monitors=[monitor]
+    )
+
+    assert [result["result"] for result in results] == list(range(5))
+    assert [record.case_index for record in monitor.records] == list(range(5))
+
+
+def test_queue_dispatcher_inline_path_matches_queue_path(monkeypatch):
+    from metamorphic_guard.dispatch import queue_dispatcher
+
+    completed = []
+    monkeypatch.setattr(queue_dispatcher, "increment_queue_completed", lambda: completed.append(1))
+    seen = {}
+
+    def recording_run_case(index, args):
+        seen.setdefault(index, []).append(args)
+        return {"success": True, "duration_ms": 1.0, "result": args[0]}
+
+    inputs = [((1, 2), "a"), ((3,), "b")]
+    inline = QueueDispatcher(workers=1, config={"backend": "memory"})
+    inline.execute(test_inputs=inputs, run_case=recording_run_case, role="baseline")
+    queued = QueueDispatcher(workers=1, config={"backend": "memory", "force_queue_path": True})
+    queued.execute(test_inputs=inputs, run_case=recording_run_case, role="baseline")
+
+    assert seen[0][0] == seen[0][1] == [[1, 2], "a"]
+    assert seen[1][0] == seen[1][1] == [[3], "b"]
+    assert len(completed) == 4
+
+
+def test_local_dispatcher_bounds_in_flight_cases(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from metamorphic_guard.dispatch import local
+
+    outstanding = set()
+    peak = {"value": 0}
+
+    class CountingPool(ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            future = super().submit(fn, *args, **kwargs)
+            outstanding.add(future)
+            peak["value"] = max(peak["value"], len(outstanding))
+            future.add_done_callback(outstanding.discard)
+            return future
+
+    monkeypatch.setattr(local, "ThreadPoolExecutor", CountingPool)
+    monkeypatch.setattr(local, "_INFLIGHT_PER_WORKER", 2)
+
+    def slow_run_case(index, args):
+        time.sleep(0.001)
+        return dummy_run_case(index, args)
+
+    results = LocalDispatcher(2).execute(
+        test_inputs=[(i,) for i in range(40)], run_case=slow_run_case, role="baseline"
+    )
+
+    assert [r["result"] for r in results] == list(range(40))
+    assert peak["value"] <= 4
+
+
+def test_local_dispatcher_process_fallback_keeps_every_result():
+    import warnings
+
+    dispatcher = LocalDispatcher(2, use_process_pool=True)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        # The dispatcher's per-case closure cannot be pickled, forcing the thread fallback
+        results = dispatcher.execute(
+            test_inputs=[(i,) for i in range(6)], run_case=dummy_run_case, role="baseline"
+        )
+
+    assert [r["result"] for r in results] == list(range(6))
+
+
+def test_local_dispatcher_coalesces_cases_into_batches():
+    batches = []
+
+    def run_case(index, args):
+        raise AssertionError("batched runner should be used")
+
+    def run_batch(indices, args_list):
+        batches.append(list(indices))
+        return [dummy_run_case(index, args) for index, args in zip(indices, args_list)]
+
+
+    class RecordingMonitor:
+        def __init__(self):
+            self.indices = []
+
+        def record(self, record):
+            self.indices.append(record.case_index)
+
+    for workers in (1, 3):
+        batches.clear()
+        monitor = RecordingMonitor()
+        results = LocalDispatcher(workers).execute(
+            test_inputs=[(i,) for i in range(10)],
+            run_case=run_case,
+            role="baseline",
+            monitors=[monitor],
+            batch_runner=BatchRunner(run=run_batch, size=4),
+        )
+
+        assert [r["result"] for r in results] == list(range(10))
+        assert sorted(batches) == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+        assert sorted(monitor.indices) == list(range(10))
@@ -1,5 +1,5 @@
 """
-Tests for the OpenAI and Anthropic executors.
+Tests for the OpenAI, Anthropic and Kubernetes executors.
 """
 
 from __future__ import annotations
@@ -163,3 +163,507 @@ def test_anthropic_pricing_override(monkeypatch):
     assert executor.pricing["claude-3-sonnet-20240229"]["prompt"] == pytest.approx(4.0, rel=1e-6)
     assert executor.pricing["claude-3-sonnet-20240229"]["completion"] == pytest.approx(16.0, rel=1e-6)
 
+
+def test_anthropic_pricing_ignores_non_dict_override(monkeypatch):
+    _stub_anthropic(monkeypatch)
+    executor = AnthropicExecutor(
+        {"api_key": "test", "pricing": {"claude-3-haiku-20240307": 0.25, "other": None}}
+    )
+    haiku = executor.pricing["claude-3-haiku-20240307"]
+    assert haiku["prompt"] == pytest.approx(0.25, rel=1e-6)
+    assert haiku["cache_write"] == pytest.approx(0.25 * 1.25, rel=1e-6)
+    assert haiku["cache_read"] == pytest.approx(0.025, rel=1e-6)
+
+
+def test_anthropic_executors_share_pooled_http_client(monkeypatch):
+    pytest.importorskip("httpx")
+    import metamorphic_guard.executors.anthropic as anthropic_module
+
+    class DummyHttpClient:
+        def __init__(self, **kwargs) -> None:
+            self.kwargs = kwargs
+
+    class DummyClient:
+        def __init__(self, api_key: str, http_client=None) -> None:
+            self.http_client = http_client
+
+    module = SimpleNamespace(Anthropic=DummyClient, DefaultHttpxClient=DummyHttpClient)
+    monkeypatch.setattr(anthropic_module, "anthropic", module)
+    monkeypatch.setattr(anthropic_module, "_HTTP_CLIENT", None)
+
+    first = AnthropicExecutor({"api_key": "a"})
+    second = AnthropicExecutor({"api_key": "b"})
+
+    assert isinstance(first.client.http_client, DummyHttpClient)
+    assert first.client.http_client is second.client.http_client
+
+
+def test_anthropic_sdk_is_imported_on_first_executor(monkeypatch):
+    import sys
+    import types
+
+    import metamorphic_guard.executors.anthropic as anthropic_module
+
+    class APIError(Exception):
+        pass
+
+    class RateLimitError(APIError):
+        pass
+
+    class DummyClient:
+        def __init__(self, api_key: str) -> None:
+            self.api_key = api_key
+
+    fake = types.ModuleType("anthropic")
+    fake.Anthropic = DummyClient
+    fake.APIError = APIError
+    fake.RateLimitError = RateLimitError
+    monkeypatch.setitem(sys.modules, "anthropic", fake)
+    monkeypatch.setitem(sys.modules, "anthropic.types", None)
+    for name in ("anthropic", "AnthropicError", "RateLimitError", "APITimeoutError", "APIConnectionError"):
+        monkeypatch.setattr(anthropic_module, name, getattr(anthropic_module, name))
+    monkeypatch.setattr(anthropic_module, "anthropic", None)
+
+    executor = AnthropicExecutor({"api_key": "test-key", "shared_http_client": False})
+
+    assert isinstance(executor.client, DummyClient)
+    assert anthropic_module.anthropic is fake
+    assert anthropic_module.RateLimitError is RateLimitError
+    assert anthropic_module.APITimeoutError is APIError
+
+
+def test_openai_executor_uses_pooled_http_client(monkeypatch):
+    pytest.importorskip("httpx")
+    import metamorphic_guard.executors.openai as openai_module
+
+    class DummyHttpClient:
+        def __init__(self, **kwargs) -> None:
+            self.kwargs = kwargs
+            self.closed = False
+
+        def close(self) -> None:
+            self.closed = True
+
+    class DummyClient:
+        def __init__(self, api_key: str, http_client=None) -> None:
+            self.http_client = http_client
+
+    module = SimpleNamespace(OpenAI=DummyClient, DefaultHttpxClient=DummyHttpClient)
+    monkeypatch.setattr(openai_module, "openai", module)
+
+    executor = OpenAIExecutor({"api_key": "a", "max_connections": 8})
+    http_client = executor.client.http_client
+
+    assert isinstance(http_client, DummyHttpClient)
+    assert http_client.kwargs["limits"].max_connections == 8
+    executor.close()
+    assert http_client.closed is True
+
+
+def test_openai_pool_outlives_backoff_and_resets_after_connection_error(monkeypatch):
+    pytest.importorskip("httpx")
+    import metamorphic_guard.executors.openai as openai_module
+
+    class APIConnectionError(Exception):
+        pass
+
+    class DummyPool:
+        closed = 0
+
+        def close(self) -> None:
+            DummyPool.closed += 1
+
+    class DummyHttpClient:
+        def __init__(self, **kwargs) -> None:
+            self.kwargs = kwargs
+            self._transport = SimpleNamespace(_pool=DummyPool())
+
+        def close(self) -> None:
+            pass
+
+    class DummyClient:
+        def __init__(self, api_key: str, http_client=None) -> None:
+            self.http_client = http_client
+
+    module = SimpleNamespace(OpenAI=DummyClient, DefaultHttpxClient=DummyHttpClient)
+    monkeypatch.setattr(openai_module, "openai", module)
+    monkeypatch.setattr(openai_module, "APIConnectionError", APIConnectionError)
+
+    executor = OpenAIExecutor({"api_key": "a", "retry_backoff_cap": 20.0, "retry_backoff_base": 0})
+    assert executor.client.http_client.kwargs["limits"].keepalive_expiry == 40.0
+
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            raise APIConnectionError("connection reset")
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="ok"), finish_reason="stop")],
+            usage=None,
+        )
+
+    executor.client.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+    executor.client.models = SimpleNamespace(list=lambda: [])
+
+    assert executor.execute("", "gpt-4", ("Hi",))["success"] is True
+    assert DummyPool.closed == 1
+    assert executor.health_check() is True
+    executor.close()
+
+
+def test_openai_shared_client_is_reused_per_key(monkeypatch):
+    import metamorphic_guard.executors.openai as openai_module
+
+    class DummyClient:
+        def __init__(self, api_key: str, base_url=None) -> None:
+            self.api_key = api_key
+            self.base_url = base_url
+
+    monkeypatch.setattr(openai_module, "openai", SimpleNamespace(OpenAI=DummyClient))
+    monkeypatch.setattr(openai_module, "_SHARED_CLIENTS", {})
+
+    first = OpenAIExecutor({"api_key": "a", "shared_client": True, "model": "gpt-4"})
+    second = OpenAIExecutor({"api_key": "a", "shared_client": True, "model": "gpt-3.5-turbo"})
+    other_key = OpenAIExecutor({"api_key": "b", "shared_client": True})
+    proxied = OpenAIExecutor({"api_key": "a", "shared_client": True, "base_url": "http://proxy/v1"})
+    private = OpenAIExecutor({"api_key": "a"})
+
+    assert first.client is second.client
+    assert other_key.client is not first.client
+    assert proxied.client is not first.client and proxied.client.base_url == "http://proxy/v1"
+    assert private.client is not first.client
+    first.close()
+    assert OpenAIExecutor({"api_key": "a", "shared_client": True}).client is second.client
+
+
+def _stub_kubernetes(monkeypatch, *, outcome=lambda job: "succeeded", logs=lambda job: '{"result": null}'):
+    """Bind a fake kubernetes client; returns the recorded API calls."""
+    import metamorphic_guard.executors.kubernetes as k8s_module
+
+    calls = SimpleNamespace(jobs=[], deleted=[], config_maps=[], deployments=[], execs=[])
+    jobs_by_name = {}
+
+    class Models:
+        def __getattr__(self, name):
+            return lambda **kwargs: SimpleNamespace(**kwargs)
+
+    class BatchV1Api:
+        def create_namespaced_job(self, body, namespace):
+            calls.jobs.append(body)
+            jobs_by_name[body.metadata.name] = body
+
+        def list_namespaced_job(self, **kwargs):  # pragma: no cover - only passed to Watch.stream
+            raise AssertionError("status must come from the watch")
+
+        def delete_collection_namespaced_job(self, **kwargs):
+            calls.deleted.append(kwargs)
+
+    class CoreV1Api:
+        def list_namespaced_pod(self, namespace, label_selector, field_selector=None):
+            name = label_selector.split("=", 1)[1]
+            return SimpleNamespace(items=[SimpleNamespace(metadata=SimpleNamespace(name=f"{name}-pod"))])
+
+        def read_namespaced_pod_log(self, pod_name, namespace):
+            return logs(jobs_by_name[pod_name[: -len("-pod")]])
+
+        def create_namespaced_config_map(self, namespace, body):
+            calls.config_maps.append(body)
+
+        def replace_namespaced_config_map(self, name, namespace, body):
+            calls.config_maps.append(body)
+
+        def connect_get_namespaced_pod_exec(self, *args, **kwargs):  # pragma: no cover
+            raise AssertionError("exec goes through k8s_stream")
+
+    class AppsV1Api:
+        def create_namespaced_deployment(self, namespace, body):
+            calls.deployments.append(body)
+
+    class Watch:
+        def stream(self, func, namespace, field_selector, timeout_seconds):
+            job_name = field_selector.split("=", 1)[1]
+            yield {"object": SimpleNamespace(status=SimpleNamespace(succeeded=None, failed=None))}
+            state = outcome(job_name)
+            if state is not None:
+                yield {"object": SimpleNamespace(status=SimpleNamespace(
+                    succeeded=1 if state == "succeeded" else None,
+                    failed=1 if state == "failed" else None,
+                ))}
+
+        def stop(self):
+            pass
+
+    class ConfigException(Exception):
+        pass
+
+    def load_incluster_config():
+        raise ConfigException()
+
+    fake_client = Models()
+    fake_client.BatchV1Api = BatchV1Api
+    fake_client.CoreV1Api = CoreV1Api
+    fake_client.AppsV1Api = AppsV1Api
+    monkeypatch.setattr(k8s_module, "client", fake_client)
+    monkeypatch.setattr(k8s_module, "watch", SimpleNamespace(Watch=Watch))
+    monkeypatch.setattr(k8s_module, "k8s_config", SimpleNamespace(
+        ConfigException=ConfigException,
+        load_incluster_config=load_incluster_config,
+        load_kube_config=lambda: None,
+    ))
+    monkeypatch.setattr(k8s_module, "K8S_AVAILABLE", True)
+
+    class ExecResponse:
+        """Runs the pod's runner locally, as the exec websocket would in the pod."""
+
+        def __init__(self, command):
+            self.command = command
+            self.stdin = ""
+            self.returncode = None
+
+        def write_stdin(self, data):
+            self.stdin += data
+
+        def run_forever(self, timeout):
+            import subprocess
+            import sys
+
+            runner = calls.config_maps[-1].data["runner.py"]
+            assert self.command == ["python", "/code/runner.py"]
+            completed = subprocess.run(
+                [sys.executable, "-c", runner], input=self.stdin, capture_output=True, text=True, timeout=timeout
+            )
+            self.returncode = completed.returncode
+            self._stdout, self._stderr = completed.stdout, completed.stderr
+
+        def read_stdout(self):
+            return self._stdout
+
+        def read_stderr(self):
+            return self._stderr
+
+        def close(self):
+            pass
+
+    def k8s_stream(func, pod_name, namespace, *, command, stdin, **kwargs):
+        assert stdin is True
+        calls.execs.append(pod_name)
+        return ExecResponse(command)
+
+    monkeypatch.setattr(k8s_module, "k8s_stream", k8s_stream)
+    return calls
+
+
+def test_kubernetes_reaper_is_opt_in_and_only_deletes_read_jobs(monkeypatch, tmp_path):
+    from metamorphic_guard.executors.kubernetes import KubernetesExecutor
+
+    calls = _stub_kubernetes(
+        monkeypatch,
+        outcome=lambda job: "succeeded" if job == calls.jobs[0].metadata.name else None,
+    )
+    target = tmp_path / "target.py"
+    target.write_text("def solve(x):\n    return x\n", encoding="utf-8")
+
+    assert KubernetesExecutor({})._reaper is None
+
+    executor = KubernetesExecutor({"reap_jobs": True, "reap_interval_s": 3600})
+    other = KubernetesExecutor({"reap_jobs": True, "reap_interval_s": 3600})
+    assert executor.execute(str(target), "solve", (1,))["success"] is True
+    assert executor.execute(str(target), "solve", (2,), timeout_s=0.01)["error"] == "Job timed out"
+    read_job, unread_job = (job.metadata for job in calls.jobs)
+    assert read_job.labels["metaguard-executor"] == executor._executor_id
+
+    other.close()
+    assert calls.deleted == []
+    executor.close()
+
+    assert len(calls.deleted) == 1
+    selector = calls.deleted[0]["label_selector"]
+    assert selector == f"metaguard-executor={executor._executor_id},metaguard-job in ({read_job.name})"
+    assert unread_job.name not in selector
+
+
+def test_kubernetes_default_job_runs_payload_on_stock_python(monkeypatch, tmp_path):
+    """The default Job command needs nothing in the image beyond a Python interpreter."""
+    import os
+    import subprocess
+    import sys
+
+    from metamorphic_guard.executors.kubernetes import KubernetesExecutor
+
+    def run_container(job):
+        container = job.spec.template.spec.containers[0]
+        assert container.image == "python:3.11-slim"
+        env = {var.name: var.value for var in container.env}
+        completed = subprocess.run(
+            [sys.executable, *container.command[1:]],
+            env={**os.environ, **env},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return completed.stdout
+
+    _stub_kubernetes(monkeypatch, logs=run_container)
+    target = tmp_path / "target.py"
+    target.write_text("def solve(xs, k):\n    print('sorting')\n    return sorted(xs)[:k]\n", encoding="utf-8")
+
+    result = KubernetesExecutor({}).execute(str(target), "solve", ([3, 1, 2], 2))
+
+    assert result["success"] is True
+    assert result["result"] == [1, 2]
+    assert result["stdout"] == "sorting\n"
+
+
+def test_kubernetes_warm_pool_sends_large_payload_over_stdin(monkeypatch, tmp_path):
+    from metamorphic_guard.executors.kubernetes import KubernetesExecutor
+
+    calls = _stub_kubernetes(monkeypatch)
+    target = tmp_path / "target.py"
+    target.write_text("def solve(xs):\n    print(len(xs))\n    return sum(xs)\n", encoding="utf-8")
+
+    executor = KubernetesExecutor({"pool_size": 2})
+    values = list(range(60_000))  # well past the 128 KiB argv element limit once encoded
+    result = executor.execute(str(target), "solve", (values,))
+
+    assert result["success"] is True, result
+    assert result["result"] == sum(values)
+    assert result["stdout"].strip() == "60000"
+    assert calls.deployments[0].spec.replicas == 2
+    assert calls.execs == ["metaguard-pool-pod"]
+    assert calls.jobs == []
+
+
+def test_kubernetes_job_status_comes_from_the_watch(monkeypatch, tmp_path):
+    from metamorphic_guard.executors.kubernetes import KubernetesExecutor
+
+    outcomes = iter(["failed", "succeeded"])
+    calls = _stub_kubernetes(
+        monkeypatch,
+        outcome=lambda job: next(outcomes),
+        logs=lambda job: 'partial\n{"result": [1, 2]}\n',
+    )
+    target = tmp_path / "target.py"
+    target.write_text("def solve(x):\n    return x\n", encoding="utf-8")
+    executor = KubernetesExecutor({"namespace": "eval"})
+
+    failed = executor.execute(str(target), "solve", (1,))
+    succeeded = executor.execute(str(target), "solve", (2,))
+
+    assert failed["success"] is False and failed["error"] == "Job failed"
+    assert succeeded["success"] is True
+    assert succeeded["result"] == [1, 2]
+    assert succeeded["stdout"] == "partial"
+    assert [job.metadata.labels["app"] for job in calls.jobs] == ["metaguard-worker"] * 2
+
+
+@pytest.fixture
+def fake_ray(monkeypatch):
+    """Reload the Ray executor against an in-process stand-in for the ``ray`` module."""
+    import importlib
+    import sys
+    import time
+    import types
+
+    import metamorphic_guard.executors.ray as ray_module
+
+    class ObjectRef:
+        def __init__(self, fn, args, options):
+            self.fn, self.args, self.options = fn, args, options
+            self.cancelled = False
+
+        @property
+        def ready(self):
+            return not (self.args and self.args[1] == "hang")
+
+    class RemoteFunction:
+        def __init__(self, fn):
+            self.fn = fn
+
+        def options(self, **options):
+            return SimpleNamespace(remote=lambda *args: ObjectRef(self.fn, args, options))
+
+    fake = types.ModuleType("ray")
+    fake.state = SimpleNamespace(initialized=False, init_calls=[], remote_calls=0, cancelled=[])
+
+    def remote(fn):
+        fake.state.remote_calls += 1
+        return RemoteFunction(fn)
+
+    def init(**kwargs):
+        fake.state.init_calls.append(kwargs)
+        fake.state.initialized = True
+
+    def get(ref, timeout=None):
+        if not ref.ready:
+            raise TimeoutError("GetTimeoutError")
+        if ref.args[1] == "boom":
+            raise RuntimeError("worker died")
+        return ref.fn(*ref.args)
+
+    def wait(refs, num_returns, timeout):
+        done = [ref for ref in refs if ref.ready][:num_returns]
+        if not done:
+            time.sleep(timeout)
+        return done, [ref for ref in refs if ref not in done]
+
+    def cancel(ref):
+        fake.state.cancelled.append(ref)
+
+    fake.remote = remote
+    fake.init = init
+    fake.is_initialized = lambda: fake.state.initialized
+    fake.get = get
+    fake.wait = wait
+    fake.cancel = cancel
+
+    original = sys.modules.get("ray")
+    sys.modules["ray"] = fake
+    try:
+        yield importlib.reload(ray_module), fake
+    finally:
+        if original is None:
+            sys.modules.pop("ray", None)
+        else:
+            sys.modules["ray"] = original
+        importlib.reload(ray_module)
+
+
+def test_ray_task_is_declared_once_and_init_is_guarded(fake_ray):
+    import threading
+
+    ray_module, fake = fake_ray
+    assert fake.state.remote_calls == 1
+
+    executors = []
+    threads = [
+        threading.Thread(target=lambda: executors.append(ray_module.RayExecutor({"num_cpus": 2})))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(executors) == 4
+    assert len(fake.state.init_calls) == 1
+    assert fake.state.init_calls[0]["address"] == "auto"
+
+    result = executors[0].execute("target.py", "solve", (1,), mem_mb=64)
+    assert result["success"] is True
+    # Per-call resources ride on .options(); the task itself is not re-declared
+    assert fake.state.remote_calls == 1
+
+
+def test_ray_execute_many_keeps_order_and_cancels_stragglers(fake_ray):
+    ray_module, fake = fake_ray
+    executor = ray_module.RayExecutor({})
+
+    requests = [("a.py", "solve", (1,)), ("b.py", "boom", (2,)), ("c.py", "hang", (3,)), ("d.py", "solve", (4,))]
+    results = executor.execute_many(requests, timeout_s=0.2, mem_mb=32)
+
+    assert [r["success"] for r in results] == [True, False, False, True]
+    assert results[0]["result"] == "Executed solve on Ray"
+    assert "worker died" in results[1]["error"]
+    assert "timed out" in results[2]["error"]
+    assert [ref.args[1] for ref in fake.state.cancelled] == ["hang"]
@@ -61,6 +61,40 @@ def test_bootstrap_ci_no_improvement():
     assert ci[0] <= 0 <= ci[1]
 
 
+def test_bootstrap_binary_indicators_match_index_resampling():
+    """The multinomial fast path has the same distribution as resampling paired cases."""
+    import numpy as np
+
+    from metamorphic_guard.harness.statistics import generate_bootstrap_deltas
+
+    baseline = [1, 0, 1, 1, 0, 1, 0, 1] * 25
+    candidate = [1, 1, 1, 0, 1, 1, 0, 1] * 25
+    deltas = np.array(
+        generate_bootstrap_deltas(baseline, candidate, rng=np.random.default_rng(7), samples=20000)
+    )
+
+    rng = np.random.default_rng(8)
+    idx = rng.integers(0, len(baseline), size=(20000, len(baseline)))
+    reference = np.array(candidate)[idx].mean(axis=1) - np.array(baseline)[idx].mean(axis=1)
+
+    assert deltas.mean() == pytest.approx(reference.mean(), abs=2e-3)
+    assert deltas.std() == pytest.approx(reference.std(), rel=0.03)
+    assert generate_bootstrap_deltas(baseline, baseline, rng=np.random.default_rng(0), samples=50) == [0.0] * 50
+
+
+def test_relation_cache_key_separates_distinct_args():
+    from metamorphic_guard.harness.execution import relation_cache_key
+
+    assert relation_cache_key(0, (1, "a")) == relation_cache_key(0, (1, "a"))
+    assert relation_cache_key(0, (1, "a")) != relation_cache_key(1, (1, "a"))
+    assert relation_cache_key(0, ([3, 1, 2], 2)) == relation_cache_key(0, ([3, 1, 2], 2))
+    assert relation_cache_key(0, ([3, 1, 2], 2)) != relation_cache_key(0, ([3, 1, 2], 1))
+    # Equal-but-distinguishable values must not share a rerun result
+    assert relation_cache_key(0, (1,)) != relation_cache_key(0, (True,))
+    assert relation_cache_key(0, (1,)) != relation_cache_key(0, (1.0,))
+    assert relation_cache_key(0, (0.0,)) != relation_cache_key(0, (-0.0,))
+
+
 def test_bootstrap_cluster_ci():
     """Cluster-aware bootstrap should handle grouped observations."""
     baseline = [1, 1, 0, 0] * 10
@@ -188,6 +222,129 @@ def test_evaluate_results_cluster_labels():
     assert metrics["cluster_labels"] == [0, 1, 0]
 
 
+def test_evaluate_results_packs_pass_indicators():
+    import numpy as np
+
+    spec = Spec(
+        gen_inputs=lambda n, seed: [(1, 2), (3, 4), (5, 6)],
+        properties=[Property(check=lambda out, x, y: out == x + y, description="Sum")],
+        relations=[],
+        equivalence=multiset_equal,
+    )
+    results = [
+        {"success": True, "result": 3},
+        {"success": False, "error": "boom"},
+        {"success": True, "result": 11},
+    ]
+
+    metrics = evaluate_results(
+        results, spec, spec.gen_inputs(3, 0), violation_cap=10, role="baseline", seed=0,
+        rerun=lambda args: {"success": True, "result": None},
+    )
+
+    assert isinstance(metrics["pass_indicators"], bytearray)
+    assert list(metrics["pass_indicators"]) == [1, 0, 1]
+    assert np.asarray(metrics["pass_indicators"], dtype=np.float64).mean() == pytest.approx(2 / 3)
+
+
+def test_evaluate_results_formats_each_case_once():
+    calls = []
+
+    def fmt_in(args):
+        calls.append(args)
+        return repr(args)
+
+    out_calls = []
+
+    def fmt_out(output):
+        out_calls.append(output)
+        return repr(output)
+
+    spec = Spec(
+        gen_inputs=lambda n, seed: [(1, 2), (3, 4)],
+        properties=[
+            Property(check=lambda out, x, y: out == x + y, description="Sum"),
+            Property(check=lambda out, x, y: out > x, description="Bigger"),
+        ],
+        relations=[],
+        equivalence=multiset_equal,
+        fmt_in=fmt_in,
+        fmt_out=fmt_out,
+    )
+    results = [{"success": True, "result": 0}, {"success": True, "result": 7}]
+
+    metrics = evaluate_results(
+        results, spec, [(1, 2), (3, 4)], violation_cap=10, role="candidate", seed=0,
+        rerun=lambda args: {"success": True, "result": None},
+    )
+    assert [v["input"] for v in metrics["prop_violations"]] == ["(1, 2)", "(1, 2)"]
+    assert calls == [(1, 2)]
+    assert out_calls == [0]
+
+    calls.clear()
+    metrics = evaluate_results(
+        results, spec, [(1, 2), (3, 4)], violation_cap=10, role="candidate", seed=0,
+        rerun=lambda args: {"success": True, "result": None},
+        formatted_inputs=["first", "second"],
+    )
+    assert [v["input"] for v in metrics["prop_violations"]] == ["first", "first"]
+    assert calls == []
+
+
+def test_evaluate_roles_share_formatting_and_shrink_each_case_once(monkeypatch):
+    from metamorphic_guard.harness import reporting
+
+    calls = []
+
+    def fmt_in(args):
+        calls.append(args)
+        return repr(args)
+
+    shrunk = []
+
+    def fake_shrink(args, still_fails):
+        shrunk.append(args)
+        return (0, 0)
+
+    monkeypatch.setattr(reporting, "shrink_input", fake_shrink)
+    spec = Spec(
+        gen_inputs=lambda n, seed: [],
+        properties=[
+            Property(check=lambda out, x, y: out == x + y, description="Sum"),
+            Property(check=lambda out, x, y: out > x, description="Bigger"),
+        ],
+        relations=[],
+        equivalence=multiset_equal,
+        fmt_in=fmt_in,
+    )
+    inputs = [(1, 2), (3, 4)]
+    results = [{"success": True, "result": 0}, {"success": True, "result": 7}]
+
+    baseline, candidate = reporting.evaluate_roles(
+        spec=spec,
+        test_inputs=inputs,
+        baseline_results=results,
+        candidate_results=results,
+        baseline_path="unused.py",
+        candidate_path="unused.py",
+        timeout_s=1.0,
+        mem_mb=64,
+        violation_cap=10,
+        seed=0,
+        executor=None,
+        executor_config=None,
+        shrink_violations=True,
+    )
+
+    # Case 0 violates both properties in both roles; its input is formatted once
+    # and shrunk once per role
+    assert calls.count((1, 2)) == 1
+    assert shrunk == [(1, 2), (1, 2)]
+    for metrics in (baseline, candidate):
+        assert [v["input"] for v in metrics["prop_violations"]] == ["(0, 0)", "(0, 0)"]
+        assert [v["original_input"] for v in metrics["prop_violations"]] == ["(1, 2)", "(1, 2)"]
+
+
 def test_metamorphic_relation_violations_detected():
     """Ensure metamorphic relations are re-run and violations recorded."""
     inputs = [([3, 1, 2], 2)]
@@ -225,10 +382,18 @@ def test_metamorphic_relation_violations_detected():
     )
 
     assert metrics["passes"] == 0
-    assert metrics["pass_indicators"] == [0]
+    assert list(metrics["pass_indicators"]) == [0]
     assert metrics["mr_violations"], "Expected metamorphic relation violation to be recorded"
 
 
+def test_relation_rng_stream_is_stable():
+    from metamorphic_guard.harness.execution import relation_rng
+
+    # Pinned so seeded relations replay identically across releases
+    assert relation_rng(42, 3, 1, "permute").random() == 0.6297256814088491
+    assert relation_rng(42, 3, 1, "permute").random() != relation_rng(42, 3, 2, "permute").random()
+
+
 def test_relation_rng_injection():
     """Metamorphic relations flagged as seeded receive deterministic RNGs."""
     calls: list[float] = []
@@ -674,3 +839,564 @@ def test_run_eval_uses_role_specific_executor_configs(monkeypatch, tmp_path):
     assert report["config"]["candidate_executor"] == "local"
     assert report["config"]["baseline_executor_config"]["label"] == "baseline_cfg"
     assert report["config"]["candidate_executor_config"]["label"] == "candidate_cfg"
+
+
+def test_serialize_for_report_rewrites_only_unserializable_leaves():
+    from metamorphic_guard.harness.evaluation import _serialize_for_report
+
+    class Opaque:
+        def __repr__(self) -> str:
+            return "<opaque>"
+
+    clean = {"values": list(range(1000)), "pair": (1, 2), 3: None}
+    assert _serialize_for_report(clean) is clean
+
+    mixed = {"values": list(range(1000)) + [Opaque()], "tags": {"a"}, ("x", 1): 2.5}
+    assert _serialize_for_report(mixed) == {
+        "values": list(range(1000)) + ["<opaque>"],
+        "tags": ["a"],
+        "('x', 1)": 2.5,
+    }
+
+
+def test_execute_implementations_runs_roles_concurrently():
+    import threading
+
+    from metamorphic_guard.dispatch import LocalDispatcher
+    from metamorphic_guard.harness.execution import ExecutionPlan, execute_implementations
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class RecordingDispatcher(LocalDispatcher):
+        def execute(self, *, test_inputs, run_case, role, monitors=None, call_spec=None, seed=None):
+            barrier.wait()  # both roles must be in flight at once
+            return [{"success": True, "role": role} for _ in test_inputs]
+
+    plan = ExecutionPlan(
+        spec=None,  # type: ignore[arg-type]
+        test_inputs=[(1,), (2,)],
+        dispatcher=RecordingDispatcher(2),
+        monitors=[],
+        worker_count=2,
+        run_id="run",
+    )
+    baseline, candidate = execute_implementations(
+        plan,
+        baseline_path="baseline.py",
+        candidate_path="candidate.py",
+        timeout_s=1.0,
+        mem_mb=64,
+        executor=None,
+        executor_config=None,
+        baseline_executor=None,
+        baseline_executor_config=None,
+        candidate_executor=None,
+        candidate_executor_config=None,
+    )
+
+    assert [r["role"] for r in baseline] == ["baseline", "baseline"]
+    assert [r["role"] for r in candidate] == ["candidate", "candidate"]
+
+
+def test_execute_implementations_runs_roles_sequentially_with_one_worker():
+    import threading
+    import time
+
+    from metamorphic_guard.dispatch import LocalDispatcher
+    from metamorphic_guard.harness.execution import ExecutionPlan, execute_implementations
+
+    active = []
+    overlap = []
+    lock = threading.Lock()
+
+    class RecordingDispatcher(LocalDispatcher):
+        def execute(self, *, test_inputs, run_case, role, monitors=None, call_spec=None, seed=None):
+            with lock:
+                active.append(role)
+                overlap.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(role)
+            return [{"success": True, "role": role} for _ in test_inputs]
+
+    plan = ExecutionPlan(
+        spec=None,  # type: ignore[arg-type]
+        test_inputs=[(1,), (2,)],
+        dispatcher=RecordingDispatcher(1),
+        monitors=[],
+        worker_count=1,
+        run_id="run",
+    )
+    execute_implementations(
+        plan,
+        baseline_path="baseline.py",
+        candidate_path="candidate.py",
+        timeout_s=1.0,
+        mem_mb=64,
+        executor=None,
+        executor_config=None,
+        baseline_executor=None,
+        baseline_executor_config=None,
+        candidate_executor=None,
+        candidate_executor_config=None,
+    )
+
+    # --parallel 1 must not turn into two sandboxes in flight
+    assert overlap == [1, 1]
+
+
+def test_execute_implementations_dedupes_inputs():
+    from metamorphic_guard.dispatch import LocalDispatcher
+    from metamorphic_guard.harness.execution import ExecutionPlan, execute_implementations
+
+    dispatched = []
+
+    class RecordingDispatcher(LocalDispatcher):
+        def execute(self, *, test_inputs, run_case, role, monitors=None, call_spec=None, seed=None):
+            dispatched.append((role, list(test_inputs)))
+            return [{"success": True, "result": args[0] * 10} for args in test_inputs]
+
+    plan = ExecutionPlan(
+        spec=None,  # type: ignore[arg-type]
+        test_inputs=[(1,), (2,), (1,), (True,), (2,)],
+        dispatcher=RecordingDispatcher(1),
+        monitors=[],
+        worker_count=1,
+        run_id="run",
+    )
+    baseline, candidate = execute_implementations(
+        plan,
+        baseline_path="baseline.py",
+        candidate_path="candidate.py",
+        timeout_s=1.0,
+        mem_mb=64,
+        executor=None,
+        executor_config=None,
+        baseline_executor=None,
+        baseline_executor_config=None,
+        candidate_executor=None,
+        candidate_executor_config=None,
+        dedupe_inputs=True,
+    )
+
+    # True == 1 but is a distinct input, so it is executed separately
+    assert sorted(dispatched) == [("baseline", [(1,), (2,), (True,)]), ("candidate", [(1,), (2,), (True,)])]
+    assert [r["result"] for r in baseline] == [10, 20, 10, 10, 20]
+    assert baseline[0] == baseline[2] and baseline[0] is not baseline[2]
+    assert len(candidate) == 5
+
+
+def test_execute_implementations_passes_batch_runner_to_local_dispatcher(monkeypatch):
+    from metamorphic_guard.dispatch import LocalDispatcher
+    from metamorphic_guard.harness.execution import ExecutionPlan, execute_implementations
+
+    batch_runners = []
+
+    class RecordingDispatcher(LocalDispatcher):
+        def execute(self, *, test_inputs, run_case, role, monitors=None, call_spec=None, seed=None, batch_runner=None):
+            batch_runners.append(batch_runner)
+            return [{"success": True} for _ in test_inputs]
+
+    def run(batch_env):
+        monkeypatch.setenv("METAMORPHIC_GUARD_SANDBOX_BATCH", batch_env)
+        batch_runners.clear()
+        plan = ExecutionPlan(
+            spec=None,  # type: ignore[arg-type]
+            test_inputs=[(1,), (2,)],
+            dispatcher=RecordingDispatcher(1),
+            monitors=[],
+            worker_count=1,
+            run_id="run",
+        )
+        execute_implementations(
+            plan,
+            baseline_path="baseline.py",
+            candidate_path="candidate.py",
+            timeout_s=1.0,
+            mem_mb=64,
+            executor=None,
+            executor_config=None,
+            baseline_executor=None,
+            baseline_executor_config=None,
+            candidate_executor=None,
+            candidate_executor_config=None,
+        )
+        return list(batch_runners)
+
+    assert [runner.size for runner in run("4")] == [4, 4]
+    assert run("1") == [None, None]
+
+
+def test_execute_implementations_dedupe_reports_original_case_indices(monkeypatch):
+    from metamorphic_guard.dispatch import LocalDispatcher
+    from metamorphic_guard.harness import execution
+    from metamorphic_guard.harness.execution import ExecutionPlan, execute_implementations
+    from metamorphic_guard.monitoring import Monitor, MonitorRecord
+
+    class _Recorder(Monitor):
+        def __init__(self):
+            super().__init__()
+            self.indices = []
+
+        def record(self, record):
+            self.indices.append((record.role, record.case_index))
+
+        def finalize(self):
+            return {}
+
+    monkeypatch.setattr(
+        execution,
+        "run_in_sandbox",
+        lambda file_path, func_name, call_args, *args, **kwargs: {"success": True, "result": call_args[0]},
+    )
+
+    class RecordingDispatcher(LocalDispatcher):
+        def execute(self, *, test_inputs, run_case, role, monitors=None, call_spec=None, seed=None):
+            results = []
+            for index, args in enumerate(test_inputs):
+                result = run_case(index, args)
+                results.append(result)
+                for monitor in monitors or []:
+                    monitor.record(MonitorRecord(index, role, 1.0, True, result))
+            return results
+
+    recorder = _Recorder()
+    plan = ExecutionPlan(
+        spec=None,  # type: ignore[arg-type]
+        test_inputs=[(1,), (1,), (2,), (1,), (3,)],
+        dispatcher=RecordingDispatcher(1),
+        monitors=[recorder],
+        worker_count=1,
+        run_id="run",
+    )
+    baseline, _ = execute_implementations(
+        plan,
+        baseline_path="baseline.py",
+        candidate_path="candidate.py",
+        timeout_s=1.0,
+        mem_mb=64,
+        executor=None,
+        executor_config=None,
+        baseline_executor=None,
+        baseline_executor_config=None,
+        candidate_executor=None,
+        candidate_executor_config=None,
+        dedupe_inputs=True,
+    )
+
+    assert [r["result"] for r in baseline] == [1, 1, 2, 1, 3]
+    # Distinct inputs first occur at cases 0, 2 and 4
+    assert recorder.indices == [
+        ("baseline", 0), ("baseline", 2), ("baseline", 4),
+        ("candidate", 0), ("candidate", 2), ("candidate", 4),
+    ]
+
+    def runner(index, call_args):
+        return {"index": index}
+
+    wrapped = execution._with_original_indices(runner, [0, 2, 4])
+    assert wrapped(1, (1,)) == {"index": 2}
+
+
+def test_run_eval_can_omit_case_trace():
+    from metamorphic_guard.harness import iter_cases
+    from metamorphic_guard.specs import get_task
+
+    repo_root = Path(__file__).resolve().parents[1]
+    kwargs = dict(
+        task_name="top_k",
+        baseline_path=str(repo_root / "examples" / "top_k_baseline.py"),
+        candidate_path=str(repo_root / "examples" / "top_k_improved.py"),
+        n=6,
+        seed=3,
+        bootstrap_samples=100,
+    )
+
+    full = run_eval(**kwargs)
+    trimmed = run_eval(include_cases=False, **kwargs)
+
+    assert "cases" not in trimmed
+    assert trimmed["baseline"]["passes"] == full["baseline"]["passes"]
+    spec = get_task("top_k")
+    rebuilt = list(iter_cases(spec, spec.gen_inputs(6, 3)))
+    assert [case["formatted"] for case in rebuilt] == [case["formatted"] for case in full["cases"]]
+
+
+def test_aggregate_trust_scores_ands_flags():
+    from metamorphic_guard.harness.trust import _aggregate_trust_scores
+
+    assert _aggregate_trust_scores([]) is None
+    aggregated = _aggregate_trust_scores(
+        [
+            {"score": 0.9, "flags": {"citation_correct": True, "answerable": True}},
+            {"score": 0.5, "flags": {"citation_correct": False}},
+            {"score": 0.7, "flags": {"novel_content": True}},
+        ]
+    )
+    assert aggregated["count"] == 3
+    assert aggregated["score"] == pytest.approx(0.7)
+    assert aggregated["flags"] == {"citation_correct": False, "answerable": True, "novel_content": True}
+
+
+def test_evaluate_results_bulk_reruns_match_sequential():
+    def sort_out(L):
+        return sorted(L)
+
+    spec = Spec(
+        gen_inputs=lambda n, seed: [],
+        properties=[Property(check=lambda out, L: out == sorted(L), description="sorted")],
+        relations=[
+            MetamorphicRelation(name="reverse", transform=lambda L: (list(reversed(L)),)),
+            MetamorphicRelation(name="append", transform=lambda L: (L + [99],), expect="not_equal"),
+            MetamorphicRelation(name="first", transform=lambda L: (L if L else L[0],)),
+        ],
+        equivalence=lambda a, b: a == b,
+    )
+    inputs = [([3, 1],), ([2],), ([5, 4, 6],), ([],)]
+    run_results = [{"success": True, "result": sort_out(*args)} for args in inputs]
+
+    def rerun(args):
+        (L,) = args
+        # Reversed inputs of length 3 fail, so "append" is never reached for case 2
+        return {"success": True, "result": L if len(L) == 3 else sort_out(L)}
+
+    waves = []
+
+    def rerun_many(batch):
+        waves.append(list(batch))
+        return [rerun(args) for args in batch]
+
+    sequential = evaluate_results(run_results, spec, inputs, 10, role="candidate", seed=1, rerun=rerun)
+    bulk = evaluate_results(
+        run_results, spec, inputs, 10, role="candidate", seed=1, rerun=rerun, rerun_many=rerun_many
+    )
+
+    # One wave per relation depth, holding only the reruns the sequential path reaches
+    assert len(waves) == 3
+    assert all(([5, 4, 6, 99],) not in wave for wave in waves)
+    for key in ("passes", "mr_violations", "prop_violations", "relation_stats"):
+        assert bulk[key] == sequential[key]
+    assert list(bulk["pass_indicators"]) == list(sequential["pass_indicators"])
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_evaluate_results_skips_transforms_after_first_relation_failure(bulk):
+    later_transforms = []
+
+    def later(x):
+        later_transforms.append(x)
+        return (x,)
+
+    spec = Spec(
+        gen_inputs=lambda n, seed: [],
+        properties=[],
+        relations=[
+            MetamorphicRelation(name="negate", transform=lambda x: (-x,)),
+            MetamorphicRelation(name="later", transform=later),
+        ],
+        equivalence=lambda a, b: a == b,
+    )
+    inputs = [(0,), (1,), (2,)]
+    run_results = [{"success": True, "result": 0} for _ in inputs]
+    reruns = []
+
+    def rerun(args):
+        reruns.append(args)
+        return {"success": True, "result": args[0]}
+
+    metrics = evaluate_results(
+        run_results,
+        spec,
+        inputs,
+        10,
+        role="candidate",
+        seed=0,
+        rerun=rerun,
+        rerun_many=(lambda batch: [rerun(args) for args in batch]) if bulk else None,
+    )
+
+    # Only case 0 survives "negate"; cases 1 and 2 never reach "later"
+    assert later_transforms == [0]
+    assert sorted(reruns) == [(-2,), (-1,), (0,), (0,)]
+    assert metrics["passes"] == 1
+    assert metrics["relation_stats"]["later"]["total"] == 1
+
+
+def test_evaluate_results_stops_checking_properties_once_cap_is_full():
+    later_checks = []
+
+    def later(out, x):
+        later_checks.append(x)
+        return True
+
+    spec = Spec(
+        gen_inputs=lambda n, seed: [],
+        properties=[
+            Property(check=lambda out, x: x % 2 == 0, description="even"),
+            Property(check=later, description="later"),
+        ],
+        relations=[],
+        equivalence=lambda a, b: a == b,
+    )
+    inputs = [(i,) for i in range(6)]
+    run_results = [{"success": True, "result": i} for i in range(6)]
+
+    metrics = evaluate_results(
+        run_results, spec, inputs, violation_cap=2, role="candidate", seed=0, rerun=lambda args: {}
+    )
+
+    assert metrics["passes"] == 3
+    assert [v["test_case"] for v in metrics["prop_violations"]] == [1, 3]
+    # Case 3's failure fills the cap, so cases 3 and 5 skip "later"
+    assert later_checks == [0, 1, 2, 4]
+
+
+def test_evaluate_results_execution_failures_share_cap_in_case_order():
+    spec = Spec(
+        gen_inputs=lambda n, seed: [],
+        properties=[
+            Property(check=lambda out, x: x % 3 != 0, description="not multiple of 3"),
+            Property(check=lambda out, x: x % 2 == 1, description="odd"),
+        ],
+        relations=[],
+        equivalence=lambda a, b: a == b,
+    )
+    inputs = [(i,) for i in range(1, 9)]
+    # Cases 1 and 4 (inputs 2 and 5) fail to execute
+    run_results = [
+        {"success": False, "error": "boom"} if x in (2, 5) else {"success": True, "result": x}
+        for (x,) in inputs
+    ]
+
+    metrics = evaluate_results(
+        run_results, spec, inputs, violation_cap=4, role="candidate", seed=0, rerun=lambda args: {}
+    )
+
+    assert metrics["passes"] == 2
+    assert [(v["test_case"], v["property"]) for v in metrics["prop_violations"]] == [
+        (1, "execution"),
+        (2, "not multiple of 3"),
+        (3, "odd"),
+        (4, "execution"),
+    ]
+    assert metrics["prop_violations"][0]["error"] == "boom"
+    assert metrics["cluster_labels"] == list(range(8))
+
+
+def test_merge_results_matches_whole_suite_evaluation():
+    from metamorphic_guard.harness.reporting import merge_results
+
+    spec = Spec(
+        gen_inputs=lambda n, seed: [],
+        properties=[Property(check=lambda out, x: x % 3 != 0, description="not multiple of 3")],
+        relations=[
+            MetamorphicRelation(
+                name="jitter", transform=lambda x, rng: (x + rng.randint(0, 1),), accepts_rng=True
+            )
+        ],
+        equivalence=lambda a, b: a == b,
+    )
+    inputs = [(i,) for i in range(10)]
+    run_results = [{"success": True, "result": 0} for _ in inputs]
+
+    def rerun(args):
+        return {"success": True, "result": 0 if args[0] % 2 else 1}
+
+    kwargs = dict(role="candidate", seed=7, rerun=rerun)
+    whole = evaluate_results(run_results, spec, inputs, 3, **kwargs)
+    merged = None
+    for start, stop in ((0, 4), (4, 7), (7, 10)):
+        chunk = evaluate_results(
+            run_results[start:stop], spec, inputs[start:stop], 3, index_offset=start, **kwargs
+        )
+        merged = merge_results(merged, chunk, 3)
+
+    for key in ("passes", "total", "pass_rate", "prop_violations", "mr_violations", "cluster_labels", "relation_stats"):
+        assert merged[key] == whole[key]
+    assert merged["pass_indicators"] == whole["pass_indicators"]
+
+
+def test_evaluate_roles_issues_relation_reruns_as_one_wave(monkeypatch):
+    from metamorphic_guard.harness import reporting
+
+    calls = []
+
+    def fake_run_in_sandbox(path, func_name, args, *rest, **kwargs):
+        calls.append((path, args))
+        return {"success": True, "result": sorted(args[0])}
+
+    monkeypatch.setattr(reporting, "run_in_sandbox", fake_run_in_sandbox)
+    executed = []
+    original_execute = reporting.LocalDispatcher.execute
+
+    def recording_execute(self, **kwargs):
+        executed.append((self.workers, len(kwargs["test_inputs"])))
+        return original_execute(self, **kwargs)
+
+    monkeypatch.setattr(reporting.LocalDispatcher, "execute", recording_execute)
+    spec = Spec(
+        gen_inputs=lambda n, seed: [],
+        properties=[],
+        relations=[MetamorphicRelation(name="reverse", transform=lambda L: (list(reversed(L)),))],
+        equivalence=lambda a, b: a == b,
+    )
+    inputs = [([i, 0],) for i in range(1, 5)]
+    results = [{"success": True, "result": [0, i]} for i in range(1, 5)]
+
+    baseline, candidate = reporting.evaluate_roles(
+        spec=spec,
+        test_inputs=inputs,
+        baseline_results=results,
+        candidate_results=results,
+        baseline_path="b.py",
+        candidate_path="c.py",
+        timeout_s=1.0,
+        mem_mb=64,
+        violation_cap=5,
+        seed=0,
+        executor=None,
+        executor_config=None,
+        shrink_violations=False,
+        workers=3,
+    )
+
+    assert executed == [(3, 4), (3, 4)]
+    assert baseline["passes"] == candidate["passes"] == 4
+    assert sorted(path for path, _ in calls) == ["b.py"] * 4 + ["c.py"] * 4
+
+
+def test_bootstrap_metric_delta_resamples_paired_deltas():
+    import numpy as np
+
+    from metamorphic_guard.harness.reporting import bootstrap_metric_delta
+
+    deltas = [0.5, -1.0, 2.0, 0.25, 1.5, -0.5]
+    ci = bootstrap_metric_delta(deltas, kind="sum", samples=400, alpha=0.1, seed=11)
+
+    rng = np.random.default_rng(11)
+    means = np.asarray(deltas)[rng.integers(0, len(deltas), size=(400, len(deltas)))].mean(axis=1)
+    assert ci["mean"]["lower"] == pytest.approx(np.quantile(means, 0.05))
+    assert ci["mean"]["upper"] == pytest.approx(np.quantile(means, 0.95))
+    assert ci["sum"]["estimate"] == pytest.approx(sum(deltas))
+    assert ci == bootstrap_metric_delta(deltas, kind="sum", samples=400, alpha=0.1, seed=11)
+
+    constant = bootstrap_metric_delta([0.3] * 5, kind="mean", samples=50, alpha=0.05, seed=None)
+    assert constant["mean"]["lower"] == pytest.approx(0.3) and constant["mean"]["upper"] == pytest.approx(0.3)
+
+
+def test_bootstrap_metric_delta_bca_corrects_skewed_deltas():
+    import numpy as np
+
+    from metamorphic_guard.harness.reporting import bootstrap_metric_delta
+
+    # Right-skewed deltas: the BCa interval shifts right of the percentile one
+    deltas = np.random.default_rng(5).exponential(1.0, size=60).tolist()
+    percentile_ci = bootstrap_metric_delta(deltas, kind="mean", samples=300, alpha=0.1, seed=2)
+    bca_ci = bootstrap_metric_delta(deltas, kind="mean", samples=300, alpha=0.1, seed=2, method="bootstrap_bca")
+    reference = bootstrap_metric_delta(deltas, kind="mean", samples=20000, alpha=0.1, seed=3, method="bootstrap_bca")
+
+    assert bca_ci["method"] == "bootstrap_bca"
+    assert bca_ci["mean"]["lower"] < bca_ci["mean"]["estimate"] < bca_ci["mean"]["upper"]
+    assert bca_ci["mean"]["upper"] > percentile_ci["mean"]["upper"]
+    assert bca_ci["mean"]["lower"] == pytest.approx(reference["mean"]["lower"], abs=0.05)
+    assert bca_ci["mean"]["upper"] == pytest.approx(reference["mean"]["upper"], abs=0.05)
@@ -729,3 +729,727 @@ def test_executor_timeout_handling(openai_executor, monkeypatch):
     result = openai_executor.execute("", "gpt-3.5-turbo", ("Hello",), timeout_s=1.0)
     assert result["success"] is True
 
+
+def test_anthropic_call_llm_marks_cache_breakpoints_and_prices_cache(anthropic_executor):
+    """System prompt and history prefix carry cache_control; cached tokens are billed separately."""
+    captured = {}
+
+    def create(**kwargs):
+        captured.update(kwargs)
+        return DummyAnthropicResponse(
+            "ok",
+            usage={
+                "input_tokens": 1_000_000,
+                "output_tokens": 0,
+                "cache_creation_input_tokens": 1_000_000,
+                "cache_read_input_tokens": 1_000_000,
+            },
+        )
+
+    anthropic_executor.client.messages = SimpleNamespace(create=create)
+    history = [{"role": "user", "content": "earlier"}, {"role": "assistant", "content": "reply"}]
+
+    result = anthropic_executor._call_llm(
+        "Hello",
+        system_prompt="Be terse.",
+        conversation_history=history,
+        model="claude-3-haiku-20240307",
+    )
+
+    assert captured["system"][0]["cache_control"] == {"type": "ephemeral"}
+    assert captured["messages"][1]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert history[1]["content"] == "reply"  # caller's history is not mutated
+    assert result["tokens_prompt"] == 3_000_000
+    assert result["tokens_cache_read"] == 1_000_000
+    # haiku: 0.25 base + 0.3125 cache write + 0.025 cache read
+    assert result["cost_usd"] == pytest.approx(0.25 + 0.3125 + 0.025, rel=1e-6)
+
+
+def test_anthropic_response_cache_reuses_deterministic_calls(monkeypatch):
+    """Identical temperature-0 requests hit the response cache when enabled."""
+    _stub_anthropic(monkeypatch)
+    executor = AnthropicExecutor({"api_key": "test-key", "cache_enabled": True, "temperature": 0.0})
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        return DummyAnthropicResponse("cached", usage={"input_tokens": 10, "output_tokens": 2})
+
+    executor.client.messages = SimpleNamespace(create=create)
+
+    first = executor._call_llm("Hello", model="claude-3-haiku-20240307")
+    second = executor._call_llm("Hello", model="claude-3-haiku-20240307")
+    executor._call_llm("Different", model="claude-3-haiku-20240307")
+
+    assert len(calls) == 2
+    assert second["content"] == first["content"] == "cached"
+    assert second["cache_hit"] is True
+    assert second["cost_usd"] == 0.0
+    assert executor.cache_stats() == {"hits": 1, "misses": 2, "size": 2}
+
+
+def test_anthropic_batch_execute_maps_results_in_order(anthropic_executor, monkeypatch):
+    """Message Batches results are mapped back to request order with discounted cost."""
+    monkeypatch.setattr("metamorphic_guard.executors.anthropic.time.sleep", lambda *_: None)
+    submitted = {}
+    statuses = iter(["in_progress", "ended"])
+
+    def create(requests):
+        submitted["requests"] = requests
+        return SimpleNamespace(id="batch-1")
+
+    def results(batch_id):
+        return [
+            SimpleNamespace(
+                custom_id="req-2",
+                result=SimpleNamespace(
+                    type="succeeded",
+                    message=DummyAnthropicResponse(
+                        "second", usage={"input_tokens": 1_000_000, "output_tokens": 0}
+                    ),
+                ),
+            ),
+            SimpleNamespace(
+                custom_id="req-0",
+                result=SimpleNamespace(type="errored", error="overloaded"),
+            ),
+        ]
+
+    anthropic_executor.client.messages = SimpleNamespace(
+        batches=SimpleNamespace(
+            create=create,
+            retrieve=lambda batch_id: SimpleNamespace(processing_status=next(statuses)),
+            results=results,
+            cancel=lambda batch_id: None,
+        )
+    )
+
+    outcome = anthropic_executor.batch_execute(
+        [
+            ("", "claude-3-haiku-20240307", ("first",)),
+            ("", "claude-3-haiku-20240307", ("",)),
+            ("", "claude-3-haiku-20240307", ("second",)),
+        ]
+    )
+
+    assert [entry["custom_id"] for entry in submitted["requests"]] == ["req-0", "req-2"]
+    assert outcome[0]["error_code"] == "batch_errored"
+    assert outcome[1]["error_code"] == "invalid_input"
+    assert outcome[2]["success"] is True
+    assert outcome[2]["result"] == "second"
+    assert outcome[2]["cost_usd"] == pytest.approx(0.125, rel=1e-6)
+    assert outcome[2]["retries"] == 0
+
+
+def test_anthropic_streaming_forwards_chunks(monkeypatch):
+    """With stream enabled, chunks reach the callback and usage comes from the final message."""
+    _stub_anthropic(monkeypatch)
+    seen = []
+    executor = AnthropicExecutor({"api_key": "test-key", "stream": True, "stream_callback": seen.append})
+
+    class DummyStream:
+        text_stream = iter(["Hel", "lo"])
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def get_final_message(self):
+            return DummyAnthropicResponse("Hello", usage={"input_tokens": 3, "output_tokens": 2})
+
+    executor.client.messages = SimpleNamespace(stream=lambda **kwargs: DummyStream())
+
+    result = executor._call_llm("Hi", model="claude-3-haiku-20240307")
+
+    assert seen == ["Hel", "lo"]
+    assert result["content"] == "Hello"
+    assert result["tokens_total"] == 5
+
+
+def test_anthropic_aexecute_many_runs_concurrently_in_order(anthropic_executor):
+    """aexecute_many returns results in request order and honours max_concurrency."""
+    import asyncio
+
+    in_flight = {"now": 0, "peak": 0}
+
+    async def create(**kwargs):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        prompt = kwargs["messages"][-1]["content"]
+        return DummyAnthropicResponse(prompt.upper(), usage={"input_tokens": 1, "output_tokens": 1})
+
+    anthropic_executor.config["max_concurrency"] = 2
+    anthropic_executor._async_client = SimpleNamespace(messages=SimpleNamespace(create=create))
+
+    requests = [("", "claude-3-haiku-20240307", (f"p{i}",)) for i in range(5)]
+    results = asyncio.run(anthropic_executor.aexecute_many(requests))
+
+    assert [r["result"] for r in results] == [f"P{i}" for i in range(5)]
+    assert in_flight["peak"] == 2
+
+
+def test_anthropic_executor_rejects_oversized_prompt(monkeypatch):
+    """Prompts estimated above max_input_tokens fail validation without calling the API."""
+    _stub_anthropic(monkeypatch)
+    executor = AnthropicExecutor({"api_key": "test-key", "max_input_tokens": 100, "chars_per_token": 4})
+
+    def fail_call_llm(*args, **kwargs):
+        raise AssertionError("API should not be called")
+
+    monkeypatch.setattr(executor, "_call_llm", fail_call_llm)
+
+    result = executor.execute("", "claude-3-haiku-20240307", ("x" * 1000,))
+
+    assert result["success"] is False
+    assert result["error_code"] == "input_too_long"
+
+
+def test_anthropic_semantic_cache_serves_paraphrases(monkeypatch):
+    """Prompts whose embeddings clear the cosine threshold reuse the stored response."""
+    _stub_anthropic(monkeypatch)
+    vectors = {"What is 2+2?": [1.0, 0.0], "what's 2 + 2?": [0.99, 0.05], "Name a colour": [0.0, 1.0]}
+    executor = AnthropicExecutor(
+        {
+            "api_key": "test-key",
+            "temperature": 0.0,
+            "semantic_cache": {"enabled": True, "embedder": lambda text: vectors[text.split("||")[0]]},
+        }
+    )
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        return DummyAnthropicResponse("4", usage={"input_tokens": 10, "output_tokens": 1})
+
+    executor.client.messages = SimpleNamespace(create=create)
+
+    executor._call_llm("What is 2+2?", model="claude-3-haiku-20240307")
+    paraphrase = executor._call_llm("what's 2 + 2?", model="claude-3-haiku-20240307")
+    executor._call_llm("Name a colour", model="claude-3-haiku-20240307")
+    executor._call_llm("what's 2 + 2?", model="claude-3-opus-20240229")
+
+    assert len(calls) == 3
+    assert paraphrase["cache_hit"] is True
+    assert paraphrase["cost_usd"] == 0.0
+    assert executor.cache_stats()["semantic_hits"] == 1
+
+
+def test_anthropic_raw_response_parses_json_body(monkeypatch):
+    """When the client exposes with_raw_response, the JSON body is parsed without SDK models."""
+    import json
+
+    class RawClient:
+        def __init__(self, api_key: str) -> None:
+            body = {
+                "content": [
+                    {"type": "text", "text": "Hello"},
+                    {"type": "tool_use", "id": "t1", "name": "noop", "input": {}},
+                    {"type": "text", "text": " world"},
+                ],
+                "usage": {"input_tokens": 1_000_000, "output_tokens": 1_000_000},
+                "stop_reason": "max_tokens",
+            }
+            raw = SimpleNamespace(content=json.dumps(body).encode("utf-8"))
+            self.with_raw_response = SimpleNamespace(
+                messages=SimpleNamespace(create=lambda **kwargs: raw)
+            )
+
+    monkeypatch.setattr(
+        "metamorphic_guard.executors.anthropic.anthropic", SimpleNamespace(Anthropic=RawClient)
+    )
+    executor = AnthropicExecutor({"api_key": "test-key"})
+
+    result = executor._call_llm("Hi", model="claude-3-haiku-20240307")
+
+    assert result["content"] == "Hello world"
+    assert result["tokens_total"] == 2_000_000
+    assert result["finish_reason"] == "max_tokens"
+    assert result["cost_usd"] == pytest.approx(0.25 + 1.25)
+
+
+def test_anthropic_history_filter_tracks_history_edits(anthropic_executor):
+    """The filtered history reflects appended turns and in-place edits of the same list."""
+    history = [
+        {"role": "system", "content": "Be terse."},
+        {"role": "user", "content": "earlier"},
+        "not-a-message",
+        {"role": "assistant", "content": "reply"},
+    ]
+
+    first = anthropic_executor._canonical_history(history)
+    assert first == (tuple(history[i] for i in (1, 3)), "Be terse.")
+
+    history[3] = {"role": "assistant", "content": "edited"}
+    assert anthropic_executor._canonical_history(history)[0][1]["content"] == "edited"
+
+    history.append({"role": "user", "content": "next"})
+    messages, system = anthropic_executor._canonical_history(history)
+    assert len(messages) == 3
+    assert system == "Be terse."
+
+    request = anthropic_executor._build_request("Hello", conversation_history=history)
+    assert [m["role"] for m in request["messages"]] == ["user", "assistant", "user", "user"]
+    assert request["system"][0]["text"] == "Be terse."
+
+
+def test_anthropic_error_payloads_do_not_share_template_state(anthropic_executor):
+    """Failure payloads are copies of the class template, never the template itself."""
+    first = anthropic_executor._validation_error("bad input", "invalid_input")
+    first["stderr"] = "mutated"
+    second = anthropic_executor._error_payload("boom", "RuntimeError", "llm_api_error", duration_ms=5.0, attempts=2)
+
+    assert AnthropicExecutor._ERROR_TEMPLATE["stderr"] == ""
+    assert "retries" not in AnthropicExecutor._ERROR_TEMPLATE
+    assert second == {
+        "success": False,
+        "duration_ms": 5.0,
+        "stdout": "",
+        "stderr": "boom",
+        "error": "boom",
+        "error_type": "RuntimeError",
+        "error_code": "llm_api_error",
+        "retries": 2,
+        "retry_limit": anthropic_executor.max_retries,
+    }
+
+
+def test_anthropic_system_prompt_file_is_cached_by_mtime(anthropic_executor, tmp_path, monkeypatch):
+    """Prompt files are read once and re-read only after they change on disk."""
+    import os
+    from pathlib import Path
+
+    prompt_file = tmp_path / "system.txt"
+    prompt_file.write_text("v1", encoding="utf-8")
+    reads = []
+    original_read_text = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+
+    assert anthropic_executor._read_system_prompt(str(prompt_file)) == "v1"
+    assert anthropic_executor._read_system_prompt(str(prompt_file)) == "v1"
+    assert len(reads) == 1
+
+    prompt_file.write_text("v2", encoding="utf-8")
+    stat = prompt_file.stat()
+    os.utime(prompt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert anthropic_executor._read_system_prompt(str(prompt_file)) == "v2"
+    assert anthropic_executor._read_system_prompt("Be terse.") == "Be terse."
+
+
+def test_openai_aexecute_many_runs_concurrently_in_order(openai_executor):
+    """OpenAI aexecute_many returns results in request order and honours max_concurrency."""
+    import asyncio
+
+    in_flight = {"now": 0, "peak": 0}
+
+    async def create(**kwargs):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        prompt = kwargs["messages"][-1]["content"]
+        return DummyOpenAIResponse(prompt.upper(), usage={"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2})
+
+    openai_executor.config["max_concurrency"] = 3
+    openai_executor._async_client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+
+    requests = [("", "gpt-3.5-turbo", (f"p{i}",)) for i in range(7)]
+    results = asyncio.run(openai_executor.aexecute_many(requests))
+
+    assert [r["result"] for r in results] == [f"P{i}" for i in range(7)]
+    assert all(r["tokens_total"] == 2 for r in results)
+    assert in_flight["peak"] == 3
+
+
+def test_openai_execute_many_packs_legacy_completion_prompts(openai_executor):
+    """Legacy completion models get several prompts per request, demultiplexed by choice index."""
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        # Choices may come back in any order
+        choices = [
+            SimpleNamespace(index=i, text=f"<{prompt}>", finish_reason="stop")
+            for i, prompt in reversed(list(enumerate(kwargs["prompt"])))
+        ]
+        return SimpleNamespace(
+            choices=choices, usage=SimpleNamespace(prompt_tokens=40, completion_tokens=20)
+        )
+
+    openai_executor.client.completions = SimpleNamespace(create=create)
+    openai_executor.config["batch_size"] = 2
+
+    results = openai_executor.execute_many("", "gpt-3.5-turbo-instruct", ["aa", "bb", "", "cc"])
+
+    assert [len(call["prompt"]) for call in calls] == [2, 1]
+    assert [r.get("result") for r in results] == ["<aa>", "<bb>", None, "<cc>"]
+    assert results[2]["error_code"] == "invalid_input"
+    assert results[0]["tokens_prompt"] == 20
+    assert results[3]["tokens_total"] == 60
+
+
+def test_openai_execute_many_legacy_batches_go_through_circuit_breaker(monkeypatch):
+    """A failing completions batch trips the breaker; later batches are rejected without a call."""
+    _stub_openai(monkeypatch)
+    executor = OpenAIExecutor(
+        {"api_key": "test-key", "max_retries": 0, "batch_size": 1, "circuit_breaker": {"failure_threshold": 2}}
+    )
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        raise DummyAPIError("bad gateway", 502)
+
+    executor.client.completions = SimpleNamespace(create=create)
+
+    results = executor.execute_many("", "gpt-3.5-turbo-instruct", ["a", "b", "c", "d"])
+
+    assert len(calls) == 2
+    assert [r["error_code"] for r in results[:2]] == ["llm_api_error"] * 2
+    assert [r["error_code"] for r in results[2:]] == ["circuit_breaker_open"] * 2
+    assert executor.circuit_breaker.get_stats()["state"] == "open"
+
+
+def test_openai_execute_many_chat_models_use_async_path(openai_executor):
+    """Chat models are fanned out through aexecute_many and keep prompt order."""
+    async def create(**kwargs):
+        return DummyOpenAIResponse(kwargs["messages"][-1]["content"][::-1])
+
+    openai_executor._async_client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+
+    results = openai_executor.execute_many("", "gpt-4", ["abc", "xyz"])
+
+    assert [r["result"] for r in results] == ["cba", "zyx"]
+    assert openai_executor._async_client is None
+
+
+def test_openai_semantic_cache_hits_and_persists(monkeypatch, tmp_path):
+    """Near-duplicate prompts are served from the semantic cache, which reloads from cache_dir."""
+    _stub_openai(monkeypatch)
+    vectors = {"sort [3, 1, 2]": [1.0, 0.0, 0.0], "sort [3,1,2]": [0.98, 0.1, 0.0], "reverse it": [0.0, 0.0, 1.0]}
+    config = {
+        "api_key": "test-key",
+        "semantic_cache": {"enabled": True, "embedder": vectors.__getitem__, "cache_dir": str(tmp_path)},
+    }
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        return DummyOpenAIResponse("[1, 2, 3]", usage={"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8})
+
+    executor = OpenAIExecutor(config)
+    executor.client.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+
+    executor._call_llm("sort [3, 1, 2]", system_prompt="You sort lists.")
+    hit = executor._call_llm("sort [3,1,2]", system_prompt="You sort lists.")
+    executor._call_llm("sort [3,1,2]", system_prompt="You reverse lists.")
+    executor._call_llm("reverse it", system_prompt="You sort lists.")
+
+    assert len(calls) == 3
+    assert hit["cache_hit"] is True and hit["cost_usd"] == 0.0
+    assert hit["content"] == "[1, 2, 3]"
+
+    reloaded = OpenAIExecutor(config)
+    reloaded.client.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+    assert reloaded._call_llm("sort [3,1,2]", system_prompt="You sort lists.")["cache_hit"] is True
+    assert len(calls) == 3
+
+
+def test_openai_exact_cache_skips_repeat_deterministic_calls(monkeypatch, tmp_path):
+    """Identical deterministic requests are answered from the on-disk exact cache."""
+    _stub_openai(monkeypatch)
+    config = {"api_key": "test-key", "exact_cache": True, "cache_dir": str(tmp_path)}
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        return DummyOpenAIResponse("ok", usage={"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6})
+
+    executor = OpenAIExecutor(config)
+    executor.client.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+
+    first = executor.execute("", "gpt-4", ("Hello",))
+    second = executor.execute("", "gpt-4", ("Hello",))
+    executor.execute("", "gpt-4", ("Hello", "Different system prompt"))
+    executor.temperature = 0.7
+    executor.execute("", "gpt-4", ("Hello",))  # sampled without a seed: never cached
+    executor.execute("", "gpt-4", ("Hello",))
+    executor.close()
+
+    assert first["cache_hit"] is False
+    assert second["cache_hit"] is True and second["cost_usd"] == 0.0
+    assert len(calls) == 4
+
+    reloaded = OpenAIExecutor(config)
+    reloaded.client.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+    assert reloaded.execute("", "gpt-4", ("Hello",))["cache_hit"] is True
+    assert len(calls) == 4
+
+
+def test_openai_system_prompt_file_is_read_once_per_mtime(openai_executor, tmp_path, monkeypatch):
+    """The prompt file is decoded once and re-read after it is modified."""
+    import os
+    from pathlib import Path
+
+    from metamorphic_guard.executors import openai as openai_module
+
+    openai_module._load_prompt_file.cache_clear()
+    prompt_file = tmp_path / "system.txt"
+    prompt_file.write_text("v1", encoding="utf-8")
+    reads = []
+    original_read_text = Path.read_text
+    monkeypatch.setattr(Path, "read_text", lambda self, *a, **k: reads.append(self) or original_read_text(self, *a, **k))
+
+    first, _ = openai_executor._prepare_call(str(prompt_file), "gpt-4", ("Hi",))
+    second, _ = openai_executor._prepare_call(str(prompt_file), "gpt-4", ("Hi",))
+    stat = prompt_file.stat()
+    prompt_file.write_text("v2", encoding="utf-8")
+    os.utime(prompt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    third, _ = openai_executor._prepare_call(str(prompt_file), "gpt-4", ("Hi",))
+
+    assert first["system_prompt"] == second["system_prompt"] == "v1"
+    assert third["system_prompt"] == "v2"
+    assert len(reads) == 2
+
+
+def test_openai_messages_keep_stable_prefix_and_price_cached_tokens(openai_executor):
+    """System comes first exactly once, history order is kept, and cached prompt tokens bill at half rate."""
+    captured = {}
+
+    def create(**kwargs):
+        captured.update(kwargs)
+        response = DummyOpenAIResponse(
+            "ok", usage={"prompt_tokens": 2000, "completion_tokens": 1000, "total_tokens": 3000}
+        )
+        response.usage.prompt_tokens_details = SimpleNamespace(cached_tokens=1000)
+        return response
+
+    openai_executor.client.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+    history = [
+        {"role": "user", "content": "u1"},
+        {"role": "system", "content": "history system"},
+        {"role": "assistant", "content": "a1"},
+    ]
+
+    result = openai_executor._call_llm(
+        "u2", system_prompt="explicit system", conversation_history=history, model="gpt-4"
+    )
+
+    assert captured["messages"] == [
+        {"role": "system", "content": "explicit system"},
+        {"role": "user", "content": "u1"},
+        {"role": "assistant", "content": "a1"},
+        {"role": "user", "content": "u2"},
+    ]
+    assert result["tokens_cached"] == 1000
+    # gpt-4: 1000 uncached * 0.03 + 1000 cached * 0.015 + 1000 completion * 0.06 (per 1K)
+    assert result["cost_usd"] == pytest.approx(0.03 + 0.015 + 0.06)
+
+
+def test_openai_batch_execute_uploads_jsonl_and_maps_results(openai_executor, monkeypatch):
+    """Batch API output lines are mapped back to request order at the discounted price."""
+    import json
+
+    monkeypatch.setattr("metamorphic_guard.executors.openai.time.sleep", lambda *_: None)
+    uploaded = {}
+    statuses = iter(["in_progress", "completed"])
+
+    def files_create(file, purpose):
+        uploaded["lines"] = [json.loads(line) for line in file.read().decode("utf-8").splitlines()]
+        uploaded["purpose"] = purpose
+        return SimpleNamespace(id="file-in")
+
+    def content(file_id):
+        if file_id == "file-out":
+            body = {
+                "choices": [{"message": {"content": "second"}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 1000, "completion_tokens": 1000, "total_tokens": 2000},
+            }
+            lines = [{"custom_id": "req-2", "response": {"status_code": 200, "body": body}}]
+        else:
+            lines = [{"custom_id": "req-0", "response": {"status_code": 400, "body": {"error": {"message": "bad"}}}}]
+        return SimpleNamespace(text="\n".join(json.dumps(line) for line in lines))
+
+    openai_executor.client.files = SimpleNamespace(create=files_create, content=content)
+    openai_executor.client.batches = SimpleNamespace(
+        create=lambda **kwargs: SimpleNamespace(id="batch-1", status="validating"),
+        retrieve=lambda batch_id: SimpleNamespace(
+            id=batch_id, status=next(statuses), output_file_id="file-out", error_file_id="file-err"
+        ),
+        cancel=lambda batch_id: None,
+    )
+
+    outcome = openai_executor.batch_execute(
+        [("", "gpt-4", ("first",)), ("", "gpt-4", ("",)), ("", "gpt-4", ("second",))]
+    )
+
+    assert uploaded["purpose"] == "batch"
+    assert [line["custom_id"] for line in uploaded["lines"]] == ["req-0", "req-2"]
+    assert uploaded["lines"][1]["body"]["messages"][-1]["content"] == "second"
+    assert outcome[0]["error_code"] == "batch_errored"
+    assert outcome[1]["error_code"] == "invalid_input"
+    assert outcome[2]["result"] == "second"
+    # gpt-4 at half price: (1000 * 0.03 + 1000 * 0.06) / 1000 / 2
+    assert outcome[2]["cost_usd"] == pytest.approx(0.045)
+
+
+def test_openai_stream_accumulates_and_stops_at_char_budget(openai_executor):
+    """Streamed deltas are joined, usage comes from the final chunk, and runaway output is cut off."""
+
+    def chunk(text=None, finish_reason=None, usage=None):
+        choices = [] if text is None and finish_reason is None else [
+            SimpleNamespace(delta=SimpleNamespace(content=text), finish_reason=finish_reason)
+        ]
+        return SimpleNamespace(choices=choices, usage=usage)
+
+    usage = SimpleNamespace(prompt_tokens=10, completion_tokens=3, total_tokens=13)
+    streams = [
+        [chunk("Hel"), chunk("lo"), chunk(finish_reason="stop"), chunk(usage=usage)],
+        [chunk("x" * 10) for _ in range(100)],
+    ]
+    captured = []
+    consumed = []
+
+    def create(**kwargs):
+        captured.append(kwargs)
+        chunks = streams.pop(0)
+
+        def generate():
+            for item in chunks:
+                consumed.append(item)
+                yield item
+
+        return generate()
+
+    openai_executor.config["stream"] = True
+    openai_executor.client.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+
+    result = openai_executor.execute("", "gpt-4", ("Hi",))
+    assert result["success"] is True
+    assert result["result"] == "Hello"
+    assert result["tokens_total"] == 13 and result["finish_reason"] == "stop"
+    assert captured[0]["stream"] is True
+    assert captured[0]["stream_options"] == {"include_usage": True}
+
+    consumed.clear()
+    openai_executor.config["max_output_chars"] = 25
+    truncated = openai_executor.execute("", "gpt-4", ("Hi",))
+    assert truncated["result"] == "x" * 30
+    assert truncated["finish_reason"] == "length"
+    assert len(consumed) == 3
+    # The usage chunk never arrived, but the consumed tokens are still billed
+    assert truncated["usage_estimated"] is True
+    assert truncated["tokens_completion"] > 0 and truncated["cost_usd"] > 0
+    assert "usage_estimated" not in result
+
+
+def test_openai_retries_reuse_messages_built_once(openai_executor, monkeypatch):
+    """The messages list is assembled once per execute call, not once per attempt."""
+    from metamorphic_guard.executors import openai as openai_module
+
+    builds = []
+    original = openai_module._canonicalize_messages
+    monkeypatch.setattr(
+        openai_module, "_canonicalize_messages", lambda *a: builds.append(a) or original(*a)
+    )
+    monkeypatch.setattr(openai_executor, "_sleep_with_backoff", lambda *a, **k: None)
+    sent = []
+
+    def create(**kwargs):
+        sent.append(kwargs["messages"])
+        if len(sent) < 3:
+            raise DummyAPIError("Rate limited", 429)
+        return DummyOpenAIResponse("ok", usage={"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2})
+
+    openai_executor.client.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+    result = openai_executor.execute("", "gpt-4", ([{"role": "assistant", "content": "a"}], "Hi"))
+
+    assert result["success"] is True and result["retries"] == 2
+    assert len(builds) == 1
+    assert sent[0] is sent[1] is sent[2] is result["conversation_history"]
+
+
+def test_openai_per_token_rates_follow_pricing_updates(openai_executor):
+    """Costs use precomputed per-token rates, refreshed when the pricing table is replaced."""
+    usage = {"prompt_tokens": 1000, "completion_tokens": 500, "total_tokens": 1500}
+    openai_executor.client.chat = SimpleNamespace(
+        completions=SimpleNamespace(create=lambda **kwargs: DummyOpenAIResponse("ok", usage=usage))
+    )
+
+    assert openai_executor._call_llm("Hi", model="gpt-4")["cost_usd"] == pytest.approx(0.03 + 0.03)
+    # Unknown models fall back to gpt-3.5-turbo rates
+    assert openai_executor._call_llm("Hi", model="my-model")["cost_usd"] == pytest.approx(0.0015 + 0.001)
+
+    openai_executor.pricing = {"my-model": {"prompt": 1.0, "completion": 2.0}}
+    assert openai_executor._call_llm("Hi", model="my-model")["cost_usd"] == pytest.approx(1.0 + 1.0)
+
+
+def test_status_codes_map_to_error_codes_in_every_path(openai_executor, monkeypatch):
+    """Non-retried and retry-exhausted failures classify HTTP statuses the same way."""
+    status = {"code": 500}
+
+    def mock_call_llm(*args, **kwargs):
+        raise DummyAPIError("boom", status["code"])
+
+    monkeypatch.setattr(openai_executor, "_call_llm", mock_call_llm)
+    monkeypatch.setattr(openai_executor, "_sleep_with_backoff", lambda *a, **k: None)
+
+    openai_executor.max_retries = 0
+    assert openai_executor.execute("", "gpt-4", ("Hi",))["error_code"] == "server_error"
+    status["code"] = 418
+    assert openai_executor.execute("", "gpt-4", ("Hi",))["error_code"] == "llm_api_error"
+
+    openai_executor.max_retries = 2
+    status["code"] = 429
+    assert openai_executor.execute("", "gpt-4", ("Hi",))["error_code"] == "rate_limit_error"
+    status["code"] = 500
+    assert openai_executor.execute("", "gpt-4", ("Hi",))["error_code"] == "server_error"
+
+
+def test_anthropic_aexecute_many_uses_fresh_client_per_loop(anthropic_executor, monkeypatch):
+    """A second asyncio.run must not reuse the client bound to the first (closed) loop."""
+    import asyncio
+
+    created = []
+
+    class DummyAsyncClient:
+        def __init__(self, api_key: str, **kwargs) -> None:
+            self.loop = None
+            self.closed = False
+            self.messages = SimpleNamespace(create=self._create)
+            created.append(self)
+
+        async def _create(self, **kwargs):
+            loop = asyncio.get_running_loop()
+            assert self.loop in (None, loop), "client reused across event loops"
+            self.loop = loop
+            return DummyAnthropicResponse("ok", usage={"input_tokens": 1, "output_tokens": 1})
+
+        async def close(self) -> None:
+            self.closed = True
+
+    monkeypatch.setattr(
+        "metamorphic_guard.executors.anthropic.anthropic",
+        SimpleNamespace(AsyncAnthropic=DummyAsyncClient),
+    )
+    requests = [("", "claude-3-haiku-20240307", ("hi",))] * 2
+
+    for _ in range(2):
+        results = asyncio.run(anthropic_executor.aexecute_many(requests))
+        assert all(r["success"] for r in results)
+
+    assert len(created) == 2
+    assert all(client.closed for client in created)
+    assert anthropic_executor._async_client is None
@@ -268,3 +268,17 @@ def test_performance_profiler_no_distribution():
     
     assert "distribution" not in result
 
+
+def test_performance_profiler_latency_stats_even_count_unsorted():
+    profiler = PerformanceProfiler()
+    for i, val in enumerate([400.0, 100.0, 300.0, 200.0]):
+        profiler.record(
+            MonitorRecord(case_index=i, role="baseline", duration_ms=val, success=True, result={})
+        )
+
+    latency = profiler.finalize()["latency"]["baseline"]
+
+    assert latency["min_ms"] == 100.0
+    assert latency["max_ms"] == 400.0
+    assert latency["median_ms"] == 250.0
+    assert latency["percentiles"]["p50_ms"] == 300.0
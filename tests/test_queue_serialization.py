@@ -24,3 +24,50 @@ def test_decode_args_rejects_malformed_base64() -> None:
     with pytest.raises(QueueSerializationError):
         decode_args(bad_payload, compress=False, use_msgpack=False)
 
+
+def test_publish_chunk_annotates_serialization_error_in_place() -> None:
+    from metamorphic_guard.dispatch.task_distribution import TaskDistributionManager
+    from metamorphic_guard.queue_adapter import InMemoryQueueAdapter
+
+    class Unserializable:
+        pass
+
+    manager = TaskDistributionManager(
+        InMemoryQueueAdapter(),
+        {"batch_size": 2},
+        workers=1,
+        test_inputs=[(Unserializable(),), (1,)],
+        job_id="job",
+        role="baseline",
+        call_spec=None,
+    )
+
+    with pytest.raises(QueueSerializationError) as excinfo:
+        manager.publish_chunk(0, 2)
+
+    assert excinfo.value.details["case_indices"] == [0, 1]
+
+
+@pytest.mark.parametrize("use_msgpack", [False, True])
+def test_prepare_payload_from_frames_round_trips(use_msgpack: bool) -> None:
+    from metamorphic_guard.queue_serialization import (
+        MSGPACK_AVAILABLE,
+        encode_frame,
+        prepare_payload_from_frames,
+    )
+
+    if use_msgpack and not MSGPACK_AVAILABLE:
+        pytest.skip("msgpack not installed")
+
+    args_list = [(i, f"value-{i}", [i, i + 1]) for i in range(20)]
+    frames = [encode_frame(args, use_msgpack=use_msgpack) for args in args_list]
+    payload, compressed, _, _ = prepare_payload_from_frames(
+        frames,
+        compress_default=True,
+        adaptive=True,
+        threshold_bytes=64,
+        use_msgpack=use_msgpack,
+    )
+
+    decoded = decode_args(payload, compress=compressed, use_msgpack=use_msgpack)
+    assert decoded == [list(args) for args in args_list]
@@ -235,3 +235,277 @@ def solve():
     finally:
         os.unlink(test_file)
         monkeypatch.delenv("METAMORPHIC_GUARD_REDACT", raising=False)
+
+
+def test_redactor_single_pass_matches_sequential_patterns():
+    import re
+
+    from metamorphic_guard.redaction import SecretRedactor, get_redactor
+
+    redactor = get_redactor({"redact_patterns": [r"(?i)password\s*=\s*\w+"]})
+    text = "AKIA1234567890ABCDEF then PASSWORD=hunter2 and token: abcdefghijklmnopqrstuvwx"
+    sequential = SecretRedactor(list(redactor.patterns))
+    object.__setattr__(sequential, "_combined", None)
+
+    assert redactor._combined is not None
+    assert redactor.redact(text) == sequential.redact(text) == "[REDACTED] then [REDACTED] and [REDACTED]"
+    # Patterns carrying compile-time flags keep the per-pattern path
+    assert SecretRedactor([re.compile("secret", re.IGNORECASE)])._combined is None
+
+
+def test_redactor_keeps_conditional_group_patterns_separate():
+    from metamorphic_guard.redaction import SecretRedactor, get_redactor
+
+    # Merged after "(#)tag-...", the "(<)" group would become group 2 and (?(1)...) would test "#"
+    redactor = get_redactor({"redact_patterns": [r"(#)tag-\d+", r"(<)?secret-\d+(?(1)>)"]})
+    sequential = SecretRedactor(list(redactor.patterns))
+    object.__setattr__(sequential, "_combined", None)
+    text = "<secret-1> and secret-2> and <secret-3"
+
+    assert redactor._combined is None
+    assert redactor.redact(text) == sequential.redact(text) == "[REDACTED] and [REDACTED]> and <[REDACTED]"
+
+
+def test_get_redactor_shares_instances_per_pattern_set():
+    from metamorphic_guard.redaction import get_redactor
+
+    assert get_redactor({}) is get_redactor(None)
+    assert get_redactor({"redact_patterns": "foo"}) is not get_redactor({})
+
+
+def test_run_batch_in_sandbox_matches_single_runs():
+    from metamorphic_guard.sandbox import run_batch_in_sandbox
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+        f.write('''
+def solve(x):
+    print("seen", x)
+    if x < 0:
+        raise ValueError("negative input")
+    return [x, x * 2]
+''')
+        test_file = f.name
+
+    try:
+        args_list = [(1,), (-1,), (3,)]
+        batched = run_batch_in_sandbox(test_file, "solve", args_list, timeout_s=2.0, mem_mb=100)
+        single = [run_in_sandbox(test_file, "solve", args, timeout_s=2.0, mem_mb=100) for args in args_list]
+
+        assert [r["success"] for r in batched] == [r["success"] for r in single] == [True, False, True]
+        assert [r["result"] for r in batched] == [r["result"] for r in single]
+        assert batched[0]["stdout"] == "seen 1\n"
+        assert batched[1]["error_code"] == single[1]["error_code"] == "SANDBOX_EXIT_CODE"
+        assert "negative input" in batched[1]["stdout"]
+    finally:
+        os.unlink(test_file)
+
+
+def test_run_batch_in_sandbox_times_out_each_case_on_its_own():
+    import time
+
+    from metamorphic_guard.sandbox import run_batch_in_sandbox
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+        f.write('''
+import sys
+import time
+
+def solve(x):
+    print("case", x, file=sys.stderr)
+    if x == 2:
+        try:
+            time.sleep(30)
+        except Exception:
+            pass
+    return x
+''')
+        test_file = f.name
+
+    try:
+        start = time.time()
+        results = run_batch_in_sandbox(test_file, "solve", [(1,), (2,), (3,)], timeout_s=0.5, mem_mb=100)
+        elapsed = time.time() - start
+
+        assert [r["success"] for r in results] == [True, False, True]
+        assert results[1]["error_code"] == "SANDBOX_TIMEOUT"
+        assert results[2]["result"] == 3
+        # Each case sees only what it wrote to stderr
+        assert results[0]["stderr"] == "case 1\n"
+        assert results[2]["stderr"] == "case 3\n"
+        assert elapsed < 1.5  # the slow case did not eat the batch's whole budget
+    finally:
+        os.unlink(test_file)
+
+
+def test_run_batch_in_sandbox_falls_back_when_batch_reports_nothing():
+    from metamorphic_guard.sandbox import run_batch_in_sandbox
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+        f.write('''
+def other_function(x):
+    return x
+''')
+        test_file = f.name
+
+    try:
+        results = run_batch_in_sandbox(test_file, "solve", [(1,), (2,)], timeout_s=1.0, mem_mb=100)
+
+        assert len(results) == 2
+        assert all(r["success"] is False and r["error"] is not None for r in results)
+    finally:
+        os.unlink(test_file)
+
+
+def test_persistent_worker_matches_single_runs(monkeypatch):
+    from metamorphic_guard.sandbox.persistent import shutdown_workers
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+        f.write('''
+import os
+
+def solve(x):
+    print("seen", x)
+    if x < 0:
+        raise ValueError("negative input")
+    return [x, os.getpid()]
+''')
+        test_file = f.name
+
+    try:
+        args_list = [(1,), (-1,), (3,)]
+        monkeypatch.delenv("METAMORPHIC_GUARD_SANDBOX_PERSISTENT", raising=False)
+        single = [run_in_sandbox(test_file, "solve", args, timeout_s=2.0, mem_mb=100, enable_cache=False) for args in args_list]
+        monkeypatch.setenv("METAMORPHIC_GUARD_SANDBOX_PERSISTENT", "1")
+        pooled = [run_in_sandbox(test_file, "solve", args, timeout_s=2.0, mem_mb=100, enable_cache=False) for args in args_list]
+
+        assert [r["success"] for r in pooled] == [r["success"] for r in single] == [True, False, True]
+        assert pooled[0]["stdout"] == "seen 1\n"
+        assert single[0]["stdout"].startswith("seen 1\n")
+        assert pooled[1]["error_code"] == single[1]["error_code"] == "SANDBOX_EXIT_CODE"
+        assert "negative input" in pooled[1]["stdout"]
+        assert pooled[0]["sandbox_metadata"]["persistent_worker"] is True
+        # Both successful calls were served by the same interpreter
+        assert pooled[0]["result"][1] == pooled[2]["result"][1]
+        assert single[0]["result"][1] != single[2]["result"][1]
+    finally:
+        shutdown_workers()
+        os.unlink(test_file)
+
+
+def test_persistent_worker_timeout_and_fallback(monkeypatch):
+    from metamorphic_guard.sandbox.persistent import module_is_reusable, shutdown_workers
+
+    monkeypatch.setenv("METAMORPHIC_GUARD_SANDBOX_PERSISTENT", "1")
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+        f.write('''
+import time
+
+def solve(x):
+    time.sleep(x)
+    return x
+''')
+        slow_file = f.name
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+        f.write('''
+CALLS = []
+print("import side effect")
+
+def solve(x):
+    CALLS.append(x)
+    return len(CALLS)
+''')
+        stateful_file = f.name
+
+    try:
+        timed_out = run_in_sandbox(slow_file, "solve", (5,), timeout_s=0.5, mem_mb=100, enable_cache=False)
+        assert timed_out["success"] is False
+        assert timed_out["error_code"] == "SANDBOX_TIMEOUT"
+        assert run_in_sandbox(slow_file, "solve", (0,), timeout_s=2.0, mem_mb=100, enable_cache=False)["result"] == 0
+
+        assert module_is_reusable(slow_file)
+        assert not module_is_reusable(stateful_file)
+        results = [run_in_sandbox(stateful_file, "solve", (x,), timeout_s=2.0, mem_mb=100, enable_cache=False) for x in (1, 2)]
+        # Each call got a fresh interpreter, so module state did not leak between them
+        assert [r["result"] for r in results] == [1, 1]
+        assert "persistent_worker" not in results[0]["sandbox_metadata"]
+    finally:
+        shutdown_workers()
+        os.unlink(slow_file)
+        os.unlink(stateful_file)
+
+
+def test_persistent_worker_reads_reply_after_raw_stdout_noise(monkeypatch):
+    from metamorphic_guard.sandbox.persistent import shutdown_workers
+
+    monkeypatch.setenv("METAMORPHIC_GUARD_SANDBOX_PERSISTENT", "1")
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+        f.write('''
+import sys
+
+def solve(x):
+    sys.__stdout__.write("noise\\n")
+    sys.__stdout__.write("more noise\\n")
+    return x + 1
+''')
+        test_file = f.name
+
+    try:
+        results = [
+            run_in_sandbox(test_file, "solve", (x,), timeout_s=2.0, mem_mb=100, enable_cache=False)
+            for x in (1, 2)
+        ]
+        assert [r["success"] for r in results] == [True, True]
+        assert [r["result"] for r in results] == [2, 3]
+        assert results[1]["sandbox_metadata"]["persistent_worker"] is True
+        assert all(r["duration_ms"] < 1500 for r in results[1:])
+    finally:
+        shutdown_workers()
+        os.unlink(test_file)
+
+
+def test_module_is_reusable_rejects_mutable_state():
+    from metamorphic_guard.sandbox.persistent import module_is_reusable
+
+    sources = {
+        'LIMIT = 10\nPAIR = (1, -2.5, "x")\nNAME: str = "a"\n\ndef solve(x, scale=2):\n    return x * scale\n': True,
+        'seen = []\n\ndef solve(x):\n    seen.append(x)\n    return len(seen)\n': False,
+        'cache = {}\n\ndef solve(x):\n    return cache.setdefault(x, len(cache))\n': False,
+        'NESTED = (1, [2])\n\ndef solve(x):\n    return x\n': False,
+        'def solve(x, seen=[]):\n    seen.append(x)\n    return len(seen)\n': False,
+        'class Acc:\n    items = []\n\ndef solve(x):\n    return x\n': False,
+    }
+    for source, expected in sources.items():
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write(source)
+            path = f.name
+        try:
+            assert module_is_reusable(path) is expected, source
+        finally:
+            os.unlink(path)
+
+
+def test_module_reusability_is_parsed_once_per_source_version(monkeypatch, tmp_path):
+    from metamorphic_guard.sandbox import persistent
+
+    parsed = []
+    real = persistent.module_is_reusable
+
+    def counting(path):
+        parsed.append(path)
+        return real(path)
+
+    monkeypatch.setattr(persistent, "module_is_reusable", counting)
+    monkeypatch.setattr(persistent, "_REUSABLE_SOURCES", {})
+    target = tmp_path / "target.py"
+    target.write_text("def solve(x):\n    return x\n", encoding="utf-8")
+
+    key = persistent._source_key(str(target))
+    assert persistent._module_is_reusable_cached(key, str(target))
+    assert persistent._module_is_reusable_cached(key, str(target))
+    assert len(parsed) == 1
+
+    target.write_text("seen = []\n\ndef solve(x):\n    seen.append(x)\n    return x\n", encoding="utf-8")
+    edited = persistent._source_key(str(target))
+    assert edited != key
+    assert not persistent._module_is_reusable_cached(edited, str(target))
+    assert len(parsed) == 2
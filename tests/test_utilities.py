@@ -279,3 +279,84 @@ def test_send_webhook_alerts(monkeypatch):
     send_webhook_alerts(alerts, ["http://example.com/webhook"], metadata={"task": "demo"}, opener=fake_opener)
     assert captured and captured[0]["alerts"][0]["monitor"] == "LatencyMonitor"
 
+
+def test_top_k_generator_memoizes_without_sharing_lists():
+    from metamorphic_guard.generators import _gen_top_k, _gen_top_k_cached, gen_top_k_inputs
+
+    _gen_top_k_cached.cache_clear()
+    first = gen_top_k_inputs(50, seed=3)
+    first[0][0].append(99)
+    second = gen_top_k_inputs(50, seed=3)
+
+    assert _gen_top_k_cached.cache_info().hits == 1
+    assert second == _gen_top_k(50, 3)
+    assert second[0][0] is not first[0][0]
+
+
+def test_sha256_file_caches_by_mtime_and_size(tmp_path):
+    import hashlib
+    import os
+
+    from metamorphic_guard import util
+
+    target = tmp_path / "impl.py"
+    target.write_bytes(b"def solve(x):\n    return x\n")
+    stat = target.stat()
+
+    digest = util.sha256_file(str(target))
+    assert digest == hashlib.sha256(target.read_bytes()).hexdigest()
+    assert util.sha256_file(str(target)) == digest
+
+    # Same mtime but a different size must not reuse the cached digest
+    target.write_bytes(b"def solve(x):\n    return x + 1\n")
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert util.sha256_file(str(target)) == hashlib.sha256(target.read_bytes()).hexdigest()
+
+    assert util.sha256_file("not a path\0") == hashlib.sha256(b"not a path\0").hexdigest()
+    assert len(util._SHA_CACHE) <= util._SHA_CACHE_MAX
+
+
+def test_dumps_indented_round_trips_like_stdlib():
+    from metamorphic_guard import util
+
+    payload = {"a": [1, 2.5, "é", None, True], "nested": {"1": {"x": (1, 2)}}}
+    assert json.loads(util._dumps_indented(payload)) == json.loads(json.dumps(payload, indent=2))
+
+    # Non-finite floats keep the stdlib encoding instead of orjson's null
+    encoded = util._dumps_indented({"rr": float("inf"), "values": [float("nan")]})
+    assert b"Infinity" in encoded and b"NaN" in encoded
+    assert json.loads(util._dumps_indented({1: "a"})) == {"1": "a"}
+
+
+def test_sha256_file_directory_digest_is_stable(tmp_path):
+    import hashlib
+
+    from metamorphic_guard.util import sha256_file
+
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "b.py").write_bytes(b"b" * 3000)
+    (tmp_path / "pkg" / "a.py").write_bytes(b"a")
+
+    expected = hashlib.sha256(b"dir" + b"a.py" + b"a" + b"b.py" + b"b" * 3000).hexdigest()
+    assert sha256_file(str(tmp_path / "pkg")) == expected
+
+
+def test_sha256_file_directory_cache_sees_nested_edits(tmp_path):
+    import hashlib
+    import os
+
+    from metamorphic_guard.util import sha256_file
+
+    package = tmp_path / "pkg"
+    (package / "sub").mkdir(parents=True)
+    nested = package / "sub" / "impl.py"
+    nested.write_bytes(b"x = 1\n")
+    dir_stat = package.stat()
+
+    before = sha256_file(str(package))
+    nested.write_bytes(b"x = 22\n")
+    os.utime(package, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+
+    after = sha256_file(str(package))
+    assert after != before
+    assert after == hashlib.sha256(b"dir" + b"sub/impl.py" + b"x = 22\n").hexdigest()